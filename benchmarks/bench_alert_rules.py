@@ -0,0 +1,103 @@
+# benchmarks/bench_alert_rules.py
+"""
+Alarm kural motoru benchmark'ı: saniyede değerlendirilen kural sayısı
+
+- compiled_single: derlenmiş tek paket değerlendirici (canlı telemetri)
+- legacy_lambdas: eski lambda listesi yaklaşımı (karşılaştırma için)
+- vectorized_numpy: NumPy dizileri üzerinde toplu değerlendirme (tekrar oynatma)
+
+Kullanım:
+    python benchmarks/bench_alert_rules.py --packets 20000 --samples 1000000
+"""
+
+import argparse
+import random
+from datetime import datetime
+
+from common import measure, print_results, save_results
+
+
+def _make_packets(count):
+    from src.telemetry.data_models import TelemetryPacket, GPSData
+
+    random.seed(1)
+    packets = []
+    for _ in range(count):
+        gps = GPSData(latitude=39.9, longitude=32.8,
+                      altitude=random.uniform(0, 450),
+                      fix_quality=random.choice([1, 3, 4]),
+                      satellites=random.randint(3, 14))
+        packets.append(TelemetryPacket(
+            timestamp=datetime.now(), gps=gps,
+            velocity=random.uniform(0, 35),
+            battery_percent=random.uniform(0, 100),
+            battery_voltage=22.0, status="FLYING"))
+    return packets
+
+
+def run(packets=20000, samples=1000000):
+    import numpy as np
+    from src.services.alerts import CompiledRuleSet, OPERATORS, packets_to_arrays
+
+    rule_set = CompiledRuleSet()
+    rule_count = len(rule_set.rules)
+    data = _make_packets(packets)
+    results = {'rules': rule_count}
+
+    # Derlenmiş tek paket değerlendirici
+    evaluate = rule_set.evaluate_raw
+    timing = measure(lambda: [evaluate(p) for p in data], iterations=5, warmup=1)
+    timing['rules_per_s'] = packets * rule_count / (timing['mean_us'] / 1e6)
+    results['compiled_single'] = timing
+
+    # Eski yaklaşım (AlarmPanel.ALARM_CHECKS): kural başına getter,
+    # tetiklenme ve temizlenme lambda'ları
+    legacy = []
+    for rule in rule_set.rules:
+        compare = OPERATORS[rule.op]
+        legacy.append((
+            eval(f"lambda p: p.{rule.field}"),
+            lambda v, c=compare, t=rule.threshold: c(v, t),
+            lambda v, c=compare, t=rule.effective_clear_threshold: not c(v, t)))
+
+    def run_legacy():
+        for p in data:
+            results_row = []
+            for getter, raise_test, clear_test in legacy:
+                value = getter(p)
+                if value is not None:
+                    results_row.append((raise_test(value), clear_test(value), value))
+
+    timing = measure(run_legacy, iterations=5, warmup=1)
+    timing['rules_per_s'] = packets * rule_count / (timing['mean_us'] / 1e6)
+    results['legacy_lambdas'] = timing
+
+    # Vektörel değerlendirme (büyük tekrar oynatma dizisi)
+    base = packets_to_arrays(data)
+    repeats = max(1, samples // packets)
+    arrays = {field: np.tile(values, repeats) for field, values in base.items()}
+    total = len(next(iter(arrays.values())))
+
+    timing = measure(lambda: rule_set.evaluate_batch(arrays), iterations=5, warmup=1)
+    timing['samples'] = total
+    timing['rules_per_s'] = total * rule_count / (timing['mean_us'] / 1e6)
+    results['vectorized_numpy'] = timing
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alarm kural motoru benchmark'ı")
+    parser.add_argument("--packets", type=int, default=20000)
+    parser.add_argument("--samples", type=int, default=1000000)
+    args = parser.parse_args()
+
+    results = run(args.packets, args.samples)
+    print_results("alert_rules", results)
+    for case in ('compiled_single', 'legacy_lambdas', 'vectorized_numpy'):
+        print(f"  {case}: {results[case]['rules_per_s']:,.0f} kural/s")
+    print(f"Sonuçlar: {save_results('alert_rules', results)}")
+
+
+if __name__ == "__main__":
+    main()
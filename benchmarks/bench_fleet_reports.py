@@ -0,0 +1,124 @@
+# benchmarks/bench_fleet_reports.py
+"""
+Filo geneli toplu rapor (src/services/fleet_reports.py) benchmark'ı
+
+Geçici dizinde sentetik çok oturumlu bir veritabanı kurulur ve tüm
+oturumların raporu önbelleksiz üretilir:
+
+- sequential: tek süreç, oturumlar sırayla (workers=1)
+- parallel: süreç havuzu, işçi başına salt okunur bağlantı
+- backfill_summaries: session_summaries tablosunun küme tabanlı toplu doldurulması
+- fleet_statistics: filo toplamları (özet tablosundan, uçuş başına tek satır)
+
+Hızlanma işlemci sayısıyla sınırlıdır; tek çekirdekli makinede havuz
+kurulum maliyeti nedeniyle sıralı yoldan hızlı olmaz.
+
+Kullanım:
+    python benchmarks/bench_fleet_reports.py --sessions 200 --records 1000
+"""
+
+import argparse
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from common import measure, print_results, save_results
+
+
+def build_database(path, sessions, records):
+    """Sentetik filo veritabanı: COMPLETED oturumlar, 1 Hz telemetri"""
+    from src.database.database_manager import DatabaseManager
+
+    DatabaseManager(path).close_connection()  # Şema ve indeksler
+    rng = random.Random(7)
+    start = datetime(2026, 10, 19, 6, 0, 0)
+
+    connection = sqlite3.connect(path)
+    with connection:
+        for s in range(sessions):
+            t0 = start + timedelta(minutes=5 * s)
+            connection.execute(
+                "INSERT INTO flight_sessions (session_name, start_time, end_time, total_duration, status) "
+                "VALUES (?, ?, ?, ?, 'COMPLETED')",
+                (f"Fleet_{s:04d}", t0.isoformat(sep=' '),
+                 (t0 + timedelta(seconds=records)).isoformat(sep=' '), float(records)))
+            session_id = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+            lat, lon = 39.9 + rng.uniform(-0.1, 0.1), 32.8 + rng.uniform(-0.1, 0.1)
+            rows = []
+            for i in range(records):
+                lat += 1e-4 * math.cos(i / 50.0)
+                lon += 1e-4 * math.sin(i / 50.0)
+                rows.append((session_id, (t0 + timedelta(seconds=i)).isoformat(sep=' '),
+                             lat, lon, 100 + 50 * math.sin(i / 100.0) + rng.gauss(0, 2),
+                             15 + rng.gauss(0, 3), 12.6 - 0.002 * i,
+                             max(0.0, 100 - 60.0 * i / records), 'ARMED'))
+            connection.executemany(
+                "INSERT INTO telemetry_records (session_id, timestamp, latitude, longitude, altitude, "
+                "velocity, battery_voltage, battery_percent, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows)
+    connection.close()
+
+
+def _timed(db_path, session_ids, workers):
+    from src.services.fleet_reports import generate_fleet_reports
+
+    result = generate_fleet_reports(db_path, session_ids, workers=workers, use_cache=False)
+    sessions = len(session_ids)
+    return {
+        'workers': result['workers'],
+        'wall_s': result['elapsed_s'],
+        'sessions_per_s': sessions / result['elapsed_s'],
+        'failed': result['fleet']['failed'],
+    }
+
+
+def run(sessions=200, records=1000, workers=0):
+    from src.database.database_manager import DatabaseManager
+
+    results = {'sessions': sessions, 'records_per_session': records,
+               'cpu_count': os.cpu_count()}
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "fleet.db")
+        build_database(db_path, sessions, records)
+        database = DatabaseManager(db_path, read_only=True)
+        session_ids = database.get_session_ids()
+        database.close_connection()
+
+        results['sequential'] = _timed(db_path, session_ids, 1)
+        # Havuz yolu tek çekirdekte de ölçülsün diye en az 2 işçi
+        results['parallel'] = _timed(db_path, session_ids,
+                                     workers or max(2, os.cpu_count() or 1))
+        results['parallel']['speedup'] = (results['sequential']['wall_s'] /
+                                          results['parallel']['wall_s'])
+
+        database = DatabaseManager(db_path)
+        t0 = time.perf_counter()
+        database.backfill_session_summaries(rebuild=True)
+        wall = time.perf_counter() - t0
+        results['backfill_summaries'] = {'wall_s': wall, 'sessions_per_s': sessions / wall}
+        results['fleet_statistics'] = measure(database.get_fleet_statistics,
+                                              iterations=200, warmup=5)
+        database.close_connection()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filo raporu benchmark'ı")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--records", type=int, default=1000, help="Oturum başına kayıt")
+    parser.add_argument("--workers", type=int, default=0, help="0: işlemci sayısı (en az 2)")
+    args = parser.parse_args()
+
+    results = run(args.sessions, args.records, args.workers)
+    print_results("fleet_reports", results)
+    print(f"Hızlanma ({results['parallel']['workers']} işçi): "
+          f"{results['parallel']['speedup']:.2f}x")
+    print(f"Sonuçlar: {save_results('fleet_reports', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_geodesy.py
+"""
+Vektörel jeodezi (src/core/utils.py) benchmark'ı
+
+- scalar_track_length: math ile nokta nokta haversine döngüsü (eski yöntem)
+- track_length: aynı iz için NumPy haversine
+- vincenty_track_length: WGS84 elipsoidi üzerinde iz uzunluğu
+- bearings: ardışık noktalar arası yönler
+- geodetic_to_enu: tüm izin yerel ENU izdüşümü
+- point_to_segment: her noktanın bir görev bacağına uzaklığı
+
+Kullanım:
+    python benchmarks/bench_geodesy.py --points 1000000
+"""
+
+import argparse
+import math
+
+from common import measure, print_results, save_results
+
+
+def _scalar_track_length(lats, lons):
+    total = 0.0
+    for i in range(1, len(lats)):
+        phi1, phi2 = math.radians(lats[i - 1]), math.radians(lats[i])
+        delta_phi = phi2 - phi1
+        delta_lambda = math.radians(lons[i] - lons[i - 1])
+        a = (math.sin(delta_phi / 2) ** 2 +
+             math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2)
+        total += 2 * 6371000.0 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return total
+
+
+def _throughput(timing, points):
+    timing['points_per_s'] = points / (timing['mean_us'] / 1e6)
+    return timing
+
+
+def run(points=1000000, repeats=3):
+    import numpy as np
+    from src.core import utils
+
+    # Rastgele yürüyüş: 1 Hz'de ~15 m/s uçuş
+    rng = np.random.default_rng(3)
+    lats = 39.9 + np.cumsum(rng.normal(0, 1e-4, points))
+    lons = 32.8 + np.cumsum(rng.normal(0, 1e-4, points))
+    alts = 100 + np.cumsum(rng.normal(0, 0.5, points))
+    lat_list, lon_list = lats.tolist(), lons.tolist()
+
+    results = {'points': points}
+
+    scalar = measure(lambda: _scalar_track_length(lat_list, lon_list), iterations=1, warmup=0)
+    results['scalar_track_length'] = _throughput(scalar, points)
+
+    vectorized = measure(lambda: utils.track_length(lats, lons), iterations=repeats, warmup=1)
+    vectorized['speedup'] = scalar['mean_us'] / vectorized['mean_us']
+    results['track_length'] = _throughput(vectorized, points)
+
+    results['vincenty_track_length'] = _throughput(measure(
+        lambda: utils.track_length(lats, lons, method='vincenty'), iterations=repeats, warmup=1),
+        points)
+    results['bearings'] = _throughput(measure(
+        lambda: utils.initial_bearing(lats[:-1], lons[:-1], lats[1:], lons[1:]),
+        iterations=repeats, warmup=1), points)
+    results['geodetic_to_enu'] = _throughput(measure(
+        lambda: utils.geodetic_to_enu(lats, lons, alts, 39.9, 32.8, 100.0),
+        iterations=repeats, warmup=1), points)
+    results['point_to_segment'] = _throughput(measure(
+        lambda: utils.point_to_segment(lats, lons, 39.9, 32.8, 39.95, 32.9),
+        iterations=repeats, warmup=1), points)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jeodezi benchmark'ı")
+    parser.add_argument("--points", type=int, default=1000000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(args.points, args.repeats)
+    print_results("geodesy", results)
+    print(f"Hızlanma (track_length): {results['track_length']['speedup']:.1f}x")
+    print(f"Sonuçlar: {save_results('geodesy', results)}")
+
+
+if __name__ == "__main__":
+    main()
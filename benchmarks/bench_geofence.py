@@ -0,0 +1,93 @@
+# benchmarks/bench_geofence.py
+"""
+Coğrafi sınır motoru benchmark'ı
+
+- indexed_single: ızgara indeksiyle paket başına kontrol (canlı telemetri)
+- brute_force_single: tüm sınırları sırayla test etme (karşılaştırma için)
+- vectorized_batch: kayıtlı oturumu NumPy ile toplu değerlendirme
+
+Kullanım:
+    python benchmarks/bench_geofence.py --fences 500 --points 20000
+"""
+
+import argparse
+import math
+import random
+
+from common import measure, print_results, save_results
+
+
+def _make_fences(count, center=(39.9, 32.8), spread_deg=0.5):
+    from src.services.geofence import Geofence
+
+    random.seed(5)
+    fences = [Geofence(name="Operasyon Alanı", kind="inclusion", ceiling_m=400,
+                       points=[(center[0] - spread_deg, center[1] - spread_deg),
+                               (center[0] - spread_deg, center[1] + spread_deg),
+                               (center[0] + spread_deg, center[1] + spread_deg),
+                               (center[0] + spread_deg, center[1] - spread_deg)])]
+
+    for i in range(count):
+        lat = center[0] + random.uniform(-spread_deg, spread_deg)
+        lon = center[1] + random.uniform(-spread_deg, spread_deg)
+        if i % 2:
+            fences.append(Geofence(name=f"Silindir {i}", shape="cylinder",
+                                   center=(lat, lon), radius_m=random.uniform(200, 3000),
+                                   ceiling_m=random.choice([None, 120, 300])))
+        else:
+            sides = random.randint(5, 12)
+            radius = random.uniform(0.002, 0.02)
+            points = [(lat + radius * math.sin(2 * math.pi * k / sides),
+                       lon + radius * math.cos(2 * math.pi * k / sides))
+                      for k in range(sides)]
+            fences.append(Geofence(name=f"Çokgen {i}", points=points,
+                                   floor_m=random.choice([None, 50])))
+    return fences
+
+
+def run(fence_count=500, points=20000):
+    import numpy as np
+    from src.services.geofence import GeofenceEngine
+
+    fences = _make_fences(fence_count)
+    engine = GeofenceEngine(fences)
+
+    random.seed(9)
+    samples = [(39.9 + random.uniform(-0.55, 0.55), 32.8 + random.uniform(-0.55, 0.55),
+                random.uniform(0, 450)) for _ in range(points)]
+    lats, lons, alts = (np.array(v) for v in zip(*samples))
+
+    results = {'fences': len(fences), 'points': points}
+
+    iterator = iter(samples * 100)
+    results['indexed_single'] = measure(lambda: engine.check(*next(iterator)),
+                                        iterations=points, warmup=100)
+
+    compiled = engine._compiled
+
+    def brute_force(lat, lon, alt):
+        return [c for c in compiled if c.contains(lat, lon, alt)]
+
+    iterator_bf = iter(samples * 100)
+    results['brute_force_single'] = measure(lambda: brute_force(*next(iterator_bf)),
+                                            iterations=min(points, 2000), warmup=10)
+
+    timing = measure(lambda: engine.check_batch(lats, lons, alts), iterations=3, warmup=1)
+    timing['points_per_s'] = points / (timing['mean_us'] / 1e6)
+    results['vectorized_batch'] = timing
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coğrafi sınır benchmark'ı")
+    parser.add_argument("--fences", type=int, default=500)
+    parser.add_argument("--points", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = run(args.fences, args.points)
+    print_results("geofence", results)
+    print(f"Sonuçlar: {save_results('geofence', results)}")
+
+
+if __name__ == "__main__":
+    main()
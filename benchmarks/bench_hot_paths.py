@@ -0,0 +1,214 @@
+# benchmarks/bench_hot_paths.py
+"""
+Sıcak yol (hot path) benchmark'ı: paket başına çalışan tüm kod yolları
+
+- packet_construction / packet_validation: TelemetryPacket oluşturma ve doğrulama
+- save_telemetry_single / save_telemetry_batch: veritabanı yazımı (paket başına)
+- summarize_session / generate_flight_report: oturum sonu hesapları (özet satırı)
+- generate_flight_report_cached: tamamlanmış oturum raporunun önbellekten okunması
+- charts_update_data / map_update_position / alarm_check: GUI güncellemeleri
+- waypoint_calculate_route: görev rotası hesabı
+
+Tümü çevrimdışı ve ekransız (offscreen Qt) çalışır; QtWebEngine yoksa
+harita durumu 'error' ile atlanır.
+
+Kullanım:
+    python benchmarks/bench_hot_paths.py --records 2000 --iterations 500
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from common import ensure_offscreen_qt, measure, print_results, save_results
+
+ensure_offscreen_qt()
+
+BATCH_SIZE = 100
+
+
+def _packet_dict(i, start):
+    """Gerçekçi bir paketin ham (dict) hali"""
+    return {
+        'timestamp': start + timedelta(seconds=i),
+        'gps': {'latitude': 39.9334 + i * 1e-5, 'longitude': 32.8597 + i * 1e-5,
+                'altitude': 100.0 + random.uniform(-20, 20),
+                'fix_quality': random.choice([3, 4, 4, 4]),
+                'satellites': random.randint(6, 14)},
+        'attitude': {'roll': random.uniform(-15, 15), 'pitch': random.uniform(-10, 10),
+                     'yaw': random.uniform(0, 360)},
+        'velocity': random.uniform(5, 25),
+        'battery_voltage': random.uniform(22.0, 25.2),
+        'battery_percent': max(0.0, 100.0 - i * 0.01),
+        'status': "FLYING"
+    }
+
+
+def _cycle(items):
+    """measure() için sonsuz döngüsel kaynak"""
+    state = {'i': 0}
+    count = len(items)
+
+    def next_item():
+        item = items[state['i'] % count]
+        state['i'] += 1
+        return item
+    return next_item
+
+
+def _per_packet(timing, packets):
+    """Toplu işlem ölçümünü paket başına µs'ye çevir"""
+    timing['packets_per_call'] = packets
+    timing['per_packet_us'] = timing['mean_us'] / packets
+    return timing
+
+
+def _bench_packets(raw, iterations):
+    from src.telemetry.data_models import TelemetryPacket, GPSData, AttitudeData
+
+    next_raw = _cycle(raw)
+
+    def construct():
+        d = next_raw()
+        return TelemetryPacket(timestamp=d['timestamp'], gps=GPSData(**d['gps']),
+                               attitude=AttitudeData(**d['attitude']),
+                               velocity=d['velocity'], battery_voltage=d['battery_voltage'],
+                               battery_percent=d['battery_percent'], status=d['status'])
+
+    return {
+        'packet_construction': measure(construct, iterations=iterations),
+        'packet_validation': measure(lambda: TelemetryPacket.model_validate(next_raw()),
+                                     iterations=iterations)
+    }
+
+
+def _bench_database(packets, records, iterations, workdir):
+    from src.database.database_manager import DatabaseManager
+    from src.utils.flight_utils import FlightDataLogger
+
+    results = {}
+    database_manager = DatabaseManager(os.path.join(workdir, "hot_paths.db"))
+    database_manager.start_flight_session("benchmark")
+    next_packet = _cycle(packets)
+
+    results['save_telemetry_single'] = measure(
+        lambda: database_manager.save_telemetry(next_packet()),
+        iterations=min(iterations, 200))
+
+    batches = [packets[i:i + BATCH_SIZE] for i in range(0, len(packets) - BATCH_SIZE + 1, BATCH_SIZE)]
+    next_batch = _cycle(batches)
+    results['save_telemetry_batch'] = _per_packet(measure(
+        lambda: database_manager.save_telemetry_batch(next_batch()),
+        iterations=max(5, iterations // 20), warmup=2), BATCH_SIZE)
+
+    # Raporlar için sabit büyüklükte ayrı bir oturum
+    session_id = database_manager.start_flight_session("report")
+    database_manager.save_telemetry_batch(packets[:records])
+
+    # Oturum kapatılırken çalışan özet hesabı (end_flight_session)
+    results['summarize_session'] = _per_packet(measure(
+        lambda: database_manager.refresh_session_summaries([session_id]),
+        iterations=10, warmup=1), records)
+
+    logger = FlightDataLogger(database_manager)
+    results['generate_flight_report'] = _per_packet(measure(
+        lambda: logger.generate_flight_report(session_id),
+        iterations=10, warmup=1), records)
+
+    # Tamamlanan oturumun raporu diskteki önbellekten okunur
+    database_manager.end_flight_session(session_id)
+    logger.generate_flight_report(session_id)
+    results['generate_flight_report_cached'] = measure(
+        lambda: logger.generate_flight_report(session_id), iterations=10, warmup=1)
+
+    database_manager.end_flight_session()
+    database_manager.close_connection()
+    return results
+
+
+def _bench_gui(packets, iterations):
+    from PySide6.QtWidgets import QApplication
+    from src.ui.charts import ChartsWidget
+    from src.ui.alarm_panel import AlarmPanel
+
+    app = QApplication.instance() or QApplication([])
+    results = {}
+
+    charts = ChartsWidget(start_time=packets[0].timestamp.timestamp())
+    next_packet = _cycle(packets)
+    results['charts_update_data'] = measure(lambda: charts.update_data(next_packet()),
+                                            iterations=iterations)
+
+    alarm_panel = AlarmPanel()
+    next_packet = _cycle(packets)
+    results['alarm_check'] = measure(lambda: alarm_panel.check_telemetry_alarms(next_packet()),
+                                     iterations=iterations)
+
+    try:
+        from src.ui.map_widget import MapWidget
+    except ImportError as e:
+        results['map_update_position'] = {'error': f"QtWebEngine kullanılamıyor: {e}"}
+    else:
+        map_widget = MapWidget()
+        next_packet = _cycle(packets)
+
+        def update_position():
+            gps = next_packet().gps
+            map_widget.update_position(gps.latitude, gps.longitude)
+
+        results['map_update_position'] = measure(update_position, iterations=iterations)
+        map_widget.deleteLater()
+
+    app.processEvents()
+    charts.deleteLater()
+    alarm_panel.deleteLater()
+    return results
+
+
+def _bench_route(waypoints, iterations):
+    from src.utils.flight_utils import WaypointManager
+
+    manager = WaypointManager(None)
+    for i in range(waypoints):
+        manager.add_waypoint(39.9 + random.uniform(-0.05, 0.05),
+                             32.8 + random.uniform(-0.05, 0.05), 100.0)
+
+    timing = measure(manager.calculate_route, iterations=iterations)
+    timing['waypoints'] = waypoints
+    return {'waypoint_calculate_route': timing}
+
+
+def run(records=2000, iterations=500, waypoints=50):
+    from src.telemetry.data_models import TelemetryPacket
+
+    random.seed(3)
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    raw = [_packet_dict(i, start) for i in range(max(records, BATCH_SIZE * 2))]
+    packets = [TelemetryPacket.model_validate(d) for d in raw]
+
+    results = {'records': records}
+    results.update(_bench_packets(raw, iterations))
+    with tempfile.TemporaryDirectory() as workdir:
+        results.update(_bench_database(packets, records, iterations, workdir))
+    results.update(_bench_gui(packets, iterations))
+    results.update(_bench_route(waypoints, iterations))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sıcak yol benchmark'ı")
+    parser.add_argument("--records", type=int, default=2000,
+                        help="Rapor/istatistik oturumundaki kayıt sayısı")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--waypoints", type=int, default=50)
+    args = parser.parse_args()
+
+    results = run(args.records, args.iterations, args.waypoints)
+    print_results("hot_paths", results)
+    print(f"Sonuçlar: {save_results('hot_paths', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# benchmarks/bench_map_update.py
+"""
+Harita güncelleme benchmark'ı: JavaScript ile artımlı güncelleme ve
+her pakette folium HTML'ini yeniden üretme (eski yol) karşılaştırması.
+
+Her güncelleme için uçtan uca gecikme ölçülür:
+- yeni yol: update_position + runJavaScript dönüşü
+- eski yol: update_position + loadFinished
+
+Eski yol, MapWidget'tan bağımsız donmuş bir kopyadır (ilk sürümdeki
+_generate_map: iz folium.PolyLine olarak her pakette sayfaya gömülür);
+MapWidget değiştikçe karşılaştırma tabanı kaymaz.
+
+Kullanım:
+    python benchmarks/bench_map_update.py --updates 50
+"""
+
+import argparse
+import time
+
+from common import ensure_offscreen_qt, print_results, save_results, summarize
+
+ensure_offscreen_qt()
+
+try:
+    import psutil
+except ImportError:  # İsteğe bağlı: alt süreç (QtWebEngineProcess) CPU ölçümü
+    psutil = None
+
+
+def _cpu_seconds():
+    """Bu süreç ve (varsa) alt süreçlerin toplam CPU süresi"""
+    total = time.process_time()
+    if psutil:
+        for child in psutil.Process().children(recursive=True):
+            try:
+                times = child.cpu_times()
+                total += times.user + times.system
+            except psutil.Error:
+                pass
+    return total
+
+
+def _wait(app, done, timeout_s=10.0):
+    """done() doğru olana kadar olay döngüsünü çalıştır"""
+    deadline = time.perf_counter() + timeout_s
+    while not done() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.0005)
+    return done()
+
+
+def _legacy_map_widget_class():
+    """İlk sürümün harita widget'ı (donmuş kopya): her pakette HTML baştan üretilir"""
+    import io
+
+    import folium
+    from PySide6.QtWebEngineWidgets import QWebEngineView
+
+    class LegacyMapWidget(QWebEngineView):
+        def __init__(self, start_lat=39.9, start_lon=32.8, zoom=13):
+            super().__init__()
+            self.start_lat = start_lat
+            self.start_lon = start_lon
+            self.zoom = zoom
+            self.path_points = []
+            self._generate_map(start_lat, start_lon)
+
+        def _generate_map(self, lat, lon):
+            m = folium.Map(location=[lat, lon], zoom_start=self.zoom)
+            folium.Marker(
+                [lat, lon],
+                tooltip=f"İHA Konumu\nLat: {lat:.5f}\nLon: {lon:.5f}",
+                popup=f"Güncel Konum<br>Lat: {lat:.5f}<br>Lon: {lon:.5f}",
+                icon=folium.Icon(color='red', icon='plane')
+            ).add_to(m)
+            if lat != self.start_lat or lon != self.start_lon:
+                folium.Marker(
+                    [self.start_lat, self.start_lon],
+                    tooltip="Başlangıç Noktası",
+                    popup="İHA Başlangıç Noktası",
+                    icon=folium.Icon(color='green', icon='home')
+                ).add_to(m)
+            if len(self.path_points) > 1:
+                folium.PolyLine(self.path_points, color="blue", weight=3, opacity=0.7,
+                                tooltip="İHA Rotası").add_to(m)
+            data = io.BytesIO()
+            m.save(data, close_file=False)
+            self.setHtml(data.getvalue().decode())
+
+        def update_position(self, lat, lon):
+            last = self.path_points[-1] if self.path_points else None
+            if last is None or abs(lat - last[0]) + abs(lon - last[1]) > 0.0001:
+                self.path_points.append([lat, lon])
+                if len(self.path_points) > 100:
+                    self.path_points = self.path_points[-50:]
+            self._generate_map(lat, lon)
+
+    return LegacyMapWidget
+
+
+def run(updates=50):
+    from PySide6.QtWidgets import QApplication
+    from src.ui.map_widget import MapWidget
+
+    app = QApplication.instance() or QApplication([])
+    LegacyMapWidget = _legacy_map_widget_class()
+
+    def bench(widget_cls, incremental):
+        widget = widget_cls()
+        loads = []
+        widget.loadFinished.connect(loads.append)
+        if not _wait(app, lambda: loads):
+            return {'error': 'Harita sayfası yüklenemedi'}
+
+        samples = []
+        cpu_start = _cpu_seconds()
+        wall_start = time.perf_counter()
+
+        for i in range(updates):
+            lat = widget.start_lat + i * 0.0002
+            lon = widget.start_lon + i * 0.0002
+            t0 = time.perf_counter_ns()
+
+            if incremental:
+                replies = []
+                widget.update_position(lat, lon)
+                widget._flush_updates()
+                widget.page().runJavaScript("1", 0, replies.append)
+                _wait(app, lambda: replies)
+            else:
+                expected = len(loads) + 1
+                widget.update_position(lat, lon)
+                _wait(app, lambda: len(loads) >= expected)
+
+            samples.append(time.perf_counter_ns() - t0)
+
+        result = summarize(samples)
+        result['wall_s'] = time.perf_counter() - wall_start
+        result['cpu_s'] = _cpu_seconds() - cpu_start
+        result['includes_child_cpu'] = psutil is not None
+        widget.deleteLater()
+        return result
+
+    return {
+        'legacy_regenerate_html': bench(LegacyMapWidget, incremental=False),
+        'incremental_javascript': bench(MapWidget, incremental=True)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Harita güncelleme benchmark'ı")
+    parser.add_argument("--updates", type=int, default=50)
+    args = parser.parse_args()
+
+    try:
+        results = run(args.updates)
+    except ImportError as e:
+        print(f"QtWebEngine kullanılamıyor, benchmark atlandı: {e}")
+        return
+
+    print_results("map_update", results)
+    print(f"Sonuçlar: {save_results('map_update', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# benchmarks/bench_missions.py
+"""
+Görev kaydetme/yükleme (DatabaseManager.save_mission, load_mission) benchmark'ı
+
+Geçici veritabanında ~5000 noktalı tarama görevi üzerinde:
+
+- add_each: her waypoint için ayrı işlem ve commit (add_waypoint, eski yol)
+- save_bulk: görevin tamamı tek işlemde executemany ile
+- resave_reordered: sırası değişmiş görevin upsert ile yerinde güncellenmesi
+- load: görevin sırasıyla okunması
+- panel_load: WaypointPanel listesinin yüklenen görevle yeniden kurulması
+- delete: görevin silinmesi
+- survey_grid: L biçimli ~2 km'lik alan için tarama ızgarası (~90 bin nokta)
+- export_plan / import_plan, export_wpl / import_wpl: ızgaranın QGroundControl
+  .plan ve MAVLink WPL dosyasına yazılıp okunması
+- tracker_build: ızgara rotası için MissionTracker bacak geometrisi
+- tracker_update: rota boyunca (gürültülü) uçuşta paket başına ilerleme
+  güncellemesi; tracker_nearest_leg: her pakette tüm bacaklara en yakın
+  bacak araması (NumPy, karşılaştırma için)
+
+Kullanım:
+    python benchmarks/bench_missions.py --waypoints 5000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from common import ensure_offscreen_qt, measure, print_results, save_results
+
+ensure_offscreen_qt()
+
+# İçbükey (L) tarama alanı; 20x15 m kare, %75/%65 bindirme
+SURVEY_AREA = [(39.9, 32.8), (39.9, 32.82), (39.905, 32.82), (39.905, 32.81),
+               (39.92, 32.81), (39.92, 32.8)]
+
+
+def _survey(count):
+    """Kalkış + satır satır tarama noktaları + iniş"""
+    side = max(1, int(count ** 0.5))
+    points = [{'latitude': 39.9 + (i // side) * 1e-4,
+               'longitude': 32.8 + (i % side if (i // side) % 2 == 0 else side - 1 - i % side) * 1e-4,
+               'altitude': 80.0} for i in range(count - 2)]
+    return ([{'latitude': 39.9, 'longitude': 32.8, 'altitude': 0.0, 'action_type': 'TAKEOFF'}] +
+            points + [{'latitude': 39.9, 'longitude': 32.8, 'altitude': 0.0, 'action_type': 'LAND'}])
+
+
+def _timed(func, count):
+    t0 = time.perf_counter()
+    func()
+    wall = time.perf_counter() - t0
+    return {'wall_s': wall, 'waypoints_per_s': count / wall}
+
+
+def run(waypoints=5000, legacy_waypoints=500):
+    from PySide6.QtWidgets import QApplication
+    from src.database.database_manager import DatabaseManager
+    from src.ui.waypoint_panel import WaypointPanel
+    from src.utils.flight_utils import WaypointManager
+
+    app = QApplication.instance() or QApplication([])
+    survey = _survey(waypoints)
+    results = {'waypoints': len(survey)}
+    with tempfile.TemporaryDirectory() as workdir:
+        database = DatabaseManager(os.path.join(workdir, "missions.db"))
+
+        legacy = WaypointManager(database)
+        legacy.current_mission = "Legacy"
+        results['add_each'] = _timed(
+            lambda: [legacy.add_waypoint(wp['latitude'], wp['longitude'], wp['altitude'])
+                     for wp in survey[:legacy_waypoints]], legacy_waypoints)
+
+        manager = WaypointManager(database)
+        manager.current_mission = "Survey"
+        manager.add_waypoints(survey)  # Yalnızca liste; veritabanı aşağıda baştan yazılır
+        database.delete_mission("Survey")
+        results['save_bulk'] = _timed(manager.save_mission, len(survey))
+        results['save_bulk']['speedup_vs_add_each'] = (
+            results['save_bulk']['waypoints_per_s'] / results['add_each']['waypoints_per_s'])
+
+        manager.waypoints = manager.waypoints[:1] + manager.waypoints[-2:0:-1] + manager.waypoints[-1:]
+        results['resave_reordered'] = _timed(manager.save_mission, len(survey))
+
+        results['load'] = measure(lambda: database.load_mission("Survey"), iterations=20, warmup=2)
+        panel = WaypointPanel(database)
+        results['panel_load'] = measure(lambda: panel.load_mission("Survey"), iterations=5, warmup=1)
+        app.processEvents()
+
+        results['delete'] = _timed(lambda: database.delete_mission("Survey"), len(survey))
+        database.close_connection()
+
+        _survey_files(results, workdir)
+    return results
+
+
+def _survey_files(results, workdir):
+    from src.services.mission_files import read_mission, write_mission
+    from src.utils.survey_grid import grid_waypoints, survey_grid
+
+    results['survey_grid'] = measure(lambda: survey_grid(SURVEY_AREA, (20, 15), angle_deg=30),
+                                     iterations=20, warmup=2)
+    lats, lons = survey_grid(SURVEY_AREA, (20, 15), angle_deg=30)
+    results['survey_grid']['points'] = len(lats)
+    grid = grid_waypoints(lats, lons, 80.0)
+    for fmt, extension in (('plan', '.plan'), ('wpl', '.waypoints')):
+        path = os.path.join(workdir, f"survey{extension}")
+        results[f'export_{fmt}'] = _timed(lambda: write_mission(path, grid), len(grid))
+        results[f'import_{fmt}'] = _timed(lambda: sum(1 for _ in read_mission(path)), len(grid))
+    _tracking(results, grid, lats, lons)
+
+
+def _tracking(results, grid, lats, lons, steps_per_leg=1, nearest_packets=200):
+    import numpy as np
+    from src.core.utils import local_xy
+    from src.services.mission_tracker import MissionTracker
+
+    results['tracker_build'] = _timed(lambda: MissionTracker(grid), len(grid))
+
+    # Bacak başına steps_per_leg konum, ~3 m gürültü
+    rng = np.random.default_rng(3)
+    t = np.arange((len(lats) - 1) * steps_per_leg) / steps_per_leg
+    leg, frac = t.astype(int), t % 1
+    flight_lats = lats[leg] + (lats[leg + 1] - lats[leg]) * frac + rng.normal(0, 3e-5, len(t))
+    flight_lons = lons[leg] + (lons[leg + 1] - lons[leg]) * frac + rng.normal(0, 3e-5, len(t))
+    positions = list(zip(flight_lats.tolist(), flight_lons.tolist()))
+
+    tracker = MissionTracker(grid)
+
+    def fly():
+        for lat, lon in positions:
+            tracker.update(lat, lon, 12.0)
+    results['tracker_update'] = _packet_rate(fly, len(positions))
+    results['tracker_update']['completed'] = tracker.completed
+
+    # Eski yaklaşım: her pakette tüm bacak parçalarına uzaklık
+    x, y = local_xy(lats, lons, lats[0], lons[0])
+    ax, ay, bx, by = x[:-1], y[:-1], x[1:], y[1:]
+    dx, dy = bx - ax, by - ay
+    length2 = np.maximum(dx * dx + dy * dy, 1e-9)
+    px_all, py_all = local_xy(flight_lats, flight_lons, lats[0], lons[0])
+
+    def nearest_leg():
+        for px, py in zip(px_all[:nearest_packets], py_all[:nearest_packets]):
+            u = np.clip(((px - ax) * dx + (py - ay) * dy) / length2, 0, 1)
+            int(np.argmin(np.hypot(ax + u * dx - px, ay + u * dy - py)))
+    results['tracker_nearest_leg'] = _packet_rate(nearest_leg, nearest_packets)
+    update, nearest = results['tracker_update'], results['tracker_nearest_leg']
+    update['speedup_vs_nearest_leg'] = nearest['us_per_packet'] / update['us_per_packet']
+
+
+def _packet_rate(func, count):
+    t0 = time.perf_counter()
+    func()
+    wall = time.perf_counter() - t0
+    return {'wall_s': wall, 'packets': count, 'us_per_packet': wall / count * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Görev kaydetme/yükleme benchmark'ı")
+    parser.add_argument("--waypoints", type=int, default=5000)
+    parser.add_argument("--legacy-waypoints", type=int, default=500,
+                        help="Tek tek commit yolu için nokta sayısı")
+    args = parser.parse_args()
+
+    results = run(args.waypoints, args.legacy_waypoints)
+    print_results("missions", results)
+    print(f"Hızlanma (toplu / tek tek kayıt): {results['save_bulk']['speedup_vs_add_each']:.0f}x")
+    tracking = results['tracker_update']
+    print(f"Görev takibi: {tracking['us_per_packet']:.1f} µs/paket "
+          f"(en yakın bacak aramasından {tracking['speedup_vs_nearest_leg']:.0f}x hızlı)")
+    print(f"Sonuçlar: {save_results('missions', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_route_optimizer.py
+"""
+Görev rotası sıralama (src/utils/route_optimizer.py) benchmark'ı
+
+~5 km x 5 km alana rastgele dağıtılmış ara noktalar, kalkış ve iniş
+noktası sabit olacak şekilde WaypointManager.optimize_route ile sıralanır.
+Her boyut için süre, kısalan mesafe ve bütçe içinde yakınsama raporlanır;
+karıştırılmış ızgara ek olarak yılan (serpentine) tarama rotasıyla karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_route_optimizer.py --sizes 200 2000 5000 --budget 1.0
+"""
+
+import argparse
+import random
+import time
+
+from common import print_results, save_results
+
+AREA_DEG = 0.045  # ~5 km
+HOME = (39.9, 32.8)
+
+
+def _manager(points):
+    from src.utils.flight_utils import WaypointManager
+
+    manager = WaypointManager(None)
+    manager.add_waypoint(*HOME, 0, action_type='TAKEOFF')
+    for lat, lon in points:
+        manager.add_waypoint(lat, lon, 100)
+    manager.add_waypoint(HOME[0], HOME[1] + 0.0005, 0, action_type='LAND')
+    return manager
+
+
+def _timed(points, budget):
+    manager = _manager(points)
+    t0 = time.perf_counter()
+    report = manager.optimize_route(time_budget_s=budget)
+    wall = time.perf_counter() - t0
+    return {
+        'waypoints': len(manager.waypoints),
+        'wall_s': wall,
+        'original_km': report['original_distance'] / 1000.0,
+        'optimized_km': report['optimized_distance'] / 1000.0,
+        'saved_ratio': report['distance_saved'] / report['original_distance'],
+        'passes': report['passes'],
+        'converged': report['converged'],
+    }
+
+
+def run(sizes=(200, 2000, 5000), budget=1.0, grid=30):
+    rng = random.Random(3)
+    results = {'budget_s': budget}
+    for size in sizes:
+        points = [(HOME[0] + rng.uniform(0, AREA_DEG), HOME[1] + rng.uniform(0, AREA_DEG))
+                  for _ in range(size)]
+        results[f'random_{size}'] = _timed(points, budget)
+
+    # Izgara: satır satır yılan gibi dolaşan rota referans alınır
+    serpentine = [(HOME[0] + r * 0.001, HOME[1] + c * 0.001)
+                  for r in range(grid) for c in (range(grid) if r % 2 == 0 else reversed(range(grid)))]
+    reference_km = _manager(serpentine).calculate_route()['total_distance'] / 1000.0
+    cells = serpentine[:]
+    rng.shuffle(cells)
+    results['grid'] = _timed(cells, budget)
+    results['grid']['serpentine_ratio'] = results['grid']['optimized_km'] / reference_km
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rota sıralama benchmark'ı")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 2000, 5000])
+    parser.add_argument("--budget", type=float, default=1.0, help="Süre bütçesi (s)")
+    parser.add_argument("--grid", type=int, default=30, help="Izgara kenarı (nokta)")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.budget, args.grid)
+    print_results("route_optimizer", results)
+    print(f"Sonuçlar: {save_results('route_optimizer', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# benchmarks/bench_spatial_index.py
+"""
+Uçuş izi mekânsal indeksi (src/database/track_index.py) benchmark'ı
+
+Geçici dizinde ~1°x1°'lik bölgede rastgele yürüyüş izlerinden oluşan
+sentetik bir veritabanı kurulur; "bu alandan hangi uçuşlar geçti?"
+sorusu farklı yollarla cevaplanır:
+
+- build_index: tüm oturumların parça kutuları + R*Tree (toplu doldurma)
+- python_scan: tüm enlem/boylamları okuyup NumPy ile süzme (eski yöntem)
+- sql_scan: telemetry_records üzerinde BETWEEN ile tam tablo taraması
+- rtree_sessions: yalnızca oturum kutuları (find_session_ids_in_bbox)
+- rtree_bbox_coarse / rtree_bbox_exact: parça aralıkları, kesin süzme
+- rtree_radius_exact: nokta + yarıçap sorgusu
+
+Kullanım:
+    python benchmarks/bench_spatial_index.py --fixes 10000000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from common import measure, print_results, save_results
+
+REGION = (39.5, 32.5)  # Bölgenin güneybatı köşesi; 1°x1°
+QUERY_SIZE_DEG = 0.005  # ~500 m kare sorgu alanı
+
+
+def build_database(path, fixes, records_per_session):
+    """Sentetik veritabanı: 1 Hz, oturum başına records_per_session konum"""
+    import numpy as np
+    from src.database.database_manager import DatabaseManager
+
+    DatabaseManager(path).close_connection()  # Şema, indeksler ve R*Tree tabloları
+    rng = np.random.default_rng(11)
+    sessions = max(1, fixes // records_per_session)
+    start = datetime(2026, 1, 1, 6, 0, 0)
+
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA synchronous = OFF")
+    connection.execute("PRAGMA journal_mode = MEMORY")
+    with connection:
+        for s in range(sessions):
+            t0 = start + timedelta(hours=2 * s)
+            connection.execute(
+                "INSERT INTO flight_sessions (session_name, start_time, end_time, status) "
+                "VALUES (?, ?, ?, 'COMPLETED')",
+                (f"Track_{s:05d}", t0.isoformat(sep=' '),
+                 (t0 + timedelta(seconds=records_per_session)).isoformat(sep=' ')))
+            session_id = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+            # ~15 m/s rastgele yürüyüş, bölge sınırlarında yansır
+            steps = rng.normal(0, 1e-4, (records_per_session, 2))
+            track = np.cumsum(steps, axis=0) + rng.uniform(0.1, 0.9, 2)
+            track = np.abs(((track + 1) % 2) - 1) + REGION
+            altitude = 100 + 30 * np.sin(np.arange(records_per_session) / 200.0)
+            times = [(t0 + timedelta(seconds=i)).isoformat(sep=' ')
+                     for i in range(records_per_session)]
+            connection.executemany(
+                "INSERT INTO telemetry_records (session_id, timestamp, latitude, longitude, "
+                "altitude, velocity, battery_percent, status) VALUES (?, ?, ?, ?, ?, 15.0, ?, 'ARMED')",
+                zip([session_id] * records_per_session, times, track[:, 0].tolist(),
+                    track[:, 1].tolist(), altitude.tolist(),
+                    np.linspace(100, 40, records_per_session).tolist()))
+    connection.close()
+    return sessions
+
+
+def _python_scan(database, bbox):
+    import numpy as np
+
+    min_lat, min_lon, max_lat, max_lon = bbox
+    with database.engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            "SELECT session_id, latitude, longitude FROM telemetry_records").fetchall()
+    data = np.array([tuple(row) for row in rows], dtype=float)
+    mask = ((data[:, 1] >= min_lat) & (data[:, 1] <= max_lat) &
+            (data[:, 2] >= min_lon) & (data[:, 2] <= max_lon))
+    return sorted(set(data[mask, 0].astype(int).tolist()))
+
+
+def _sql_scan(database, bbox):
+    with database.engine.connect() as connection:
+        return [row[0] for row in connection.exec_driver_sql(
+            "SELECT DISTINCT session_id FROM telemetry_records "
+            "WHERE latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ? ORDER BY session_id",
+            (bbox[0], bbox[2], bbox[1], bbox[3]))]
+
+
+def _throughput(timing, points):
+    timing['points_per_s'] = points / timing['wall_s']
+    return timing
+
+
+def run(fixes=1000000, records_per_session=3600, queries=50, scan_repeats=1):
+    from src.database.database_manager import DatabaseManager
+
+    random.seed(5)
+    boxes = []
+    for _ in range(queries):
+        lat = REGION[0] + random.uniform(0.1, 0.9)
+        lon = REGION[1] + random.uniform(0.1, 0.9)
+        boxes.append((lat, lon, lat + QUERY_SIZE_DEG, lon + QUERY_SIZE_DEG))
+    cycle = {'i': 0}
+
+    def next_box():
+        cycle['i'] = (cycle['i'] + 1) % len(boxes)
+        return boxes[cycle['i']]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "spatial.db")
+        t0 = time.perf_counter()
+        sessions = build_database(db_path, fixes, records_per_session)
+        results.update(fixes=sessions * records_per_session, sessions=sessions,
+                       build_database_s=time.perf_counter() - t0)
+        fixes = results['fixes']
+
+        database = DatabaseManager(db_path)
+        results['spatial_index'] = database.spatial_index
+        t0 = time.perf_counter()
+        database.backfill_track_index(rebuild=True)
+        results['build_index'] = _throughput({'wall_s': time.perf_counter() - t0}, fixes)
+
+        # Doğrulama: indeks tam taramayla aynı oturumları bulmalı
+        mismatches = sum(
+            [r['session_id'] for r in database.find_sessions_in_bbox(*box)] != _sql_scan(database, box)
+            for box in boxes[:10])
+        results['mismatches'] = mismatches
+
+        results['python_scan'] = measure(lambda: _python_scan(database, next_box()),
+                                         iterations=scan_repeats, warmup=0)
+        results['sql_scan'] = measure(lambda: _sql_scan(database, next_box()),
+                                      iterations=scan_repeats, warmup=0)
+        results['rtree_sessions'] = measure(
+            lambda: database.find_session_ids_in_bbox(*next_box()), iterations=queries, warmup=2)
+        results['rtree_bbox_coarse'] = measure(
+            lambda: database.find_sessions_in_bbox(*next_box(), exact=False),
+            iterations=queries, warmup=2)
+        results['rtree_bbox_exact'] = measure(
+            lambda: database.find_sessions_in_bbox(*next_box()), iterations=queries, warmup=2)
+        results['rtree_radius_exact'] = measure(
+            lambda: database.find_sessions_near(*next_box()[:2], radius_m=250.0),
+            iterations=queries, warmup=2)
+        results['rtree_bbox_exact']['speedup_vs_sql_scan'] = (
+            results['sql_scan']['mean_us'] / results['rtree_bbox_exact']['mean_us'])
+        database.close_connection()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mekânsal indeks benchmark'ı")
+    parser.add_argument("--fixes", type=int, default=1000000)
+    parser.add_argument("--records-per-session", type=int, default=3600)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    results = run(args.fixes, args.records_per_session, args.queries)
+    print_results("spatial_index", results)
+    print(f"Hızlanma (kesin bbox / SQL tarama): "
+          f"{results['rtree_bbox_exact']['speedup_vs_sql_scan']:.0f}x")
+    print(f"Sonuçlar: {save_results('spatial_index', results)}")
+
+
+if __name__ == "__main__":
+    main()
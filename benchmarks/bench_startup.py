@@ -0,0 +1,173 @@
+# benchmarks/bench_startup.py
+"""
+Başlangıç benchmark'ı: headless kaydedici ve GUI süreçlerinin açılış
+süresi ve bellek kullanımı (RSS) karşılaştırması
+
+Her mod ayrı bir alt süreçte ölçülür (import önbelleği paylaşılmasın):
+- headless: import süresi, ilk paketin veritabanına yazılma süresi
+- gui: import süresi, ilk pencere çizimi ve ilk telemetrinin gösterilmesi
+
+Eşik verilirse (saniye) medyan değer eşiği aşınca çıkış kodu 1 olur:
+    python benchmarks/bench_startup.py --max-first-paint 1.5 --max-first-telemetry 3.0
+
+Kullanım:
+    python benchmarks/bench_startup.py --runs 3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import PROJECT_ROOT, save_results
+
+
+def _peak_rss_mb():
+    # Linux: VmHWM yalnızca bu sürecin tepe değeridir (ru_maxrss, fork edildiği
+    # üst sürecin belleğini de içerebilir)
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta byte
+    return usage / (1024.0 * 1024.0) if sys.platform == 'darwin' else usage / 1024.0
+
+
+def _child_headless(t0):
+    from src.telemetry.recorder import HeadlessRecorder
+    from src.database.database_manager import DatabaseManager
+    from src.utils.flight_utils import AlertManager
+    import_s = time.perf_counter() - t0
+
+    db_path = os.path.join(tempfile.mkdtemp(), "startup.db")
+    database_manager = DatabaseManager(db_path)
+    recorder = HeadlessRecorder(database_manager, AlertManager(database_manager),
+                                sample_rate=50.0, flush_rate=20.0, metrics_interval_s=0)
+    recorder.start()
+    while recorder.first_packet_saved_s is None and time.perf_counter() - t0 < 30:
+        time.sleep(0.001)
+    first_packet_s = time.perf_counter() - t0
+    recorder.stop()
+
+    return {'import_s': import_s, 'first_telemetry_s': first_packet_s,
+            'peak_rss_mb': _peak_rss_mb(),
+            'gui_modules_loaded': [m for m in ('PySide6', 'folium', 'pyqtgraph')
+                                   if m in sys.modules]}
+
+
+def _child_gui(t0):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent
+    from src.ui.main_window import MainWindow
+    import_s = time.perf_counter() - t0
+
+    app = QApplication.instance() or QApplication([])
+    marks = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and 'first_paint_s' not in marks:
+                marks['first_paint_s'] = time.perf_counter() - t0
+            return False
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+
+    window = MainWindow()
+    window.show()
+    initial_text = window.telemetry_label.text()
+
+    while time.perf_counter() - t0 < 30:
+        app.processEvents()
+        if 'first_paint_s' in marks and window.telemetry_label.text() != initial_text:
+            marks['first_telemetry_s'] = time.perf_counter() - t0
+            break
+        time.sleep(0.001)
+
+    window.close()
+    return dict(import_s=import_s, peak_rss_mb=_peak_rss_mb(), **marks)
+
+
+def _run_child(mode):
+    """Alt süreci başlat, sonuç JSON'unu oku"""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    start = time.perf_counter()
+    # Geçici dizinde çalış: GUI'nin veritabanı ve karo önbelleği depoya yazılmasın
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode],
+                          capture_output=True, text=True, cwd=tempfile.mkdtemp(), env=env,
+                          timeout=120)
+    wall = time.perf_counter() - start
+
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("RESULT "):
+            result = json.loads(line[len("RESULT "):])
+            result['process_wall_s'] = wall
+            return result
+    return {'error': (proc.stderr.strip().splitlines() or ["bilinmeyen hata"])[-1]}
+
+
+def run(runs=3, modes=('headless', 'gui')):
+    results = {}
+    for mode in modes:
+        samples = [_run_child(mode) for _ in range(runs)]
+        ok = [s for s in samples if 'error' not in s]
+        if not ok:
+            results[mode] = samples[0]
+            continue
+        summary = {'runs': len(ok)}
+        for key in ok[0]:
+            values = [s[key] for s in ok if isinstance(s.get(key), (int, float))]
+            if values:
+                summary[key] = sorted(values)[len(values) // 2]  # Medyan
+        summary['gui_modules_loaded'] = ok[0].get('gui_modules_loaded')
+        results[mode] = summary
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başlangıç benchmark'ı")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--modes", nargs="+", default=['headless', 'gui'])
+    parser.add_argument("--max-first-paint", type=float, default=None,
+                        help="GUI ilk çizim eşiği (s)")
+    parser.add_argument("--max-first-telemetry", type=float, default=None,
+                        help="İlk telemetri gösterimi/kaydı eşiği (s)")
+    parser.add_argument("--child", choices=['headless', 'gui'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        t0 = time.perf_counter()
+        child = _child_headless if args.child == 'headless' else _child_gui
+        print("RESULT " + json.dumps(child(t0)), flush=True)
+        return
+
+    results = run(args.runs, args.modes)
+    print("\n=== startup ===")
+    for mode, values in results.items():
+        print(f"  {mode}: {values}")
+    print(f"Sonuçlar: {save_results('startup', results)}")
+
+    # Regresyon eşikleri
+    failures = []
+    for mode, values in results.items():
+        for key, limit in (('first_paint_s', args.max_first_paint),
+                           ('first_telemetry_s', args.max_first_telemetry)):
+            if limit is not None and key in values and values[key] > limit:
+                failures.append(f"{mode}.{key} = {values[key]:.3f}s > {limit:.3f}s")
+    if failures:
+        print("❌ Başlangıç regresyonu:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
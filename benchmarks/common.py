@@ -0,0 +1,152 @@
+# benchmarks/common.py
+"""
+Benchmark yardımcıları: zamanlama, özetleme ve JSON sonuç kaydı
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Proje kök dizinini Python path'ine ekle
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+BASELINE_DIR = PROJECT_ROOT / "benchmarks" / "baselines"
+
+# Karşılaştırılan metrikler: True ise küçük değer daha iyi
+COMPARED_METRICS = {
+    'p50_us': True,
+    'per_packet_us': True,
+    'first_paint_s': True,
+    'first_telemetry_s': True,
+    'rules_per_s': False,
+    'points_per_s': False,
+    'sessions_per_s': False,
+}
+
+
+def summarize(samples_ns: List[int]) -> Dict:
+    """Nanosaniye örneklerinden µs cinsinden özet istatistik"""
+    if not samples_ns:
+        return {'count': 0}
+
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+
+    def percentile(p):
+        return ordered[min(count - 1, int(p / 100.0 * count))] / 1000.0
+
+    return {
+        'count': count,
+        'mean_us': sum(ordered) / count / 1000.0,
+        'p50_us': percentile(50),
+        'p95_us': percentile(95),
+        'p99_us': percentile(99),
+        'max_us': ordered[-1] / 1000.0
+    }
+
+
+def measure(func: Callable, iterations: int = 1000, warmup: int = 10) -> Dict:
+    """Fonksiyonu tekrar tekrar çalıştırıp gecikme ve CPU süresini ölç"""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    for _ in range(iterations):
+        t0 = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - t0)
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    result = summarize(samples)
+    result['wall_s'] = wall
+    result['cpu_s'] = cpu
+    result['ops_per_s'] = iterations / wall if wall > 0 else 0.0
+    return result
+
+
+def ensure_offscreen_qt():
+    """Qt'yi ekransız (offscreen) platformda çalıştır"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def save_results(name: str, results: Dict, output_dir: Path = RESULTS_DIR) -> Path:
+    """Sonuçları JSON olarak kaydet"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    payload = {
+        'benchmark': name,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+
+    path = output_dir / f"{name}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def print_results(name: str, results: Dict):
+    """Sonuçları okunabilir biçimde yazdır"""
+    print(f"\n=== {name} ===")
+    for case, values in results.items():
+        if not isinstance(values, dict):
+            print(f"  {case}: {values}")
+            continue
+        if 'error' in values:
+            print(f"  {case}: atlandı ({values['error']})")
+            continue
+        parts = []
+        for key in ('mean_us', 'p50_us', 'p95_us', 'ops_per_s', 'cpu_s',
+                    'first_paint_s', 'first_telemetry_s', 'peak_rss_mb',
+                    'wall_s', 'sessions_per_s', 'speedup'):
+            if key in values:
+                parts.append(f"{key}={values[key]:.2f}")
+        print(f"  {case}: " + ", ".join(parts))
+
+
+def load_baseline(name: str, baseline_dir: Path = BASELINE_DIR) -> Optional[Dict]:
+    """Kayıtlı referans (baseline) sonuçlarını oku; yoksa None"""
+    path = Path(baseline_dir) / f"{name}.json"
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('results', {})
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float = 0.25) -> List[Dict]:
+    """Sonuçları referansla karşılaştır
+
+    Her durum (case) için COMPARED_METRICS'teki metrikler incelenir;
+    değişim oranı threshold'u kötü yönde aşarsa 'regression' işaretlenir.
+    """
+    comparisons = []
+    for case, values in current.items():
+        reference = baseline.get(case)
+        if not isinstance(values, dict) or not isinstance(reference, dict):
+            continue
+        for metric, lower_is_better in COMPARED_METRICS.items():
+            new, old = values.get(metric), reference.get(metric)
+            if not isinstance(new, (int, float)) or not isinstance(old, (int, float)) or old <= 0:
+                continue
+            change = (new - old) / old
+            worse = change if lower_is_better else -change
+            comparisons.append({
+                'case': case, 'metric': metric, 'baseline': old, 'current': new,
+                'change': change, 'regression': worse > threshold
+            })
+    return comparisons
@@ -0,0 +1,92 @@
+# benchmarks/run_all.py
+"""
+Benchmark paketi çalıştırıcı: tüm benchmark'ları çalıştırır, sonuçları
+JSON olarak kaydeder ve kayıtlı referansla (benchmarks/baselines/) karşılaştırır.
+
+Karşılaştırılan metrikler common.COMPARED_METRICS'te tanımlıdır; herhangi
+biri eşikten (varsayılan %25) fazla kötüleşirse çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/run_all.py                       # Tümü, referansla karşılaştır
+    python benchmarks/run_all.py --only hot_paths --threshold 0.5
+    python benchmarks/run_all.py --update-baseline     # Referansı güncelle
+"""
+
+import argparse
+import importlib
+import sys
+
+from common import (BASELINE_DIR, RESULTS_DIR, compare_results, ensure_offscreen_qt,
+                    load_baseline, print_results, save_results)
+
+ensure_offscreen_qt()
+
+# Paket adı -> (modül, run() parametreleri). Boyutlar, paketin tamamı
+# birkaç dakikada bitecek şekilde seçilmiştir.
+SUITES = {
+    'hot_paths': ('bench_hot_paths', {'records': 2000, 'iterations': 500}),
+    'alert_rules': ('bench_alert_rules', {'packets': 5000, 'samples': 200000}),
+    'geofence': ('bench_geofence', {'fence_count': 500, 'points': 5000}),
+    'geodesy': ('bench_geodesy', {'points': 1000000, 'repeats': 3}),
+    'fleet_reports': ('bench_fleet_reports', {'sessions': 200, 'records': 1000}),
+    'spatial_index': ('bench_spatial_index', {'fixes': 1000000, 'queries': 50}),
+    'route_optimizer': ('bench_route_optimizer', {'sizes': [200, 2000, 5000], 'budget': 1.0}),
+    'missions': ('bench_missions', {'waypoints': 5000}),
+    'map_update': ('bench_map_update', {'updates': 20}),
+    'startup': ('bench_startup', {'runs': 3}),
+}
+
+
+def run_suite(name: str) -> dict:
+    module_name, kwargs = SUITES[name]
+    try:
+        return importlib.import_module(module_name).run(**kwargs)
+    except ImportError as e:
+        return {'error': f"Bağımlılık eksik: {e}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark paketi")
+    parser.add_argument("--only", nargs="+", choices=list(SUITES), default=list(SUITES))
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="İzin verilen kötüleşme oranı (0.25 = %%25)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Sonuçları yeni referans olarak kaydet")
+    parser.add_argument("--baseline-dir", default=str(BASELINE_DIR))
+    parser.add_argument("--output-dir", default=str(RESULTS_DIR))
+    args = parser.parse_args()
+
+    regressions = []
+    for name in args.only:
+        results = run_suite(name)
+        print_results(name, results)
+        if 'error' in results:
+            continue
+
+        print(f"Sonuçlar: {save_results(name, results, args.output_dir)}")
+
+        if args.update_baseline:
+            print(f"Referans güncellendi: {save_results(name, results, args.baseline_dir)}")
+            continue
+
+        baseline = load_baseline(name, args.baseline_dir)
+        if baseline is None:
+            print("  Referans yok (--update-baseline ile oluşturun)")
+            continue
+
+        for c in compare_results(results, baseline, args.threshold):
+            mark = "❌" if c['regression'] else "  "
+            print(f"  {mark} {c['case']}.{c['metric']}: {c['baseline']:.3f} -> "
+                  f"{c['current']:.3f} ({c['change']:+.1%})")
+            if c['regression']:
+                regressions.append(f"{name}.{c['case']}.{c['metric']} {c['change']:+.1%}")
+
+    if regressions:
+        print(f"\n❌ Performans regresyonu (eşik {args.threshold:.0%}):\n  " +
+              "\n  ".join(regressions))
+        sys.exit(1)
+    print("\n✅ Regresyon yok")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,11 @@ sys.path.insert(0, current_dir)
 project_name = "Uav_telemetry_imaging_system"
 sys.path.insert(0, os.path.join(current_dir, project_name))
 
-from src.ui.main_window import main
-
 if __name__ == "__main__":
-    main()
+    if "--headless" in sys.argv[1:]:
+        # GUI modülleri (PySide6, QtWebEngine, folium) hiç import edilmez
+        from src.telemetry.recorder import main as headless_main
+        headless_main(sys.argv[1:])
+    else:
+        from src.ui.main_window import main
+        main()
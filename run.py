@@ -3,7 +3,11 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.ui.main_window import main
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--headless" in sys.argv[1:]:
+        # GUI modülleri (PySide6, QtWebEngine, folium) hiç import edilmez
+        from src.telemetry.recorder import main as headless_main
+        headless_main(sys.argv[1:])
+    else:
+        from src.ui.main_window import main
+        main()
\ No newline at end of file
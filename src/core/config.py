@@ -0,0 +1,236 @@
+# src/core/config.py
+"""
+Merkezi performans ayarları
+
+Hızlar, tampon boyutları ve yollar tek bir tipli yapılandırmada toplanır
+ve her alt sisteme kurucu parametreleriyle verilir. Değerler şu sırayla
+birleştirilir (sonraki öncekini ezer):
+
+    1. Profil (desktop / laptop / headless)
+    2. Yapılandırma dosyası (JSON; PyYAML kuruluysa .yaml/.yml da)
+    3. Ortam değişkenleri: UAV__<BÖLÜM>__<ALAN>=değer
+
+Dosya yolu UAV_CONFIG, profil UAV_PROFILE ile de seçilebilir.
+
+Örnek:
+    UAV_PROFILE=laptop UAV__CHARTS__MAX_POINTS=60 python run.py
+"""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+ENV_PREFIX = 'UAV__'
+DEFAULT_PROFILE = 'desktop'
+
+
+class _Section(BaseModel):
+    # Yazım hatası olan anahtarlar sessizce yok sayılmasın
+    model_config = ConfigDict(extra='forbid')
+
+
+class TelemetryConfig(_Section):
+    sample_rate_hz: float = Field(1.0, gt=0)          # Simülasyon üretim hızı
+    display_rate_hz: float = Field(30.0, gt=0)        # GUI'ye batch gönderim hızı
+    error_backoff_s: float = Field(1.0, ge=0)         # Hata sonrası bekleme
+    mavlink_poll_interval_s: float = Field(1.0, gt=0)  # MAVLink alım/simülasyon aralığı
+
+
+class DatabaseConfig(_Section):
+    path: str = "iha_telemetry.db"
+    flush_rate_hz: float = Field(5.0, gt=0)           # Headless yazıcı hızı
+    max_queue: int = Field(10000, ge=1)
+    report_workers: int = Field(0, ge=0)              # Filo raporu süreçleri (0: işlemci sayısı)
+
+
+class AlertConfig(_Section):
+    rules_file: Optional[str] = None                  # None: varsayılan kurallar
+    thresholds: Dict[str, float] = Field(default_factory=dict)  # Kural tipi -> eşik (ezme)
+    geofences_file: Optional[str] = None
+    off_route_m: float = Field(25.0, gt=0)            # Görev rotasından sapma alarmı
+    off_route_clear_m: Optional[float] = None         # None: off_route_m * 0.8
+    panel_capacity: int = Field(200, ge=1)
+    coalesce_window_s: float = Field(5.0, ge=0)
+    flush_interval_s: float = Field(0.5, gt=0)
+    max_batch: int = Field(500, ge=1)
+    max_queue: int = Field(10000, ge=1)
+
+    def build_rules(self) -> List:
+        """Kuralları yükle ve eşik ezmelerini uygula"""
+        from src.services.alerts import load_rules
+
+        rules = load_rules(self.rules_file)
+        unknown = set(self.thresholds) - {rule.type for rule in rules}
+        if unknown:
+            raise ValueError(f"Bilinmeyen alarm tipi: {', '.join(sorted(unknown))}")
+        return [rule.model_copy(update={'threshold': self.thresholds[rule.type]})
+                if rule.type in self.thresholds else rule for rule in rules]
+
+    def writer_options(self) -> Dict:
+        """AlertWriter kurucu parametreleri"""
+        return {
+            'coalesce_window_s': self.coalesce_window_s,
+            'flush_interval_s': self.flush_interval_s,
+            'max_batch': self.max_batch,
+            'max_queue': self.max_queue
+        }
+
+
+class ChartsConfig(_Section):
+    max_points: int = Field(100, ge=2)                # Grafik penceresi (örnek)
+
+
+class MapConfig(_Section):
+    min_spacing_m: float = Field(2.0, ge=0)           # İz noktaları arası en az mesafe
+    flush_interval_ms: int = Field(16, ge=0)          # runJavaScript birleştirme aralığı
+    zoom_poll_interval_ms: int = Field(500, ge=50)
+    tile_cache_path: str = "tile_cache.mbtiles"
+    max_tiles: int = Field(50000, ge=1)
+    upstream_url: str = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"  # Karo kaynağı
+    prefetch_rate_hz: float = Field(2.0, gt=0)        # Ön yüklemede upstream istek hızı
+
+
+class MetricsConfig(_Section):
+    enabled: bool = True                              # Yerel /metrics uç noktası
+    port: int = Field(9108, ge=0, le=65535)
+    print_interval_s: float = Field(10.0, ge=0)       # Headless metrik satırı (0: kapalı)
+
+
+class LoggingConfig(_Section):
+    level: Optional[str] = None                       # None: UAV_LOG_LEVEL veya INFO
+    modules: Optional[Dict[str, str]] = None
+    file: Optional[str] = None
+    json_lines: bool = True
+
+
+class AppConfig(_Section):
+    profile: str = DEFAULT_PROFILE
+    telemetry: TelemetryConfig = Field(default_factory=TelemetryConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    alerts: AlertConfig = Field(default_factory=AlertConfig)
+    charts: ChartsConfig = Field(default_factory=ChartsConfig)
+    map: MapConfig = Field(default_factory=MapConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+
+    def with_overrides(self, overrides: Dict) -> 'AppConfig':
+        """İç içe dict ile ezilmiş doğrulanmış kopya (None değerler yok sayılır)"""
+        return AppConfig.model_validate(_deep_merge(self.model_dump(), _drop_none(overrides)))
+
+    def setup_logging(self):
+        """Günlüğü bu yapılandırmayla kur"""
+        from src.core.logger import setup_logging
+
+        return setup_logging(level=self.logging.level, module_levels=self.logging.modules,
+                             log_file=self.logging.file, json_lines=self.logging.json_lines)
+
+
+# Varsayılanlardan farklar; desktop varsayılanların kendisidir
+PROFILES: Dict[str, Dict] = {
+    'desktop': {},
+    # Düşük güçlü dizüstü: daha seyrek ekran güncellemesi, küçük pencereler
+    'laptop': {
+        'telemetry': {'display_rate_hz': 15.0},
+        'database': {'flush_rate_hz': 2.0, 'report_workers': 2},
+        'charts': {'max_points': 60},
+        'map': {'min_spacing_m': 5.0, 'flush_interval_ms': 33,
+                'zoom_poll_interval_ms': 1000, 'max_tiles': 20000},
+        'alerts': {'panel_capacity': 100, 'flush_interval_s': 1.0}
+    },
+    # GUI'siz kaydedici: büyük kuyruklar ve batch'ler, uç nokta isteğe bağlı
+    'headless': {
+        'database': {'flush_rate_hz': 5.0, 'max_queue': 50000},
+        'alerts': {'max_batch': 1000, 'max_queue': 50000},
+        'metrics': {'enabled': False}
+    }
+}
+
+
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _drop_none(data: Dict) -> Dict:
+    return {key: _drop_none(value) if isinstance(value, dict) else value
+            for key, value in data.items() if value is not None}
+
+
+def _read_file(path) -> Dict:
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix.lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("YAML yapılandırması için PyYAML gerekli") from e
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    return data or {}
+
+
+def _env_overrides(environ) -> Dict:
+    """UAV__BÖLÜM__ALAN=değer değişkenlerini iç içe dict'e çevir"""
+    overrides = {}
+    for name, raw in environ.items():
+        if not name.startswith(ENV_PREFIX):
+            continue
+        parts = [part.lower() for part in name[len(ENV_PREFIX):].split('__') if part]
+        if not parts:
+            continue
+        try:
+            value = json.loads(raw)  # Sayılar, true/false, null, {...}
+        except ValueError:
+            value = raw
+        target = overrides
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return overrides
+
+
+def load_config(path=None, profile: Optional[str] = None,
+                default_profile: str = DEFAULT_PROFILE, environ=None) -> AppConfig:
+    """Profil, dosya ve ortam değişkenlerini birleştirerek yapılandırmayı yükle"""
+    environ = os.environ if environ is None else environ
+    path = path or environ.get('UAV_CONFIG') or None
+    file_data = _read_file(path) if path else {}
+    env_data = _env_overrides(environ)
+
+    # Profil öncelik sırası: argüman > ortam > dosya > varsayılan
+    profile = (profile or environ.get('UAV_PROFILE') or env_data.get('profile')
+               or file_data.get('profile') or default_profile)
+    if profile not in PROFILES:
+        raise ValueError(f"Bilinmeyen profil: {profile} (seçenekler: {', '.join(PROFILES)})")
+
+    data = _deep_merge(copy.deepcopy(PROFILES[profile]), file_data)
+    data = _deep_merge(data, env_data)
+    data['profile'] = profile
+    return AppConfig.model_validate(data)
+
+
+_config: Optional[AppConfig] = None
+
+
+def get_config() -> AppConfig:
+    """Süreç geneli yapılandırma (ilk çağrıda yüklenir)"""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def set_config(config: Optional[AppConfig]):
+    """Süreç geneli yapılandırmayı değiştir (None: bir sonraki get_config yeniden yükler)"""
+    global _config
+    _config = config
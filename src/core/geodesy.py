@@ -0,0 +1,26 @@
+# src/core/geodesy.py
+"""
+Skaler jeodezi sabitleri ve yerel düzlem izdüşümü
+
+NumPy import etmez; GUI'siz ve paket başına çalışan skaler yollar
+(kinematik kestirim, iz sadeleştirme, geofence, görev takibi) buradan
+alır. src.core.utils aynı adları yeniden dışa aktarır, böylece vektörel
+ve skaler hesaplar aynı değeri kullanır.
+"""
+
+import math
+
+EARTH_RADIUS_M = 6371000.0
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+def local_xy(lat, lon, lat0: float, lon0: float, cos_lat0: float = None):
+    """Eşdikdörtgen yerel düzlem (x: doğu, y: kuzey, metre); birkaç km için yeterli
+
+    lat/lon skaler veya NumPy dizisi olabilir. Aynı başlangıç noktasıyla
+    tekrar tekrar çağrılırken cos_lat0 önceden hesaplanıp verilebilir.
+    """
+    if cos_lat0 is None:
+        cos_lat0 = math.cos(math.radians(lat0))
+    return ((lon - lon0) * cos_lat0 * METERS_PER_DEGREE_LAT,
+            (lat - lat0) * METERS_PER_DEGREE_LAT)
@@ -0,0 +1,436 @@
+# src/core/logger.py
+"""
+Merkezi günlük (logging) ve telemetri hattı ölçümleri
+
+Günlük: tüm modüller get_logger(__name__) kullanır. Kayıtlar bir
+QueueHandler ile kuyruğa atılır; biçimlendirme ve G/Ç (konsol, dönen
+JSON-lines dosyası) QueueListener thread'inde yapılır, böylece GUI ve
+worker thread'leri stdout'ta beklemez. Seviyeler modül bazında ayarlanabilir:
+    setup_logging(level="INFO", module_levels={"telemetry": "DEBUG"},
+                  log_file="logs/uav.jsonl")
+    UAV_LOG_LEVEL=DEBUG UAV_LOG_MODULES="ui=WARNING" python run.py
+
+Ölçümler: her paket, hattın aşamalarından geçerken monotonik zaman damgası alır
+(alım -> çözümleme -> birleştirme -> veritabanı -> ekran). Bir aşamanın
+gecikmesi, paketin bir önceki damgasından bu yana geçen süredir; ekran
+aşamasında ayrıca uçtan uca (alımdan ekrana) gecikme kaydedilir.
+
+Gecikmeler HDR tarzı log-lineer histogramlarda (~%3 çözünürlük, sabit
+bellek), hızlar saniyelik kayan sayaçlarda tutulur. Paket başına maliyet
+birkaç µs'dir; PySide6 import edilmez (headless kaydedici de kullanır).
+
+Kullanım:
+    from src.core.logger import pipeline_metrics, DECODE
+    pipeline_metrics.mark(packet, DECODE)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+ROOT_LOGGER = 'uav'
+CONSOLE_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# Kuyrukta beklerken değişemeyecek argüman tipleri (biçimlendirme ertelenebilir)
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None))
+# JSON çıktısına 'extra' alanı olarak eklenmeyecek standart LogRecord alanları
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+# ---------------------------------------------------------------------------
+# Günlük (logging)
+# ---------------------------------------------------------------------------
+
+def get_logger(name: str) -> logging.Logger:
+    """Modül adından (src.ui.alarm_panel) 'uav.ui.alarm_panel' logger'ı"""
+    if name.startswith('src.'):
+        name = name[len('src.'):]
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Her kaydı tek satır JSON olarak yazar (extra={...} alanları dahil)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Kaydı biçimlendirmeden kuyruğa atar; mesaj dinleyici thread'inde üretilir"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(v, _IMMUTABLE_ARGS) for v in values):
+                # Değişebilir nesneler kuyrukta beklerken değişebilir: şimdi biçimlendir
+                record.msg = record.getMessage()
+                record.args = None
+        if record.exc_info:
+            # Traceback çerçeveleri canlı tutmasın diye metne çevir
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _parse_module_levels(text: str) -> Dict[str, str]:
+    """'telemetry=DEBUG,ui.map_widget=WARNING' -> sözlük"""
+    levels = {}
+    for part in text.split(','):
+        if '=' in part:
+            module, level = part.split('=', 1)
+            levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(level: Optional[Union[str, int]] = None,
+                  module_levels: Optional[Dict[str, str]] = None,
+                  log_file: Optional[str] = None, json_lines: bool = True,
+                  max_bytes: int = 5 * 1024 * 1024, backup_count: int = 5,
+                  console: bool = True, stream=None) -> logging.handlers.QueueListener:
+    """Kuyruk tabanlı günlüğü kur (yeniden çağrılırsa önceki kurulum kapatılır)
+
+    Verilmeyen ayarlar UAV_LOG_LEVEL, UAV_LOG_MODULES ve UAV_LOG_FILE
+    ortam değişkenlerinden okunur.
+    """
+    global _listener
+    shutdown_logging()
+
+    level = level or os.environ.get('UAV_LOG_LEVEL', 'INFO')
+    if module_levels is None:
+        module_levels = _parse_module_levels(os.environ.get('UAV_LOG_MODULES', ''))
+    log_file = log_file or os.environ.get('UAV_LOG_FILE') or None
+
+    handlers = []
+    if console:
+        console_handler = logging.StreamHandler(stream or sys.stdout)
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT, "%H:%M:%S"))
+        handlers.append(console_handler)
+    if log_file:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        file_handler.setFormatter(JsonLinesFormatter() if json_lines
+                                  else logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(level if isinstance(level, int) else str(level).upper())
+    root.propagate = False
+
+    for module, module_level in module_levels.items():
+        get_logger(module if module.startswith('src.') else f"src.{module}").setLevel(module_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Kuyrukta kalan kayıtları yaz ve dinleyiciyi durdur"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+# ---------------------------------------------------------------------------
+# Hat ölçümleri
+# ---------------------------------------------------------------------------
+
+# Hat aşamaları (sıralı)
+RECEIVE = 'receive'
+DECODE = 'decode'
+FUSION = 'fusion'
+DB_COMMIT = 'db_commit'
+RENDER = 'render'
+END_TO_END = 'end_to_end'
+
+STAGES = (RECEIVE, DECODE, FUSION, DB_COMMIT, RENDER)
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LatencyHistogram:
+    """Log-lineer (HDR tarzı) gecikme histogramı, nanosaniye girdili
+
+    Her ikinin kuvveti aralığı 2**sub_bits alt kovaya bölünür; bağıl hata
+    en fazla 1 / 2**sub_bits olur. 2**40 ns (~18 dk) üstü son kovaya düşer.
+    """
+
+    def __init__(self, sub_bits: int = 5, max_bits: int = 40):
+        self.sub_bits = sub_bits
+        self._sub = 1 << sub_bits
+        self._size = (max_bits - sub_bits + 1) * self._sub
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * self._size
+        self.total = 0
+        self.sum_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._sub:
+            return value
+        shift = value.bit_length() - 1 - self.sub_bits
+        return min(self._size - 1, self._sub * shift + (value >> shift))
+
+    def _bucket_mid(self, index: int) -> float:
+        """Kovanın temsil ettiği değer (ns, orta nokta)"""
+        if index < self._sub:
+            return float(index)
+        shift = index // self._sub - 1
+        mantissa = index - self._sub * shift
+        return ((mantissa << shift) + ((mantissa + 1) << shift) - 1) / 2.0
+
+    def record(self, value_ns: int):
+        if value_ns < 0:
+            value_ns = 0
+        self.counts[self._index(value_ns)] += 1
+        self.total += 1
+        self.sum_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, q: float) -> float:
+        """q (0-1) yüzdelik değeri, ns"""
+        if not self.total:
+            return 0.0
+        target = max(1, int(q * self.total + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                seen += count
+                if seen >= target:
+                    return min(self._bucket_mid(index), float(self.max_ns))
+        return float(self.max_ns)
+
+    def mean(self) -> float:
+        return self.sum_ns / self.total if self.total else 0.0
+
+
+class RateCounter:
+    """Son window_s saniyedeki olay hızı (saniyelik kovalar)"""
+
+    def __init__(self, window_s: int = 10):
+        self.window_s = max(2, window_s)
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self._first_second = None
+        self._seconds = [-1] * self.window_s
+        self._counts = [0] * self.window_s
+
+    def add(self, count: int, now_s: float):
+        second = int(now_s)
+        if self._first_second is None:
+            self._first_second = second
+        slot = second % self.window_s
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += count
+        self.total += count
+
+    def rate(self, now_s: float) -> float:
+        """Tamamlanmış son (en fazla window_s - 1) saniyenin ortalaması (Hz)"""
+        second = int(now_s)
+        if self._first_second is None:
+            return 0.0
+        # Yeni başlamış sayaçta yalnızca tamamlanmış saniyeler kadar böl
+        span = min(self.window_s - 1, second - self._first_second)
+        if span <= 0:
+            return 0.0
+        oldest = second - span - 1
+        count = sum(c for s, c in zip(self._seconds, self._counts) if oldest < s < second)
+        return count / span
+
+
+class _StageStats:
+    __slots__ = ('histogram', 'rate', 'lock')
+
+    def __init__(self, window_s):
+        self.histogram = LatencyHistogram()
+        self.rate = RateCounter(window_s)
+        self.lock = threading.Lock()
+
+
+class PipelineMetrics:
+    """Aşama başına gecikme histogramları ve hız sayaçları
+
+    Damgalar paketin _trace özel özniteliğinde [ilk, son] olarak tutulur; farklı
+    thread'lerden (alıcı, yazıcı, GUI) güvenle çağrılabilir.
+    """
+
+    def __init__(self, stages: Iterable[str] = STAGES, window_s: int = 10):
+        self.stages = tuple(stages)
+        self._stats = {stage: _StageStats(window_s) for stage in self.stages + (END_TO_END,)}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self.enabled = True
+
+    def mark(self, packet, stage: str, t_ns: Optional[int] = None):
+        """Paketi bir aşamadan geçmiş olarak damgala"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns() if t_ns is None else t_ns
+        stats = self._stats[stage]
+        # pydantic'in özel öznitelik erişimi (~3 µs) yerine doğrudan sözlük
+        private = packet.__pydantic_private__
+        trace = private['_trace']
+
+        with stats.lock:
+            if trace is None:
+                private['_trace'] = [now, now]  # İlk damga: gecikme yok
+            else:
+                stats.histogram.record(now - trace[1])
+                trace[1] = now
+            stats.rate.add(1, now / 1e9)
+
+        if stage == RENDER and trace is not None:
+            self._record_end_to_end([trace[0]], now)
+
+    def mark_batch(self, packets: List, stage: str):
+        """Aynı anda işlenen paketleri tek zaman damgasıyla damgala"""
+        if not self.enabled or not packets:
+            return
+        now = time.perf_counter_ns()
+        stats = self._stats[stage]
+        record = stats.histogram.record
+        starts = []
+
+        with stats.lock:
+            for packet in packets:
+                private = packet.__pydantic_private__
+                trace = private['_trace']
+                if trace is None:
+                    private['_trace'] = [now, now]
+                    continue
+                record(now - trace[1])
+                trace[1] = now
+                starts.append(trace[0])
+            stats.rate.add(len(packets), now / 1e9)
+
+        if stage == RENDER and starts:
+            self._record_end_to_end(starts, now)
+
+    def _record_end_to_end(self, starts, now):
+        stats = self._stats[END_TO_END]
+        with stats.lock:
+            for start in starts:
+                stats.histogram.record(now - start)
+            stats.rate.add(len(starts), now / 1e9)
+
+    def register_gauge(self, name: str, func: Callable[[], float]):
+        """/metrics çıktısına anlık değer ekle (örn. kuyruk derinliği)"""
+        self._gauges[name] = func
+
+    def reset(self):
+        for stats in self._stats.values():
+            with stats.lock:
+                stats.histogram.reset()
+                stats.rate.reset()
+
+    # -------------------------------------------------------------------
+    # Dışa aktarım
+    # -------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Aşama -> {count, rate_hz, mean_us, p50_us, p90_us, p99_us, max_us}"""
+        now_s = time.perf_counter_ns() / 1e9
+        result = {}
+        for stage, stats in self._stats.items():
+            with stats.lock:
+                h = stats.histogram
+                entry = {
+                    'count': stats.rate.total,
+                    'samples': h.total,
+                    'rate_hz': stats.rate.rate(now_s),
+                    'mean_us': h.mean() / 1000.0,
+                    'max_us': h.max_ns / 1000.0
+                }
+                for q in QUANTILES:
+                    entry[f"p{int(q * 100)}_us"] = h.percentile(q) / 1000.0
+            result[stage] = entry
+        return result
+
+    def gauges(self) -> Dict[str, float]:
+        values = {}
+        for name, func in self._gauges.items():
+            try:
+                values[name] = float(func())
+            except Exception:
+                continue  # Kaynağı kapanmış ölçer
+        return values
+
+    def render_text(self) -> str:
+        """Prometheus metin biçimi (/metrics)"""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP uav_stage_latency_us Önceki aşamadan bu aşamaya gecikme (µs)",
+            "# TYPE uav_stage_latency_us summary"
+        ]
+        for stage, s in snapshot.items():
+            if not s['samples']:
+                continue
+            for q in QUANTILES:
+                lines.append(f'uav_stage_latency_us{{stage="{stage}",quantile="{q}"}} '
+                             f"{s[f'p{int(q * 100)}_us']:.3f}")
+            lines.append(f'uav_stage_latency_us_sum{{stage="{stage}"}} '
+                         f"{s['mean_us'] * s['samples']:.3f}")
+            lines.append(f'uav_stage_latency_us_count{{stage="{stage}"}} {s["samples"]}')
+
+        lines += ["# HELP uav_stage_packets_total Aşamadan geçen paket sayısı",
+                  "# TYPE uav_stage_packets_total counter"]
+        lines += [f'uav_stage_packets_total{{stage="{stage}"}} {s["count"]}'
+                  for stage, s in snapshot.items()]
+
+        lines += ["# HELP uav_stage_rate_hz Aşama hızı (kayan pencere)",
+                  "# TYPE uav_stage_rate_hz gauge"]
+        lines += [f'uav_stage_rate_hz{{stage="{stage}"}} {s["rate_hz"]:.3f}'
+                  for stage, s in snapshot.items()]
+
+        for name, value in self.gauges().items():
+            lines += [f"# TYPE uav_{name} gauge", f"uav_{name} {value:g}"]
+        return "\n".join(lines) + "\n"
+
+
+# Süreç geneli ölçüm nesnesi
+pipeline_metrics = PipelineMetrics()
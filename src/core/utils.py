@@ -0,0 +1,218 @@
+# src/core/utils.py
+"""
+Vektörel jeodezi araçları
+
+Tüm mesafe, yön ve yerel izdüşüm hesapları burada, NumPy dizileri
+üzerinde tek seferde yapılır. Fonksiyonlar skaler veya dizi kabul eder
+(NumPy yayınlama kuralları geçerlidir); skaler girdide float döner.
+
+    haversine           Küre üzerinde büyük daire mesafesi (metre)
+    vincenty            WGS84 elipsoidi üzerinde ters çözüm (mm doğruluk)
+    initial_bearing     Başlangıç yönü (derece, 0-360)
+    segment_distances   Ardışık noktalar arası mesafeler
+    cumulative_distance Her noktaya kadar toplam iz uzunluğu
+    track_length        Toplam iz uzunluğu (NaN içeren segmentler atlanır)
+    geodetic_to_enu     Yerel Doğu-Kuzey-Yukarı izdüşümü (ECEF üzerinden)
+    enu_to_geodetic     ENU'dan enlem/boylam/yüksekliğe dönüş
+    local_xy            Küçük alanlar için eşdikdörtgen yerel düzlem (geodesy'den)
+    point_to_segment    Noktanın doğru parçasına uzaklığı ve izdüşüm oranı
+    cross_track         Büyük daireye işaretli yanal ve boylamsal mesafe
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from .geodesy import EARTH_RADIUS_M, METERS_PER_DEGREE_LAT, local_xy
+
+# WGS84 elipsoidi
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+
+
+def _result(value):
+    """0 boyutlu sonucu float'a çevir"""
+    return value.item() if np.ndim(value) == 0 else value
+
+
+def _radians(*values):
+    return [np.radians(np.asarray(v, dtype=float)) for v in values]
+
+
+def haversine(lat1, lon1, lat2, lon2, radius_m: float = EARTH_RADIUS_M):
+    """Büyük daire mesafesi (metre)"""
+    phi1, lam1, phi2, lam2 = _radians(lat1, lon1, lat2, lon2)
+    a = (np.sin((phi2 - phi1) * 0.5) ** 2 +
+         np.cos(phi1) * np.cos(phi2) * np.sin((lam2 - lam1) * 0.5) ** 2)
+    return _result(2.0 * radius_m * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))))
+
+
+def vincenty(lat1, lon1, lat2, lon2, tolerance: float = 1e-12, max_iterations: int = 200):
+    """WGS84 elipsoidi üzerinde mesafe (metre, Vincenty ters çözümü)
+
+    Yakınsamayan (neredeyse antipodal) noktalar için haversine kullanılır.
+    """
+    phi1, lam1, phi2, lam2 = _radians(lat1, lon1, lat2, lon2)
+    phi1, lam1, phi2, lam2 = np.broadcast_arrays(phi1, lam1, phi2, lam2)
+    f, a, b = WGS84_F, WGS84_A, WGS84_B
+
+    big_l = lam2 - lam1
+    u1 = np.arctan((1 - f) * np.tan(phi1))
+    u2 = np.arctan((1 - f) * np.tan(phi2))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+
+    lam = big_l.copy()
+    active = np.ones(lam.shape, dtype=bool)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            # Ekvator üzerindeki çizgilerde cos2_alpha = 0
+            cos_2sigma_m = np.where(cos2_alpha == 0, 0.0,
+                                    cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam_next = big_l + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)))
+            delta = np.abs(lam_next - lam)
+            lam = np.where(active, lam_next, lam)
+            active &= ~(delta < tolerance)
+            if not active.any():
+                break
+
+        u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+        big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+        big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+        delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sigma_m ** 2) -
+            big_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+        distance = b * big_a * (sigma - delta_sigma)
+
+    if active.any():
+        fallback = haversine(np.degrees(phi1), np.degrees(lam1), np.degrees(phi2), np.degrees(lam2))
+        distance = np.where(active, fallback, distance)
+    return _result(distance)
+
+
+def initial_bearing(lat1, lon1, lat2, lon2):
+    """1. noktadan 2. noktaya başlangıç yönü (derece, 0-360)"""
+    phi1, lam1, phi2, lam2 = _radians(lat1, lon1, lat2, lon2)
+    delta_lam = lam2 - lam1
+    y = np.sin(delta_lam) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(delta_lam)
+    return _result(np.degrees(np.arctan2(y, x)) % 360.0)
+
+
+def segment_distances(lats, lons, method: str = 'haversine') -> np.ndarray:
+    """Ardışık noktalar arası mesafeler (n-1 eleman, metre)"""
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    if lats.size < 2:
+        return np.zeros(0)
+    func = vincenty if method == 'vincenty' else haversine
+    return np.asarray(func(lats[:-1], lons[:-1], lats[1:], lons[1:]), dtype=float)
+
+
+def cumulative_distance(lats, lons, method: str = 'haversine') -> np.ndarray:
+    """Her noktaya kadar kat edilen mesafe (ilk eleman 0, metre)"""
+    segments = np.nan_to_num(segment_distances(lats, lons, method))
+    result = np.zeros(segments.size + 1)
+    np.cumsum(segments, out=result[1:])
+    return result
+
+
+def track_length(lats, lons, method: str = 'haversine') -> float:
+    """Toplam iz uzunluğu (metre); eksik (NaN) noktalara değen segmentler atlanır"""
+    return float(np.nansum(segment_distances(lats, lons, method)))
+
+
+def _ecef(phi, lam, h):
+    sin_phi = np.sin(phi)
+    n = WGS84_A / np.sqrt(1 - WGS84_E2 * sin_phi ** 2)
+    return ((n + h) * np.cos(phi) * np.cos(lam),
+            (n + h) * np.cos(phi) * np.sin(lam),
+            (n * (1 - WGS84_E2) + h) * sin_phi)
+
+
+def geodetic_to_enu(lats, lons, alts, lat0: float, lon0: float, alt0: float = 0.0):
+    """Noktaları (lat0, lon0, alt0) merkezli yerel Doğu-Kuzey-Yukarı koordinatlara çevir"""
+    phi, lam = _radians(lats, lons)
+    phi0, lam0 = np.radians(lat0), np.radians(lon0)
+    x, y, z = _ecef(phi, lam, np.asarray(alts, dtype=float))
+    x0, y0, z0 = _ecef(phi0, lam0, alt0)
+    dx, dy, dz = x - x0, y - y0, z - z0
+
+    sin_phi0, cos_phi0 = np.sin(phi0), np.cos(phi0)
+    sin_lam0, cos_lam0 = np.sin(lam0), np.cos(lam0)
+    east = -sin_lam0 * dx + cos_lam0 * dy
+    north = -sin_phi0 * cos_lam0 * dx - sin_phi0 * sin_lam0 * dy + cos_phi0 * dz
+    up = cos_phi0 * cos_lam0 * dx + cos_phi0 * sin_lam0 * dy + sin_phi0 * dz
+    return _result(east), _result(north), _result(up)
+
+
+def enu_to_geodetic(east, north, up, lat0: float, lon0: float, alt0: float = 0.0):
+    """geodetic_to_enu'nun tersi: (enlem, boylam, yükseklik)"""
+    phi0, lam0 = np.radians(lat0), np.radians(lon0)
+    east, north, up = (np.asarray(v, dtype=float) for v in (east, north, up))
+    sin_phi0, cos_phi0 = np.sin(phi0), np.cos(phi0)
+    sin_lam0, cos_lam0 = np.sin(lam0), np.cos(lam0)
+
+    x0, y0, z0 = _ecef(phi0, lam0, alt0)
+    x = x0 - sin_lam0 * east - sin_phi0 * cos_lam0 * north + cos_phi0 * cos_lam0 * up
+    y = y0 + cos_lam0 * east - sin_phi0 * sin_lam0 * north + cos_phi0 * sin_lam0 * up
+    z = z0 + cos_phi0 * north + sin_phi0 * up
+
+    # ECEF -> jeodezik (birkaç yinelemede mm altına yakınsar)
+    lam = np.arctan2(y, x)
+    p = np.hypot(x, y)
+    phi = np.arctan2(z, p * (1 - WGS84_E2))
+    for _ in range(5):
+        n = WGS84_A / np.sqrt(1 - WGS84_E2 * np.sin(phi) ** 2)
+        h = p / np.cos(phi) - n
+        phi = np.arctan2(z, p * (1 - WGS84_E2 * n / (n + h)))
+    n = WGS84_A / np.sqrt(1 - WGS84_E2 * np.sin(phi) ** 2)
+    h = p / np.cos(phi) - n
+    return _result(np.degrees(phi)), _result(np.degrees(lam)), _result(h)
+
+
+def point_to_segment(lat, lon, lat_a, lon_a, lat_b, lon_b) -> Tuple:
+    """Noktanın A-B doğru parçasına en kısa uzaklığı (metre) ve izdüşüm oranı t (0-1)
+
+    Her segment kendi başlangıç noktasında yerel düzleme izdüşürülür;
+    segmentler birkaç km'den kısa olduğu sürece hata cm mertebesindedir.
+    """
+    lat, lon, lat_a, lon_a, lat_b, lon_b = (np.asarray(v, dtype=float)
+                                            for v in (lat, lon, lat_a, lon_a, lat_b, lon_b))
+    cos_lat = np.cos(np.radians(lat_a))
+    bx = (lon_b - lon_a) * cos_lat * METERS_PER_DEGREE_LAT
+    by = (lat_b - lat_a) * METERS_PER_DEGREE_LAT
+    px = (lon - lon_a) * cos_lat * METERS_PER_DEGREE_LAT
+    py = (lat - lat_a) * METERS_PER_DEGREE_LAT
+
+    length_sq = bx * bx + by * by
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(length_sq > 0, (px * bx + py * by) / length_sq, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    distance = np.hypot(px - t * bx, py - t * by)
+    return _result(distance), _result(t)
+
+
+def cross_track(lat, lon, lat_a, lon_a, lat_b, lon_b, radius_m: float = EARTH_RADIUS_M) -> Tuple:
+    """A'dan B'ye büyük daireye göre işaretli yanal mesafe ve A'dan boylamsal mesafe (metre)
+
+    Yanal mesafe rotanın sağında pozitif, solunda negatiftir.
+    """
+    d13 = np.asarray(haversine(lat_a, lon_a, lat, lon, radius_m)) / radius_m
+    theta13 = np.radians(initial_bearing(lat_a, lon_a, lat, lon))
+    theta12 = np.radians(initial_bearing(lat_a, lon_a, lat_b, lon_b))
+    xtd = np.arcsin(np.clip(np.sin(d13) * np.sin(theta13 - theta12), -1.0, 1.0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        atd = np.arccos(np.clip(np.cos(d13) / np.cos(xtd), -1.0, 1.0))
+    atd = np.where(np.cos(theta13 - theta12) < 0, -atd, atd)
+    return _result(xtd * radius_m), _result(atd * radius_m)
@@ -1,33 +1,117 @@
 # src/database/database_manager.py
 import sqlite3
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import bindparam, create_engine, delete, insert, inspect, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker, close_all_sessions
 from contextlib import contextmanager
 from pathlib import Path
 import json
+import math
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from .models import Base, FlightSession, TelemetryRecord
+from .models import (Base, FlightSession, TelemetryRecord, AlertLog, SessionSummary, TrackSegment,
+                     Waypoint)
+from .session_summary import summarize_sessions
+from . import track_index
 from ..telemetry.data_models import TelemetryPacket
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sonradan eklenen kolonlar: mevcut veritabanlarına ALTER TABLE ile eklenir
+SCHEMA_MIGRATIONS = {
+    'telemetry_records': {
+        'climb_rate': 'FLOAT',
+        'course': 'FLOAT',
+    },
+    'alert_logs': {
+        'last_time': 'DATETIME',
+        'occurrences': 'INTEGER DEFAULT 1',
+    },
+}
+
+# Rapor istatistikleri hesaplanan telemetri kolonları
+REPORT_FIELDS = ('altitude', 'velocity', 'battery_percent')
+REPORT_PERCENTILES = (50, 90, 95, 99)
+
+# Görev kaydında upsert ile güncellenen waypoint kolonları (varsayılanlarıyla)
+WAYPOINT_FIELDS = {
+    'latitude': None,
+    'longitude': None,
+    'altitude': None,
+    'action_type': 'FLY_TO',
+    'hold_time': 0.0,
+    'radius': 5.0,
+    'notes': None,
+}
 
 
 class DatabaseManager:
     """Veritabanı yönetim sınıfı"""
 
-    def __init__(self, db_path: str = "flight_data.db"):
+    def __init__(self, db_path: str = "flight_data.db", read_only: bool = False):
         self.db_path = Path(db_path)
-        self.engine = create_engine(f'sqlite:///{self.db_path}', echo=False)
+        self.read_only = read_only
+        if read_only:
+            # Rapor işçileri: şema oluşturma/göç yok, yazma denemesi hata verir
+            uri = f"file:{self.db_path.absolute().as_posix()}?mode=ro"
+            self.engine = create_engine(
+                'sqlite://', echo=False,
+                creator=lambda: sqlite3.connect(uri, uri=True, check_same_thread=False))
+        else:
+            self.engine = create_engine(f'sqlite:///{self.db_path}', echo=False)
         self.SessionLocal = sessionmaker(bind=self.engine)
         self.current_session_id = None
 
         # Veritabanını başlat
-        self._initialize_database()
+        if read_only:
+            with self.engine.connect() as connection:
+                self.spatial_index = track_index.has_rtree_tables(connection)
+        else:
+            self._initialize_database()
 
     def _initialize_database(self):
         """Veritabanı tablolarını oluştur"""
+        existing = inspect(self.engine)
+        has_summaries = existing.has_table(SessionSummary.__tablename__)
+        has_segments = existing.has_table(TrackSegment.__tablename__)
         Base.metadata.create_all(self.engine)
-        print(f"Veritabanı başlatıldı: {self.db_path.absolute()}")
+        self._migrate_schema()
+        with self.engine.begin() as connection:
+            self.spatial_index = track_index.create_rtree_tables(connection)
+
+        # Türetilmiş tablolar yeni eklendiyse mevcut oturumları bir kez toplu doldur
+        if not has_summaries:
+            self.backfill_session_summaries()
+        if not has_segments:
+            self.backfill_track_index()
+        logger.info("Veritabanı başlatıldı: %s", self.db_path.absolute())
+
+    def _migrate_schema(self):
+        """Eski veritabanlarında eksik kolonları ekle"""
+        with self.engine.begin() as connection:
+            for table, columns in SCHEMA_MIGRATIONS.items():
+                existing = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+                for name, ddl in columns.items():
+                    if name not in existing:
+                        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+
+            # Tekil görev sırası indeksinden önce eski kayıtlardaki çakışan sıraları düzelt
+            if not connection.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' "
+                    "AND name = 'ux_waypoints_mission_order'").first():
+                connection.exec_driver_sql("""
+                    UPDATE waypoints SET order_index = ordered.position
+                    FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY mission_name
+                                                        ORDER BY order_index, id) - 1 AS position
+                          FROM waypoints) AS ordered
+                    WHERE waypoints.id = ordered.id AND waypoints.order_index != ordered.position""")
+
+            # create_all mevcut tablolara sonradan tanımlanan indeksleri eklemez
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
 
     def __del__(self):
         """Destructor - bağlantıları temizle"""
@@ -46,7 +130,7 @@ class DatabaseManager:
             session.commit()
         except Exception as e:
             session.rollback()
-            print(f"Database error: {e}")
+            logger.error("Veritabanı hatası: %s", e)
             raise
         finally:
             session.close()
@@ -67,20 +151,20 @@ class DatabaseManager:
             session_id = flight_session.id
 
         self.current_session_id = session_id
-        print(f"Yeni uçuş oturumu başlatıldı: {session_name} (ID: {session_id})")
+        logger.info("Yeni uçuş oturumu başlatıldı: %s (ID: %d)", session_name, session_id)
         return session_id
 
     def close_connection(self):
         """Veritabanı bağlantısını kapat"""
         try:
             # Tüm session'ları kapat
-            self.SessionLocal.close_all()
+            close_all_sessions()
             # Engine'i dispose et
             if hasattr(self, 'engine'):
                 self.engine.dispose()
-            print("Veritabanı bağlantısı kapatıldı")
+            logger.debug("Veritabanı bağlantısı kapatıldı")
         except Exception as e:
-            print(f"Bağlantı kapatma hatası: {e}")
+            logger.warning("Bağlantı kapatma hatası: %s", e)
 
     def end_flight_session(self, session_id: int = None):
         """Uçuş oturumunu sonlandır"""
@@ -88,61 +172,369 @@ class DatabaseManager:
             session_id = self.current_session_id
 
         if not session_id:
-            print("Sonlandırılacak aktif oturum bulunamadı")
+            logger.warning("Sonlandırılacak aktif oturum bulunamadı")
             return
 
+        # Özet satırı kayıtları bir kez tarar; oturum kolonları da ondan doldurulur
+        summary = self.refresh_session_summaries([session_id])[0]
+        self.index_session_tracks([session_id])
+
         with self.get_session() as session:
             flight_session = session.query(FlightSession).filter_by(id=session_id).first()
             if flight_session:
                 flight_session.end_time = datetime.now()
                 flight_session.status = 'COMPLETED'
+                flight_session.total_duration = summary['duration_s']
+                flight_session.max_altitude = summary['max_altitude'] or 0
+                flight_session.max_velocity = summary['max_velocity'] or 0
+                flight_session.min_battery = (100 if summary['battery_min'] is None
+                                              else summary['battery_min'])
+                flight_session.total_distance = summary['distance_m']
 
-                # İstatistikleri hesapla
-                stats = self._calculate_session_stats(session_id)
-                flight_session.total_duration = stats['duration']
-                flight_session.max_altitude = stats['max_altitude']
-                flight_session.max_velocity = stats['max_velocity']
-                flight_session.min_battery = stats['min_battery']
-                flight_session.total_distance = stats['total_distance']
-
-                print(f"Uçuş oturumu sonlandırıldı: {flight_session.session_name}")
+                logger.info("Uçuş oturumu sonlandırıldı: %s", flight_session.session_name)
 
         self.current_session_id = None
 
     def save_telemetry(self, packet: TelemetryPacket) -> bool:
         """Telemetri verisini kaydet"""
+        return self.save_telemetry_batch([packet])
+
+    def save_telemetry_batch(self, packets: List[TelemetryPacket]) -> bool:
+        """Birden fazla telemetri paketini tek işlemde (executemany) kaydet"""
+        if not packets:
+            return True
+
         if not self.current_session_id:
             self.start_flight_session()  # Otomatik oturum başlat
 
         try:
+            rows = [self._packet_to_row(packet) for packet in packets]
             with self.get_session() as session:
-                record = TelemetryRecord(
-                    session_id=self.current_session_id,
-                    timestamp=packet.timestamp,
-                    latitude=packet.gps.latitude,
-                    longitude=packet.gps.longitude,
-                    altitude=packet.gps.altitude,
-                    velocity=packet.velocity,
-                    roll=packet.attitude.roll if packet.attitude else None,
-                    pitch=packet.attitude.pitch if packet.attitude else None,
-                    yaw=packet.attitude.yaw if packet.attitude else None,
-                    battery_voltage=packet.battery_voltage,
-                    battery_percent=packet.battery_percent,
-                    status=packet.status,
-                    raw_data=packet.json()
-                )
-                session.add(record)
+                session.execute(insert(TelemetryRecord), rows)
             return True
         except Exception as e:
-            print(f"Telemetri kayıt hatası: {e}")
+            logger.error("Telemetri kayıt hatası: %s", e)
             return False
 
+    def _packet_to_row(self, packet: TelemetryPacket) -> Dict:
+        """TelemetryPacket'i telemetry_records satırına çevir"""
+        attitude = packet.attitude
+        return {
+            'session_id': self.current_session_id,
+            'timestamp': packet.timestamp,
+            'latitude': packet.gps.latitude,
+            'longitude': packet.gps.longitude,
+            'altitude': packet.gps.altitude,
+            'velocity': packet.velocity,
+            'climb_rate': packet.climb_rate,
+            'course': packet.course,
+            'roll': attitude.roll if attitude else None,
+            'pitch': attitude.pitch if attitude else None,
+            'yaw': attitude.yaw if attitude else None,
+            'battery_voltage': packet.battery_voltage,
+            'battery_percent': packet.battery_percent,
+            'status': packet.status,
+            'raw_data': packet.model_dump_json()
+        }
+
     def get_flight_sessions(self) -> List[Dict]:
         """Tüm uçuş oturumlarını getir"""
         with self.get_session() as session:
             sessions = session.query(FlightSession).order_by(FlightSession.start_time.desc()).all()
             return [self._session_to_dict(s) for s in sessions]
 
+    def get_session_ids(self, status: str = None, start: datetime = None,
+                        end: datetime = None) -> List[int]:
+        """Filtreye uyan oturum kimlikleri (başlangıç zamanına göre sıralı)"""
+        query = "SELECT id FROM flight_sessions WHERE 1 = 1"
+        params = {}
+        if status:
+            query += " AND status = :status"
+            params['status'] = status
+        if start:
+            query += " AND start_time >= :start"
+            params['start'] = start.isoformat(sep=' ')
+        if end:
+            query += " AND start_time < :end"
+            params['end'] = end.isoformat(sep=' ')
+        with self.engine.connect() as connection:
+            return list(connection.execute(text(query + " ORDER BY start_time, id"), params).scalars())
+
+    def refresh_session_summaries(self, session_ids: List[int]) -> List[Dict]:
+        """Oturumların özet satırlarını yeniden hesapla ve yaz (tek işlem)"""
+        with self.engine.begin() as connection:
+            summaries = summarize_sessions(connection, session_ids)
+            if summaries:
+                connection.execute(delete(SessionSummary).where(
+                    SessionSummary.session_id.in_([s['session_id'] for s in summaries])))
+                connection.execute(insert(SessionSummary), summaries)
+        return summaries
+
+    def backfill_session_summaries(self, rebuild: bool = False, batch_size: int = 500) -> int:
+        """Özeti olmayan (rebuild=True ise tüm) oturumları toplu doldur
+
+        Oturumlar batch_size'lık gruplar halinde küme tabanlı sorgularla
+        hesaplanır. Kayıt süren oturum atlanır; kapanınca güncellenir.
+        """
+        query = "SELECT id FROM flight_sessions"
+        if not rebuild:
+            query += " WHERE id NOT IN (SELECT session_id FROM session_summaries)"
+        with self.engine.connect() as connection:
+            session_ids = [sid for sid in connection.execute(text(query)).scalars()
+                           if sid != self.current_session_id]
+
+        for i in range(0, len(session_ids), batch_size):
+            self.refresh_session_summaries(session_ids[i:i + batch_size])
+        if session_ids:
+            logger.info("Oturum özetleri dolduruldu: %d oturum", len(session_ids))
+        return len(session_ids)
+
+    def index_session_tracks(self, session_ids: List[int]):
+        """Oturumların iz parçalarını ve R*Tree kutularını yeniden oluştur"""
+        with self.engine.begin() as connection:
+            track_index.index_sessions(connection, session_ids, self.spatial_index)
+
+    def backfill_track_index(self, rebuild: bool = False, batch_size: int = 500) -> int:
+        """Parçası olmayan (rebuild=True ise tüm) oturumların izlerini indeksle"""
+        query = "SELECT id FROM flight_sessions"
+        if not rebuild:
+            query += " WHERE id NOT IN (SELECT DISTINCT session_id FROM track_segments)"
+        with self.engine.connect() as connection:
+            session_ids = [sid for sid in connection.execute(text(query)).scalars()
+                           if sid != self.current_session_id]
+
+        for i in range(0, len(session_ids), batch_size):
+            self.index_session_tracks(session_ids[i:i + batch_size])
+        if session_ids:
+            logger.info("İz indeksi dolduruldu: %d oturum", len(session_ids))
+        return len(session_ids)
+
+    def find_session_ids_in_bbox(self, min_lat: float, min_lon: float,
+                                 max_lat: float, max_lon: float) -> List[int]:
+        """Tüm iz kutusu alanla kesişen oturumlar (kaba, yalnızca oturum kutuları)"""
+        with self.engine.connect() as connection:
+            return track_index.query_session_ids(
+                connection, (min_lat, min_lon, max_lat, max_lon), self.spatial_index)
+
+    def find_sessions_in_bbox(self, min_lat: float, min_lon: float, max_lat: float,
+                              max_lon: float, exact: bool = True) -> List[Dict]:
+        """Alandan geçen oturumlar ve alanda bulunulan zaman aralıkları
+
+        exact=False: parça kutusu kesişen aralıklar (yalnızca indeks okunur);
+        exact=True: aday parçaların konumları süzülür, kesin aralıklar döner.
+        """
+        def inside(lats, lons):
+            return (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+
+        return self._find_sessions((min_lat, min_lon, max_lat, max_lon),
+                                   inside if exact else None)
+
+    def find_sessions_near(self, lat: float, lon: float, radius_m: float,
+                           exact: bool = True) -> List[Dict]:
+        """Noktanın radius_m yakınından geçen oturumlar (bkz. find_sessions_in_bbox)"""
+        from ..core.utils import EARTH_RADIUS_M, haversine
+
+        def inside(lats, lons):
+            return haversine(lats, lons, lat, lon) <= radius_m
+
+        bbox = track_index.radius_bbox(lat, lon, radius_m, EARTH_RADIUS_M)
+        return self._find_sessions(bbox, inside if exact else None)
+
+    def _find_sessions(self, bbox, inside) -> List[Dict]:
+        with self.engine.connect() as connection:
+            windows = track_index.query_windows(connection, bbox, self.spatial_index)
+            if inside is not None:
+                windows = track_index.refine_windows(connection, windows, inside)
+            else:
+                windows = {sid: [(datetime.fromisoformat(start), datetime.fromisoformat(end))
+                                 for start, end in session_windows]
+                           for sid, session_windows in windows.items()}
+            names = dict(connection.execute(
+                text("SELECT id, session_name FROM flight_sessions WHERE id IN :ids")
+                .bindparams(bindparam('ids', expanding=True)), {'ids': list(windows)}).all()) \
+                if windows else {}
+        return [{'session_id': sid, 'session_name': names.get(sid), 'windows': windows[sid]}
+                for sid in sorted(windows)]
+
+    def get_session_summaries(self, start: datetime = None, end: datetime = None,
+                              min_max_altitude: float = None) -> List[Dict]:
+        """Özet satırları (oturum adı ve durumuyla); yalnızca özet tablosu okunur
+
+        Örnek: get_session_summaries(min_max_altitude=120) -> 120 m'yi aşan uçuşlar
+        """
+        query = ("SELECT s.*, f.session_name, f.status FROM session_summaries s "
+                 "JOIN flight_sessions f ON f.id = s.session_id WHERE 1 = 1")
+        params = {}
+        if start:
+            query += " AND s.start_time >= :start"
+            params['start'] = start.isoformat(sep=' ')
+        if end:
+            query += " AND s.start_time < :end"
+            params['end'] = end.isoformat(sep=' ')
+        if min_max_altitude is not None:
+            query += " AND s.max_altitude > :altitude"
+            params['altitude'] = min_max_altitude
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(query + " ORDER BY s.start_time, s.session_id"),
+                                      params).mappings().all()
+        datetime_keys = ('computed_time', 'start_time', 'end_time')
+        return [{key: datetime.fromisoformat(value) if key in datetime_keys and value else value
+                 for key, value in row.items()} for row in rows]
+
+    def get_fleet_statistics(self, start: datetime = None, end: datetime = None) -> Dict:
+        """Özet tablosundan filo toplamları (uçuş başına tek satır okunur)"""
+        query = """
+            SELECT COUNT(*), SUM(duration_s), SUM(distance_m), SUM(record_count),
+                   MAX(max_altitude), MAX(max_velocity), AVG(battery_drain_per_min),
+                   SUM(time_above_50m_s), SUM(time_above_100m_s), SUM(time_above_120m_s),
+                   SUM(alert_count), SUM(critical_alerts)
+            FROM session_summaries WHERE record_count > 0"""
+        params = {}
+        if start:
+            query += " AND start_time >= :start"
+            params['start'] = start.isoformat(sep=' ')
+        if end:
+            query += " AND start_time < :end"
+            params['end'] = end.isoformat(sep=' ')
+        with self.engine.connect() as connection:
+            row = connection.execute(text(query), params).one()
+        keys = ('flights', 'total_duration_s', 'total_distance_m', 'total_records',
+                'max_altitude', 'max_velocity', 'avg_battery_drain_per_min',
+                'time_above_50m_s', 'time_above_100m_s', 'time_above_120m_s',
+                'alert_count', 'critical_alerts')
+        return dict(zip(keys, row))
+
+    def save_mission(self, mission_name: str, waypoints: List[Dict], replace: bool = True) -> int:
+        """Görev noktalarını tek işlemde kaydet (executemany + upsert)
+
+        Satırlar (mission_name, order_index) üzerinden eklenir ya da
+        güncellenir. replace=True ise sıra listedeki konumdur ve listede
+        olmayan fazla noktalar silinir; replace=False ise her noktanın
+        kendi order_index'i kullanılır, diğer noktalara dokunulmaz.
+        """
+        rows = []
+        for position, waypoint in enumerate(waypoints):
+            row = {field: waypoint.get(field, default) for field, default in WAYPOINT_FIELDS.items()}
+            row.update(mission_name=mission_name,
+                       order_index=position if replace else waypoint.get('order_index', position))
+            rows.append(row)
+
+        table = Waypoint.__table__
+        statement = sqlite_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=['mission_name', 'order_index'],
+            set_={field: statement.excluded[field] for field in WAYPOINT_FIELDS})
+        with self.engine.begin() as connection:
+            if rows:
+                connection.execute(statement, rows)
+            if replace:
+                connection.execute(delete(table).where(table.c.mission_name == mission_name,
+                                                       table.c.order_index >= len(rows)))
+        logger.debug("Görev kaydedildi: %s (%d waypoint)", mission_name, len(rows))
+        return len(rows)
+
+    def load_mission(self, mission_name: str) -> List[Dict]:
+        """Görev noktalarını sırasıyla getir (kayıtlı görev yoksa boş liste)"""
+        keys = ('mission_name', 'order_index') + tuple(WAYPOINT_FIELDS)
+        with self.engine.connect() as connection:
+            rows = connection.exec_driver_sql(
+                f"SELECT {', '.join(keys)} FROM waypoints "
+                f"WHERE mission_name = ? ORDER BY order_index", (mission_name,)).all()
+        return [dict(zip(keys, row)) for row in rows]
+
+    def delete_mission(self, mission_name: str) -> int:
+        """Görevin tüm noktalarını sil; silinen nokta sayısı"""
+        with self.get_session() as session:
+            result = session.execute(delete(Waypoint).where(Waypoint.mission_name == mission_name))
+            return result.rowcount
+
+    def get_missions(self) -> List[Dict]:
+        """Kayıtlı görevler (son kaydedilen önce)"""
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(
+                "SELECT mission_name, COUNT(*) AS waypoint_count, MAX(created_time) AS created_time "
+                "FROM waypoints GROUP BY mission_name ORDER BY MAX(created_time) DESC, mission_name"))
+            return [dict(row, created_time=datetime.fromisoformat(row['created_time'])
+                         if row['created_time'] else None) for row in rows.mappings()]
+
+    def get_flight_session(self, session_id: int) -> Optional[Dict]:
+        """Tek oturumu birincil anahtarla getir"""
+        with self.get_session() as session:
+            flight_session = session.get(FlightSession, session_id)
+            return self._session_to_dict(flight_session) if flight_session else None
+
+    def get_session_report_stats(self, session_id: int, fields=REPORT_FIELDS,
+                                 percentiles=REPORT_PERCENTILES, histogram_bins: int = 10) -> Dict:
+        """Oturum istatistiklerini SQL'de hesapla (kayıtlar Python'a taşınmaz)
+
+        Alan başına: count, min, max, avg, yüzdelikler (en yakın sıra) ve
+        eşit aralıklı histogram.
+        """
+        params = {'sid': session_id}
+        aggregates = ", ".join(
+            f"COUNT({f}), MIN({f}), MAX({f}), AVG({f})" for f in fields)
+        with self.engine.connect() as connection:
+            row = connection.execute(text(
+                f"SELECT COUNT(*), MIN(timestamp), MAX(timestamp), {aggregates} "
+                f"FROM telemetry_records WHERE session_id = :sid"), params).one()
+            first_battery, last_battery = (
+                connection.execute(text(
+                    "SELECT battery_percent FROM telemetry_records "
+                    "WHERE session_id = :sid AND battery_percent IS NOT NULL "
+                    f"ORDER BY timestamp {order}, id {order} LIMIT 1"), params).scalar()
+                for order in ('ASC', 'DESC'))
+
+            start_time, end_time = (datetime.fromisoformat(v) if isinstance(v, str) else v
+                                    for v in row[1:3])
+            stats = {'total_records': row[0], 'start_time': start_time, 'end_time': end_time,
+                     'battery_start': first_battery, 'battery_end': last_battery, 'fields': {}}
+            for i, field in enumerate(fields):
+                count, low, high, mean = row[3 + 4 * i: 7 + 4 * i]
+                field_stats = {'count': count, 'min': low, 'max': high, 'avg': mean,
+                               'percentiles': {}, 'histogram': {'edges': [], 'counts': []}}
+                if count:
+                    field_stats['percentiles'] = self._sql_percentiles(
+                        connection, field, session_id, count, percentiles)
+                    field_stats['histogram'] = self._sql_histogram(
+                        connection, field, session_id, low, high, histogram_bins)
+                stats['fields'][field] = field_stats
+        return stats
+
+    @staticmethod
+    def _sql_percentiles(connection, field: str, session_id: int, count: int,
+                         percentiles) -> Dict:
+        """En yakın sıra yöntemiyle yüzdelikler (tek sıralama)"""
+        ranks = {p: max(1, math.ceil(p / 100.0 * count)) for p in percentiles}
+        rank_list = ", ".join(str(r) for r in sorted(set(ranks.values())))
+        values = dict(connection.execute(text(
+            f"SELECT rn, value FROM (SELECT {field} AS value, "
+            f"ROW_NUMBER() OVER (ORDER BY {field}) AS rn FROM telemetry_records "
+            f"WHERE session_id = :sid AND {field} IS NOT NULL) WHERE rn IN ({rank_list})"),
+            {'sid': session_id}).all())
+        return {f"p{p}": values.get(rank) for p, rank in ranks.items()}
+
+    @staticmethod
+    def _sql_histogram(connection, field: str, session_id: int, low: float, high: float,
+                       bins: int) -> Dict:
+        """[low, high] aralığında eşit genişlikli histogram (GROUP BY)"""
+        width = (high - low) / bins if high > low else 1.0
+        counts = [0] * bins
+        for index, count in connection.execute(text(
+                f"SELECT MIN(CAST(({field} - :low) / :width AS INTEGER), :last) AS bin, COUNT(*) "
+                f"FROM telemetry_records WHERE session_id = :sid AND {field} IS NOT NULL "
+                f"GROUP BY bin"),
+                {'sid': session_id, 'low': low, 'width': width, 'last': bins - 1}):
+            counts[index] = count
+        return {'edges': [low + width * i for i in range(bins + 1)], 'counts': counts}
+
+    def get_session_track(self, session_id: int) -> Tuple[List[float], List[float]]:
+        """Oturumun yalnızca enlem/boylam kolonları (zaman sırasıyla)"""
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(
+                "SELECT latitude, longitude FROM telemetry_records WHERE session_id = :sid "
+                "ORDER BY timestamp, id"), {'sid': session_id}).all()
+        return [r[0] for r in rows], [r[1] for r in rows]
+
     def get_session_telemetry(self, session_id: int, limit: int = None) -> List[Dict]:
         """Belirli oturumun telemetri verilerini getir"""
         with self.get_session() as session:
@@ -164,44 +556,15 @@ class DatabaseManager:
                        .all())
             return [self._record_to_dict(r) for r in records[::-1]]  # Ters çevir
 
-    def _calculate_session_stats(self, session_id: int) -> Dict:
-        """Oturum istatistiklerini hesapla"""
+    def get_session_alerts(self, session_id: int = None) -> List[Dict]:
+        """Oturumun alarm kayıtlarını getir"""
+        session_id = session_id or self.current_session_id
         with self.get_session() as session:
-            records = session.query(TelemetryRecord).filter_by(session_id=session_id).all()
-
-            if not records:
-                return {'duration': 0, 'max_altitude': 0, 'max_velocity': 0,
-                        'min_battery': 100, 'total_distance': 0}
-
-            # Süre hesapla
-            start_time = min(r.timestamp for r in records)
-            end_time = max(r.timestamp for r in records)
-            duration = (end_time - start_time).total_seconds()
-
-            # Diğer istatistikler
-            altitudes = [r.altitude for r in records if r.altitude is not None]
-            velocities = [r.velocity for r in records if r.velocity is not None]
-            batteries = [r.battery_percent for r in records if r.battery_percent is not None]
-
-            # Mesafe hesapla (basit Euclidean)
-            total_distance = 0
-            for i in range(1, len(records)):
-                prev = records[i - 1]
-                curr = records[i]
-                if prev.latitude and curr.latitude:
-                    # Basit mesafe hesaplaması (gerçek projede Haversine kullanın)
-                    lat_diff = curr.latitude - prev.latitude
-                    lon_diff = curr.longitude - prev.longitude
-                    distance = ((lat_diff ** 2 + lon_diff ** 2) ** 0.5) * 111000  # Yaklaşık metre
-                    total_distance += distance
-
-            return {
-                'duration': duration,
-                'max_altitude': max(altitudes) if altitudes else 0,
-                'max_velocity': max(velocities) if velocities else 0,
-                'min_battery': min(batteries) if batteries else 100,
-                'total_distance': total_distance
-            }
+            alerts = (session.query(AlertLog)
+                      .filter_by(session_id=session_id)
+                      .order_by(AlertLog.timestamp, AlertLog.id)
+                      .all())
+            return [self._alert_to_dict(a) for a in alerts]
 
     def _session_to_dict(self, session: FlightSession) -> Dict:
         """FlightSession nesnesini dict'e çevir"""
@@ -229,6 +592,8 @@ class DatabaseManager:
             'longitude': record.longitude,
             'altitude': record.altitude,
             'velocity': record.velocity,
+            'climb_rate': record.climb_rate,
+            'course': record.course,
             'roll': record.roll,
             'pitch': record.pitch,
             'yaw': record.yaw,
@@ -237,18 +602,33 @@ class DatabaseManager:
             'status': record.status
         }
 
+    def _alert_to_dict(self, alert: AlertLog) -> Dict:
+        """AlertLog nesnesini dict'e çevir"""
+        return {
+            'id': alert.id,
+            'session_id': alert.session_id,
+            'alert_type': alert.alert_type,
+            'severity': alert.severity,
+            'message': alert.message,
+            'first_time': alert.timestamp,
+            'last_time': alert.last_time or alert.timestamp,
+            'occurrences': alert.occurrences or 1,
+            'resolved': alert.resolved,
+            'resolved_time': alert.resolved_time
+        }
+
     def export_session_csv(self, session_id: int, output_path: str):
         """Oturum verilerini CSV olarak dışa aktar"""
         import pandas as pd
 
         records = self.get_session_telemetry(session_id)
         if not records:
-            print("Dışa aktarılacak veri bulunamadı")
+            logger.warning("Dışa aktarılacak veri bulunamadı")
             return
 
         df = pd.DataFrame(records)
         df.to_csv(output_path, index=False)
-        print(f"Veriler dışa aktarıldı: {output_path}")
+        logger.info("Veriler dışa aktarıldı: %s", output_path)
 
     def get_database_info(self) -> Dict:
         """Veritabanı bilgilerini getir"""
@@ -1,5 +1,5 @@
 # src/database/models.py
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Text
+from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -31,6 +31,8 @@ class FlightSession(Base):
 class TelemetryRecord(Base):
     """Telemetri kayıt tablosu"""
     __tablename__ = 'telemetry_records'
+    # Oturum bazlı sorgular (rapor, dışa aktarma) tüm tabloyu taramasın
+    __table_args__ = (Index('ix_telemetry_records_session_time', 'session_id', 'timestamp'),)
 
     id = Column(Integer, primary_key=True)
     session_id = Column(Integer, nullable=False)  # FlightSession'a referans
@@ -42,7 +44,9 @@ class TelemetryRecord(Base):
     altitude = Column(Float, nullable=False)
 
     # Hareket verileri
-    velocity = Column(Float)
+    velocity = Column(Float)  # Yer hızı (m/s)
+    climb_rate = Column(Float)  # Dikey hız (m/s)
+    course = Column(Float)  # Yer rotası (derece)
     roll = Column(Float)
     pitch = Column(Float)
     yaw = Column(Float)
@@ -65,7 +69,9 @@ class AlertLog(Base):
 
     id = Column(Integer, primary_key=True)
     session_id = Column(Integer, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.now)
+    timestamp = Column(DateTime, nullable=False, default=datetime.now)  # İlk görülme
+    last_time = Column(DateTime)  # Son görülme (birleştirilmiş tekrarlar)
+    occurrences = Column(Integer, default=1)  # Birleştirilen tekrar sayısı
     alert_type = Column(String(100), nullable=False)  # BATTERY_LOW, GPS_LOST, etc.
     severity = Column(String(20), nullable=False)  # INFO, WARNING, CRITICAL
     message = Column(String(500), nullable=False)
@@ -76,9 +82,89 @@ class AlertLog(Base):
         return f"<AlertLog(type='{self.alert_type}', severity='{self.severity}')>"
 
 
+class SessionSummary(Base):
+    """Oturum başına önceden hesaplanmış özet (filo sorguları tek satır okur)
+
+    Oturum kapanırken güncellenir; eski oturumlar toplu olarak doldurulur
+    (bkz. src/database/session_summary.py).
+    """
+    __tablename__ = 'session_summaries'
+    __table_args__ = (Index('ix_session_summaries_start_time', 'start_time'),)
+
+    session_id = Column(Integer, primary_key=True)  # FlightSession'a referans
+    computed_time = Column(DateTime, nullable=False, default=datetime.now)
+    start_time = Column(DateTime)  # İlk telemetri kaydı
+    end_time = Column(DateTime)  # Son telemetri kaydı
+    duration_s = Column(Float)
+    record_count = Column(Integer, nullable=False, default=0)
+    distance_m = Column(Float)
+
+    # Yükseklik / hız dağılımı
+    min_altitude = Column(Float)
+    max_altitude = Column(Float)
+    avg_altitude = Column(Float)
+    altitude_p50 = Column(Float)
+    altitude_p95 = Column(Float)
+    max_velocity = Column(Float)
+    avg_velocity = Column(Float)
+    velocity_p50 = Column(Float)
+    velocity_p95 = Column(Float)
+
+    # Yükseklik bantlarının üstünde geçen süre (saniye)
+    time_above_50m_s = Column(Float)
+    time_above_100m_s = Column(Float)
+    time_above_120m_s = Column(Float)
+
+    # Batarya
+    battery_start = Column(Float)
+    battery_end = Column(Float)
+    battery_min = Column(Float)
+    battery_drain_per_min = Column(Float)  # Yüzde / dakika
+
+    # Alarmlar
+    alert_count = Column(Integer, default=0)  # Birleştirilmiş tekrarlar dahil
+    warning_alerts = Column(Integer, default=0)
+    critical_alerts = Column(Integer, default=0)
+
+    # Sınırlayıcı kutu
+    min_latitude = Column(Float)
+    max_latitude = Column(Float)
+    min_longitude = Column(Float)
+    max_longitude = Column(Float)
+
+    def __repr__(self):
+        return f"<SessionSummary(session={self.session_id}, records={self.record_count})>"
+
+
+class TrackSegment(Base):
+    """İz parçası sınırlayıcı kutusu (mekânsal sorgular için)
+
+    Kutular ayrıca track_segments_rtree sanal tablosunda (SQLite R*Tree)
+    indekslenir; bkz. src/database/track_index.py.
+    """
+    __tablename__ = 'track_segments'
+    __table_args__ = (Index('ix_track_segments_session', 'session_id', 'segment_index'),)
+
+    id = Column(Integer, primary_key=True)  # R*Tree satırıyla aynı kimlik
+    session_id = Column(Integer, nullable=False)
+    segment_index = Column(Integer, nullable=False)  # Oturum içinde sıra
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    record_count = Column(Integer, nullable=False)
+    min_latitude = Column(Float, nullable=False)
+    max_latitude = Column(Float, nullable=False)
+    min_longitude = Column(Float, nullable=False)
+    max_longitude = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<TrackSegment(session={self.session_id}, index={self.segment_index})>"
+
+
 class Waypoint(Base):
     """Waypoint/Görev noktaları tablosu"""
     __tablename__ = 'waypoints'
+    # Görev yükleme sırası ve toplu kaydetmede upsert anahtarı
+    __table_args__ = (Index('ux_waypoints_mission_order', 'mission_name', 'order_index', unique=True),)
 
     id = Column(Integer, primary_key=True)
     mission_name = Column(String(200), nullable=False)
@@ -0,0 +1,164 @@
+# src/database/session_summary.py
+"""
+Oturum özet tablosu (session_summaries) hesaplaması
+
+Özetler küme tabanlı hesaplanır: aynı sorgular tek oturum için (oturum
+kapanırken) de yüzlerce oturum için (toplu doldurma) de çalışır; oturum
+başına ayrı tarama yapılmaz. Toplamlar ve alarm sayıları SQL'de GROUP BY
+ile, iz gerektiren metrikler (mesafe, yükseklik bantları, yüzdelikler)
+zaman sıralı tek taramadan NumPy ile bulunur.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import bindparam, text
+
+# models.SessionSummary'deki time_above_<bant>m_s kolonlarıyla aynı olmalı
+ALTITUDE_BANDS = (50, 100, 120)
+SUMMARY_PERCENTILES = (50, 95)
+PERCENTILE_FIELDS = ('altitude', 'velocity')
+
+# Bant süresinde iki örnek arası en fazla bu kadar sayılır (bağlantı kopması)
+MAX_SAMPLE_GAP_S = 5.0
+
+
+def _query(connection, sql: str, params: Dict):
+    statement = text(sql).bindparams(bindparam('ids', expanding=True))
+    return connection.execute(statement, params).all()
+
+
+def _as_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _empty_summary(session_id: int, now: datetime) -> Dict:
+    summary = {
+        'session_id': session_id, 'computed_time': now, 'start_time': None, 'end_time': None,
+        'duration_s': 0.0, 'record_count': 0, 'distance_m': 0.0,
+        'min_altitude': None, 'max_altitude': None, 'avg_altitude': None,
+        'max_velocity': None, 'avg_velocity': None,
+        'battery_start': None, 'battery_end': None, 'battery_min': None,
+        'battery_drain_per_min': None,
+        'alert_count': 0, 'warning_alerts': 0, 'critical_alerts': 0,
+        'min_latitude': None, 'max_latitude': None,
+        'min_longitude': None, 'max_longitude': None,
+    }
+    for field in PERCENTILE_FIELDS:
+        for p in SUMMARY_PERCENTILES:
+            summary[f"{field}_p{p}"] = None
+    for band in ALTITUDE_BANDS:
+        summary[f"time_above_{band}m_s"] = 0.0
+    return summary
+
+
+def summarize_sessions(connection, session_ids: Iterable[int]) -> List[Dict]:
+    """Verilen oturumların session_summaries satırlarını hesapla"""
+    ids = sorted(set(session_ids))
+    if not ids:
+        return []
+    params = {'ids': ids}
+    now = datetime.now()
+    summaries = {sid: _empty_summary(sid, now) for sid in ids}
+
+    # Temel toplamlar ve sınırlayıcı kutu (enlem 0: konum yok)
+    for row in _query(connection, """
+            SELECT session_id, COUNT(*), MIN(timestamp), MAX(timestamp),
+                   MIN(altitude), MAX(altitude), AVG(altitude), MAX(velocity), AVG(velocity),
+                   MIN(battery_percent),
+                   MIN(NULLIF(latitude, 0)), MAX(NULLIF(latitude, 0)),
+                   MIN(CASE WHEN latitude != 0 THEN longitude END),
+                   MAX(CASE WHEN latitude != 0 THEN longitude END)
+            FROM telemetry_records WHERE session_id IN :ids GROUP BY session_id""", params):
+        summary = summaries[row[0]]
+        start, end = _as_datetime(row[2]), _as_datetime(row[3])
+        summary.update(
+            record_count=row[1], start_time=start, end_time=end,
+            duration_s=(end - start).total_seconds(),
+            min_altitude=row[4], max_altitude=row[5], avg_altitude=row[6],
+            max_velocity=row[7], avg_velocity=row[8], battery_min=row[9],
+            min_latitude=row[10], max_latitude=row[11],
+            min_longitude=row[12], max_longitude=row[13])
+
+    # İlk/son batarya okuması ve dakika başına tüketim: ilişkili alt sorgular
+    # (session_id, timestamp) indeksinden oturum başına birkaç satır okur
+    reading = ("(SELECT {column} FROM telemetry_records t WHERE t.session_id = f.id "
+               "AND t.battery_percent IS NOT NULL ORDER BY t.timestamp {order}, t.id {order} LIMIT 1)")
+    columns = ", ".join(reading.format(column=column, order=order)
+                        for order in ('ASC', 'DESC') for column in ('timestamp', 'battery_percent'))
+    for session_id, t_start, start, t_end, end in _query(
+            connection, f"SELECT f.id, {columns} FROM flight_sessions f WHERE f.id IN :ids", params):
+        if start is None:
+            continue
+        minutes = (_as_datetime(t_end) - _as_datetime(t_start)).total_seconds() / 60.0
+        summaries[session_id].update(
+            battery_start=start, battery_end=end,
+            battery_drain_per_min=(start - end) / minutes if minutes > 0 else None)
+
+    # Alarm kayıtları (birleştirilmiş tekrarlar tek kayıt sayılır)
+    for session_id, total, warnings, criticals in _query(connection, """
+            SELECT session_id, COUNT(*), SUM(severity = 'WARNING'), SUM(severity = 'CRITICAL')
+            FROM alert_logs WHERE session_id IN :ids GROUP BY session_id""", params):
+        summaries[session_id].update(alert_count=total, warning_alerts=warnings,
+                                     critical_alerts=criticals)
+
+    _add_track_metrics(connection, ids, summaries, params)
+    return [summaries[sid] for sid in ids]
+
+
+def _add_track_metrics(connection, ids: List[int], summaries: Dict, params: Dict):
+    """Mesafe, yükseklik bantları ve yüzdelikler: zaman sıralı tek tarama + NumPy
+
+    Oturum başına pencere fonksiyonlu sorgular her alan için ayrı sıralama
+    gerektirir; kayıtlar (session_id, timestamp) indeksi sırasıyla bir kez
+    okunup oturum sınırlarına göre bincount/lexsort ile gruplanır.
+    """
+    import numpy as np
+    from ..core.utils import segment_distances
+
+    fields = ", ".join(PERCENTILE_FIELDS)
+    rows = _query(connection, f"""
+        SELECT session_id, (julianday(timestamp) - 2440587.5) * 86400.0,
+               latitude, longitude, altitude, {fields}
+        FROM telemetry_records WHERE session_id IN :ids
+        ORDER BY session_id, timestamp, id""", params)
+    if not rows:
+        return
+
+    # Row nesneleri NumPy'a doğrudan verilirse anahtar araması yapılır: önce tuple
+    data = np.array([tuple(row) for row in rows], dtype=float)
+    index = np.searchsorted(ids, data[:, 0].astype(np.int64))  # ids içindeki sıra
+    times, lats, lons, altitudes = data[:, 1], data[:, 2], data[:, 3], data[:, 4]
+    lats[lats == 0] = np.nan  # Konumu olmayan kayıtlar; bunlara değen segmentler atlanır
+    same_session = index[1:] == index[:-1]
+
+    def per_session(mask, weights):
+        return np.bincount(index[1:][mask], weights=weights[mask], minlength=len(ids)).tolist()
+
+    segments = segment_distances(lats, lons)
+    distances = per_session(same_session & np.isfinite(segments), segments)
+
+    # Her örnek bir sonrakine kadar geçen süreyi taşır (bağlantı kopması kırpılır)
+    gaps = np.minimum(np.diff(times), MAX_SAMPLE_GAP_S)
+    bands = {band: per_session(same_session & (altitudes[:-1] >= band), gaps)
+             for band in ALTITUDE_BANDS}
+
+    for i, session_id in enumerate(ids):
+        summary = summaries[session_id]
+        summary['distance_m'] = distances[i]
+        for band in ALTITUDE_BANDS:
+            summary[f"time_above_{band}m_s"] = bands[band][i]
+
+    # En yakın sıra yüzdelikleri (DatabaseManager._sql_percentiles ile aynı):
+    # oturum ve değere göre tek lexsort, oturum başlangıcından ceil(p/100 * n). sıra
+    for column, field in enumerate(PERCENTILE_FIELDS, start=5):
+        values = data[:, column]
+        present = ~np.isnan(values)
+        ordered = values[present][np.lexsort((values[present], index[present]))]
+        counts = np.bincount(index[present], minlength=len(ids))
+        offsets = np.cumsum(counts) - counts
+        sessions = np.flatnonzero(counts)
+        for p in SUMMARY_PERCENTILES:
+            positions = offsets[sessions] + np.maximum(1, (p * counts[sessions] + 99) // 100) - 1
+            for i, value in zip(sessions.tolist(), ordered[positions].tolist()):
+                summaries[ids[i]][f"{field}_p{p}"] = value
@@ -0,0 +1,186 @@
+# src/database/track_index.py
+"""
+Uçuş izleri için mekânsal indeks (SQLite R*Tree)
+
+Her oturumun zaman sıralı konumları SEGMENT_SIZE'lık parçalara bölünür;
+parçaların sınırlayıcı kutuları track_segments tablosunda tutulur ve
+track_segments_rtree sanal tablosunda indekslenir. Oturumun tüm izini
+kapsayan kutu ayrıca session_tracks_rtree'de bulunur. Parça kutusu her
+konumdan bir sonrakine giden doğruyu da kapsar; parçalar arası geçişler
+sorgularda kaçmaz.
+
+R*Tree koordinatları 32 bit saklar ve dışa doğru yuvarlar: sorgu yanlış
+negatif vermez, kesin sonuç için konumlar ayrıca süzülür (exact=True).
+SQLite rtree modülü olmadan derlenmişse aynı sorgular track_segments
+tablosunun kolonları üzerinde çalışır.
+"""
+
+import math
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import OperationalError
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SEGMENT_RTREE = 'track_segments_rtree'
+SESSION_RTREE = 'session_tracks_rtree'
+SEGMENT_SIZE = 60  # Parça başına konum (1 Hz'de ~1 dakika)
+
+
+def _execute(connection, sql: str, params: Dict):
+    statement = text(sql)
+    if 'ids' in params:
+        statement = statement.bindparams(bindparam('ids', expanding=True))
+    return connection.execute(statement, params)
+
+
+def _as_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def create_rtree_tables(connection) -> bool:
+    """R*Tree sanal tablolarını oluştur; modül yoksa False"""
+    try:
+        for table in (SEGMENT_RTREE, SESSION_RTREE):
+            connection.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} "
+                f"USING rtree(id, min_lat, max_lat, min_lon, max_lon)")
+    except OperationalError as e:
+        logger.warning("SQLite R*Tree kullanılamıyor, mekânsal sorgular taramayla çalışacak: %s", e)
+        return False
+    return True
+
+
+def has_rtree_tables(connection) -> bool:
+    return connection.execute(text(
+        "SELECT COUNT(*) FROM sqlite_master WHERE name IN (:segments, :sessions)"),
+        {'segments': SEGMENT_RTREE, 'sessions': SESSION_RTREE}).scalar() == 2
+
+
+def index_sessions(connection, session_ids: List[int], rtree: bool,
+                   segment_size: int = SEGMENT_SIZE):
+    """Oturumların parçalarını yeniden oluştur (tamamı SQL içinde, tek geçiş)"""
+    params = {'ids': list(session_ids)}
+    if rtree:
+        _execute(connection, f"DELETE FROM {SEGMENT_RTREE} WHERE id IN "
+                             f"(SELECT id FROM track_segments WHERE session_id IN :ids)", params)
+        _execute(connection, f"DELETE FROM {SESSION_RTREE} WHERE id IN :ids", params)
+    _execute(connection, "DELETE FROM track_segments WHERE session_id IN :ids", params)
+
+    # Her konum bir sonrakine kadar olan doğruyu kapsar (LEAD); enlem 0: konum yok
+    _execute(connection, """
+        INSERT INTO track_segments (session_id, segment_index, start_time, end_time, record_count,
+                                    min_latitude, max_latitude, min_longitude, max_longitude)
+        SELECT session_id, segment, MIN(timestamp), MAX(timestamp), COUNT(*),
+               MIN(lat_low), MAX(lat_high), MIN(lon_low), MAX(lon_high)
+        FROM (
+            SELECT session_id, timestamp,
+                   (ROW_NUMBER() OVER w - 1) / :size AS segment,
+                   MIN(latitude, COALESCE(LEAD(latitude) OVER w, latitude)) AS lat_low,
+                   MAX(latitude, COALESCE(LEAD(latitude) OVER w, latitude)) AS lat_high,
+                   MIN(longitude, COALESCE(LEAD(longitude) OVER w, longitude)) AS lon_low,
+                   MAX(longitude, COALESCE(LEAD(longitude) OVER w, longitude)) AS lon_high
+            FROM telemetry_records
+            WHERE session_id IN :ids AND latitude != 0
+            WINDOW w AS (PARTITION BY session_id ORDER BY timestamp, id))
+        GROUP BY session_id, segment""", dict(params, size=segment_size))
+
+    if rtree:
+        _execute(connection, f"""
+            INSERT INTO {SEGMENT_RTREE}
+            SELECT id, min_latitude, max_latitude, min_longitude, max_longitude
+            FROM track_segments WHERE session_id IN :ids""", params)
+        _execute(connection, f"""
+            INSERT INTO {SESSION_RTREE}
+            SELECT session_id, MIN(min_latitude), MAX(max_latitude),
+                   MIN(min_longitude), MAX(max_longitude)
+            FROM track_segments WHERE session_id IN :ids GROUP BY session_id""", params)
+
+
+def query_session_ids(connection, bbox: Tuple[float, float, float, float],
+                      rtree: bool) -> List[int]:
+    """Tüm iz kutusu bbox ile kesişen oturumlar (kaba aday listesi)"""
+    params = dict(zip(('min_lat', 'min_lon', 'max_lat', 'max_lon'), bbox))
+    if rtree:
+        sql = (f"SELECT id FROM {SESSION_RTREE} WHERE max_lat >= :min_lat AND min_lat <= :max_lat "
+               f"AND max_lon >= :min_lon AND min_lon <= :max_lon ORDER BY id")
+    else:
+        sql = ("SELECT DISTINCT session_id FROM track_segments "
+               "WHERE max_latitude >= :min_lat AND min_latitude <= :max_lat "
+               "AND max_longitude >= :min_lon AND min_longitude <= :max_lon ORDER BY session_id")
+    return list(connection.execute(text(sql), params).scalars())
+
+
+def query_windows(connection, bbox: Tuple[float, float, float, float],
+                  rtree: bool) -> Dict[int, List[List]]:
+    """bbox ile kesişen parçalar; ardışık parçalar tek zaman aralığında birleşir
+
+    Dönüş: oturum -> [[başlangıç, bitiş], ...] (veritabanındaki zaman metni)
+    """
+    params = dict(zip(('min_lat', 'min_lon', 'max_lat', 'max_lon'), bbox))
+    if rtree:
+        sql = (f"SELECT s.session_id, s.segment_index, s.start_time, s.end_time "
+               f"FROM {SEGMENT_RTREE} r JOIN track_segments s ON s.id = r.id "
+               f"WHERE r.max_lat >= :min_lat AND r.min_lat <= :max_lat "
+               f"AND r.max_lon >= :min_lon AND r.min_lon <= :max_lon")
+    else:
+        sql = ("SELECT s.session_id, s.segment_index, s.start_time, s.end_time "
+               "FROM track_segments s WHERE s.max_latitude >= :min_lat "
+               "AND s.min_latitude <= :max_lat AND s.max_longitude >= :min_lon "
+               "AND s.min_longitude <= :max_lon")
+
+    windows: Dict[int, List[List]] = {}
+    previous = None
+    for session_id, index, start, end in connection.execute(
+            text(sql + " ORDER BY s.session_id, s.segment_index"), params):
+        session_windows = windows.setdefault(session_id, [])
+        if previous == (session_id, index - 1):
+            session_windows[-1][1] = end
+        else:
+            session_windows.append([start, end])
+        previous = (session_id, index)
+    return windows
+
+
+def refine_windows(connection, windows: Dict[int, List[List]],
+                   inside: Callable) -> Dict[int, List[Tuple[datetime, datetime]]]:
+    """Aday aralıklardaki konumları süz; alan içinde kalınan kesin aralıkları döndür
+
+    inside(lats, lons) -> bool dizisi (NumPy). Yalnızca aday parçaların
+    kayıtları (session_id, timestamp) indeksiyle okunur.
+    """
+    import numpy as np
+
+    refined = {}
+    for session_id, session_windows in windows.items():
+        result = []
+        for start, end in session_windows:
+            rows = connection.execute(text(
+                "SELECT timestamp, latitude, longitude FROM telemetry_records "
+                "WHERE session_id = :sid AND timestamp BETWEEN :start AND :end "
+                "AND latitude != 0 ORDER BY timestamp, id"),
+                {'sid': session_id, 'start': start, 'end': end}).all()
+            if not rows:
+                continue
+            coords = np.array([(row[1], row[2]) for row in rows], dtype=float)
+            mask = np.asarray(inside(coords[:, 0], coords[:, 1]), dtype=np.int8)
+            # İçeride kalınan ardışık konum dizilerinin ilk ve son indeksleri
+            edges = np.diff(np.concatenate(([0], mask, [0])))
+            for first, last in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1):
+                result.append((_as_datetime(rows[first][0]), _as_datetime(rows[last][0])))
+        if result:
+            refined[session_id] = result
+    return refined
+
+
+def radius_bbox(lat: float, lon: float, radius_m: float,
+                earth_radius_m: float) -> Tuple[float, float, float, float]:
+    """Daireyi kapsayan kutu (kutba yakın enlemde boylam payı genişler)"""
+    dlat = math.degrees(radius_m / earth_radius_m)
+    extreme_lat = min(89.9, abs(lat) + dlat)
+    dlon = min(180.0, dlat / max(math.cos(math.radians(extreme_lat)), 1e-6))
+    return lat - dlat, lon - dlon, lat + dlat, lon + dlon
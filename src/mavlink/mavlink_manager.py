@@ -1,16 +1,28 @@
 # src/mavlink/mavlink_manager.py
 from pymavlink import mavutil
+import math
 import time
 import threading
 from datetime import datetime
 from typing import Optional, Dict, Any, Callable
 
+from src.core.geodesy import METERS_PER_DEGREE_LAT
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# MAVLink'te "bilinmiyor" anlamına gelen uint16 değeri (vel, cog, hdg)
+UINT16_UNKNOWN = 65535
+
 
 class MAVLinkManager:
     """MAVLink protokol yönetimi sınıfı"""
 
-    def __init__(self):
+    def __init__(self, poll_interval_s: float = 1.0):
         self.connection = None
+        # recv_match zaman aşımı, simüle mesaj aralığı ve hata sonrası bekleme (s)
+        self.poll_interval_s = poll_interval_s
+        self._simulated_track = None  # Simüle modda uçağın konumu ve hızı
         self.is_connected = False
         self.is_running = False
         self.thread = None
@@ -26,8 +38,10 @@ class MAVLinkManager:
         self.last_gps = None
         self.last_attitude = None
         self.last_battery = None
+        self.last_global_position = None  # GLOBAL_POSITION_INT hızları (NED, m/s)
+        self.last_received_ns = None  # Son mesajın alındığı an (monotonik, ns)
 
-        print("MAVLink Manager başlatıldı")
+        logger.debug("MAVLink Manager başlatıldı")
 
     def create_simulated_connection(self):
         """Simüle MAVLink bağlantısı oluştur"""
@@ -36,7 +50,7 @@ class MAVLinkManager:
         # Simüle mod - gerçek bağlantı kurmuyoruz
         self.connection = None
         self.is_connected = True  # Simüle modda "bağlı" sayılır
-        print("Simüle MAVLink modu aktif (gerçek bağlantı yok)")
+        logger.info("Simüle MAVLink modu aktif (gerçek bağlantı yok)")
         return True
 
     def start_listening(self):
@@ -47,14 +61,14 @@ class MAVLinkManager:
         self.is_running = True
         self.thread = threading.Thread(target=self._listen_loop, daemon=True)
         self.thread.start()
-        print("MAVLink dinleme başlatıldı")
+        logger.info("MAVLink dinleme başlatıldı")
 
     def stop_listening(self):
         """MAVLink dinlemeyi durdur"""
         self.is_running = False
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2)
-        print("MAVLink dinleme durduruldu")
+        logger.info("MAVLink dinleme durduruldu")
 
     def _listen_loop(self):
         """MAVLink mesajlarını dinle (ana loop)"""
@@ -62,17 +76,18 @@ class MAVLinkManager:
             try:
                 if self.connection:
                     # Gerçek MAVLink mesajı bekle
-                    msg = self.connection.recv_match(timeout=1)
+                    msg = self.connection.recv_match(timeout=self.poll_interval_s)
                     if msg:
+                        self.last_received_ns = time.perf_counter_ns()
                         self._process_message(msg)
                 else:
                     # Simüle mod - kendi mesajlarımızı oluştur
                     self._generate_simulated_messages()
-                    time.sleep(1)
+                    time.sleep(self.poll_interval_s)
 
             except Exception as e:
-                print(f"MAVLink dinleme hatası: {e}")
-                time.sleep(1)
+                logger.error("MAVLink dinleme hatası: %s", e)
+                time.sleep(self.poll_interval_s)
 
     def _process_message(self, msg):
         """Gelen MAVLink mesajını işle"""
@@ -82,6 +97,8 @@ class MAVLinkManager:
             self._handle_heartbeat(msg)
         elif msg_type == 'GPS_RAW_INT':
             self._handle_gps_raw(msg)
+        elif msg_type == 'GLOBAL_POSITION_INT':
+            self._handle_global_position(msg)
         elif msg_type == 'ATTITUDE':
             self._handle_attitude(msg)
         elif msg_type == 'BATTERY_STATUS':
@@ -113,7 +130,11 @@ class MAVLinkManager:
             'altitude': msg.alt / 1000.0,  # mm'den metre'ye
             'fix_type': msg.fix_type,
             'satellites_visible': msg.satellites_visible,
-            'hdop': msg.eph / 100.0 if msg.eph != 65535 else 0
+            'hdop': msg.eph / 100.0 if msg.eph != 65535 else 0,
+            'ground_speed': msg.vel / 100.0 if msg.vel != UINT16_UNKNOWN else None,  # cm/s
+            'course': msg.cog / 100.0 if msg.cog != UINT16_UNKNOWN else None,  # cdeg
+            'time_usec': msg.time_usec,
+            'received_ns': self.last_received_ns
         }
 
         self.last_gps = gps_data
@@ -121,6 +142,17 @@ class MAVLinkManager:
         if self.on_gps_data:
             self.on_gps_data(gps_data)
 
+    def _handle_global_position(self, msg):
+        """GLOBAL_POSITION_INT mesajını işle (otopilotun birleştirilmiş hızları)"""
+        self.last_global_position = {
+            'vn': msg.vx / 100.0,  # cm/s, NED
+            've': msg.vy / 100.0,
+            'climb_rate': -msg.vz / 100.0,  # NED'de aşağı pozitif
+            'heading': msg.hdg / 100.0 if msg.hdg != UINT16_UNKNOWN else None,
+            'relative_alt': msg.relative_alt / 1000.0,
+            'received_ns': self.last_received_ns
+        }
+
     def _handle_attitude(self, msg):
         """ATTITUDE mesajını işle"""
         attitude_data = {
@@ -185,16 +217,32 @@ class MAVLinkManager:
             self.last_heartbeat = heartbeat_data
             self.on_heartbeat(heartbeat_data)
 
-        # Simüle GPS
+        # Simüle GPS: sabit hız ve yavaşça dönen rotayla ilerleyen konum
         if self.on_gps_data:
+            state = self._simulated_track
+            if state is None:
+                state = self._simulated_track = {
+                    'lat': 39.9334, 'lon': 32.8597, 'alt': 120.0,
+                    'speed': random.uniform(8, 20), 'course': random.uniform(0, 360)}
+            dt = self.poll_interval_s
+            state['course'] = (state['course'] + random.uniform(-10, 10)) % 360
+            state['alt'] = max(20.0, min(380.0, state['alt'] + random.uniform(-1, 1) * dt))
+            course_rad = math.radians(state['course'])
+            state['lat'] += state['speed'] * math.cos(course_rad) * dt / METERS_PER_DEGREE_LAT
+            state['lon'] += (state['speed'] * math.sin(course_rad) * dt /
+                             (METERS_PER_DEGREE_LAT * math.cos(math.radians(state['lat']))))
+
             gps_data = {
                 'timestamp': datetime.now(),
-                'latitude': 39.9334 + random.uniform(-0.001, 0.001),
-                'longitude': 32.8597 + random.uniform(-0.001, 0.001),
-                'altitude': random.uniform(50, 200),
+                'latitude': state['lat'],
+                'longitude': state['lon'],
+                'altitude': state['alt'],
                 'fix_type': 3,  # 3D fix
                 'satellites_visible': random.randint(8, 15),
-                'hdop': random.uniform(0.5, 2.0)
+                'hdop': random.uniform(0.5, 2.0),
+                'ground_speed': state['speed'],
+                'course': state['course'],
+                'received_ns': time.perf_counter_ns()
             }
             self.last_gps = gps_data
             self.on_gps_data(gps_data)
@@ -236,7 +284,7 @@ class MAVLinkManager:
                 )
                 return True
             except Exception as e:
-                print(f"Heartbeat gönderme hatası: {e}")
+                logger.warning("Heartbeat gönderme hatası: %s", e)
                 return False
         return False
 
@@ -255,4 +303,4 @@ class MAVLinkManager:
         if self.connection:
             self.connection.close()
         self.is_connected = False
-        print("MAVLink bağlantısı kapatıldı")
\ No newline at end of file
+        logger.debug("MAVLink bağlantısı kapatıldı")
\ No newline at end of file
@@ -0,0 +1,120 @@
+# src/services/alarm_state.py
+"""
+Alarm durum makinesi: tetiklenme gecikmesi (debounce) ve histerezis
+
+Her alarm tipi için durum tutulur:
+    CLEARED -> RAISED (koşul debounce kadar örnek sürdü, alarm bir kez eklenir)
+    RAISED  -> ACTIVE (koşul sürüyor, alarm yerinde güncellenir)
+    ACTIVE  -> CLEARED (temizleme koşulu debounce kadar örnek sürdü)
+
+Tetiklenme ve temizlenme eşikleri ayrı verildiği için (histerezis) eşik
+etrafında salınan bir değer alarmı sürekli açıp kapatmaz.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+CLEARED = 'CLEARED'
+RAISED = 'RAISED'
+ACTIVE = 'ACTIVE'
+
+
+@dataclass
+class AlarmState:
+    """Tek bir alarm tipinin anlık durumu"""
+    alarm_type: str
+    severity: str = 'WARNING'
+    state: str = CLEARED
+    message: str = ''
+    value: Optional[float] = None
+    first_time: Optional[datetime] = None
+    last_time: Optional[datetime] = None
+    cleared_time: Optional[datetime] = None
+    occurrences: int = 0  # Alarm aktifken gelen örnek sayısı
+    _raise_count: int = field(default=0, repr=False)
+    _clear_count: int = field(default=0, repr=False)
+
+    @property
+    def is_active(self) -> bool:
+        return self.state != CLEARED
+
+
+class AlarmStateMachine:
+    """Alarm tiplerinin debounce/histerezisli durum takibi"""
+
+    def __init__(self, raise_debounce: int = 1, clear_debounce: int = 1):
+        self.raise_debounce = raise_debounce
+        self.clear_debounce = clear_debounce
+        self.states: Dict[str, AlarmState] = {}
+
+    def update(self, alarm_type: str, raise_condition: bool, clear_condition: bool,
+               severity: str = 'WARNING', message: str = '', value: Optional[float] = None,
+               timestamp: Optional[datetime] = None, raise_debounce: Optional[int] = None,
+               clear_debounce: Optional[int] = None) -> Optional[str]:
+        """Yeni örnekle durumu güncelle, geçiş olduysa yeni durumu döndür
+
+        raise_condition ve clear_condition ikisi de yanlışsa (histerezis
+        bandı) mevcut durum korunur.
+        """
+        state = self.states.get(alarm_type)
+        if state is None:
+            state = self.states[alarm_type] = AlarmState(alarm_type, severity)
+
+        timestamp = timestamp or datetime.now()
+        raise_needed = raise_debounce or self.raise_debounce
+        clear_needed = clear_debounce or self.clear_debounce
+
+        if state.state == CLEARED:
+            if not raise_condition:
+                state._raise_count = 0
+                return None
+
+            state._raise_count += 1
+            if state._raise_count < raise_needed:
+                return None
+
+            state.state = RAISED
+            state.severity = severity
+            state.message = message
+            state.value = value
+            state.first_time = state.last_time = timestamp
+            state.cleared_time = None
+            state.occurrences = 1
+            state._clear_count = 0
+            return RAISED
+
+        # RAISED veya ACTIVE
+        if clear_condition:
+            state._clear_count += 1
+            if state._clear_count < clear_needed:
+                return None
+
+            state.state = CLEARED
+            state.cleared_time = timestamp
+            state._raise_count = 0
+            state._clear_count = 0
+            return CLEARED
+
+        state._clear_count = 0
+        if raise_condition:
+            state.occurrences += 1
+            state.message = message
+            state.value = value
+            state.last_time = timestamp
+
+        if state.state == RAISED:
+            state.state = ACTIVE
+            return ACTIVE
+        return None
+
+    def get(self, alarm_type: str) -> Optional[AlarmState]:
+        return self.states.get(alarm_type)
+
+    def active(self) -> List[AlarmState]:
+        """Aktif alarmlar"""
+        return [s for s in self.states.values() if s.is_active]
+
+    def reset(self):
+        """Tüm alarm durumlarını sıfırla"""
+        self.states.clear()
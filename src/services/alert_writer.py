@@ -0,0 +1,257 @@
+# src/services/alert_writer.py
+"""
+Arka planda çalışan, tekrarları birleştiren alarm kayıt kuyruğu
+
+Alarmlar çağıran iş parçacığında veritabanına yazılmaz; kuyruğa atılır ve
+yazıcı iş parçacığı bunları toplu olarak (tek işlemde) kaydeder. Aynı
+oturumda aynı tipteki alarm, son görülmesinden itibaren birleştirme
+penceresi içinde tekrar gelirse yeni satır açılmaz; mevcut satırın tekrar
+sayısı ve son görülme zamanı güncellenir. Koşul temizlendiğinde satır
+resolved='YES' ve resolved_time ile kapatılır.
+"""
+
+import queue
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import update
+
+from ..database.models import AlertLog
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ALERT = 'alert'
+_RESOLVE = 'resolve'
+_FLUSH = 'flush'
+_STOP = 'stop'
+
+
+class _AlertGroup:
+    """Birleştirilmiş tek alarm satırının bellekteki karşılığı"""
+
+    __slots__ = ('row_id', 'session_id', 'alert_type', 'severity', 'message',
+                 'first_time', 'last_time', 'occurrences', 'resolved_time')
+
+    def __init__(self, session_id, alert_type, severity, message, timestamp):
+        self.row_id = None  # Henüz yazılmadı
+        self.session_id = session_id
+        self.alert_type = alert_type
+        self.severity = severity
+        self.message = message
+        self.first_time = self.last_time = timestamp
+        self.occurrences = 1
+        self.resolved_time = None
+
+    def values(self) -> Dict:
+        return {
+            'last_time': self.last_time,
+            'occurrences': self.occurrences,
+            'severity': self.severity,
+            'message': self.message[:500],
+            'resolved': 'YES' if self.resolved_time else 'NO',
+            'resolved_time': self.resolved_time
+        }
+
+
+class AlertWriter:
+    """Alarm kayıtlarını arka planda birleştirip toplu yazan kuyruk"""
+
+    def __init__(self, database_manager, coalesce_window_s: float = 5.0,
+                 flush_interval_s: float = 0.5, max_batch: int = 500,
+                 max_queue: int = 10000, autostart: bool = True):
+        self.db_manager = database_manager
+        self.coalesce_window_s = coalesce_window_s
+        self.flush_interval_s = flush_interval_s
+        self.max_batch = max_batch
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._groups = {}  # (session_id, alert_type) -> açık _AlertGroup (yalnızca yazıcı iş parçacığı)
+        # Yazımı başarısız olan gruplar (çözülenler dahil); sonraki yazıma eklenir
+        self._pending = {}
+        self._thread = None
+
+        # Metrikler
+        self.submitted = 0
+        self.dropped = 0
+        self.rows_inserted = 0
+        self.rows_updated = 0
+        self.flushes = 0
+
+        if autostart:
+            self.start()
+
+    # -------------------------------------------------------------------
+    # Çağıran taraf (bloklamaz)
+    # -------------------------------------------------------------------
+
+    def submit(self, alert: Dict, session_id: Optional[int] = None) -> bool:
+        """Alarmı kuyruğa at; kuyruk doluysa düşür ve False döndür"""
+        session_id = session_id or self.db_manager.current_session_id
+        if not session_id:
+            return False
+
+        item = (_ALERT, session_id, alert['type'], alert['severity'], alert['message'],
+                alert.get('timestamp') or datetime.now())
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def resolve(self, alert_type: str, session_id: Optional[int] = None,
+                timestamp: Optional[datetime] = None) -> bool:
+        """Alarm koşulu temizlendi: açık satırı kapat"""
+        session_id = session_id or self.db_manager.current_session_id
+        if not session_id:
+            return False
+        try:
+            self._queue.put_nowait((_RESOLVE, session_id, alert_type, timestamp or datetime.now()))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Kuyruktaki her şey yazılana kadar bekle"""
+        if not self.is_running():
+            self._write(self._drain())
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    # -------------------------------------------------------------------
+    # Yazıcı iş parçacığı
+    # -------------------------------------------------------------------
+
+    def start(self):
+        if self.is_running():
+            return
+        self._thread = threading.Thread(target=self._run, name="AlertWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Kalan kayıtları yaz ve iş parçacığını durdur"""
+        if not self.is_running():
+            return
+        self._queue.put((_STOP,))
+        self._thread.join(timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _drain(self, first=None):
+        items = [first] if first is not None else []
+        while len(items) < self.max_batch:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self):
+        running = True
+        while running:
+            try:
+                first = self._queue.get(timeout=self.flush_interval_s)
+            except queue.Empty:
+                if self._pending:
+                    self._write([])  # Başarısız yazımı tekrar dene
+                continue
+
+            items = self._drain(first)
+            waiters = [item[1] for item in items if item[0] == _FLUSH]
+            running = not any(item[0] == _STOP for item in items)
+
+            self._write(items)
+            for done in waiters:
+                done.set()
+
+        # Durdurulurken kuyrukta kalanlar
+        self._write(self._drain())
+
+    def _coalesce(self, items):
+        """Kuyruk öğelerini açık gruplara uygula, değişen (ve bekleyen) grupları döndür
+
+        Çözülen grup açık gruplardan hemen çıkarılır (yeni alarm yeni satır
+        açar); kaydı ise yazımı onaylanana kadar bekleyenlerde tutulur.
+        """
+        dirty = dict(self._pending)
+        window = self.coalesce_window_s
+
+        for item in items:
+            kind = item[0]
+            if kind == _ALERT:
+                _, session_id, alert_type, severity, message, timestamp = item
+                key = (session_id, alert_type)
+                group = self._groups.get(key)
+
+                if group is None or (timestamp - group.last_time).total_seconds() > window:
+                    group = self._groups[key] = _AlertGroup(
+                        session_id, alert_type, severity, message, timestamp)
+                else:
+                    group.occurrences += 1
+                    group.last_time = max(group.last_time, timestamp)
+                    group.severity = severity
+                    group.message = message
+                dirty[id(group)] = group
+
+            elif kind == _RESOLVE:
+                _, session_id, alert_type, timestamp = item
+                group = self._groups.pop((session_id, alert_type), None)
+                if group is not None:
+                    group.resolved_time = timestamp
+                    dirty[id(group)] = group
+
+        return list(dirty.values())
+
+    def _write(self, items):
+        groups = self._coalesce(items)
+        if not groups:
+            return
+
+        new_groups = [g for g in groups if g.row_id is None]
+        existing = [g for g in groups if g.row_id is not None]
+
+        try:
+            with self.db_manager.get_session() as session:
+                rows = [AlertLog(session_id=g.session_id, alert_type=g.alert_type,
+                                 timestamp=g.first_time, **g.values()) for g in new_groups]
+                session.add_all(rows)
+                session.flush()  # ID'leri al
+                # commit sonrası nesneler süresi dolmuş (expire) olur; ID'ler burada okunur
+                row_ids = [row.id for row in rows]
+
+                if existing:
+                    session.execute(update(AlertLog),
+                                    [dict(id=g.row_id, **g.values()) for g in existing])
+
+        except Exception as e:
+            # Değişen tüm gruplar (çözülenler dahil) bir sonraki yazımda tekrar denenir
+            self._pending = {id(group): group for group in groups}
+            logger.error("Alarm kayıt hatası: %s", e)
+            return
+
+        for group, row_id in zip(new_groups, row_ids):
+            group.row_id = row_id
+        self._pending = {}
+        self.rows_inserted += len(new_groups)
+        self.rows_updated += len(existing)
+        self.flushes += 1
+
+    def get_metrics(self) -> Dict:
+        return {
+            'submitted': self.submitted,
+            'dropped': self.dropped,
+            'queued': self._queue.qsize(),
+            'open_alerts': len(self._groups),
+            'pending_groups': len(self._pending),
+            'rows_inserted': self.rows_inserted,
+            'rows_updated': self.rows_updated,
+            'flushes': self.flushes
+        }
@@ -0,0 +1,337 @@
+# src/services/alerts.py
+"""
+Bildirimsel (declarative) alarm kural motoru
+
+Kurallar yapılandırmadan (JSON veya dict listesi) yüklenir ve bir kez
+tek bir Python fonksiyonuna derlenir; böylece paket başına değerlendirme
+yalnızca birkaç öznitelik erişimi ve karşılaştırmadan ibarettir. Aynı
+kurallar tekrar oynatma ve uçuş sonrası analiz için NumPy dizileri
+üzerinde vektörel olarak da çalıştırılabilir.
+
+Kural alanları:
+    type            Alarm tipi (BATTERY_LOW, GPS_LOST, ...)
+    severity        INFO / WARNING / CRITICAL
+    category        battery / gps / envelope (AlertManager gruplaması)
+    field           Paket alanı (nokta ile: gps.altitude, battery_percent)
+    op              <, <=, >, >=
+    threshold       Tetiklenme eşiği
+    clear_threshold Temizlenme eşiği (histerezis; yoksa threshold)
+    suppressed_by   Bu alarm tetiklendiğinde bastırılacak kural tipi
+    raise_debounce  Tetiklenmek için art arda gereken örnek sayısı
+    message         str.format şablonu ({value}, {threshold})
+"""
+
+import json
+import operator
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, field_validator
+
+from .alarm_state import AlarmStateMachine
+
+OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+# Alan adı derlenen kaynağa yazılır: yalnızca noktalı tanımlayıcılar (gps.altitude)
+FIELD_PATTERN = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$')
+
+# Varsayılan kurallar (AlertManager ve AlarmPanel ortak eşikleri)
+DEFAULT_RULES = [
+    {'type': 'BATTERY_CRITICAL', 'severity': 'CRITICAL', 'category': 'battery',
+     'field': 'battery_percent', 'op': '<=', 'threshold': 15.0, 'clear_threshold': 17.0,
+     'message': 'KRİTİK BATARYA! {value:.1f}% - Acil iniş gerekli!'},
+    {'type': 'BATTERY_LOW', 'severity': 'WARNING', 'category': 'battery',
+     'field': 'battery_percent', 'op': '<=', 'threshold': 30.0, 'clear_threshold': 32.0,
+     'suppressed_by': 'BATTERY_CRITICAL', 'raise_debounce': 2,
+     'message': 'Düşük batarya: {value:.1f}% - İnişe hazır olun'},
+    {'type': 'GPS_POOR', 'severity': 'WARNING', 'category': 'gps',
+     'field': 'gps.satellites', 'op': '<', 'threshold': 6, 'clear_threshold': 7,
+     'raise_debounce': 2,
+     'message': 'Zayıf GPS sinyali: {value} uydu (Min: {threshold})'},
+    {'type': 'GPS_LOST', 'severity': 'CRITICAL', 'category': 'gps',
+     'field': 'gps.fix_quality', 'op': '<', 'threshold': 3,
+     'message': 'GPS kilidi kayboldu! Fix kalitesi: {value}'},
+    {'type': 'ALTITUDE_HIGH', 'severity': 'WARNING', 'category': 'envelope',
+     'field': 'gps.altitude', 'op': '>', 'threshold': 400.0, 'clear_threshold': 390.0,
+     'raise_debounce': 2,
+     'message': 'Yüksek rakım: {value:.1f}m (Max: {threshold}m)'},
+    {'type': 'ALTITUDE_LOW', 'severity': 'WARNING', 'category': 'envelope',
+     'field': 'gps.altitude', 'op': '<', 'threshold': 5.0, 'clear_threshold': 7.0,
+     'raise_debounce': 2,
+     'message': 'Düşük rakım: {value:.1f}m - Çarpma riski!'},
+    {'type': 'VELOCITY_HIGH', 'severity': 'WARNING', 'category': 'envelope',
+     'field': 'velocity', 'op': '>', 'threshold': 30.0, 'clear_threshold': 28.0,
+     'raise_debounce': 2,
+     'message': 'Yüksek hız: {value:.1f} m/s (Max: {threshold} m/s)'},
+]
+
+# Veritabanı kolonları -> paket alanları (tekrar oynatma için)
+RECORD_FIELDS = {
+    'altitude': 'gps.altitude',
+    'latitude': 'gps.latitude',
+    'longitude': 'gps.longitude',
+    'velocity': 'velocity',
+    'climb_rate': 'climb_rate',
+    'battery_percent': 'battery_percent',
+    'battery_voltage': 'battery_voltage',
+}
+
+
+class AlertRule(BaseModel):
+    """Tek bir eşik kuralı"""
+    type: str
+    severity: str = 'WARNING'
+    category: str = 'general'
+    field: str
+    op: str
+    threshold: float
+    clear_threshold: Optional[float] = None
+    suppressed_by: Optional[str] = None
+    raise_debounce: int = Field(1, ge=1)
+    message: str = '{type}: {value}'
+
+    @field_validator('op')
+    @classmethod
+    def _check_op(cls, value):
+        if value not in OPERATORS:
+            raise ValueError(f"Geçersiz operatör: {value}")
+        return value
+
+    @field_validator('field')
+    @classmethod
+    def _check_field(cls, value):
+        if not FIELD_PATTERN.match(value):
+            raise ValueError(f"Geçersiz alan adı: {value!r}")
+        return value
+
+    @property
+    def effective_clear_threshold(self) -> float:
+        return self.threshold if self.clear_threshold is None else self.clear_threshold
+
+    def format_message(self, value) -> str:
+        threshold = int(self.threshold) if float(self.threshold).is_integer() else self.threshold
+        return self.message.format(value=value, threshold=threshold, type=self.type)
+
+    def make_alert(self, value, timestamp=None) -> Dict:
+        """Tetiklenen kural için alarm dict'i"""
+        alert = {
+            'type': self.type,
+            'severity': self.severity,
+            'message': self.format_message(value),
+            'value': value
+        }
+        if timestamp is not None:
+            alert['timestamp'] = timestamp
+        return alert
+
+
+def load_rules(source=None) -> List[AlertRule]:
+    """Kuralları yükle: None (varsayılan), JSON dosya yolu veya dict listesi"""
+    if source is None:
+        raw = DEFAULT_RULES
+    elif isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        if isinstance(raw, dict):
+            raw = raw.get('rules', [])
+    else:
+        raw = source
+
+    rules = [rule if isinstance(rule, AlertRule) else AlertRule(**rule) for rule in raw]
+
+    types = {rule.type for rule in rules}
+    for rule in rules:
+        if rule.suppressed_by and rule.suppressed_by not in types:
+            raise ValueError(f"{rule.type}: bilinmeyen suppressed_by kuralı {rule.suppressed_by}")
+    return rules
+
+
+class CompiledRuleSet:
+    """Kuralları tek bir değerlendirme fonksiyonuna derler"""
+
+    def __init__(self, rules: Iterable[AlertRule] = None):
+        self.rules: List[AlertRule] = list(rules) if rules is not None else load_rules()
+        self._index = {rule.type: i for i, rule in enumerate(self.rules)}
+        # Bastıran kural önce değerlendirilmeli
+        self._order = self._evaluation_order()
+        self._evaluate = self._compile()
+
+    def _evaluation_order(self) -> List[int]:
+        order, visiting = [], set()
+
+        def visit(i):
+            if i in order:
+                return
+            if i in visiting:
+                raise ValueError("suppressed_by kurallarında döngü var")
+            visiting.add(i)
+            rule = self.rules[i]
+            if rule.suppressed_by:
+                visit(self._index[rule.suppressed_by])
+            order.append(i)
+
+        for i in range(len(self.rules)):
+            visit(i)
+        return order
+
+    def _compile(self):
+        """Kurallardan Python kaynak kodu üret ve derle
+
+        Kaynağa yalnızca doğrulanmış alan adları, izinli operatörler ve
+        float eşikler yazılır (model_copy/model_construct doğrulamayı
+        atladığı için burada tekrar denetlenir).
+        """
+        for rule in self.rules:
+            if not FIELD_PATTERN.match(rule.field) or rule.op not in OPERATORS:
+                raise ValueError(f"{rule.type}: geçersiz alan veya operatör")
+        lines = ["def evaluate(p):"]
+        field_vars = {}
+
+        for field_name in dict.fromkeys(rule.field for rule in self.rules):
+            var = f"v{len(field_vars)}"
+            field_vars[field_name] = var
+            lines.append(f"    {var} = p.{field_name}")
+
+        for i in self._order:
+            rule = self.rules[i]
+            var = field_vars[rule.field]
+            raise_expr = f"{var} is not None and {var} {rule.op} {float(rule.threshold)!r}"
+            clear_expr = (f"{var} is not None and not "
+                          f"({var} {rule.op} {float(rule.effective_clear_threshold)!r})")
+            if rule.suppressed_by:
+                other = self._index[rule.suppressed_by]
+                raise_expr = f"({raise_expr}) and not r{other}"
+                clear_expr = f"({clear_expr}) or r{other}"
+            lines.append(f"    r{i} = {raise_expr}")
+            lines.append(f"    c{i} = {clear_expr}")
+
+        results = ", ".join(
+            f"(r{i}, c{i}, {field_vars[rule.field]})" for i, rule in enumerate(self.rules))
+        lines.append(f"    return ({results}{',' if len(self.rules) == 1 else ''})")
+
+        namespace = {}
+        exec(compile("\n".join(lines), "<alert-rules>", "exec"), namespace)
+        self.source = "\n".join(lines)
+        return namespace['evaluate']
+
+    def evaluate_raw(self, packet) -> Tuple[Tuple[bool, bool, Optional[float]], ...]:
+        """Kural sırasıyla (tetiklendi, temizlendi, değer) demetleri"""
+        return self._evaluate(packet)
+
+    def evaluate(self, packet, categories: Iterable[str] = None) -> List[Dict]:
+        """Tetiklenen kuralları alarm dict'leri olarak döndür"""
+        categories = set(categories) if categories else None
+        alerts = []
+        for rule, (raised, _, value) in zip(self.rules, self._evaluate(packet)):
+            if raised and (categories is None or rule.category in categories):
+                alerts.append(rule.make_alert(value))
+        return alerts
+
+    # -------------------------------------------------------------------
+    # Vektörel (NumPy) değerlendirme
+    # -------------------------------------------------------------------
+
+    def evaluate_batch(self, arrays: Dict[str, "object"]) -> Dict[str, Dict]:
+        """Alan dizileri üzerinde tüm kuralları vektörel değerlendir
+
+        arrays: {'battery_percent': ndarray, 'gps.altitude': ndarray, ...}
+        Eksik alanlar ve NaN değerler hiçbir kuralı tetiklemez.
+        Dönüş: {kural tipi: {'raised': bool dizisi, 'cleared': bool dizisi}}
+        """
+        import numpy as np
+
+        length = len(next(iter(arrays.values()))) if arrays else 0
+        masks = {}
+
+        for i in self._order:
+            rule = self.rules[i]
+            values = arrays.get(rule.field)
+            if values is None:
+                values = np.full(length, np.nan)
+            values = np.asarray(values, dtype=float)
+
+            compare = OPERATORS[rule.op]
+            valid = ~np.isnan(values)
+            with np.errstate(invalid='ignore'):
+                raised = valid & compare(values, rule.threshold)
+                cleared = valid & ~compare(values, rule.effective_clear_threshold)
+
+            if rule.suppressed_by:
+                other = masks[rule.suppressed_by]['raised']
+                raised &= ~other
+                cleared |= other
+
+            masks[rule.type] = {'raised': raised, 'cleared': cleared}
+
+        return {rule.type: masks[rule.type] for rule in self.rules}
+
+    def summarize_batch(self, arrays: Dict[str, "object"]) -> Dict[str, Dict]:
+        """Kural başına tetiklenen örnek sayısı ve olay (yükselen kenar) sayısı"""
+        import numpy as np
+
+        summary = {}
+        for rule_type, mask in self.evaluate_batch(arrays).items():
+            raised = mask['raised']
+            edges = int(np.count_nonzero(raised[1:] & ~raised[:-1])) + int(raised[:1].sum())
+            summary[rule_type] = {'samples': int(raised.sum()), 'events': edges}
+        return summary
+
+
+def packets_to_arrays(packets, fields: Iterable[str] = None) -> Dict[str, "object"]:
+    """TelemetryPacket listesini alan dizilerine çevir (None -> NaN)"""
+    import numpy as np
+
+    packets = list(packets)
+    fields = list(fields) if fields else sorted({rule['field'] for rule in DEFAULT_RULES})
+    arrays = {}
+    for field_name in fields:
+        getter = operator.attrgetter(field_name)
+        arrays[field_name] = np.array(
+            [getter(p) if getter(p) is not None else np.nan for p in packets], dtype=float)
+    return arrays
+
+
+def records_to_arrays(records: List[Dict]) -> Dict[str, "object"]:
+    """Veritabanı kayıt dict'lerini alan dizilerine çevir"""
+    import numpy as np
+
+    arrays = {}
+    for column, field_name in RECORD_FIELDS.items():
+        arrays[field_name] = np.array(
+            [r.get(column) if r.get(column) is not None else np.nan for r in records], dtype=float)
+    return arrays
+
+
+class AlertEngine:
+    """Derlenmiş kurallar + debounce/histerezis durum makinesi"""
+
+    def __init__(self, rules: Iterable[AlertRule] = None):
+        self.rule_set = rules if isinstance(rules, CompiledRuleSet) else CompiledRuleSet(rules)
+        self.states = AlarmStateMachine()
+
+    @property
+    def rules(self) -> List[AlertRule]:
+        return self.rule_set.rules
+
+    def process(self, packet) -> List[Tuple[AlertRule, str, object]]:
+        """Paketi değerlendir, durum geçişlerini (kural, geçiş, durum) döndür"""
+        transitions = []
+        timestamp = getattr(packet, 'timestamp', None)
+        update = self.states.update
+
+        for rule, (raised, cleared, value) in zip(self.rule_set.rules,
+                                                  self.rule_set.evaluate_raw(packet)):
+            transition = update(
+                rule.type, raised, cleared,
+                severity=rule.severity,
+                message=rule.format_message(value) if raised else '',
+                value=value,
+                timestamp=timestamp,
+                raise_debounce=rule.raise_debounce
+            )
+            if transition or raised:
+                transitions.append((rule, transition, self.states.get(rule.type)))
+        return transitions
+
+    def reset(self):
+        self.states.reset()
@@ -0,0 +1,259 @@
+# src/services/fleet_reports.py
+"""
+Filo geneli toplu uçuş raporu
+
+Oturumlar bir süreç havuzuna dağıtılır; her işçi veritabanına kendi salt
+okunur SQLite bağlantısını açar ve FlightDataLogger.generate_flight_report
+ile oturum raporunu üretir. İşçiler yalnızca düz bir özet satırı döndürür
+(uçuş izi süreçler arasında taşınmaz); satırlar geldikçe CSV/JSON özetine
+yazılır ve ilerleme bildirilir.
+
+Kullanım:
+    python -m src.services.fleet_reports --date 2026-10-19 --output filo.csv
+    python -m src.services.fleet_reports --sessions 3 4 5 --workers 4 --output filo.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.core.config import get_config
+from src.core.logger import get_logger
+from src.database.database_manager import DatabaseManager, REPORT_FIELDS, REPORT_PERCENTILES
+from src.utils.flight_utils import FlightDataLogger
+
+logger = get_logger(__name__)
+
+SUMMARY_FIELDS = [
+    'session_id', 'session_name', 'status', 'start_time', 'end_time', 'duration_s',
+    'total_records', 'total_distance_m', 'max_altitude', 'min_altitude', 'avg_altitude',
+    'max_velocity', 'avg_velocity', 'battery_start', 'battery_end', 'battery_consumed',
+] + [f"{field}_p{p}" for field in REPORT_FIELDS for p in REPORT_PERCENTILES] + ['error']
+
+# İşçi süreç durumu (_init_worker ile süreç başına bir kez kurulur)
+_worker_reporter: Optional[FlightDataLogger] = None
+
+
+def summarize_report(session_id: int, report: Dict) -> Dict:
+    """generate_flight_report çıktısını düz özet satırına çevir"""
+    row = dict.fromkeys(SUMMARY_FIELDS)
+    row['session_id'] = session_id
+    info = report.get('session_info') or {}
+    for key in ('session_name', 'status', 'start_time', 'end_time'):
+        row[key] = info.get(key)
+    if 'error' in report:
+        row['error'] = report['error']
+        return row
+
+    stats = report['statistics']
+    for key in ('total_records', 'max_altitude', 'min_altitude', 'avg_altitude',
+                'max_velocity', 'avg_velocity', 'battery_start', 'battery_end',
+                'battery_consumed'):
+        row[key] = stats.get(key)
+    row['total_distance_m'] = stats.get('total_distance')
+    for field, values in stats.get('percentiles', {}).items():
+        for name, value in values.items():
+            if f"{field}_{name}" in row:
+                row[f"{field}_{name}"] = value
+
+    if info.get('total_duration') is not None:
+        row['duration_s'] = info['total_duration']
+    elif info.get('start_time') and info.get('end_time'):
+        row['duration_s'] = (info['end_time'] - info['start_time']).total_seconds()
+    return row
+
+
+def _session_row(reporter: FlightDataLogger, session_id: int, use_cache: bool) -> Dict:
+    try:
+        return summarize_report(session_id, reporter.generate_flight_report(session_id, use_cache))
+    except Exception as e:
+        # Tek bozuk oturum tüm filo raporunu durdurmasın
+        row = dict.fromkeys(SUMMARY_FIELDS)
+        row.update(session_id=session_id, error=f"{type(e).__name__}: {e}")
+        return row
+
+
+def _init_worker(db_path: str, cache_dir: Optional[str]):
+    global _worker_reporter
+    _worker_reporter = FlightDataLogger(DatabaseManager(db_path, read_only=True), cache_dir)
+
+
+def _worker_row(session_id: int, use_cache: bool) -> Dict:
+    return _session_row(_worker_reporter, session_id, use_cache)
+
+
+class SummaryWriter:
+    """Özet satırlarını geldikçe CSV veya JSON dosyasına yazar
+
+    JSON biçimi: {"sessions": [...], "fleet": {...}}; filo toplamı dosya
+    kapanırken eklenir. CSV yalnızca oturum satırlarını içerir.
+    """
+
+    def __init__(self, path, fmt: Optional[str] = None):
+        self.path = Path(path)
+        self.format = fmt or ('json' if self.path.suffix.lower() == '.json' else 'csv')
+        if self.format not in ('csv', 'json'):
+            raise ValueError(f"Bilinmeyen özet biçimi: {self.format}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        self._count = 0
+        if self.format == 'csv':
+            self._csv = csv.DictWriter(self._file, fieldnames=SUMMARY_FIELDS)
+            self._csv.writeheader()
+        else:
+            self._file.write('{"sessions": [')
+
+    def write(self, row: Dict):
+        if self.format == 'csv':
+            self._csv.writerow({key: _format_value(value) for key, value in row.items()})
+        else:
+            self._file.write(',\n  ' if self._count else '\n  ')
+            json.dump(row, self._file, ensure_ascii=False, default=_format_value)
+        self._count += 1
+
+    def close(self, fleet: Optional[Dict] = None):
+        if self.format == 'json':
+            self._file.write('\n], "fleet": ')
+            json.dump(fleet or {}, self._file, ensure_ascii=False, default=_format_value)
+            self._file.write('}\n')
+        self._file.close()
+
+
+def _format_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class FleetSummary:
+    """Özet satırlarından filo toplamlarını biriktirir"""
+
+    def __init__(self):
+        self.sessions = 0
+        self.failed = 0
+        self.total_records = 0
+        self.total_distance_m = 0.0
+        self.total_duration_s = 0.0
+        self.max_altitude = None
+        self.max_velocity = None
+        self.battery_consumed = 0.0
+
+    def add(self, row: Dict):
+        self.sessions += 1
+        if row.get('error'):
+            self.failed += 1
+            return
+        self.total_records += row['total_records'] or 0
+        self.total_distance_m += row['total_distance_m'] or 0.0
+        self.total_duration_s += row['duration_s'] or 0.0
+        self.battery_consumed += row['battery_consumed'] or 0.0
+        for key in ('max_altitude', 'max_velocity'):
+            if row[key] is not None:
+                current = getattr(self, key)
+                setattr(self, key, row[key] if current is None else max(current, row[key]))
+
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+
+def generate_fleet_reports(db_path, session_ids: Iterable[int], workers: int = 0,
+                           output=None, fmt: Optional[str] = None,
+                           cache_dir=None, use_cache: bool = True,
+                           progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """Oturum raporlarını üret, özet dosyasına akıt ve filo toplamını döndür
+
+    workers <= 0: işlemci sayısı; 1: havuz kurulmadan sıralı çalışır.
+    Dönen dict: fleet (toplamlar), rows (geliş sırasıyla satırlar), elapsed_s.
+    """
+    session_ids = list(session_ids)
+    total = len(session_ids)
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    workers = max(1, min(workers, total))
+    cache_dir = str(cache_dir) if cache_dir is not None else None
+
+    writer = SummaryWriter(output, fmt) if output else None
+    fleet = FleetSummary()
+    rows: List[Dict] = []
+    started = time.perf_counter()
+
+    def collect(row):
+        rows.append(row)
+        fleet.add(row)
+        if writer:
+            writer.write(row)
+        if progress:
+            progress(len(rows), total)
+
+    try:
+        if workers == 1:
+            database = DatabaseManager(db_path, read_only=True)
+            reporter = FlightDataLogger(database, cache_dir)
+            try:
+                for session_id in session_ids:
+                    collect(_session_row(reporter, session_id, use_cache))
+            finally:
+                database.close_connection()
+        elif total:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(str(db_path), cache_dir)) as executor:
+                futures = [executor.submit(_worker_row, session_id, use_cache)
+                           for session_id in session_ids]
+                for future in as_completed(futures):
+                    collect(future.result())
+    finally:
+        if writer:
+            writer.close(fleet.to_dict())
+
+    elapsed = time.perf_counter() - started
+    logger.info("Filo raporu: %d oturum (%d hatalı), %d işçi, %.2f s",
+                fleet.sessions, fleet.failed, workers, elapsed)
+    return {'fleet': fleet.to_dict(), 'rows': rows, 'elapsed_s': elapsed, 'workers': workers}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Filo geneli toplu uçuş raporu")
+    parser.add_argument('--db', default=None)
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument('--sessions', nargs='+', type=int, help="Oturum kimlikleri")
+    selection.add_argument('--date', help="Bu günde başlayan oturumlar (YYYY-MM-DD)")
+    parser.add_argument('--status', default=None, help="Yalnızca bu durumdaki oturumlar")
+    parser.add_argument('--workers', type=int, default=None, help="0: işlemci sayısı, 1: sıralı")
+    parser.add_argument('--output', required=True, help="Özet dosyası (.csv / .json)")
+    parser.add_argument('--format', choices=('csv', 'json'), default=None)
+    parser.add_argument('--no-cache', action='store_true', help="Rapor önbelleğini kullanma")
+
+    args = parser.parse_args(argv)
+    config = get_config()
+    config.setup_logging()
+    db_path = args.db or config.database.path
+    workers = config.database.report_workers if args.workers is None else args.workers
+
+    if args.sessions:
+        session_ids = args.sessions
+    else:
+        start = datetime.strptime(args.date, '%Y-%m-%d') if args.date else None
+        database = DatabaseManager(db_path, read_only=True)
+        session_ids = database.get_session_ids(
+            status=args.status, start=start, end=start + timedelta(days=1) if start else None)
+        database.close_connection()
+    if not session_ids:
+        logger.error("Rapor üretilecek oturum bulunamadı")
+        return 1
+
+    def progress(done, total):
+        if done == total or done % 20 == 0:
+            logger.info("%d/%d oturum", done, total)
+
+    result = generate_fleet_reports(db_path, session_ids, workers=workers, output=args.output,
+                                    fmt=args.format, use_cache=not args.no_cache,
+                                    progress=progress)
+    logger.info("Filo özeti: %s", result['fleet'])
+    return 0 if not result['fleet']['failed'] else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,298 @@
+# src/services/geofence.py
+"""
+Coğrafi sınır (geofence) motoru
+
+İzin verilen (inclusion) ve yasak (exclusion) bölgeler çokgen veya silindir
+(merkez + yarıçap) olarak, isteğe bağlı taban/tavan irtifasıyla tanımlanır.
+Sınırlar sınır kutularına göre düzenli bir ızgaraya (grid) yerleştirilir;
+paket başına yalnızca bulunduğu hücredeki sınırlar test edilir. Çok büyük
+sınırlar (ör. operasyon alanı) ızgaraya değil ayrı bir listeye konur.
+
+Kurallar:
+    - Herhangi bir yasak bölgenin içindeyse ihlal (GEOFENCE:<ad>)
+    - En az bir izin verilen bölge tanımlıysa ve hiçbirinin içinde değilse
+      ihlal (GEOFENCE_OUTSIDE)
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, model_validator
+
+from ..core.geodesy import METERS_PER_DEGREE_LAT, local_xy
+
+INCLUSION = 'inclusion'
+EXCLUSION = 'exclusion'
+POLYGON = 'polygon'
+CYLINDER = 'cylinder'
+
+OUTSIDE_ALERT_TYPE = 'GEOFENCE_OUTSIDE'
+ALERT_PREFIX = 'GEOFENCE'
+
+
+class Geofence(BaseModel):
+    """Tek bir coğrafi sınır tanımı"""
+    name: str
+    kind: str = EXCLUSION
+    shape: str = POLYGON
+    points: List[Tuple[float, float]] = []  # [(lat, lon), ...]
+    center: Optional[Tuple[float, float]] = None
+    radius_m: float = 0.0
+    floor_m: Optional[float] = None  # None: sınırsız
+    ceiling_m: Optional[float] = None
+    severity: str = 'CRITICAL'
+
+    @model_validator(mode='after')
+    def _check_geometry(self):
+        if self.kind not in (INCLUSION, EXCLUSION):
+            raise ValueError(f"{self.name}: geçersiz sınır türü {self.kind}")
+        if self.shape == POLYGON:
+            if len(self.points) < 3:
+                raise ValueError(f"{self.name}: çokgen en az 3 nokta içermeli")
+        elif self.shape == CYLINDER:
+            if self.center is None or self.radius_m <= 0:
+                raise ValueError(f"{self.name}: silindir için merkez ve yarıçap gerekli")
+        else:
+            raise ValueError(f"{self.name}: geçersiz şekil {self.shape}")
+        return self
+
+    @property
+    def alert_type(self) -> str:
+        return f"{ALERT_PREFIX}:{self.name}"
+
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """(min_lat, min_lon, max_lat, max_lon)"""
+        if self.shape == CYLINDER:
+            lat, lon = self.center
+            dlat = self.radius_m / METERS_PER_DEGREE_LAT
+            dlon = dlat / max(math.cos(math.radians(lat)), 1e-6)
+            return lat - dlat, lon - dlon, lat + dlat, lon + dlon
+        lats = [p[0] for p in self.points]
+        lons = [p[1] for p in self.points]
+        return min(lats), min(lons), max(lats), max(lons)
+
+    def to_map_shape(self) -> Dict:
+        """Haritada çizim için sade gösterim"""
+        shape = {'name': self.name, 'kind': self.kind, 'shape': self.shape,
+                 'floor': self.floor_m, 'ceiling': self.ceiling_m}
+        if self.shape == CYLINDER:
+            shape['center'] = list(self.center)
+            shape['radius'] = self.radius_m
+        else:
+            shape['points'] = [list(p) for p in self.points]
+        return shape
+
+
+def load_geofences(source) -> List[Geofence]:
+    """Sınırları yükle: JSON dosya yolu veya dict listesi"""
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        if isinstance(raw, dict):
+            raw = raw.get('geofences', [])
+    else:
+        raw = source
+    return [fence if isinstance(fence, Geofence) else Geofence(**fence) for fence in raw]
+
+
+def point_in_polygon(lat: float, lon: float, lats, lons) -> bool:
+    """Işın atma (ray casting) ile çokgen içinde mi"""
+    inside = False
+    j = len(lats) - 1
+    for i in range(len(lats)):
+        yi, yj = lats[i], lats[j]
+        if (yi > lat) != (yj > lat):
+            xi, xj = lons[i], lons[j]
+            if lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+                inside = not inside
+        j = i
+    return inside
+
+
+class _CompiledFence:
+    """Hızlı test için hazırlanmış sınır"""
+
+    __slots__ = ('fence', 'exclusion', 'min_lat', 'min_lon', 'max_lat', 'max_lon',
+                 'lats', 'lons', 'floor', 'ceiling', 'center_lat', 'center_lon',
+                 'cos_lat', 'radius_sq')
+
+    def __init__(self, fence: Geofence):
+        self.fence = fence
+        self.exclusion = fence.kind == EXCLUSION
+        self.min_lat, self.min_lon, self.max_lat, self.max_lon = fence.bbox()
+        self.floor = -math.inf if fence.floor_m is None else fence.floor_m
+        self.ceiling = math.inf if fence.ceiling_m is None else fence.ceiling_m
+        self.lats = [p[0] for p in fence.points]
+        self.lons = [p[1] for p in fence.points]
+        if fence.shape == CYLINDER:
+            self.center_lat, self.center_lon = fence.center
+            self.cos_lat = math.cos(math.radians(self.center_lat))
+            self.radius_sq = fence.radius_m * fence.radius_m
+        else:
+            self.center_lat = self.center_lon = self.cos_lat = self.radius_sq = None
+
+    def contains(self, lat: float, lon: float, alt: float) -> bool:
+        if not (self.floor <= alt <= self.ceiling):
+            return False
+        if not (self.min_lat <= lat <= self.max_lat and self.min_lon <= lon <= self.max_lon):
+            return False
+        if self.radius_sq is not None:
+            dx, dy = local_xy(lat, lon, self.center_lat, self.center_lon, self.cos_lat)
+            return dx * dx + dy * dy <= self.radius_sq
+        return point_in_polygon(lat, lon, self.lats, self.lons)
+
+    def contains_many(self, lats, lons, alts):
+        """Vektörel içerme testi (NumPy dizileri)"""
+        import numpy as np
+
+        mask = ((alts >= self.floor) & (alts <= self.ceiling) &
+                (lats >= self.min_lat) & (lats <= self.max_lat) &
+                (lons >= self.min_lon) & (lons <= self.max_lon))
+        idx = np.flatnonzero(mask)
+        if idx.size == 0:
+            return mask
+
+        y, x = lats[idx], lons[idx]
+        if self.radius_sq is not None:
+            dx, dy = local_xy(y, x, self.center_lat, self.center_lon, self.cos_lat)
+            inside = dx * dx + dy * dy <= self.radius_sq
+        else:
+            inside = np.zeros(idx.size, dtype=bool)
+            lat_v, lon_v = self.lats, self.lons
+            j = len(lat_v) - 1
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for i in range(len(lat_v)):
+                    yi, yj, xi, xj = lat_v[i], lat_v[j], lon_v[i], lon_v[j]
+                    crosses = (yi > y) != (yj > y)
+                    if yi != yj:
+                        crosses &= x < (xj - xi) * (y - yi) / (yj - yi) + xi
+                    inside ^= crosses
+                    j = i
+
+        mask[idx] = inside
+        return mask
+
+
+class GridIndex:
+    """Sınır kutularını düzenli enlem/boylam ızgarasına yerleştiren indeks"""
+
+    def __init__(self, cell_deg: float = 0.01, max_cells_per_item: int = 400):
+        self.cell_deg = cell_deg
+        self.max_cells_per_item = max_cells_per_item
+        self._cells = {}
+        self._large = []  # Çok hücre kaplayan öğeler: her sorguda test edilir
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self.cell_deg)), int(math.floor(lon / self.cell_deg))
+
+    def insert(self, item, bbox: Tuple[float, float, float, float]):
+        min_lat, min_lon, max_lat, max_lon = bbox
+        y0, x0 = self._cell(min_lat, min_lon)
+        y1, x1 = self._cell(max_lat, max_lon)
+
+        if (y1 - y0 + 1) * (x1 - x0 + 1) > self.max_cells_per_item:
+            self._large.append(item)
+            return
+
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self._cells.setdefault((cy, cx), []).append(item)
+
+    def query(self, lat: float, lon: float) -> List:
+        """Noktanın hücresindeki aday öğeler"""
+        cell = self._cells.get(self._cell(lat, lon))
+        if cell is None:
+            return self._large
+        return cell + self._large if self._large else cell
+
+
+class GeofenceEngine:
+    """Sınırları ızgara indeksiyle paket başına (veya toplu) değerlendirir"""
+
+    def __init__(self, fences: Iterable[Geofence] = (), cell_deg: float = 0.01):
+        self.fences = list(fences)
+        self._compiled = [_CompiledFence(f) for f in self.fences]
+        self.has_inclusion = any(not c.exclusion for c in self._compiled)
+
+        self.index = GridIndex(cell_deg)
+        for compiled in self._compiled:
+            self.index.insert(compiled, (compiled.min_lat, compiled.min_lon,
+                                         compiled.max_lat, compiled.max_lon))
+
+    def __len__(self):
+        return len(self.fences)
+
+    def check(self, lat: float, lon: float, alt: float) -> List[Geofence]:
+        """İhlal edilen sınırlar (dışında kalınan izin bölgeleri tek kayıt)"""
+        breached = []
+        inside_inclusion = False
+
+        for compiled in self.index.query(lat, lon):
+            if compiled.exclusion:
+                if compiled.contains(lat, lon, alt):
+                    breached.append(compiled.fence)
+            elif not inside_inclusion and compiled.contains(lat, lon, alt):
+                inside_inclusion = True
+
+        if self.has_inclusion and not inside_inclusion:
+            breached.append(None)  # Tüm izin verilen bölgelerin dışında
+        return breached
+
+    def check_packet(self, packet) -> List[Dict]:
+        """Paketi değerlendir, ihlalleri alarm dict'leri olarak döndür"""
+        gps = packet.gps
+        alerts = []
+        for fence in self.check(gps.latitude, gps.longitude, gps.altitude):
+            if fence is None:
+                alerts.append({
+                    'type': OUTSIDE_ALERT_TYPE,
+                    'severity': 'CRITICAL',
+                    'message': f'Uçuş alanı dışında! ({gps.latitude:.5f}, '
+                               f'{gps.longitude:.5f}, {gps.altitude:.0f}m)',
+                    'value': gps.altitude,
+                    'timestamp': packet.timestamp
+                })
+            else:
+                alerts.append({
+                    'type': fence.alert_type,
+                    'severity': fence.severity,
+                    'message': f'Yasak bölge ihlali: {fence.name} ({gps.altitude:.0f}m)',
+                    'value': gps.altitude,
+                    'timestamp': packet.timestamp
+                })
+        return alerts
+
+    def check_batch(self, lats, lons, alts) -> Dict:
+        """Kayıtlı bir oturumu toplu değerlendir
+
+        Dönüş: {'exclusion': {ad: bool dizisi}, 'outside': bool dizisi,
+                'any': bool dizisi}
+        """
+        import numpy as np
+
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        alts = np.asarray(alts, dtype=float)
+
+        exclusion = {}
+        inside_inclusion = np.zeros(lats.shape, dtype=bool)
+        for compiled in self._compiled:
+            mask = compiled.contains_many(lats, lons, alts)
+            if compiled.exclusion:
+                exclusion[compiled.fence.name] = mask
+            else:
+                inside_inclusion |= mask
+
+        outside = ~inside_inclusion if self.has_inclusion else np.zeros(lats.shape, dtype=bool)
+        breached = outside.copy()
+        for mask in exclusion.values():
+            breached |= mask
+        return {'exclusion': exclusion, 'outside': outside, 'any': breached}
+
+    def check_records(self, records: List[Dict]) -> Dict:
+        """Veritabanı kayıt dict'leri için check_batch"""
+        return self.check_batch([r['latitude'] for r in records],
+                                [r['longitude'] for r in records],
+                                [r['altitude'] for r in records])
@@ -0,0 +1,68 @@
+# src/services/metrics_server.py
+"""
+Yerel /metrics uç noktası (Prometheus metin biçimi)
+
+Telemetri hattının aşama gecikmeleri ve hızları yalnızca 127.0.0.1
+üzerinden sunulur:
+    curl http://127.0.0.1:9108/metrics
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.core.logger import PipelineMetrics, get_logger, pipeline_metrics
+
+logger = get_logger(__name__)
+
+DEFAULT_PORT = 9108
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    metrics: PipelineMetrics = None
+
+    def do_GET(self):
+        if self.path.split('?')[0].rstrip('/') != '/metrics':
+            self._respond(404, b'', 'text/plain')
+            return
+        body = self.metrics.render_text().encode('utf-8')
+        self._respond(200, body, 'text/plain; version=0.0.4; charset=utf-8')
+
+    def _respond(self, code, body, content_type):
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Her kazıma (scrape) isteğini loglama
+
+
+class MetricsServer:
+    """PipelineMetrics'i http://127.0.0.1:<port>/metrics adresinden sunar"""
+
+    def __init__(self, metrics: PipelineMetrics = pipeline_metrics,
+                 host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        handler = type('MetricsRequestHandler', (_MetricsRequestHandler,), {'metrics': metrics})
+        self.metrics = metrics
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info("Metrik uç noktası: %s", self.url)
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join(timeout=2)
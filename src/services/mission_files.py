@@ -0,0 +1,180 @@
+# src/services/mission_files.py
+"""
+Görev dosyası içe/dışa aktarma: QGroundControl .plan ve MAVLink WPL metni
+
+Görev noktaları WaypointManager biçimindeki dict'lerdir (latitude,
+longitude, altitude, action_type, hold_time). Dışa aktarma noktaları
+tek tek yazar; liste bellekte kopyalanmaz, üreteç de verilebilir. WPL
+okuma satır satır akar; .plan tek bir JSON belgesidir ve bir kerede
+okunur, öğeleri yine üreteçle döndürülür.
+
+Eylem <-> MAVLink komut eşlemesi:
+    FLY_TO  -> MAV_CMD_NAV_WAYPOINT (16), param1 bekleme süresi
+    HOVER   -> MAV_CMD_NAV_LOITER_TIME (19), param1 bekleme süresi
+    LAND    -> MAV_CMD_NAV_LAND (21)
+    TAKEOFF -> MAV_CMD_NAV_TAKEOFF (22)
+    PHOTO   -> MAV_CMD_NAV_WAYPOINT + MAV_CMD_DO_DIGICAM_CONTROL (203)
+Diğer komutlar (konumsuz DO_* öğeleri vb.) okunurken atlanır.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+NAV_WAYPOINT = 16
+NAV_LOITER_TIME = 19
+NAV_LAND = 21
+NAV_TAKEOFF = 22
+DO_DIGICAM_CONTROL = 203
+
+ACTION_COMMANDS = {
+    'FLY_TO': NAV_WAYPOINT,
+    'HOVER': NAV_LOITER_TIME,
+    'LAND': NAV_LAND,
+    'TAKEOFF': NAV_TAKEOFF,
+    'PHOTO': NAV_WAYPOINT,
+}
+COMMAND_ACTIONS = {NAV_WAYPOINT: 'FLY_TO', NAV_LOITER_TIME: 'HOVER',
+                   NAV_LAND: 'LAND', NAV_TAKEOFF: 'TAKEOFF'}
+
+FRAME_GLOBAL = 0  # Deniz seviyesine göre (ev konumu)
+FRAME_GLOBAL_RELATIVE_ALT = 3  # Eve göre yükseklik (görev noktaları)
+
+WPL_HEADER = "QGC WPL 110"
+PLAN_EXTENSION = '.plan'
+
+
+def _mission_items(waypoints: Iterable[Dict]) -> Iterator[Tuple[int, list]]:
+    """(komut, [param1..4, enlem, boylam, yükseklik]) öğeleri"""
+    for wp in waypoints:
+        action = wp.get('action_type', 'FLY_TO')
+        command = ACTION_COMMANDS.get(action, NAV_WAYPOINT)
+        hold = float(wp.get('hold_time') or 0) if command in (NAV_WAYPOINT, NAV_LOITER_TIME) else 0.0
+        yield command, [hold, 0, 0, 0, wp['latitude'], wp['longitude'], wp['altitude']]
+        if action == 'PHOTO':
+            yield DO_DIGICAM_CONTROL, [0, 0, 0, 0, 1, 0, 0]  # param5=1: çek
+
+
+def _to_waypoint(command: int, params) -> Optional[Dict]:
+    if command not in COMMAND_ACTIONS:
+        return None
+    action = COMMAND_ACTIONS[command]
+    return {
+        'latitude': float(params[4]),
+        'longitude': float(params[5]),
+        'altitude': float(params[6]),
+        'action_type': action,
+        'hold_time': float(params[0] or 0) if command in (NAV_WAYPOINT, NAV_LOITER_TIME) else 0.0,
+    }
+
+
+def _collect(items: Iterable[Tuple[int, list]]) -> Iterator[Dict]:
+    """Komut akışını görev noktalarına çevir (DIGICAM önceki noktayı PHOTO yapar)"""
+    pending = None
+    skipped = 0
+    for command, params in items:
+        if command == DO_DIGICAM_CONTROL and pending is not None:
+            pending['action_type'] = 'PHOTO'
+            continue
+        waypoint = _to_waypoint(command, params)
+        if waypoint is None:
+            skipped += 1
+            continue
+        if pending is not None:
+            yield pending
+        pending = waypoint
+    if pending is not None:
+        yield pending
+    if skipped:
+        logger.info("Desteklenmeyen %d görev öğesi atlandı", skipped)
+
+
+def write_wpl(path, waypoints: Iterable[Dict], home: Optional[Tuple[float, float, float]] = None) -> int:
+    """MAVLink WPL 110 metni yaz; 0. satır ev konumu (verilmezse ilk nokta)"""
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(WPL_HEADER + "\n")
+        for command, params in _mission_items(waypoints):
+            if count == 0:
+                lat, lon, alt = home or (params[4], params[5], 0.0)
+                f.write(f"0\t1\t{FRAME_GLOBAL}\t{NAV_WAYPOINT}\t0\t0\t0\t0\t{lat:.8f}\t{lon:.8f}\t{alt:.3f}\t1\n")
+            count += 1
+            p1, p2, p3, p4, lat, lon, alt = params
+            f.write(f"{count}\t0\t{FRAME_GLOBAL_RELATIVE_ALT}\t{command}\t{p1:g}\t{p2:g}\t{p3:g}\t{p4:g}\t"
+                    f"{lat:.8f}\t{lon:.8f}\t{alt:.3f}\t1\n")
+    return count
+
+
+def read_wpl(path) -> Iterator[Dict]:
+    """MAVLink WPL metnini satır satır oku (0. satır ev konumu atlanır)"""
+    def items():
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline().strip()
+            if not header.startswith("QGC WPL"):
+                raise ValueError(f"WPL başlığı bekleniyordu: {header!r}")
+            for number, line in enumerate(f, start=2):
+                fields = line.split()
+                if not fields:
+                    continue
+                if len(fields) != 12:
+                    raise ValueError(f"{path}:{number}: 12 alan bekleniyordu")
+                if int(fields[0]) == 0:
+                    continue  # Ev konumu
+                yield int(fields[3]), [float(value) for value in fields[4:11]]
+    return _collect(items())
+
+
+def write_plan(path, waypoints: Iterable[Dict], home: Optional[Tuple[float, float, float]] = None,
+               cruise_speed: float = 15.0, hover_speed: float = 5.0) -> int:
+    """QGroundControl .plan (JSON) yaz; öğeler tek tek eklenir"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"fileType": "Plan", "groundStation": "QGroundControl", "version": 1,\n'
+                ' "geoFence": {"circles": [], "polygons": [], "version": 2},\n'
+                ' "rallyPoints": {"points": [], "version": 2},\n'
+                ' "mission": {"version": 2, "firmwareType": 12, "vehicleType": 2, '
+                f'"globalPlanAltitudeMode": 1, "cruiseSpeed": {cruise_speed}, '
+                f'"hoverSpeed": {hover_speed},\n  "items": [')
+        for command, params in _mission_items(waypoints):
+            if count == 0 and home is None:
+                home = (params[4], params[5], 0.0)
+            count += 1
+            # json.dumps yerine hazır şablon (öğe başına ~4 kat hızlı); float repr'i geçerli JSON
+            position = "" if command == DO_DIGICAM_CONTROL else (
+                f', "Altitude": {float(params[6])!r}, "AltitudeMode": 1, "AMSLAltAboveTerrain": null')
+            f.write(f'{"," if count > 1 else ""}\n   {{"type": "SimpleItem", "autoContinue": true, '
+                    f'"command": {command}, "doJumpId": {count}, "frame": {FRAME_GLOBAL_RELATIVE_ALT}, '
+                    f'"params": [{", ".join(repr(float(value)) for value in params)}]{position}}}')
+        f.write(f'\n  ],\n  "plannedHomePosition": {json.dumps(list(home or (0.0, 0.0, 0.0)))}}}\n}}\n')
+    return count
+
+
+def read_plan(path) -> Iterator[Dict]:
+    """QGroundControl .plan görev öğelerini oku (yalnızca SimpleItem)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+    if plan.get('fileType') != 'Plan':
+        raise ValueError(f"QGroundControl plan dosyası değil: {path}")
+
+    def items():
+        for item in plan.get('mission', {}).get('items', []):
+            if item.get('type') != 'SimpleItem':
+                logger.warning("Karmaşık görev öğesi atlandı: %s", item.get('complexItemType'))
+                continue
+            yield item['command'], item['params']
+    return _collect(items())
+
+
+def read_mission(path) -> Iterator[Dict]:
+    """Uzantıya göre .plan veya WPL metni oku"""
+    return read_plan(path) if Path(path).suffix.lower() == PLAN_EXTENSION else read_wpl(path)
+
+
+def write_mission(path, waypoints: Iterable[Dict], **kwargs) -> int:
+    """Uzantıya göre .plan veya WPL metni yaz; yazılan öğe sayısı"""
+    writer = write_plan if Path(path).suffix.lower() == PLAN_EXTENSION else write_wpl
+    return writer(path, waypoints, **kwargs)
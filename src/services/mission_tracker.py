@@ -0,0 +1,226 @@
+# src/services/mission_tracker.py
+"""
+Görev ilerleme takibi: aktif bacak, yanal sapma, kalan mesafe ve ETA
+
+Rota görev noktaları arasındaki bacaklardan oluşur. Bacak geometrisi görev
+başlarken bir kez hesaplanır (NumPy): başlangıç noktası, boylam ölçeği
+(cos enlem), birim yön vektörü, uzunluk; ayrıca noktalara kadar birikimli
+mesafe ve bekleme süreleri. Paket başına yalnızca aktif bacağın yerel
+düzlemine izdüşüm yapılır:
+
+    along = p · u          (bacak boyunca ilerleme)
+    cross = p × u          (yanal sapma; rotanın sağı pozitif)
+
+Hedef noktanın kabul yarıçapına girilince veya bacak sonu geçilince
+sonraki bacağa geçilir. Bacaklar yalnızca ileri sayıldığı için paket
+başına maliyet amortize O(1)'dir; görev büyüklüğünden bağımsızdır.
+
+Rotadan sapma alarmı AlarmStateMachine ile debounce/histerezisli
+tutulur (off_route_m üstünde tetiklenir, clear_route_m altında temizlenir).
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..core.geodesy import local_xy
+from .alarm_state import AlarmStateMachine
+
+ROUTE_ALERT_TYPE = 'OFF_ROUTE'
+ACCEPTANCE_RADIUS_M = 10.0  # Görev noktasında 'radius' verilmemişse
+MIN_ETA_SPEED = 0.5  # m/s; daha yavaşken ETA hesaplanmaz
+_EPS = 1e-6
+
+
+class MissionTracker:
+    """Canlı telemetriyi planlanan rotaya göre izler (paket başına O(1))"""
+
+    def __init__(self, waypoints: Sequence[Dict], off_route_m: float = 25.0,
+                 clear_route_m: Optional[float] = None,
+                 acceptance_radius_m: float = ACCEPTANCE_RADIUS_M,
+                 severity: str = 'WARNING', alarm_states: AlarmStateMachine = None,
+                 raise_debounce: int = 3, clear_debounce: int = 3):
+        """waypoints: latitude, longitude, isteğe bağlı hold_time ve radius
+        içeren dict'ler (WaypointPanel veya WaypointManager biçimi).
+
+        alarm_states verilirse alarm durumu onunla paylaşılır (ör. AlarmPanel).
+        """
+        if not waypoints:
+            raise ValueError("Görev en az 1 waypoint içermeli")
+        self.off_route_m = off_route_m
+        self.clear_route_m = off_route_m * 0.8 if clear_route_m is None else clear_route_m
+        self.severity = severity
+        self.raise_debounce = raise_debounce
+        self.clear_debounce = clear_debounce
+        self.alarm_states = alarm_states if alarm_states is not None else AlarmStateMachine()
+
+        lats = np.array([wp['latitude'] for wp in waypoints], dtype=float)
+        lons = np.array([wp['longitude'] for wp in waypoints], dtype=float)
+        holds = np.array([wp.get('hold_time') or 0 for wp in waypoints], dtype=float)
+        radii = np.array([wp.get('radius') or acceptance_radius_m for wp in waypoints], dtype=float)
+        if len(lats) == 1:
+            # Tek nokta: sıfır uzunluklu bacak (yalnızca hedefe mesafe)
+            lats, lons = np.repeat(lats, 2), np.repeat(lons, 2)
+            holds, radii = np.append(holds, 0.0), np.repeat(radii, 2)
+        self.waypoint_count = len(waypoints)
+
+        # Bacak geometrisi: başlangıç noktasında yerel Doğu-Kuzey düzlemi
+        cos_lat0 = np.cos(np.radians(lats[:-1]))
+        dx, dy = local_xy(lats[1:], lons[1:], lats[:-1], lons[:-1], cos_lat0)
+        length = np.hypot(dx, dy)
+        safe = np.where(length > _EPS, length, 1.0)
+        ux = np.where(length > _EPS, dx / safe, 0.0)
+        uy = np.where(length > _EPS, dy / safe, 0.0)
+
+        # Skaler erişim Python listelerinde NumPy'dan hızlı
+        self._lat0 = lats[:-1].tolist()
+        self._lon0 = lons[:-1].tolist()
+        self._cos_lat0 = cos_lat0.tolist()
+        self._dx, self._dy = dx.tolist(), dy.tolist()
+        self._ux, self._uy = ux.tolist(), uy.tolist()
+        self._length = length.tolist()
+        self._radius = radii.tolist()
+
+        # Noktaya kadar birikimli mesafe ve (önceki noktalardaki) bekleme
+        self._cum_distance = np.concatenate(([0.0], np.cumsum(length)))
+        self._cum_hold = np.concatenate(([0.0], np.cumsum(holds)))
+        self.total_distance = float(self._cum_distance[-1])
+        self.leg_count = len(self._length)
+
+        self.leg = 0
+        self.completed = False
+        self.state: Optional[Dict] = None
+
+    @property
+    def target_index(self) -> int:
+        """Uçulan (sıradaki) görev noktası"""
+        return min(self.leg + 1, self.waypoint_count - 1)
+
+    def _project(self, leg: int, lat: float, lon: float):
+        """Konumun bacak düzlemindeki (x, y) koordinatları"""
+        return local_xy(lat, lon, self._lat0[leg], self._lon0[leg], self._cos_lat0[leg])
+
+    def update(self, lat: float, lon: float, speed: Optional[float] = None,
+               timestamp=None) -> Dict:
+        """Yeni konumla ilerlemeyi güncelle
+
+        Dönüş: leg, target_index, cross_track_m, deviation_m (bacak
+        doğrusuna değil parçasına uzaklık), along_track_m,
+        distance_to_target_m, remaining_m, eta_target_s, eta_end_s,
+        progress (0-1), off_route, completed, transition (alarm geçişi).
+        """
+        last = self.leg_count - 1
+        while True:
+            leg = self.leg
+            px, py = self._project(leg, lat, lon)
+            length = self._length[leg]
+            along = px * self._ux[leg] + py * self._uy[leg]
+            to_target = math.hypot(px - self._dx[leg], py - self._dy[leg])
+            reached = to_target <= self._radius[leg + 1]
+            if leg < last and (reached or (length > _EPS and along >= length)):
+                self.leg += 1
+                continue
+            break
+        if leg == last and reached:
+            self.completed = True
+
+        cross = px * self._uy[leg] - py * self._ux[leg]
+        if length <= _EPS:
+            deviation = 0.0
+        elif along < 0:
+            deviation = math.hypot(px, py)
+        elif along > length:
+            deviation = to_target
+        else:
+            deviation = abs(cross)
+
+        if self.completed:
+            leg_remaining = 0.0
+        elif length > _EPS:
+            leg_remaining = max(length - along, 0.0)
+        else:
+            leg_remaining = to_target
+        remaining = leg_remaining + self.total_distance - self._cum_distance[leg + 1]
+
+        eta_target = eta_end = None
+        if speed is not None and speed >= MIN_ETA_SPEED and not self.completed:
+            eta_target = leg_remaining / speed
+            eta_end = float(remaining / speed + self._cum_hold[-2] - self._cum_hold[leg + 1])
+
+        if self.completed:
+            progress = 1.0
+        elif self.total_distance > _EPS:
+            progress = max(0.0, 1.0 - float(remaining) / self.total_distance)
+        else:
+            progress = 0.0
+
+        off_route = deviation > self.off_route_m and not self.completed
+        # Mesaj yalnızca tetiklenme koşulunda kullanılır; diğer paketlerde biçimlenmez
+        message = ''
+        if off_route:
+            message = f'Rotadan sapma: {deviation:.0f} m (bacak {leg + 1}/{self.leg_count})'
+        transition = self.alarm_states.update(
+            ROUTE_ALERT_TYPE, off_route, deviation < self.clear_route_m or self.completed,
+            self.severity, message, deviation, timestamp, self.raise_debounce, self.clear_debounce)
+
+        self.state = {
+            'leg': leg,
+            'target_index': self.target_index,
+            'cross_track_m': cross,
+            'deviation_m': deviation,
+            'along_track_m': along,
+            'distance_to_target_m': to_target,
+            'remaining_m': float(remaining),
+            'eta_target_s': eta_target,
+            'eta_end_s': eta_end,
+            'progress': progress,
+            'off_route': self.alarm_active,
+            'completed': self.completed,
+            'transition': transition,
+        }
+        return self.state
+
+    def update_packet(self, packet) -> Optional[Dict]:
+        """Telemetri paketiyle güncelle; konum yoksa (0, 0) son durum döner"""
+        gps = packet.gps
+        if gps.latitude == 0 and gps.longitude == 0:
+            return self.state
+        return self.update(gps.latitude, gps.longitude, packet.velocity, packet.timestamp)
+
+    @property
+    def alarm_active(self) -> bool:
+        state = self.alarm_states.get(ROUTE_ALERT_TYPE)
+        return bool(state and state.is_active)
+
+    def check_packet(self, packet) -> List[Dict]:
+        """Paketi değerlendir; rotadan sapma sürüyorsa alarm dict'i döndür"""
+        if self.update_packet(packet) is None or not self.alarm_active:
+            return []
+        state = self.alarm_states.get(ROUTE_ALERT_TYPE)
+        return [{
+            'type': ROUTE_ALERT_TYPE,
+            'severity': state.severity,
+            'message': state.message,
+            'value': state.value,
+            'timestamp': packet.timestamp
+        }]
+
+    def etas(self, speed: float) -> np.ndarray:
+        """Her görev noktasına ETA (s, beklemeler dahil); geçilenler NaN"""
+        # Rota noktaları üzerinde hesaplanır (tek noktalı görevde nokta çiftlenmiştir)
+        etas = np.full(self.leg_count + 1, np.nan)
+        if self.state is not None and not self.completed and speed >= MIN_ETA_SPEED:
+            target = self.leg + 1
+            ahead = np.arange(target, self.leg_count + 1)
+            distance = (self.state['remaining_m'] - self.total_distance
+                        + self._cum_distance[ahead])
+            etas[ahead] = distance / speed + self._cum_hold[ahead] - self._cum_hold[target]
+        return etas[-self.waypoint_count:]
+
+    def reset(self):
+        """Görevi baştan izle"""
+        self.leg = 0
+        self.completed = False
+        self.state = None
+        self.alarm_states.states.pop(ROUTE_ALERT_TYPE, None)
@@ -0,0 +1,488 @@
+# src/services/tile_cache.py
+"""
+Çevrimdışı harita karo (tile) önbelleği
+
+- MBTiles (SQLite) formatında yerel karo deposu, LRU tahliyesi ile
+- Sınır kutusu veya görev waypoint'leri boyunca ön yükleme (prefetch)
+- QtWebEngine'in karoları yüklediği yerel HTTP sunucusu
+- Önbellek isabet oranı ve karo sunma gecikmesi metrikleri
+
+Ön yükleme karoları map.upstream_url adresinden map.prefetch_rate_hz hızıyla
+indirir. Herkese açık OpenStreetMap sunucusu toplu indirmeye izin vermez
+(karo kullanım politikası); bu sunucu hedefse komut --force olmadan çalışmaz.
+
+Kullanım:
+    python -m src.services.tile_cache prefetch --bbox 39.90 32.80 39.96 32.90 --zoom 12 16 \
+        --upstream "https://tiles.example.local/{z}/{x}/{y}.png"
+    python -m src.services.tile_cache prefetch --mission "Test Uçuş" --zoom 14 17
+"""
+
+import argparse
+import functools
+import json
+import math
+import sqlite3
+import threading
+import time
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..core.config import get_config
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+OSM_TILE_HOST = "tile.openstreetmap.org"  # Toplu indirme yasak (karo kullanım politikası)
+DEFAULT_USER_AGENT = "UAV-Telemetry-Imaging-System/1.0 (offline tile cache)"
+
+Tile = Tuple[int, int, int]  # (zoom, x, y) - XYZ şeması
+
+
+# ---------------------------------------------------------------------------
+# Karo matematiği (Web Mercator / XYZ)
+# ---------------------------------------------------------------------------
+
+def lat_lon_to_tile(lat: float, lon: float, zoom: int) -> Tuple[int, int]:
+    """Enlem/boylamı verilen zoom seviyesindeki karo koordinatına çevir"""
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    n = 2 ** zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tiles_for_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                   zooms: Iterable[int]) -> List[Tile]:
+    """Sınır kutusunu kaplayan tüm karolar"""
+    tiles = []
+    for zoom in zooms:
+        x_min, y_min = lat_lon_to_tile(max_lat, min_lon, zoom)  # Kuzeybatı
+        x_max, y_max = lat_lon_to_tile(min_lat, max_lon, zoom)  # Güneydoğu
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                tiles.append((zoom, x, y))
+    return tiles
+
+
+def tiles_along_path(points: Iterable[Tuple[float, float]], zooms: Iterable[int],
+                     buffer_tiles: int = 1) -> List[Tile]:
+    """Rota boyunca (ve çevresindeki buffer_tiles karo) karolar"""
+    points = list(points)
+    tiles = set()
+
+    for zoom in zooms:
+        n = 2 ** zoom
+        previous = None
+        for lat, lon in points:
+            current = lat_lon_to_tile(lat, lon, zoom)
+            # Bacak boyunca karo atlamamak için ara noktaları doldur
+            if previous is None:
+                cells = [current]
+            else:
+                steps = max(abs(current[0] - previous[0]), abs(current[1] - previous[1]), 1)
+                cells = [(round(previous[0] + (current[0] - previous[0]) * i / steps),
+                          round(previous[1] + (current[1] - previous[1]) * i / steps))
+                         for i in range(1, steps + 1)]
+            for cx, cy in cells:
+                for dx in range(-buffer_tiles, buffer_tiles + 1):
+                    for dy in range(-buffer_tiles, buffer_tiles + 1):
+                        x, y = cx + dx, cy + dy
+                        if 0 <= x < n and 0 <= y < n:
+                            tiles.add((zoom, x, y))
+            previous = current
+
+    return sorted(tiles)
+
+
+# ---------------------------------------------------------------------------
+# MBTiles deposu
+# ---------------------------------------------------------------------------
+
+class TileCache:
+    """MBTiles (SQLite) karo deposu - LRU tahliyeli"""
+
+    # Erişim zamanlarını her istekte değil, toplu yaz
+    ACCESS_FLUSH_EVERY = 64
+
+    def __init__(self, path: str = "tile_cache.mbtiles", max_tiles: int = 50000):
+        self.path = Path(path)
+        self.max_tiles = max_tiles
+        self._lock = threading.Lock()
+        self._touched: Dict[Tile, float] = {}
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._initialize()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+
+    def _initialize(self):
+        """MBTiles şemasını oluştur"""
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tiles ("
+                "zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, "
+                "tile_data BLOB, last_access REAL, "
+                "PRIMARY KEY (zoom_level, tile_column, tile_row))")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tiles_last_access ON tiles (last_access)")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO metadata (name, value) VALUES (?, ?)",
+                [('name', 'uav_offline_tiles'), ('format', 'png'), ('type', 'baselayer')])
+
+    @staticmethod
+    def _tms_row(zoom: int, y: int) -> int:
+        """MBTiles TMS şeması kullanır: y ekseni ters"""
+        return (2 ** zoom - 1) - y
+
+    def get(self, zoom: int, x: int, y: int) -> Optional[bytes]:
+        """Karoyu getir (yoksa None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                (zoom, x, self._tms_row(zoom, y))).fetchone()
+            if row is None:
+                return None
+
+            self._touched[(zoom, x, y)] = time.time()
+            if len(self._touched) >= self.ACCESS_FLUSH_EVERY:
+                self._flush_access()
+            return row[0]
+
+    def put(self, zoom: int, x: int, y: int, data: bytes):
+        """Karoyu kaydet, kapasite aşılırsa en eski erişilenleri sil"""
+        row = self._tms_row(zoom, y)
+        with self._lock:
+            with self._conn:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                    (zoom, x, row)).fetchone() is not None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tiles "
+                    "(zoom_level, tile_column, tile_row, tile_data, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (zoom, x, row, sqlite3.Binary(data), time.time()))
+                if not exists:
+                    self._count += 1
+                if self._count > self.max_tiles:
+                    self._evict(self._count - self.max_tiles)
+
+    def contains(self, zoom: int, x: int, y: int) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                (zoom, x, self._tms_row(zoom, y))).fetchone() is not None
+
+    def _flush_access(self):
+        """Biriken erişim zamanlarını tek işlemde yaz (kilit tutulurken çağrılır)"""
+        if not self._touched:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE tiles SET last_access=? "
+                "WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                [(ts, z, x, self._tms_row(z, y)) for (z, x, y), ts in self._touched.items()])
+        self._touched.clear()
+
+    def _evict(self, count: int):
+        """En uzun süredir erişilmeyen karoları sil (kilit tutulurken çağrılır)"""
+        self._flush_access()
+        cursor = self._conn.execute(
+            "DELETE FROM tiles WHERE rowid IN "
+            "(SELECT rowid FROM tiles ORDER BY last_access ASC LIMIT ?)", (count,))
+        self._count -= cursor.rowcount
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        with self._lock:
+            self._flush_access()
+            self._conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Karo sağlayıcı (önbellek + upstream) ve metrikler
+# ---------------------------------------------------------------------------
+
+def is_public_osm(url_template: str) -> bool:
+    """Adres herkese açık OpenStreetMap karo sunucusu mu?"""
+    host = (urlsplit(url_template).hostname or '').lower()
+    return host == OSM_TILE_HOST or host.endswith('.' + OSM_TILE_HOST)
+
+
+def fetch_upstream_tile(zoom: int, x: int, y: int, url_template: str,
+                        timeout: float = 5.0) -> bytes:
+    """Karoyu internetten indir"""
+    url = url_template.format(z=zoom, x=x, y=y)
+    request = urllib.request.Request(url, headers={'User-Agent': DEFAULT_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+class TileProvider:
+    """Önbellekten karo sunar, bulamazsa (çevrimiçiyse) upstream'den çeker"""
+
+    def __init__(self, cache: TileCache, fetcher: Optional[Callable[[int, int, int], bytes]] = None,
+                 offline: bool = False, latency_window: int = 1000,
+                 upstream_url: Optional[str] = None):
+        """upstream_url verilmezse map.upstream_url kullanılır (fetcher verilmişse yok sayılır)"""
+        self.cache = cache
+        self.upstream_url = upstream_url or get_config().map.upstream_url
+        self.fetcher = fetcher or functools.partial(fetch_upstream_tile,
+                                                    url_template=self.upstream_url)
+        self.offline = offline
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.upstream_errors = 0
+        self._latencies_ms = deque(maxlen=latency_window)
+
+    def get_tile(self, zoom: int, x: int, y: int) -> Optional[bytes]:
+        """Karoyu getir; önbellekte yoksa indirip kaydet"""
+        start = time.perf_counter()
+        data = self.cache.get(zoom, x, y)
+        hit = data is not None
+
+        if not hit and not self.offline:
+            try:
+                data = self.fetcher(zoom, x, y)
+                self.cache.put(zoom, x, y, data)
+            except Exception:
+                data = None
+                with self._lock:
+                    self.upstream_errors += 1
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._latencies_ms.append(elapsed_ms)
+        return data
+
+    def prefetch(self, tiles: Iterable[Tile],
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 rate_hz: Optional[float] = None) -> Dict:
+        """Karoları önceden indir (önbellekte olanlar atlanır)
+
+        rate_hz verilirse upstream istekleri saniyede en fazla bu kadar yapılır.
+        """
+        tiles = list(tiles)
+        fetched = skipped = failed = 0
+        min_interval = 1.0 / rate_hz if rate_hz else 0.0
+        next_request = 0.0
+
+        for index, (zoom, x, y) in enumerate(tiles, 1):
+            if self.cache.contains(zoom, x, y):
+                skipped += 1
+            else:
+                wait = next_request - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                next_request = time.monotonic() + min_interval
+                try:
+                    self.cache.put(zoom, x, y, self.fetcher(zoom, x, y))
+                    fetched += 1
+                except Exception:
+                    failed += 1
+            if progress:
+                progress(index, len(tiles))
+
+        return {'total': len(tiles), 'fetched': fetched, 'skipped': skipped, 'failed': failed}
+
+    def metrics(self) -> Dict:
+        """Önbellek isabet oranı ve karo sunma gecikmesi"""
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            requests = self.hits + self.misses
+            hits, misses, errors = self.hits, self.misses, self.upstream_errors
+
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p / 100.0 * len(latencies)))]
+
+        return {
+            'requests': requests,
+            'hits': hits,
+            'misses': misses,
+            'upstream_errors': errors,
+            'hit_rate': hits / requests if requests else 0.0,
+            'serve_latency_ms_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+            'serve_latency_ms_p50': percentile(50),
+            'serve_latency_ms_p95': percentile(95),
+            'cached_tiles': len(self.cache)
+        }
+
+
+# ---------------------------------------------------------------------------
+# Yerel HTTP karo sunucusu
+# ---------------------------------------------------------------------------
+
+class _TileRequestHandler(BaseHTTPRequestHandler):
+    provider: TileProvider = None
+
+    def do_GET(self):
+        parts = self.path.split('?')[0].strip('/').split('/')
+
+        if parts == ['tiles', 'metrics']:
+            body = json.dumps(self.provider.metrics()).encode()
+            self._respond(200, body, 'application/json')
+            return
+
+        try:
+            if len(parts) != 4 or parts[0] != 'tiles':
+                raise ValueError
+            zoom, x = int(parts[1]), int(parts[2])
+            y = int(parts[3].split('.')[0])
+        except ValueError:
+            self._respond(404, b'', 'text/plain')
+            return
+
+        data = self.provider.get_tile(zoom, x, y)
+        if data is None:
+            self._respond(404, b'', 'text/plain')
+        else:
+            self._respond(200, data, 'image/png')
+
+    def _respond(self, code, body, content_type):
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        # Eksik karo önbelleğe alınmamalı: ağ gelince yeniden istenebilsin
+        self.send_header('Cache-Control', 'max-age=86400' if code == 200 else 'no-store')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Her karo isteğini loglama
+
+
+class TileServer:
+    """Karoları http://127.0.0.1:<port>/tiles/{z}/{x}/{y}.png adresinden sunar"""
+
+    def __init__(self, provider: TileProvider, host: str = "127.0.0.1", port: int = 0):
+        handler = type('TileRequestHandler', (_TileRequestHandler,), {'provider': provider})
+        self.provider = provider
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url_template(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/tiles/{{z}}/{{x}}/{{y}}.png"
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info("Yerel karo sunucusu: %s", self.url_template)
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join(timeout=2)
+
+
+# ---------------------------------------------------------------------------
+# Komut satırı: prefetch
+# ---------------------------------------------------------------------------
+
+def _load_mission_points(db_path: str, mission_name: str) -> List[Tuple[float, float]]:
+    """Veritabanındaki görevin waypoint koordinatları"""
+    from ..database.database_manager import DatabaseManager
+    from ..database.models import Waypoint
+
+    db_manager = DatabaseManager(db_path)
+    try:
+        with db_manager.get_session() as session:
+            rows = (session.query(Waypoint.latitude, Waypoint.longitude)
+                    .filter_by(mission_name=mission_name)
+                    .order_by(Waypoint.order_index)
+                    .all())
+            return [(lat, lon) for lat, lon in rows]
+    finally:
+        db_manager.close_connection()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çevrimdışı harita karo önbelleği")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    prefetch = subparsers.add_parser('prefetch', help="Karoları önceden indir")
+    area = prefetch.add_mutually_exclusive_group(required=True)
+    area.add_argument('--bbox', nargs=4, type=float,
+                      metavar=('MIN_LAT', 'MIN_LON', 'MAX_LAT', 'MAX_LON'))
+    area.add_argument('--mission', help="Veritabanındaki görev adı")
+    prefetch.add_argument('--zoom', nargs=2, type=int, default=[12, 16], metavar=('MIN', 'MAX'))
+    prefetch.add_argument('--buffer', type=int, default=1, help="Rota çevresindeki karo payı")
+    prefetch.add_argument('--cache', default=None)
+    prefetch.add_argument('--db', default=None)
+    prefetch.add_argument('--max-tiles', type=int, default=None)
+    prefetch.add_argument('--upstream', default=None, help="Karo adresi ({z}/{x}/{y} şablonu)")
+    prefetch.add_argument('--rate', type=float, default=None, help="Upstream istek/saniye")
+    prefetch.add_argument('--force', action='store_true',
+                          help="Herkese açık OpenStreetMap sunucusundan indirmeye izin ver")
+
+    args = parser.parse_args(argv)
+    config = get_config()
+    config.setup_logging()
+    cache_path = args.cache or config.map.tile_cache_path
+    max_tiles = args.max_tiles or config.map.max_tiles
+    upstream_url = args.upstream or config.map.upstream_url
+    rate_hz = args.rate or config.map.prefetch_rate_hz
+    zooms = range(args.zoom[0], args.zoom[1] + 1)
+
+    if args.bbox:
+        tiles = tiles_for_bbox(*args.bbox, zooms)
+    else:
+        points = _load_mission_points(args.db or config.database.path, args.mission)
+        if not points:
+            logger.error("Görev bulunamadı: %s", args.mission)
+            return 1
+        tiles = tiles_along_path(points, zooms, buffer_tiles=args.buffer)
+
+    if len(tiles) > max_tiles:
+        # Kapasiteyi aşan ön yükleme az önce indirdiği karoları tahliye ederdi
+        logger.error("Alan %d karo gerektiriyor, önbellek kapasitesi %d; alanı veya zoom "
+                     "aralığını küçültün ya da --max-tiles değerini artırın",
+                     len(tiles), max_tiles)
+        return 1
+
+    if is_public_osm(upstream_url):
+        if not args.force:
+            logger.error("Toplu indirme OpenStreetMap karo kullanım politikasına aykırı (%s); "
+                         "--upstream veya map.upstream_url ile kendi karo sunucunuzu verin "
+                         "ya da --force kullanın", upstream_url)
+            return 1
+        logger.warning("Herkese açık OpenStreetMap sunucusundan %d karo indirilecek", len(tiles))
+
+    cache = TileCache(cache_path, max_tiles=max_tiles)
+    provider = TileProvider(cache, upstream_url=upstream_url)
+
+    def progress(done, total):
+        if done == total or done % 500 == 0:
+            logger.info("%d/%d karo", done, total)
+
+    summary = provider.prefetch(tiles, progress, rate_hz=rate_hz)
+    logger.info("Ön yükleme tamamlandı: %s", summary)
+    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
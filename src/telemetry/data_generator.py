@@ -1,267 +1,175 @@
 # src/telemetry/data_generator.py - VERİTABANI ENTEGRASYONLİ
-import random
+import threading
 import time
-from datetime import datetime, timedelta
-from PySide6.QtCore import QThread, Signal, QTimer
+from PySide6.QtCore import QThread, Signal
 
-# Eski (yanlış)
-# from data_models import TelemetryPacket, GPSData, AttitudeData
+from .data_models import TelemetryPacket
+from .data_receiver import TelemetrySimulator, MavlinkTelemetrySource
+from src.core.logger import get_logger, pipeline_metrics, DB_COMMIT
 
-# Yeni (doğru)
-from .data_models import TelemetryPacket, GPSData, AttitudeData
+logger = get_logger(__name__)
 
 
 class TelemetryWorker(QThread):
-    """Telemetri veri üretici - Veritabanı entegrasyonlu"""
+    """Telemetri veri üretici - Veritabanı entegrasyonlu
 
-    new_data = Signal(TelemetryPacket)
+    Paketler tek tek değil, ekran yenileme hızında toplu (batch) olarak
+    GUI'ye gönderilir; böylece yüksek veri hızlarında Qt olay kuyruğu
+    taşmaz.
+    """
 
-    def __init__(self, database_manager=None, use_mavlink=False, parent=None):
+    new_batch = Signal(list)  # List[TelemetryPacket]
+
+    def __init__(self, database_manager=None, use_mavlink=False, parent=None,
+                 sample_rate=1.0, display_rate=30.0, error_backoff_s=1.0,
+                 mavlink_poll_interval_s=1.0):
         super().__init__(parent)
         self.database_manager = database_manager
         self.use_mavlink = use_mavlink
         self.running = True
 
-        self.mavlink_manager = None
-        print(f"TelemetryWorker başlatılıyor, use_mavlink={use_mavlink}")  # DEBUG
+        # Üretim ve GUI'ye gönderim hızları (Hz)
+        self.sample_rate = sample_rate
+        self.display_rate = display_rate
+        self.error_backoff_s = error_backoff_s
+
+        # Gönderilmeyi bekleyen paketler ve kuyruk derinliği metrikleri
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._last_emit = 0.0
+        self.pending_batches = 0  # Gönderilmiş ama GUI'nin henüz işlemediği batch'ler
+        self.max_pending_batches = 0
+        self.max_batch_size = 0
+        self.packets_emitted = 0
+
+        self.mavlink_source = None
 
         if self.use_mavlink:
-            print("MAVLink Manager oluşturuluyor...")  # DEBUG
             try:
-                from src.mavlink.mavlink_manager import MAVLinkManager
-                print("MAVLink Manager import edildi")  # DEBUG
-                self.mavlink_manager = MAVLinkManager()
-                print("MAVLink Manager oluşturuldu")  # DEBUG
+                self.mavlink_source = MavlinkTelemetrySource(
+                    self._enqueue, poll_interval_s=mavlink_poll_interval_s)
             except Exception as e:
-                print(f"MAVLink Manager hatası: {e}")  # DEBUG
-                self.mavlink_manager = None
+                logger.error("MAVLink Manager hatası: %s", e)
+                self.mavlink_source = None
                 self.use_mavlink = False
 
-        # Simülasyon parametreleri (MAVLink kullanılmıyorsa)
-        self.current_lat = 39.9334
-
-        # Simülasyon parametreleri
-        self.current_lat = 39.9334  # Ankara
-        self.current_lon = 32.8597
-        self.current_alt = 100.0
-        self.battery_level = 100.0
-        self.flight_time = 0
+        # Simülasyon (MAVLink kullanılmıyorsa)
+        self.simulator = TelemetrySimulator(sample_rate)
 
-        # Hareket yönü
-        self.direction_lat = random.uniform(-0.001, 0.001)
-        self.direction_lon = random.uniform(-0.001, 0.001)
-        self.direction_alt = random.uniform(-2, 2)
-
-        print("🚁 TelemetryWorker başlatıldı (Database entegrasyonlu)")
-        if self.database_manager:
-            print("✅ Veritabanı bağlantısı aktif")
-        else:
-            print("⚠️ Veritabanı bağlantısı YOK - sadece görselleştirme modu")
+        logger.debug("TelemetryWorker oluşturuldu (mavlink=%s, veritabanı=%s)",
+                     self.use_mavlink, self.database_manager is not None)
+        if not self.database_manager:
+            logger.warning("Veritabanı bağlantısı yok - sadece görselleştirme modu")
 
     def run(self):
         """Ana thread döngüsü - MAVLink desteği ile"""
 
-        if self.use_mavlink and self.mavlink_manager:
-            # MAVLink callback'lerini ayarla
-            self.mavlink_manager.on_gps_data = self._on_mavlink_gps
-            self.mavlink_manager.on_attitude_data = self._on_mavlink_attitude
-            self.mavlink_manager.on_battery_data = self._on_mavlink_battery
-
-            # MAVLink bağlantısını başlat
-            self.mavlink_manager.create_simulated_connection()
-            self.mavlink_manager.start_listening()
+        if self.use_mavlink and self.mavlink_source:
+            # GPS/attitude/batarya callback'leri paketleri _enqueue ile biriktirir
+            self.mavlink_source.start()
 
-            print("MAVLink dinleme modu başlatıldı")
+            logger.info("MAVLink dinleme modu başlatıldı")
 
-            # MAVLink modunda sadece bekle
+            # MAVLink modunda paketler callback'lerle gelir; burada yalnızca
+            # ekran hızında biriken batch'leri gönder
             while self.running:
-                time.sleep(1)
+                time.sleep(1.0 / self.display_rate)
+                self._emit_batch()
 
         else:
             # Klasik simülasyon modu
+            sample_interval = 1.0 / self.sample_rate
+            emit_interval = 1.0 / self.display_rate
+            next_sample = time.perf_counter()
+
             while self.running:
                 try:
-                    packet = self._generate_packet()
+                    now = time.perf_counter()
+                    if now >= next_sample:
+                        self._enqueue(self.simulator.generate_packet())
+                        self.simulator.step()
+                        next_sample += sample_interval
+                        # Geride kaldıysak birikmiş örnekleri telafi etmeye çalışma
+                        if next_sample < now - sample_interval:
+                            next_sample = now + sample_interval
+
+                    if now - self._last_emit >= emit_interval:
+                        self._emit_batch()
+
+                    wait = min(next_sample, self._last_emit + emit_interval) - time.perf_counter()
+                    if wait > 0:
+                        time.sleep(wait)
+
+                except Exception as e:
+                    logger.exception("TelemetryWorker hatası: %s", e)
+                    time.sleep(self.error_backoff_s)
 
-                    if self.database_manager:
-                        success = self.database_manager.save_telemetry(packet)
-                        if not success:
-                            print("Veritabanı kayıt hatası!")
+            self._emit_batch()
 
-                    self.new_data.emit(packet)
-                    self._update_simulation()
-                    time.sleep(1)
+    def _enqueue(self, packet: TelemetryPacket):
+        """Paketi bir sonraki batch'e ekle (herhangi bir thread'den çağrılabilir)"""
+        with self._buffer_lock:
+            self._buffer.append(packet)
+
+    def _emit_batch(self):
+        """Biriken paketleri kaydet ve tek sinyalle GUI'ye gönder"""
+        self._last_emit = time.perf_counter()
+
+        with self._buffer_lock:
+            if not self._buffer:
+                return
+            batch = self._buffer
+            self._buffer = []
+            self.pending_batches += 1
+            self.max_pending_batches = max(self.max_pending_batches, self.pending_batches)
+
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        self.packets_emitted += len(batch)
 
-                except Exception as e:
-                    print(f"TelemetryWorker hatası: {e}")
-                    time.sleep(1)
-
-    def _on_mavlink_gps(self, gps_data):
-        """MAVLink GPS verisi callback"""
-        from .data_models import GPSData, AttitudeData
-
-        # GPS verisi
-        gps = GPSData(
-            latitude=gps_data['latitude'],
-            longitude=gps_data['longitude'],
-            altitude=gps_data['altitude'],
-            fix_quality=gps_data['fix_type'],
-            satellites=gps_data['satellites_visible']
-        )
-
-        # Son attitude verisini al
-        attitude = None
-        if self.mavlink_manager.last_attitude:
-            att_data = self.mavlink_manager.last_attitude
-            attitude = AttitudeData(
-                roll=att_data['roll'],
-                pitch=att_data['pitch'],
-                yaw=att_data['yaw']
-            )
-
-        # Telemetri paketi oluştur
-        packet = self._create_mavlink_packet(gps, attitude)
-
-        # Veritabanına kaydet
         if self.database_manager:
-            self.database_manager.save_telemetry(packet)
-
-        # GUI'ye gönder
-        self.new_data.emit(packet)
-
-    def _on_mavlink_attitude(self, attitude_data):
-        """MAVLink attitude verisi callback"""
-        # Attitude verisi geldiğinde GPS güncellemesi bekle
-        pass
-
-    def _on_mavlink_battery(self, battery_data):
-        """MAVLink battery verisi callback"""
-        # Battery verisi geldiğinde diğer verilerle birleştir
-        pass
-
-    def _create_mavlink_packet(self, gps, attitude=None):
-        """MAVLink verilerinden telemetri paketi oluştur"""
-
-        # Battery verisi
-        battery_voltage = 24.0
-        battery_percent = 100.0
-
-        if self.mavlink_manager.last_battery:
-            battery_voltage = self.mavlink_manager.last_battery['voltage']
-            battery_percent = self.mavlink_manager.last_battery['remaining']
-
-        # Hız hesapla (basit)
-        velocity = 15.0  # Sabit değer, gerçekte GPS'den hesaplanabilir
-
-        # Durum belirle
-        status = "FLYING"
-        if battery_percent < 20:
-            status = "LOW_BATTERY"
-
-        packet = TelemetryPacket(
-            timestamp=datetime.now(),
-            gps=gps,
-            attitude=attitude,
-            velocity=velocity,
-            battery_voltage=battery_voltage,
-            battery_percent=battery_percent,
-            status=status
-        )
-
-        return packet
-
-    def _generate_packet(self) -> TelemetryPacket:
-        """Simüle telemetri paketi oluştur"""
-
-        # GPS verisi
-        gps = GPSData(
-            latitude=self.current_lat,
-            longitude=self.current_lon,
-            altitude=self.current_alt,
-            fix_quality=4 if random.random() > 0.05 else 3,  # %95 iyi sinyal
-            satellites=random.randint(8, 15)
-        )
-
-        # Attitude verisi (uçuş açıları)
-        attitude = AttitudeData(
-            roll=random.uniform(-15, 15),
-            pitch=random.uniform(-10, 10),
-            yaw=random.uniform(0, 360)
-        )
-
-        # Durum belirle
-        status = "FLYING"
-        if self.battery_level < 20:
-            status = "LOW_BATTERY"
-        elif gps.fix_quality < 3:
-            status = "GPS_POOR"
-        elif self.current_alt < 10:
-            status = "LANDING"
-
-        # Telemetri paketi oluştur
-        packet = TelemetryPacket(
-            timestamp=datetime.now(),
-            gps=gps,
-            attitude=attitude,
-            velocity=random.uniform(5, 25),  # m/s
-            battery_voltage=random.uniform(22.0, 25.2),
-            battery_percent=self.battery_level,
-            status=status
-        )
-
-        return packet
-
-    def _update_simulation(self):
-        """Simülasyon parametrelerini güncelle"""
-
-        # Pozisyonu güncelle
-        self.current_lat += self.direction_lat * random.uniform(0.5, 1.5)
-        self.current_lon += self.direction_lon * random.uniform(0.5, 1.5)
-        self.current_alt += self.direction_alt * random.uniform(0.5, 1.5)
-
-        # Sınırları kontrol et
-        self.current_alt = max(10, min(500, self.current_alt))
-
-        # Bazen yön değiştir
-        if random.random() < 0.1:  # %10 şans
-            self.direction_lat = random.uniform(-0.001, 0.001)
-            self.direction_lon = random.uniform(-0.001, 0.001)
-            self.direction_alt = random.uniform(-2, 2)
-
-        # Batarya seviyesini azalt
-        self.flight_time += 1
-        battery_drain = random.uniform(0.30, 0.45)  # Dakikada %0.05-0.15
-        self.battery_level = max(0, self.battery_level - battery_drain)
-
-        # Kritik batarya durumunda inmesi için rakımı azalt
-        if self.battery_level < 10:
-            self.direction_alt = -abs(self.direction_alt)  # Aşağı yönlü hareket
+            success = self.database_manager.save_telemetry_batch(batch)
+            if success:
+                pipeline_metrics.mark_batch(batch, DB_COMMIT)
+            else:
+                logger.error("Veritabanı kayıt hatası (%d paket)", len(batch))
+
+        self.new_batch.emit(batch)
+
+    def batch_consumed(self):
+        """GUI bir batch'i işlediğinde çağırır (kuyruk derinliği metriği)"""
+        with self._buffer_lock:
+            self.pending_batches = max(0, self.pending_batches - 1)
+
+    def get_queue_metrics(self) -> dict:
+        """Olay kuyruğu derinliği ve batch istatistikleri"""
+        with self._buffer_lock:
+            return {
+                'pending_batches': self.pending_batches,
+                'max_pending_batches': self.max_pending_batches,
+                'buffered_packets': len(self._buffer),
+                'max_batch_size': self.max_batch_size,
+                'packets_emitted': self.packets_emitted
+            }
 
     def stop(self):
         """Thread'i durdur"""
-        print("🛑 TelemetryWorker durduruluyor...")
+        logger.debug("TelemetryWorker durduruluyor")
         self.running = False
 
-        # MAVLink manager'ı da durdur
-        if self.mavlink_manager:
-            self.mavlink_manager.stop_listening()
-            self.mavlink_manager.close_connection()
+        # MAVLink dinlemeyi de durdur
+        if self.mavlink_source:
+            self.mavlink_source.stop()
 
     def stop_session(self):
         """Mevcut oturumu sonlandır"""
         if self.database_manager and self.database_manager.current_session_id:
             self.database_manager.end_flight_session()
-            print("✅ Uçuş oturumu sonlandırıldı")
+            logger.debug("Uçuş oturumu sonlandırıldı")
 
     def restart_simulation(self):
         """Simülasyonu yeniden başlat"""
-        print("🔄 Simülasyon sıfırlanıyor...")
-        self.current_lat = 39.9334 + random.uniform(-0.01, 0.01)
-        self.current_lon = 32.8597 + random.uniform(-0.01, 0.01)
-        self.current_alt = random.uniform(50, 200)
-        self.battery_level = 100.0
-        self.flight_time = 0
-        print("✅ Simülasyon sıfırlandı")
+        self.simulator.restart()
+        logger.info("Simülasyon sıfırlandı")
 
     def __del__(self):
         """Destructor"""
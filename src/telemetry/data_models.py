@@ -1,7 +1,7 @@
 # src/telemetry/data_models.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 
@@ -26,11 +26,16 @@ class TelemetryPacket(BaseModel):
     timestamp: datetime
     gps: GPSData
     attitude: Optional[AttitudeData] = None
-    velocity: Optional[float] = Field(None, description="m/s")
+    velocity: Optional[float] = Field(None, description="Yer hızı (m/s)")
+    climb_rate: Optional[float] = Field(None, description="Dikey hız (m/s, yukarı +)")
+    course: Optional[float] = Field(None, description="Yer rotası (derece, 0-360)")
     battery_voltage: Optional[float] = Field(None, description="Volt")
     battery_percent: Optional[float] = Field(None, description="%")
     status: Optional[str] = Field(None, description="Uçuş durumu")
 
+    # Hat ölçümü için [ilk, son] monotonik damga (ns); serileştirilmez
+    _trace: Optional[List[int]] = PrivateAttr(default=None)
+
 
 # Örnek kullanım
 if __name__ == "__main__":
@@ -0,0 +1,245 @@
+# src/telemetry/data_receiver.py
+"""
+Qt'den bağımsız telemetri kaynakları
+
+TelemetryWorker (GUI) ve HeadlessRecorder (sunucu) aynı kaynakları
+kullanır; bu modül PySide6 import etmez.
+"""
+
+import math
+import random
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from .data_models import TelemetryPacket, GPSData, AttitudeData
+from .kinematics import KinematicsEstimator
+from src.core.logger import pipeline_metrics, RECEIVE, DECODE, FUSION
+
+# GLOBAL_POSITION_INT hızları bu süreden eskiyse GPS_RAW_INT kullanılır
+VELOCITY_MAX_AGE_NS = 2_000_000_000
+
+# Simülasyonda yön bileşenlerinin üst sınırı (derece/s, ≈17 m/s)
+SIM_MAX_RATE_DEG = 0.00015
+
+
+class TelemetrySimulator:
+    """Simüle telemetri üretici"""
+
+    def __init__(self, sample_rate: float = 1.0):
+        self.sample_rate = sample_rate
+
+        # Simülasyon parametreleri
+        self.current_lat = 39.9334  # Ankara
+        self.current_lon = 32.8597
+        self.current_alt = 100.0
+        self.battery_level = 100.0
+        self.flight_time = 0
+
+        # Hareket yönü
+        self.direction_lat = random.uniform(-SIM_MAX_RATE_DEG, SIM_MAX_RATE_DEG)
+        self.direction_lon = random.uniform(-SIM_MAX_RATE_DEG, SIM_MAX_RATE_DEG)
+        self.direction_alt = random.uniform(-2, 2)
+
+        # Simüle GPS hız bildirmez; hız ve rota konum farkından kestirilir
+        self.kinematics = KinematicsEstimator()
+
+    def generate_packet(self) -> TelemetryPacket:
+        """Simüle telemetri paketi oluştur"""
+        received_ns = time.perf_counter_ns()
+
+        # GPS verisi
+        gps = GPSData(
+            latitude=self.current_lat,
+            longitude=self.current_lon,
+            altitude=self.current_alt,
+            fix_quality=4 if random.random() > 0.05 else 3,  # %95 iyi sinyal
+            satellites=random.randint(8, 15)
+        )
+
+        # Attitude verisi (uçuş açıları)
+        attitude = AttitudeData(
+            roll=random.uniform(-15, 15),
+            pitch=random.uniform(-10, 10),
+            yaw=random.uniform(0, 360)
+        )
+
+        # Simülasyon zamanı örnek aralığıyla ilerler
+        kinematics = self.kinematics
+        kinematics.update(self.flight_time, self.current_lat, self.current_lon, self.current_alt)
+
+        # Durum belirle
+        status = "FLYING"
+        if self.battery_level < 20:
+            status = "LOW_BATTERY"
+        elif gps.fix_quality < 3:
+            status = "GPS_POOR"
+        elif self.current_alt < 10:
+            status = "LANDING"
+
+        # Telemetri paketi oluştur
+        packet = TelemetryPacket(
+            timestamp=datetime.now(),
+            gps=gps,
+            attitude=attitude,
+            velocity=kinematics.ground_speed,
+            climb_rate=kinematics.climb_rate,
+            course=kinematics.course,
+            battery_voltage=random.uniform(22.0, 25.2),
+            battery_percent=self.battery_level,
+            status=status
+        )
+
+        # Simülatör birleşik paketi doğrudan üretir (ayrı birleştirme aşaması yok)
+        pipeline_metrics.mark(packet, RECEIVE, received_ns)
+        pipeline_metrics.mark(packet, DECODE)
+        return packet
+
+    def step(self):
+        """Simülasyon parametrelerini güncelle (bir örnek aralığı kadar)"""
+        dt = 1.0 / self.sample_rate  # Hareket ve tüketim saniye bazlı
+
+        # Pozisyonu güncelle
+        self.current_lat += self.direction_lat * random.uniform(0.5, 1.5) * dt
+        self.current_lon += self.direction_lon * random.uniform(0.5, 1.5) * dt
+        self.current_alt += self.direction_alt * random.uniform(0.5, 1.5) * dt
+
+        # Sınırları kontrol et
+        self.current_alt = max(10, min(500, self.current_alt))
+
+        # Bazen yön değiştir
+        if random.random() < 0.1 * dt:  # Saniyede %10 şans
+            self.direction_lat = random.uniform(-SIM_MAX_RATE_DEG, SIM_MAX_RATE_DEG)
+            self.direction_lon = random.uniform(-SIM_MAX_RATE_DEG, SIM_MAX_RATE_DEG)
+            self.direction_alt = random.uniform(-2, 2)
+
+        # Batarya seviyesini azalt
+        self.flight_time += dt
+        battery_drain = random.uniform(0.30, 0.45) * dt  # Saniyede %0.30-0.45
+        self.battery_level = max(0, self.battery_level - battery_drain)
+
+        # Kritik batarya durumunda inmesi için rakımı azalt
+        if self.battery_level < 10:
+            self.direction_alt = -abs(self.direction_alt)  # Aşağı yönlü hareket
+
+    def restart(self):
+        """Simülasyonu yeniden başlat"""
+        self.current_lat = 39.9334 + random.uniform(-0.01, 0.01)
+        self.current_lon = 32.8597 + random.uniform(-0.01, 0.01)
+        self.current_alt = random.uniform(50, 200)
+        self.battery_level = 100.0
+        self.flight_time = 0
+        self.kinematics.reset()
+
+
+class MavlinkTelemetrySource:
+    """MAVLink mesajlarını (GPS + attitude + batarya) tek pakette birleştirir
+
+    GPS mesajı geldiğinde son attitude ve batarya verisiyle bir
+    TelemetryPacket oluşturulup on_packet ile iletilir.
+    """
+
+    def __init__(self, on_packet: Callable[[TelemetryPacket], None], mavlink_manager=None,
+                 poll_interval_s: float = 1.0):
+        self.on_packet = on_packet
+        if mavlink_manager is None:
+            from src.mavlink.mavlink_manager import MAVLinkManager
+            mavlink_manager = MAVLinkManager(poll_interval_s=poll_interval_s)
+        self.mavlink_manager = mavlink_manager
+        self.kinematics = KinematicsEstimator()
+
+    def start(self):
+        """Callback'leri bağla ve dinlemeyi başlat"""
+        self.mavlink_manager.on_gps_data = self._on_gps
+        self.mavlink_manager.on_attitude_data = self._on_attitude
+        self.mavlink_manager.on_battery_data = self._on_battery
+
+        # MAVLink bağlantısını başlat
+        self.mavlink_manager.create_simulated_connection()
+        self.mavlink_manager.start_listening()
+
+    def stop(self):
+        self.mavlink_manager.stop_listening()
+        self.mavlink_manager.close_connection()
+
+    def _on_gps(self, gps_data):
+        """MAVLink GPS verisi callback"""
+        received_ns = gps_data.get('received_ns') or time.perf_counter_ns()
+        gps = GPSData(
+            latitude=gps_data['latitude'],
+            longitude=gps_data['longitude'],
+            altitude=gps_data['altitude'],
+            fix_quality=gps_data['fix_type'],
+            satellites=gps_data['satellites_visible']
+        )
+
+        # Son attitude verisini al
+        attitude = None
+        if self.mavlink_manager.last_attitude:
+            att_data = self.mavlink_manager.last_attitude
+            attitude = AttitudeData(
+                roll=att_data['roll'],
+                pitch=att_data['pitch'],
+                yaw=att_data['yaw']
+            )
+
+        # Hız: GLOBAL_POSITION_INT (güncelse) > GPS_RAW_INT vel/cog > konum farkı
+        ground_speed, course, climb_rate = gps_data.get('ground_speed'), gps_data.get('course'), None
+        position = self.mavlink_manager.last_global_position
+        if position and received_ns - position['received_ns'] < VELOCITY_MAX_AGE_NS:
+            vn, ve = position['vn'], position['ve']
+            ground_speed = math.sqrt(vn * vn + ve * ve)
+            course = math.degrees(math.atan2(ve, vn)) % 360.0
+            climb_rate = position['climb_rate']
+        time_usec = gps_data.get('time_usec')
+        t_s = time_usec * 1e-6 if time_usec else received_ns * 1e-9
+        self.kinematics.update(t_s, gps.latitude, gps.longitude, gps.altitude,
+                               ground_speed, course, climb_rate)
+
+        decoded_ns = time.perf_counter_ns()
+
+        packet = self.create_packet(gps, attitude)
+        pipeline_metrics.mark(packet, RECEIVE, received_ns)
+        pipeline_metrics.mark(packet, DECODE, decoded_ns)
+        pipeline_metrics.mark(packet, FUSION)
+        self.on_packet(packet)
+
+    def _on_attitude(self, attitude_data):
+        """MAVLink attitude verisi callback"""
+        # Attitude verisi geldiğinde GPS güncellemesi bekle
+        pass
+
+    def _on_battery(self, battery_data):
+        """MAVLink battery verisi callback"""
+        # Battery verisi geldiğinde diğer verilerle birleştir
+        pass
+
+    def create_packet(self, gps: GPSData, attitude: Optional[AttitudeData] = None) -> TelemetryPacket:
+        """MAVLink verilerinden telemetri paketi oluştur"""
+
+        # Battery verisi
+        battery_voltage = 24.0
+        battery_percent = 100.0
+
+        if self.mavlink_manager.last_battery:
+            battery_voltage = self.mavlink_manager.last_battery['voltage']
+            battery_percent = self.mavlink_manager.last_battery['remaining']
+
+        kinematics = self.kinematics
+
+        # Durum belirle
+        status = "FLYING"
+        if battery_percent < 20:
+            status = "LOW_BATTERY"
+
+        return TelemetryPacket(
+            timestamp=datetime.now(),
+            gps=gps,
+            attitude=attitude,
+            velocity=kinematics.ground_speed,
+            climb_rate=kinematics.climb_rate,
+            course=kinematics.course,
+            battery_voltage=battery_voltage,
+            battery_percent=battery_percent,
+            status=status
+        )
@@ -0,0 +1,95 @@
+# src/telemetry/kinematics.py
+"""
+GPS akışından yer hızı, tırmanma hızı ve yer rotası kestirimi
+
+Alıcı hız bildiriyorsa (GPS_RAW_INT vel/cog, GLOBAL_POSITION_INT
+vx/vy/vz) doğrudan o kullanılır; bildirmiyorsa ardışık konumların
+farkı üstel olarak yumuşatılır. Örnek başına maliyet sabittir ve
+durum yalnızca __slots__ içindeki float'larda tutulur (liste/dict
+ayrılmaz). Bu modül PySide6 ve NumPy import etmez.
+"""
+
+import math
+from typing import Optional
+
+from src.core.geodesy import METERS_PER_DEGREE_LAT
+
+_RAD = math.pi / 180.0
+_DEG = 180.0 / math.pi
+
+
+class KinematicsEstimator:
+    """Ardışık GPS konumlarından hız ve rota kestirici (O(1) / örnek)
+
+    Kullanım:
+        estimator.update(t_s, lat, lon, alt)
+        packet.velocity = estimator.ground_speed
+    """
+
+    __slots__ = ('time_constant_s', 'min_course_speed', 'max_speed', 'max_gap_s',
+                 '_t', '_lat', '_lon', '_alt', '_vn', '_ve', '_vu', '_primed',
+                 'ground_speed', 'climb_rate', 'course', 'rejected')
+
+    def __init__(self, time_constant_s: float = 2.0, min_course_speed: float = 0.5,
+                 max_speed: float = 150.0, max_gap_s: float = 5.0):
+        self.time_constant_s = time_constant_s    # Yumuşatma zaman sabiti (s)
+        self.min_course_speed = min_course_speed  # Bunun altında rota güncellenmez (m/s)
+        self.max_speed = max_speed                # Daha hızlı sıçramalar GPS hatası sayılır
+        self.max_gap_s = max_gap_s                # Daha uzun boşluktan sonra filtre sıfırlanır
+        self.rejected = 0
+        self.reset()
+
+    def reset(self):
+        self._t = self._lat = self._lon = self._alt = 0.0
+        self._vn = self._ve = self._vu = 0.0
+        self._primed = False  # Fark alınabilecek bir önceki konum var mı
+        self.ground_speed = 0.0
+        self.climb_rate = 0.0
+        self.course: Optional[float] = None
+
+    def update(self, t_s: float, lat: float, lon: float, alt: float,
+               ground_speed: Optional[float] = None, course: Optional[float] = None,
+               climb_rate: Optional[float] = None) -> float:
+        """Yeni konumu işle, yer hızını döndür
+
+        ground_speed/course/climb_rate alıcıdan geliyorsa kestirim yerine
+        kullanılır; eksik olanlar konum farkından hesaplanır.
+        """
+        dt = t_s - self._t
+        if self._primed and 0.0 < dt <= self.max_gap_s:
+            vn = (lat - self._lat) * METERS_PER_DEGREE_LAT / dt
+            ve = (lon - self._lon) * METERS_PER_DEGREE_LAT * math.cos(lat * _RAD) / dt
+            if vn * vn + ve * ve > self.max_speed * self.max_speed:
+                # Konum sıçraması: hızı bozma, yeni konumdan devam et
+                self.rejected += 1
+            else:
+                alpha = dt / (self.time_constant_s + dt)
+                self._vn += alpha * (vn - self._vn)
+                self._ve += alpha * (ve - self._ve)
+                self._vu += alpha * ((alt - self._alt) / dt - self._vu)
+        elif dt <= 0.0 and self._primed:
+            # Aynı zamanlı tekrar: yalnızca bildirilen değerler güncellenir
+            self._apply_reported(ground_speed, course, climb_rate)
+            return self.ground_speed
+        else:
+            # İlk konum veya uzun boşluk: fark yok, filtre sıfırdan başlar
+            self._vn = self._ve = self._vu = 0.0
+
+        self._t, self._lat, self._lon, self._alt = t_s, lat, lon, alt
+        self._primed = True
+
+        estimated = math.sqrt(self._vn * self._vn + self._ve * self._ve)
+        self.ground_speed = estimated
+        self.climb_rate = self._vu
+        if estimated >= self.min_course_speed:
+            self.course = (math.atan2(self._ve, self._vn) * _DEG) % 360.0
+        self._apply_reported(ground_speed, course, climb_rate)
+        return self.ground_speed
+
+    def _apply_reported(self, ground_speed, course, climb_rate):
+        if ground_speed is not None:
+            self.ground_speed = ground_speed
+        if course is not None and (ground_speed is None or ground_speed >= self.min_course_speed):
+            self.course = course % 360.0
+        if climb_rate is not None:
+            self.climb_rate = climb_rate
@@ -0,0 +1,303 @@
+# src/telemetry/recorder.py
+"""
+Ekransız (headless) yer istasyonu kaydedicisi
+
+Alıcı -> birleştirme -> veritabanı yazıcı -> alarm zinciri GUI olmadan,
+düz iş parçacıklarıyla çalışır. PySide6, QtWebEngine, folium ve
+pyqtgraph import edilmez; çıktı yalnızca periyodik metrik satırlarıdır.
+
+Kullanım:
+    python run.py --headless --sample-rate 10 --duration 60 --metrics-port 9108
+
+Verilmeyen seçenekler yapılandırmadan (varsayılan profil: headless) alınır.
+"""
+
+import argparse
+import queue
+import signal
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .data_receiver import TelemetrySimulator, MavlinkTelemetrySource
+from src.core.config import load_config
+from src.core.logger import get_logger, pipeline_metrics, DB_COMMIT
+
+logger = get_logger(__name__)
+
+
+class HeadlessRecorder:
+    """Telemetriyi GUI olmadan alıp kaydeden ve alarmları işleyen kaydedici"""
+
+    def __init__(self, database_manager=None, alert_manager=None, use_mavlink=False,
+                 sample_rate: float = 1.0, flush_rate: float = 5.0,
+                 metrics_interval_s: float = 10.0, max_queue: int = 10000,
+                 mavlink_poll_interval_s: float = 1.0):
+        self.database_manager = database_manager
+        self.alert_manager = alert_manager
+        self.use_mavlink = use_mavlink
+        self.sample_rate = sample_rate
+        self.flush_interval = 1.0 / flush_rate
+        self.metrics_interval_s = metrics_interval_s
+        self.mavlink_poll_interval_s = mavlink_poll_interval_s
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.simulator = TelemetrySimulator(sample_rate)
+        self.mavlink_source = None
+
+        # Metrikler
+        self.started_at = None
+        self.packets_received = 0
+        self.packets_dropped = 0
+        self.packets_saved = 0
+        self.alerts_raised = 0
+        self.batches_written = 0
+        self.max_batch_size = 0
+        self.write_time_s = 0.0
+        self.max_write_ms = 0.0
+        self.first_packet_saved_s = None  # Başlangıçtan ilk kayda kadar geçen süre
+
+    # -------------------------------------------------------------------
+    # Yaşam döngüsü
+    # -------------------------------------------------------------------
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._stop.clear()
+
+        if self.database_manager and not self.database_manager.current_session_id:
+            self.database_manager.start_flight_session()
+
+        if self.use_mavlink:
+            self.mavlink_source = MavlinkTelemetrySource(
+                self._on_packet, poll_interval_s=self.mavlink_poll_interval_s)
+            self.mavlink_source.start()
+        else:
+            self._spawn(self._simulation_loop, "HeadlessSimulator")
+
+        self._spawn(self._writer_loop, "HeadlessWriter")
+        if self.metrics_interval_s > 0:
+            self._spawn(self._metrics_loop, "HeadlessMetrics")
+
+    def stop(self):
+        """Kaynağı durdur, kuyrukta kalanları yaz, oturumu kapat"""
+        self._stop.set()
+        if self.mavlink_source:
+            self.mavlink_source.stop()
+            self.mavlink_source = None
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+        if self.alert_manager:
+            self.alert_manager.close()
+        if self.database_manager and self.database_manager.current_session_id:
+            self.database_manager.end_flight_session()
+
+    def request_stop(self):
+        """Sinyal işleyicilerinden güvenle çağrılabilir"""
+        self._stop.set()
+
+    def run_forever(self, duration: Optional[float] = None):
+        """Süre dolana veya stop() çağrılana kadar çalış"""
+        self.start()
+        try:
+            self._stop.wait(duration)
+        finally:
+            self.stop()
+
+    def _spawn(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    # -------------------------------------------------------------------
+    # Alıcı
+    # -------------------------------------------------------------------
+
+    def _on_packet(self, packet):
+        """Kaynaktan gelen paketi kuyruğa at (bloklamaz)"""
+        try:
+            self._queue.put_nowait(packet)
+            self.packets_received += 1
+        except queue.Full:
+            self.packets_dropped += 1
+
+    def _simulation_loop(self):
+        interval = 1.0 / self.sample_rate
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            self._on_packet(self.simulator.generate_packet())
+            self.simulator.step()
+
+            next_sample += interval
+            wait = next_sample - time.perf_counter()
+            if wait > 0:
+                self._stop.wait(wait)
+            elif wait < -interval:
+                next_sample = time.perf_counter()  # Geride kaldıysak telafi etme
+
+    # -------------------------------------------------------------------
+    # Yazıcı ve alarmlar
+    # -------------------------------------------------------------------
+
+    def _drain(self) -> List:
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _writer_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self._process(self._drain())
+        self._process(self._drain())
+
+    def _process(self, batch):
+        if not batch:
+            return
+
+        t0 = time.perf_counter()
+        if self.database_manager and self.database_manager.save_telemetry_batch(batch):
+            pipeline_metrics.mark_batch(batch, DB_COMMIT)
+            self.packets_saved += len(batch)
+            if self.first_packet_saved_s is None:
+                self.first_packet_saved_s = time.perf_counter() - self.started_at
+        elapsed = time.perf_counter() - t0
+
+        self.batches_written += 1
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        self.write_time_s += elapsed
+        self.max_write_ms = max(self.max_write_ms, elapsed * 1000.0)
+
+        if self.alert_manager:
+            for packet in batch:
+                self.alerts_raised += len(self.alert_manager.check_all(packet))
+
+    # -------------------------------------------------------------------
+    # Metrikler
+    # -------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict:
+        uptime = time.perf_counter() - self.started_at if self.started_at else 0.0
+        metrics = {
+            'uptime_s': round(uptime, 1),
+            'packets_received': self.packets_received,
+            'packets_saved': self.packets_saved,
+            'packets_dropped': self.packets_dropped,
+            'queue_depth': self._queue.qsize(),
+            'rate_hz': round(self.packets_received / uptime, 2) if uptime else 0.0,
+            'batches_written': self.batches_written,
+            'max_batch_size': self.max_batch_size,
+            'mean_write_ms': round(self.write_time_s * 1000.0 / self.batches_written, 3)
+            if self.batches_written else 0.0,
+            'max_write_ms': round(self.max_write_ms, 3),
+            'alerts_raised': self.alerts_raised,
+            'first_packet_saved_s': self.first_packet_saved_s
+        }
+        if self.alert_manager and self.alert_manager.writer:
+            metrics['alert_writer'] = self.alert_manager.writer.get_metrics()
+        return metrics
+
+    def _metrics_loop(self):
+        while not self._stop.wait(self.metrics_interval_s):
+            m = self.get_metrics()
+            logger.info("%ss | alınan: %d kaydedilen: %d düşen: %d kuyruk: %d | "
+                        "yazım: %s ms (max %s) | alarm: %d",
+                        m['uptime_s'], m['packets_received'], m['packets_saved'],
+                        m['packets_dropped'], m['queue_depth'], m['mean_write_ms'],
+                        m['max_write_ms'], m['alerts_raised'], extra={'metrics': m})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="İHA telemetri kaydedici (GUI'siz)")
+    parser.add_argument("--headless", action="store_true", help="GUI olmadan çalış")
+    parser.add_argument("--config", default=None, help="Yapılandırma dosyası (JSON/YAML)")
+    parser.add_argument("--profile", default=None, help="Ayar profili (varsayılan headless)")
+    parser.add_argument("--db", default=None, help="Veritabanı dosyası")
+    parser.add_argument("--mavlink", action="store_true", help="MAVLink kaynağını kullan")
+    parser.add_argument("--sample-rate", type=float, default=None, help="Simülasyon hızı (Hz)")
+    parser.add_argument("--flush-rate", type=float, default=None, help="Veritabanı yazım hızı (Hz)")
+    parser.add_argument("--duration", type=float, default=None, help="Çalışma süresi (s)")
+    parser.add_argument("--geofences", default=None, help="Coğrafi sınır JSON dosyası")
+    parser.add_argument("--metrics-interval", type=float, default=None,
+                        help="Metrik yazdırma aralığı (s, 0: kapalı)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Yerel /metrics uç noktası portu (verilmezse kapalı)")
+    parser.add_argument("--log-level", default=None, help="Günlük seviyesi (varsayılan INFO)")
+    parser.add_argument("--log-file", default=None, help="Dönen JSON-lines günlük dosyası")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config = load_config(args.config, profile=args.profile, default_profile='headless')
+
+    # Komut satırı seçenekleri yapılandırmayı ezer
+    overrides = {
+        'database': {'path': args.db, 'flush_rate_hz': args.flush_rate},
+        'telemetry': {'sample_rate_hz': args.sample_rate},
+        'alerts': {'geofences_file': args.geofences},
+        'metrics': {'print_interval_s': args.metrics_interval, 'port': args.metrics_port,
+                    'enabled': True if args.metrics_port is not None else None},
+        'logging': {'level': args.log_level, 'file': args.log_file}
+    }
+    config = config.with_overrides(overrides)
+    config.setup_logging()
+
+    from src.database.database_manager import DatabaseManager
+    from src.services.alert_writer import AlertWriter
+    from src.utils.flight_utils import AlertManager
+
+    database_manager = DatabaseManager(config.database.path)
+    geofences = None
+    if config.alerts.geofences_file:
+        from src.services.geofence import load_geofences
+        geofences = load_geofences(config.alerts.geofences_file)
+    alert_manager = AlertManager(
+        database_manager, rules=config.alerts.build_rules(), geofences=geofences,
+        writer=AlertWriter(database_manager, **config.alerts.writer_options()))
+
+    recorder = HeadlessRecorder(
+        database_manager=database_manager,
+        alert_manager=alert_manager,
+        use_mavlink=args.mavlink,
+        sample_rate=config.telemetry.sample_rate_hz,
+        flush_rate=config.database.flush_rate_hz,
+        metrics_interval_s=config.metrics.print_interval_s,
+        max_queue=config.database.max_queue,
+        mavlink_poll_interval_s=config.telemetry.mavlink_poll_interval_s
+    )
+
+    pipeline_metrics.register_gauge('recorder_queue_depth', recorder._queue.qsize)
+    metrics_server = None
+    if config.metrics.enabled:
+        from src.services.metrics_server import MetricsServer
+        try:
+            metrics_server = MetricsServer(pipeline_metrics, port=config.metrics.port)
+            metrics_server.start()
+        except OSError as e:
+            logger.warning("Metrik uç noktası başlatılamadı: %s", e)
+            metrics_server = None
+
+    # SIGINT/SIGTERM ile temiz kapanış
+    def handle_signal(signum, frame):
+        recorder.request_stop()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    logger.info("Headless kaydedici başlatıldı (profil=%s, db=%s, mavlink=%s)",
+                config.profile, config.database.path, args.mavlink)
+    recorder.run_forever(args.duration)
+    logger.info("Kaydedici durduruldu: %s", recorder.get_metrics())
+    if metrics_server:
+        metrics_server.stop()
+    database_manager.close_connection()
+
+
+if __name__ == "__main__":
+    main()
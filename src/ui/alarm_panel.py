@@ -1,10 +1,103 @@
 # src/ui/alarm_panel.py
+from collections import deque
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                               QListWidget, QPushButton, QFrame, QListWidgetItem)
-from PySide6.QtCore import Qt, Signal
+                               QListView, QPushButton, QFrame)
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex
 from PySide6.QtGui import QFont, QPalette, QColor
 from datetime import datetime
 
+from src.services.alarm_state import RAISED, CLEARED
+from src.services.alerts import AlertEngine
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SEVERITY_ICONS = {'CRITICAL': "🔴", 'WARNING': "🟡"}
+SEVERITY_COLORS = {
+    'CRITICAL': QColor(255, 200, 200),  # Açık kırmızı
+    'WARNING': QColor(255, 235, 200),  # Açık turuncu
+}
+
+class AlarmListModel(QAbstractListModel):
+    """Sabit kapasiteli (halka) alarm listesi modeli - en yeni en üstte"""
+
+    def __init__(self, capacity=200, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._entries = deque()  # Sağ uç en yeni
+        self.total_added = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def _entry_at(self, row):
+        return self._entries[len(self._entries) - 1 - row]
+
+    def _row_of(self, entry):
+        """Kaydın satırı: sıra numarasından O(1) hesaplanır"""
+        row = self.total_added - 1 - entry['seq']
+        return row if row < len(self._entries) else None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+
+        entry = self._entry_at(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.format_entry(entry)
+        if role == Qt.ItemDataRole.BackgroundRole and not entry['cleared']:
+            return SEVERITY_COLORS.get(entry['severity'])
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        return None
+
+    @staticmethod
+    def format_entry(entry):
+        icon = SEVERITY_ICONS.get(entry['severity'], "🔵")
+        text = f"{icon} {entry['time'].strftime('%H:%M:%S')} - {entry['message']}"
+        if entry['count'] > 1:
+            text += f" (x{entry['count']})"
+        if entry['cleared']:
+            text += " ✅ temizlendi"
+        return text
+
+    def add_entry(self, alert_type, severity, message, timestamp=None):
+        """En üste yeni kayıt ekle; kapasite dolarsa en eskisini sil"""
+        if len(self._entries) >= self.capacity:
+            last_row = len(self._entries) - 1
+            self.beginRemoveRows(QModelIndex(), last_row, last_row)
+            self._entries.popleft()
+            self.endRemoveRows()
+
+        entry = {
+            'seq': self.total_added,
+            'type': alert_type,
+            'severity': severity,
+            'message': message,
+            'time': timestamp or datetime.now(),
+            'count': 1,
+            'cleared': False
+        }
+
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._entries.append(entry)
+        self.total_added += 1
+        self.endInsertRows()
+        return entry
+
+    def update_entry(self, entry, **changes):
+        """Kaydı yerinde güncelle (halkadan düştüyse yok sayılır)"""
+        entry.update(changes)
+        row = self._row_of(entry)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries.clear()
+        self.endResetModel()
+
 
 class AlarmPanel(QWidget):
     """Alarm ve Uyarı Paneli"""
@@ -13,10 +106,14 @@ class AlarmPanel(QWidget):
     clearAlarmsRequested = Signal()
     muteAlarmsRequested = Signal()
 
-    def __init__(self):
+    def __init__(self, max_alarms=200, rules=None):
         super().__init__()
         self.alarms_muted = False
-        self.last_alarms = {}  # BUNU EKLEYİN
+        self.alarm_model = AlarmListModel(capacity=max_alarms, parent=self)
+        # Kurallar AlertManager ile ortak; debounce/histerezis motor içinde
+        self.alert_engine = AlertEngine(rules)
+        self.alarm_states = self.alert_engine.states
+        self._alarm_entries = {}  # alarm tipi -> liste kaydı
         self.init_ui()
 
     def init_ui(self):
@@ -49,7 +146,9 @@ class AlarmPanel(QWidget):
         alarm_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
         layout.addWidget(alarm_label)
 
-        self.alarm_list = QListWidget()
+        self.alarm_list = QListView()
+        self.alarm_list.setModel(self.alarm_model)
+        self.alarm_list.setUniformItemSizes(True)
         self.alarm_list.setMaximumHeight(200)
         layout.addWidget(self.alarm_list)
 
@@ -80,45 +179,25 @@ class AlarmPanel(QWidget):
 
     def add_alarm(self, alert_type: str, severity: str, message: str):
         """Yeni alarm ekle"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Renk belirleme
-        if severity == "CRITICAL":
-            color = "red"
-            icon = "🔴"
-        elif severity == "WARNING":
-            color = "orange"
-            icon = "🟡"
-        else:
-            color = "blue"
-            icon = "🔵"
-
-        # Liste öğesi oluştur
-        item_text = f"{icon} {timestamp} - {message}"
-        item = QListWidgetItem(item_text)
-
-        # Renk ayarla
-        if severity == "CRITICAL":
-            item.setBackground(QColor(255, 200, 200))  # Açık kırmızı
-        elif severity == "WARNING":
-            item.setBackground(QColor(255, 235, 200))  # Açık turuncu
-
-        # Listeye ekle (en üstte görünmesi için)
-        self.alarm_list.insertItem(0, item)
+        entry = self.alarm_model.add_entry(alert_type, severity, message)
 
         # Durum güncelle
         self._update_status(severity)
         self._update_stats()
 
-        print(f"🚨 ALARM: {message}")
+        logger.debug("Alarm [%s] %s: %s", severity, alert_type, message)
+        return entry
 
     def clear_alarms(self):
         """Tüm alarmları temizle"""
-        self.alarm_list.clear()
+        self.alarm_model.clear()
+        # Hâlâ süren koşullar yeniden tetiklenebilsin
+        self.alarm_states.reset()
+        self._alarm_entries.clear()
         self._set_normal_status()
         self._update_stats()
         self.clearAlarmsRequested.emit()
-        print("✅ Alarmlar temizlendi")
+        logger.debug("Alarmlar temizlendi")
 
     def toggle_mute(self):
         """Alarm sesini aç/kapat"""
@@ -132,7 +211,7 @@ class AlarmPanel(QWidget):
             self.mute_btn.setStyleSheet("")
 
         self.muteAlarmsRequested.emit()
-        print(f"🔇 Alarmlar {'sessize alındı' if self.alarms_muted else 'sesli yapıldı'}")
+        logger.info("Alarmlar %s", 'sessize alındı' if self.alarms_muted else 'sesli yapıldı')
 
     def _set_normal_status(self):
         """Normal durum ayarla"""
@@ -150,37 +229,53 @@ class AlarmPanel(QWidget):
 
     def _update_stats(self):
         """İstatistikleri güncelle"""
-        count = self.alarm_list.count()
-        self.stats_label.setText(f"📊 İstatistik: {count} alarm")
+        active = len(self.alarm_states.active())
+        self.stats_label.setText(
+            f"📊 İstatistik: {self.alarm_model.total_added} alarm ({active} aktif)")
+
+    def _refresh_status(self):
+        """Aktif alarmlara göre durum göstergesini yeniden belirle"""
+        severities = {state.severity for state in self.alarm_states.active()}
+        if 'CRITICAL' in severities:
+            self._update_status('CRITICAL')
+        elif 'WARNING' in severities:
+            self._update_status('WARNING')
+        else:
+            self._set_normal_status()
 
     def check_telemetry_alarms(self, packet):
-        """Telemetri verilerini kontrol et ve alarm üret"""
-        # Batarya kontrolü
-        if packet.battery_percent <= 15:
-            self.add_alarm("BATTERY_CRITICAL", "CRITICAL",
-                           f"KRİTİK BATARYA! {packet.battery_percent:.1f}% - Acil iniş gerekli!")
-        elif packet.battery_percent <= 30:
-            self.add_alarm("BATTERY_LOW", "WARNING",
-                           f"Düşük batarya: {packet.battery_percent:.1f}%")
-
-        # GPS kontrolü
-        if packet.gps.satellites < 6:
-            self.add_alarm("GPS_POOR", "WARNING",
-                           f"Zayıf GPS: {packet.gps.satellites} uydu")
-
-        if packet.gps.fix_quality < 3:
-            self.add_alarm("GPS_LOST", "CRITICAL",
-                           f"GPS kilidi kayboldu! Kalite: {packet.gps.fix_quality}")
-
-        # Rakım kontrolü
-        if packet.gps.altitude > 400:
-            self.add_alarm("ALTITUDE_HIGH", "WARNING",
-                           f"Yüksek rakım: {packet.gps.altitude:.1f}m")
-        elif packet.gps.altitude < 5:
-            self.add_alarm("ALTITUDE_LOW", "WARNING",
-                           f"Düşük rakım: {packet.gps.altitude:.1f}m - Çarpma riski!")
-
-        # Hız kontrolü
-        if packet.velocity > 30:
-            self.add_alarm("VELOCITY_HIGH", "WARNING",
-                           f"Yüksek hız: {packet.velocity:.1f} m/s")
\ No newline at end of file
+        """Telemetri verilerini kontrol et; alarm bir kez eklenir, sonra yerinde güncellenir"""
+        status_changed = False
+
+        for rule, transition, state in self.alert_engine.process(packet):
+            status_changed |= self._apply_transition(rule.type, rule.severity, transition, state)
+
+        if status_changed:
+            self._refresh_status()
+            self._update_stats()
+
+    def process_transition(self, alarm_type: str, transition, state):
+        """Panel dışında (ör. görev takibi) alarm_states ile üretilen geçişi göster"""
+        if state is None:
+            return
+        if self._apply_transition(alarm_type, state.severity, transition, state):
+            self._refresh_status()
+            self._update_stats()
+
+    def _apply_transition(self, alarm_type: str, severity: str, transition, state) -> bool:
+        """Geçişi listeye uygula; durum göstergesi değişmeliyse True"""
+        if transition == RAISED:
+            self._alarm_entries[alarm_type] = self.add_alarm(alarm_type, severity, state.message)
+            return True
+
+        if transition == CLEARED:
+            entry = self._alarm_entries.pop(alarm_type, None)
+            if entry:
+                self.alarm_model.update_entry(entry, cleared=True)
+            return True
+
+        if alarm_type in self._alarm_entries:
+            self.alarm_model.update_entry(
+                self._alarm_entries[alarm_type],
+                message=state.message, count=state.occurrences)
+        return False
@@ -5,9 +5,11 @@ from PySide6.QtCore import Qt
 from collections import deque
 import time
 
+from src.utils.rolling_stats import TelemetryStats
+
 
 class ChartsWidget(QWidget):
-    def __init__(self, max_points=100):
+    def __init__(self, max_points=100, start_time=None):
         super().__init__()
         self.max_points = max_points
 
@@ -17,8 +19,12 @@ class ChartsWidget(QWidget):
         self.velocity_data = deque(maxlen=max_points)
         self.battery_data = deque(maxlen=max_points)
 
-        # Başlangıç zamanı
-        self.start_time = time.time()
+        # Grafik penceresiyle aynı boyutta O(1) kayan istatistikler
+        self.window_stats = TelemetryStats(window=max_points,
+                                           fields=('altitude', 'velocity', 'battery_percent'))
+
+        # Başlangıç zamanı (widget geç oluşturulsa da x ekseni uygulama başlangıcından)
+        self.start_time = start_time or time.time()
 
         self._setup_ui()
 
@@ -117,13 +123,21 @@ class ChartsWidget(QWidget):
 
     def update_data(self, telemetry_packet):
         """Yeni telemetri verisiyle grafikleri güncelle"""
-        current_time = time.time() - self.start_time
-
-        # Veri ekle
-        self.time_data.append(current_time)
-        self.altitude_data.append(telemetry_packet.gps.altitude)
-        self.velocity_data.append(telemetry_packet.velocity)
-        self.battery_data.append(telemetry_packet.battery_percent)
+        self.update_batch([telemetry_packet])
+
+    def update_batch(self, packets):
+        """Bir batch'teki tüm örnekleri ekle, grafikleri tek seferde çiz"""
+        if not packets:
+            return
+
+        # Veri ekle (batch içindeki örnekler kendi zaman damgalarıyla)
+        for packet in packets:
+            current_time = packet.timestamp.timestamp() - self.start_time
+            self.time_data.append(current_time)
+            self.altitude_data.append(packet.gps.altitude)
+            self.velocity_data.append(packet.velocity)
+            self.battery_data.append(packet.battery_percent)
+            self.window_stats.update(packet)
 
         # Grafikleri güncelle
         if len(self.time_data) > 1:
@@ -131,8 +145,8 @@ class ChartsWidget(QWidget):
             self.velocity_curve.setData(list(self.time_data), list(self.velocity_data))
             self.battery_curve.setData(list(self.time_data), list(self.battery_data))
 
-        # İstatistikleri güncelle
-        self._update_stats(telemetry_packet, current_time)
+        # İstatistikleri güncelle (son değerlerle)
+        self._update_stats(packets[-1], current_time)
 
     def _update_stats(self, packet, flight_time):
         """İstatistik panelini güncelle"""
@@ -142,17 +156,17 @@ class ChartsWidget(QWidget):
         self.current_battery_label.setText(f"Batarya: {packet.battery_percent:.1f} %")
         self.flight_time_label.setText(f"Uçuş Süresi: {flight_time:.0f} s")
 
-        # Min/Max değerler
-        if self.altitude_data:
-            max_alt = max(self.altitude_data)
+        # Min/Max değerler (pencere üzerinde O(1))
+        max_alt = self.window_stats['altitude'].max
+        if max_alt is not None:
             self.max_altitude_label.setText(f"Max İrtifa: {max_alt:.1f} m")
 
-        if self.velocity_data:
-            max_vel = max(self.velocity_data)
+        max_vel = self.window_stats['velocity'].max
+        if max_vel is not None:
             self.max_velocity_label.setText(f"Max Hız: {max_vel:.1f} m/s")
 
-        if self.battery_data:
-            min_bat = min(self.battery_data)
+        min_bat = self.window_stats['battery_percent'].min
+        if min_bat is not None:
             self.min_battery_label.setText(f"Min Batarya: {min_bat:.1f} %")
 
     def clear_data(self):
@@ -161,6 +175,7 @@ class ChartsWidget(QWidget):
         self.altitude_data.clear()
         self.velocity_data.clear()
         self.battery_data.clear()
+        self.window_stats.clear()
         self.start_time = time.time()
 
         # Grafikleri temizle
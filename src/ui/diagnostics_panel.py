@@ -0,0 +1,107 @@
+# src/ui/diagnostics_panel.py
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                               QTableWidget, QTableWidgetItem, QHeaderView)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
+
+from src.core.logger import pipeline_metrics, STAGES, END_TO_END
+
+STAGE_TITLES = {
+    'receive': "Alım",
+    'decode': "Çözümleme",
+    'fusion': "Birleştirme",
+    'db_commit': "Veritabanı",
+    'render': "Ekran",
+    END_TO_END: "Uçtan uca"
+}
+
+COLUMNS = (("Aşama", None), ("Hız (Hz)", 'rate_hz'), ("Paket", 'count'),
+           ("Ort. (µs)", 'mean_us'), ("p50 (µs)", 'p50_us'), ("p90 (µs)", 'p90_us'),
+           ("p99 (µs)", 'p99_us'), ("Maks (µs)", 'max_us'))
+
+
+class DiagnosticsPanel(QWidget):
+    """Telemetri hattı tanılama paneli: aşama başına hız ve gecikme"""
+
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, metrics=pipeline_metrics, metrics_url=None):
+        super().__init__()
+        self.metrics = metrics
+        self.metrics_url = metrics_url
+        self.stages = STAGES + (END_TO_END,)
+        self.init_ui()
+
+        # Yalnızca panel görünürken yenilenir
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        title = QLabel("Telemetri Hattı Tanılama")
+        title.setAlignment(Qt.AlignCenter)
+        title_font = QFont()
+        title_font.setPointSize(14)
+        title_font.setBold(True)
+        title.setFont(title_font)
+        layout.addWidget(title)
+
+        self.table = QTableWidget(len(self.stages), len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([name for name, _ in COLUMNS])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        for row, stage in enumerate(self.stages):
+            self.table.setItem(row, 0, QTableWidgetItem(STAGE_TITLES.get(stage, stage)))
+            for column in range(1, len(COLUMNS)):
+                item = QTableWidgetItem("-")
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+        layout.addWidget(self.table)
+
+        self.gauges_label = QLabel("")
+        layout.addWidget(self.gauges_label)
+
+        bottom = QHBoxLayout()
+        url_text = f"Metrik uç noktası: {self.metrics_url}" if self.metrics_url \
+            else "Metrik uç noktası kapalı"
+        self.url_label = QLabel(url_text)
+        self.url_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        bottom.addWidget(self.url_label)
+        bottom.addStretch()
+
+        self.reset_button = QPushButton("🔄 Sıfırla")
+        self.reset_button.clicked.connect(self.reset)
+        bottom.addWidget(self.reset_button)
+        layout.addLayout(bottom)
+
+        self.setLayout(layout)
+
+    def refresh(self, force=False):
+        """Tabloyu güncel ölçümlerle doldur"""
+        if not force and not self.isVisible():
+            return
+
+        snapshot = self.metrics.snapshot()
+        for row, stage in enumerate(self.stages):
+            values = snapshot.get(stage, {})
+            for column, (_, key) in enumerate(COLUMNS[1:], start=1):
+                value = values.get(key)
+                if value is None or (key not in ('count', 'rate_hz') and not values.get('samples')):
+                    text = "-"
+                elif key == 'count':
+                    text = str(value)
+                else:
+                    text = f"{value:.1f}"
+                self.table.item(row, column).setText(text)
+
+        gauges = self.metrics.gauges()
+        self.gauges_label.setText("  |  ".join(f"{name}: {value:g}"
+                                               for name, value in gauges.items()))
+
+    def reset(self):
+        self.metrics.reset()
+        self.refresh(force=True)
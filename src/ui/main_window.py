@@ -1,33 +1,60 @@
 # src/ui/main_window.py - DATABASE ENTEGRASYONU
 import sys
+import time
+from collections import deque
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QLabel, QTabWidget, QMessageBox, QPushButton, QHBoxLayout, QCheckBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QEvent, QThread, QTimer, Signal
 
 # Import'lar
-#from Uav_telemetry_imaging_system.src.telemetry.data_generator import TelemetryWorker
+# Ağır modüller (folium/QtWebEngine, pyqtgraph) sekme ilk açıldığında import edilir
 from src.telemetry.data_generator import TelemetryWorker
 from src.telemetry.data_models import TelemetryPacket
-from src.ui.map_widget import MapWidget
-from src.ui.charts import ChartsWidget
 from src.ui.status_panel import StatusPanel
 from src.ui.alarm_panel import AlarmPanel
-from src.ui.waypoint_panel import WaypointPanel
+from src.services.alarm_state import CLEARED
+from src.services.geofence import GeofenceEngine, load_geofences
+from src.services.mission_tracker import MissionTracker, ROUTE_ALERT_TYPE
 from src.database.database_manager import DatabaseManager
+from src.utils.flight_track import FlightTrack
+from src.core.config import get_config
+from src.core.logger import get_logger, pipeline_metrics, RENDER
+
+logger = get_logger(__name__)
+
+
+class DatabaseInfoLoader(QThread):
+    """Veritabanı bilgilerini GUI thread'ini bloklamadan yükler"""
+
+    loaded = Signal(dict, list)  # (veritabanı bilgisi, oturumlar)
+    failed = Signal(str)
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+
+    def run(self):
+        try:
+            info = self.db_manager.get_database_info()
+            sessions = self.db_manager.get_flight_sessions()
+            self.loaded.emit(info, sessions[:10])  # Son 10 oturum
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, config=None):
         super().__init__()
+        # Hızlar, tampon boyutları ve yollar (src/core/config.py)
+        self.config = config if config is not None else get_config()
         self.setWindowTitle("İHA Telemetri Görüntüleyici - Database v3.0")
         self.setMinimumSize(1200, 800)
 
         # DATABASE MANAGER BAŞLAT
         try:
-            self.db_manager = DatabaseManager("iha_telemetry.db")
-            print("Veritabanı bağlantısı başarılı!")
+            self.db_manager = DatabaseManager(self.config.database.path)
         except Exception as e:
-            print(f"Veritabanı hatası: {e}")
+            logger.error("Veritabanı hatası: %s", e)
             QMessageBox.critical(self, "Veritabanı Hatası",
                                  f"Veritabanı başlatılamadı:\n{e}")
             self.db_manager = None
@@ -36,31 +63,51 @@ class MainWindow(QMainWindow):
         self.telemetry_label = QLabel("Henüz veri yok")
         self.telemetry_label.setAlignment(Qt.AlignCenter)
 
-        self.map_widget = MapWidget()
-        self.charts_widget = ChartsWidget()
-        self.waypoint_panel = WaypointPanel()
+        # Ağır sekmeler ilk açıldıklarında oluşturulur; o zamana kadar gelen
+        # veriler biriktirilir (harita izi ve grafik penceresi)
+        self.tile_server = None
+        self.metrics_server = None
+        self.map_widget = None
+        self.charts_widget = None
+        self.waypoint_panel = None
+        self.mission_tracker = None  # Başlatılan görevin canlı takibi
+        self.db_stats_label = None
+        self._db_loader = None
+        self._start_time = time.time()
+        self.flight_track = FlightTrack(min_spacing_m=self.config.map.min_spacing_m)
+        self._last_position = None
+        # Grafik sekmesi açılmadan önce biriktirilecek örnekler (grafik penceresi kadar)
+        self._chart_backlog = deque(maxlen=self.config.charts.max_points)
 
         # Status panel'den önce:
         self.mavlink_checkbox = QCheckBox("MAVLink Protokolü Kullan")
         self.mavlink_checkbox.setChecked(False)
         self.mavlink_checkbox.stateChanged.connect(self.toggle_mavlink_mode)
-        print("MAVLink checkbox oluşturuldu ve signal bağlandı")  # TEST
         self.mavlink_checkbox.setStyleSheet("QCheckBox::indicator { width: 20px; height: 20px; }")
 
         # Status panel
         try:
             self.status_panel = StatusPanel()
         except Exception as e:
-            print(f"Status panel oluşturulamadı: {e}")
+            logger.error("Status panel oluşturulamadı: %s", e)
             self.status_panel = None
 
         try:
             # Status panel'den sonra ekleyin
-            self.alarm_panel = AlarmPanel()
-        except:
-            print(f"Alarm Panel Oluşturulamadı:{e}")
+            self.alarm_panel = AlarmPanel(max_alarms=self.config.alerts.panel_capacity,
+                                          rules=self.config.alerts.build_rules())
+        except Exception as e:
+            logger.error("Alarm paneli oluşturulamadı: %s", e)
             self.alarm_panel = None
 
+        # Coğrafi sınırlar: haritada çizilir, her paket kontrol edilir
+        self.geofences = self._load_geofences()
+        self.geofence_engine = GeofenceEngine(self.geofences) if self.geofences else None
+        self._geofence_alarm_types = set()  # Durumu açık (tetiklenmiş) sınır alarmları
+
+        # Yerel /metrics uç noktası ve kuyruk ölçerleri
+        self._start_metrics_server()
+
         # Tab düzeni
         self._setup_tabs()
 
@@ -68,19 +115,33 @@ class MainWindow(QMainWindow):
         self._connect_status_panel_signals()
 
         # Worker başlat (DATABASE MANAGER İLE!)
-        self.worker = TelemetryWorker(database_manager=self.db_manager)
-        self.worker.new_data.connect(self.update_telemetry)
+        self.worker = self._create_worker()
         self.worker.start()
 
+    def _create_worker(self, use_mavlink=False):
+        """Yapılandırmadaki hızlarla yeni bir TelemetryWorker oluştur"""
+        telemetry = self.config.telemetry
+        worker = TelemetryWorker(
+            database_manager=self.db_manager,
+            use_mavlink=use_mavlink,
+            sample_rate=telemetry.sample_rate_hz,
+            display_rate=telemetry.display_rate_hz,
+            error_backoff_s=telemetry.error_backoff_s,
+            mavlink_poll_interval_s=telemetry.mavlink_poll_interval_s
+        )
+        worker.new_batch.connect(self.update_telemetry_batch)
+        return worker
+
     def _setup_tabs(self):
-        """Tab düzenini oluştur"""
-        tabs = QTabWidget()
+        """Tab düzenini oluştur (ağır sekmeler ilk açılışta doldurulur)"""
+        self.tabs = tabs = QTabWidget()
+        self._lazy_tabs = {}  # sekme indeksi -> (yer tutucu, oluşturucu)
 
         # 1. Harita Tab
-        tabs.addTab(self._create_map_tab(), "🗺️ Harita")
+        self._add_lazy_tab(self._create_map_tab, "🗺️ Harita")
 
         # 2. Grafikler Tab
-        tabs.addTab(self._create_charts_tab(), "📊 Grafikler")
+        self._add_lazy_tab(self._create_charts_tab, "📊 Grafikler")
 
         # 3. Telemetri Tab
         tabs.addTab(self._create_telemetry_tab(), "📡 Telemetri")
@@ -91,20 +152,106 @@ class MainWindow(QMainWindow):
 
         # Status tab'dan sonra ekleyin
         tabs.addTab(self._create_alarm_tab(), "🚨 Alarmlar")
-        tabs.addTab(self._create_waypoint_tab(), "🗺️ Görev")
+        self._add_lazy_tab(self._create_waypoint_tab, "🗺️ Görev")
 
         # 5. VERİTABANI TAB - YENİ!
-        tabs.addTab(self._create_database_tab(), "💾 Veritabanı")
+        self._add_lazy_tab(self._create_database_tab, "💾 Veritabanı")
 
+        # 6. Tanılama (hat gecikmeleri)
+        self._add_lazy_tab(self._create_diagnostics_tab, "🩺 Tanılama")
+
+        tabs.currentChanged.connect(self._ensure_tab)
         self.setCentralWidget(tabs)
 
+        # Açık sekme pencere ilk kez çizildikten sonra oluşturulur (eventFilter)
+        tabs.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.tabs and event.type() == QEvent.Type.Paint:
+            self.tabs.removeEventFilter(self)
+            QTimer.singleShot(0, lambda: self._ensure_tab(self.tabs.currentIndex()))
+        return super().eventFilter(obj, event)
+
+    def _add_lazy_tab(self, factory, title):
+        placeholder = QWidget()
+        placeholder.setLayout(QVBoxLayout())
+        index = self.tabs.addTab(placeholder, title)
+        self._lazy_tabs[index] = (placeholder, factory)
+
+    def _ensure_tab(self, index):
+        """Sekme henüz oluşturulmadıysa içeriğini oluştur"""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return
+        placeholder, factory = entry
+        try:
+            content = factory()
+        except Exception as e:
+            logger.exception("Sekme oluşturulamadı: %s", e)
+            content = QLabel(f"Sekme yüklenemedi: {e}")
+            content.setAlignment(Qt.AlignCenter)
+        placeholder.layout().addWidget(content)
+
     def _create_map_tab(self):
+        from src.ui.map_widget import MapWidget
+        from src.services.tile_cache import TileCache, TileProvider, TileServer
+
+        # Çevrimdışı karo önbelleği ve yerel karo sunucusu
+        try:
+            map_config = self.config.map
+            tile_provider = TileProvider(TileCache(map_config.tile_cache_path,
+                                                   max_tiles=map_config.max_tiles),
+                                         upstream_url=map_config.upstream_url)
+            self.tile_server = TileServer(tile_provider)
+            self.tile_server.start()
+        except Exception as e:
+            logger.warning("Karo sunucusu başlatılamadı, çevrimiçi karolar kullanılacak: %s", e)
+            self.tile_server = None
+
+        # Harita açılmadan önce toplanan iz de çizilir
+        track = self.flight_track
+        start = (track.lats[0], track.lons[0]) if len(track) else (39.9, 32.8)
+        self.map_widget = MapWidget(
+            start_lat=start[0], start_lon=start[1], track=track,
+            tile_url=self.tile_server.url_template if self.tile_server else None,
+            flush_interval_ms=self.config.map.flush_interval_ms,
+            zoom_poll_interval_ms=self.config.map.zoom_poll_interval_ms)
+        if self._last_position:
+            self.map_widget.update_position(*self._last_position)
+        if self.geofences:
+            self.map_widget.set_geofences(self.geofences)
+        if self.waypoint_panel and self.waypoint_panel.waypoints:
+            self.map_widget.set_route([(wp['latitude'], wp['longitude'])
+                                       for wp in self.waypoint_panel.waypoints])
+
         widget = QWidget()
         layout = QVBoxLayout()
         layout.addWidget(self.map_widget)
         widget.setLayout(layout)
         return widget
 
+    def _start_metrics_server(self):
+        from src.services.metrics_server import MetricsServer
+
+        pipeline_metrics.register_gauge(
+            'gui_pending_batches', lambda: self.worker.get_queue_metrics()['pending_batches'])
+        pipeline_metrics.register_gauge(
+            'worker_buffered_packets', lambda: self.worker.get_queue_metrics()['buffered_packets'])
+        if not self.config.metrics.enabled:
+            return
+        try:
+            self.metrics_server = MetricsServer(pipeline_metrics, port=self.config.metrics.port)
+            self.metrics_server.start()
+        except OSError as e:
+            logger.warning("Metrik uç noktası başlatılamadı: %s", e)
+            self.metrics_server = None
+
+    def _create_diagnostics_tab(self):
+        from src.ui.diagnostics_panel import DiagnosticsPanel
+
+        url = self.metrics_server.url if self.metrics_server else None
+        return DiagnosticsPanel(pipeline_metrics, metrics_url=url)
+
     def _create_status_tab(self):
         widget = QWidget()
         layout = QVBoxLayout()
@@ -126,6 +273,14 @@ class MainWindow(QMainWindow):
         return widget
 
     def _create_waypoint_tab(self):
+        from src.ui.waypoint_panel import WaypointPanel
+
+        self.waypoint_panel = WaypointPanel(self.db_manager)
+        self.waypoint_panel.waypointAdded.connect(self._on_waypoint_added)
+        self.waypoint_panel.missionCleared.connect(self._on_mission_cleared)
+        self.waypoint_panel.missionLoaded.connect(self._on_mission_loaded)
+        self.waypoint_panel.missionStarted.connect(self._on_mission_started)
+
         widget = QWidget()
         layout = QVBoxLayout()
         layout.addWidget(self.waypoint_panel)
@@ -133,6 +288,14 @@ class MainWindow(QMainWindow):
         return widget
 
     def _create_charts_tab(self):
+        from src.ui.charts import ChartsWidget
+
+        self.charts_widget = ChartsWidget(max_points=self.config.charts.max_points,
+                                          start_time=self._start_time)
+        if self._chart_backlog:
+            self.charts_widget.update_batch(list(self._chart_backlog))
+            self._chart_backlog.clear()
+
         widget = QWidget()
         layout = QVBoxLayout()
         layout.addWidget(self.charts_widget)
@@ -193,73 +356,71 @@ class MainWindow(QMainWindow):
         self.end_session_btn.clicked.connect(self.end_current_session)
         self.export_csv_btn.clicked.connect(self.export_current_session)
 
-        # İlk yükleme
+        # İlk yükleme (arka planda)
         self.refresh_database_info()
 
         return widget
 
     def toggle_mavlink_mode(self, checked):
-        print("CHECKBOX TIKLANДИ!")
         is_mavlink = bool(checked)  # 0,2 değerini True/False'a çevir
-        print(f"MAVLink modu: {'Açık' if is_mavlink else 'Kapalı'}")
-        print(f"Checkbox durumu: {checked} -> {is_mavlink}")
+        logger.info("MAVLink modu: %s", 'Açık' if is_mavlink else 'Kapalı')
         self.restart_worker_with_mavlink(is_mavlink)
 
     def restart_worker_with_mavlink(self, use_mavlink):
-        print(f"Worker yeniden başlatılıyor, use_mavlink={use_mavlink}")
+        logger.debug("Worker yeniden başlatılıyor, use_mavlink=%s", use_mavlink)
 
         if hasattr(self, 'worker'):
-            print("Eski worker durduruluyor...")
             self.worker.running = False  # Worker'ı durdur
             self.worker.quit()
             if not self.worker.wait(3000):  # 3 saniye timeout
-                print("Worker zorla sonlandırılıyor...")
+                logger.warning("Worker zorla sonlandırılıyor")
                 self.worker.terminate()
-            print("Eski worker durduruldu")
 
-        print("Yeni worker oluşturuluyor...")
-        self.worker = TelemetryWorker(
-            database_manager=self.db_manager,
-            use_mavlink=use_mavlink
-        )
-        print("Worker oluşturuldu, sinyal bağlanıyor...")
-        self.worker.new_data.connect(self.update_telemetry)
-        print("Worker başlatılıyor...")
+        self.worker = self._create_worker(use_mavlink=use_mavlink)
         self.worker.start()
-        print("Worker başlatıldı!")
+        logger.debug("Worker başlatıldı")
 
     def refresh_database_info(self):
-        """Veritabanı bilgilerini yenile"""
+        """Veritabanı bilgilerini arka planda yenile"""
+        if self.db_stats_label is None:
+            return  # Sekme henüz açılmadı
         if not self.db_manager:
             self.db_stats_label.setText("Veritabanı bağlantısı yok!")
             return
+        if self._db_loader and self._db_loader.isRunning():
+            return
 
-        try:
-            # Genel bilgiler
-            info = self.db_manager.get_database_info()
-            stats_text = (
-                f"Veritabanı: {info['database_path']}\n"
-                f"Dosya boyutu: {info['database_size'] / 1024:.1f} KB\n"
-                f"Toplam oturum: {info['total_sessions']}\n"
-                f"Toplam kayıt: {info['total_records']}\n"
-                f"Aktif oturum: {info['active_sessions']}"
-            )
-            self.db_stats_label.setText(stats_text)
+        self.refresh_db_btn.setEnabled(False)
+        self._db_loader = DatabaseInfoLoader(self.db_manager, self)
+        self._db_loader.loaded.connect(self._show_database_info)
+        self._db_loader.failed.connect(self._show_database_error)
+        self._db_loader.start()
+
+    def _show_database_info(self, info, sessions):
+        stats_text = (
+            f"Veritabanı: {info['database_path']}\n"
+            f"Dosya boyutu: {info['database_size'] / 1024:.1f} KB\n"
+            f"Toplam oturum: {info['total_sessions']}\n"
+            f"Toplam kayıt: {info['total_records']}\n"
+            f"Aktif oturum: {info['active_sessions']}"
+        )
+        self.db_stats_label.setText(stats_text)
 
-            # Son oturumlar
-            sessions = self.db_manager.get_flight_sessions()
-            if sessions:
-                session_text = "\n".join([
-                    f"• {s['session_name']} - {s['start_time'].strftime('%Y-%m-%d %H:%M')} "
-                    f"({s['status']})" for s in sessions[:10]  # Son 10 oturum
-                ])
-            else:
-                session_text = "Henüz oturum bulunmuyor"
+        # Son oturumlar
+        if sessions:
+            session_text = "\n".join([
+                f"• {s['session_name']} - {s['start_time'].strftime('%Y-%m-%d %H:%M')} "
+                f"({s['status']})" for s in sessions
+            ])
+        else:
+            session_text = "Henüz oturum bulunmuyor"
 
-            self.sessions_list_label.setText(session_text)
+        self.sessions_list_label.setText(session_text)
+        self.refresh_db_btn.setEnabled(True)
 
-        except Exception as e:
-            self.db_stats_label.setText(f"Veritabanı bilgi hatası: {e}")
+    def _show_database_error(self, message):
+        self.db_stats_label.setText(f"Veritabanı bilgi hatası: {message}")
+        self.refresh_db_btn.setEnabled(True)
 
     def start_new_session(self):
         """Yeni uçuş oturumu başlat"""
@@ -269,6 +430,7 @@ class MainWindow(QMainWindow):
 
         # Mevcut worker'ı durdur
         if hasattr(self, 'worker') and self.worker.isRunning():
+            self.worker.running = False  # run() döngüsü quit() ile durmaz
             self.worker.quit()
             self.worker.wait()
 
@@ -276,8 +438,7 @@ class MainWindow(QMainWindow):
         session_id = self.db_manager.start_flight_session()
 
         # Yeni worker başlat
-        self.worker = TelemetryWorker(database_manager=self.db_manager)
-        self.worker.new_data.connect(self.update_telemetry)
+        self.worker = self._create_worker()
         self.worker.start()
 
         QMessageBox.information(self, "Başarılı", f"Yeni oturum başlatıldı: {session_id}")
@@ -314,39 +475,82 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Hata", f"Dışa aktarma hatası: {e}")
 
     def update_telemetry(self, packet: TelemetryPacket):
-        """Worker'dan gelen veriyi tüm widget'lara dağıt"""
-        # 1. Telemetri text güncelle
+        """Tek bir paketi tüm widget'lara dağıt"""
+        self.update_telemetry_batch([packet])
+
+    def update_telemetry_batch(self, packets):
+        """Worker'dan gelen batch'i tüm widget'lara dağıt
+
+        Etiketler yalnızca son değeri, grafikler ve alarmlar tüm örnekleri kullanır.
+        """
+        worker = self.sender()
+        if isinstance(worker, TelemetryWorker):
+            worker.batch_consumed()
+
+        if not packets:
+            return
+        packet = packets[-1]
+
+        # 1. Telemetri text güncelle (son değer)
         txt = (
             f"🕐 Zaman: {packet.timestamp.strftime('%H:%M:%S')}\n"
             f"📍 GPS: {packet.gps.latitude:.5f}, {packet.gps.longitude:.5f}\n"
             f"⛰️ Rakım: {packet.gps.altitude:.1f} m\n"
             f"🚀 Hız: {packet.velocity:.1f} m/s\n"
+            f"↕️ Tırmanma: {packet.climb_rate or 0.0:+.1f} m/s\n"
+            f"🧭 Rota: {'--' if packet.course is None else f'{packet.course:.0f}°'}\n"
             f"🔋 Batarya: {packet.battery_percent:.1f}% ({packet.battery_voltage:.1f} V)\n"
             f"📊 Durum: {packet.status}"
         )
         self.telemetry_label.setText(txt)
 
-        # 2. Haritayı güncelle
-        self.map_widget.update_position(packet.gps.latitude, packet.gps.longitude)
-
-        # 3. Grafikleri güncelle
-        self.charts_widget.update_data(packet)
-
-        # 5. Alarm kontrolü
-        self.alarm_panel.check_telemetry_alarms(packet)
-
-        # 4. Status paneli güncelle (eğer varsa)
+        # 2. Haritayı güncelle (iz için tüm noktalar, çizim karede bir)
+        if self.map_widget:
+            for p in packets:
+                self.map_widget.update_position(p.gps.latitude, p.gps.longitude)
+        else:
+            # Harita sekmesi henüz açılmadı: yalnızca izi biriktir
+            for p in packets:
+                self.flight_track.add(p.gps.latitude, p.gps.longitude)
+        self._last_position = (packet.gps.latitude, packet.gps.longitude)
+
+        # 3. Grafikleri güncelle (tüm örnekler, tek çizim)
+        if self.charts_widget:
+            self.charts_widget.update_batch(packets)
+        else:
+            self._chart_backlog.extend(packets)
+
+        # 4. Alarm kontrolü (tüm örnekler)
+        for p in packets:
+            self.alarm_panel.check_telemetry_alarms(p)
+        if self.geofence_engine and self.alarm_panel:
+            self._check_geofences(packets)
+
+        # 5. Görev ilerlemesi (tüm örnekler, gösterim batch başına bir kez)
+        if self.mission_tracker:
+            self._update_mission_progress(packets)
+
+        # 6. Status paneli güncelle (eğer varsa)
         if self.status_panel:
             try:
                 self.status_panel.update_status(packet)
             except Exception as e:
-                print(f"Status panel güncelleme hatası: {e}")
+                logger.error("Status panel güncelleme hatası: %s", e)
+
+        pipeline_metrics.mark_batch(packets, RENDER)
+
+        # Olay kuyruğu derinliği
+        if isinstance(worker, TelemetryWorker):
+            metrics = worker.get_queue_metrics()
+            self.statusBar().showMessage(
+                f"Kuyruk: {metrics['pending_batches']} batch "
+                f"(max {metrics['max_pending_batches']}), "
+                f"son batch: {len(packets)} paket"
+            )
 
     def _connect_status_panel_signals(self):
         """Status panel butonlarını işlevlere bağla"""
         if self.status_panel:
-            print("Status panel sinyalleri bağlanıyor...")
-
             # Grafikleri temizle
             self.status_panel.clearGraphsRequested.connect(self.clear_graphs)
 
@@ -356,32 +560,130 @@ class MainWindow(QMainWindow):
             # Acil durdur
             self.status_panel.emergencyStopRequested.connect(self.emergency_stop)
 
-            # Waypoint panel sinyallerini bağla
-            self.waypoint_panel.waypointAdded.connect(self.map_widget.add_waypoint)
-            self.waypoint_panel.missionCleared.connect(self.map_widget.clear_waypoints)
+    def _on_waypoint_added(self, lat, lon, alt):
+        if self.map_widget:
+            self.map_widget.add_waypoint(lat, lon, alt)
+
+    def _on_mission_cleared(self):
+        self._stop_mission_tracking()
+        if self.map_widget:
+            self.map_widget.clear_waypoints()
+
+    def _on_mission_loaded(self, waypoints):
+        self._stop_mission_tracking()
+        if self.map_widget:
+            self.map_widget.set_route([(wp['latitude'], wp['longitude']) for wp in waypoints])
+
+    def _load_geofences(self):
+        """alerts.geofences_file'daki sınırlar; dosya yoksa veya hatalıysa boş liste"""
+        path = self.config.alerts.geofences_file
+        if not path:
+            return []
+        try:
+            fences = load_geofences(path)
+        except (OSError, ValueError) as e:
+            logger.error("Coğrafi sınırlar yüklenemedi (%s): %s", path, e)
+            return []
+        logger.info("%d coğrafi sınır yüklendi: %s", len(fences), path)
+        return fences
+
+    def _check_geofences(self, packets):
+        """Her paketi sınırlara karşı kontrol et; ihlaller alarm panelinde gösterilir
+
+        Sınır ihlali ikili bir koşuldur: alarm ilk ihlalde tetiklenir, ihlal
+        bitince temizlenir. Yalnızca ihlal edilen ve açık alarmı olan sınır
+        tipleri güncellenir.
+        """
+        states = self.alarm_panel.alarm_states
+        open_types = self._geofence_alarm_types
+        for p in packets:
+            alerts = {alert['type']: alert for alert in self.geofence_engine.check_packet(p)}
+            for alarm_type in open_types | alerts.keys():
+                alert = alerts.get(alarm_type)
+                transition = states.update(
+                    alarm_type, alert is not None, alert is None,
+                    severity=alert['severity'] if alert else 'CRITICAL',
+                    message=alert['message'] if alert else '',
+                    value=alert['value'] if alert else None,
+                    timestamp=p.timestamp, raise_debounce=1, clear_debounce=1)
+                state = states.get(alarm_type)
+                if transition or alert:
+                    self.alarm_panel.process_transition(alarm_type, transition, state)
+                if state.is_active:
+                    open_types.add(alarm_type)
+                else:
+                    open_types.discard(alarm_type)
+
+    def _on_mission_started(self, waypoints):
+        """Görev rotasını canlı telemetriyle izlemeye başla"""
+        self._stop_mission_tracking()
+        alerts = self.config.alerts
+        # Alarm durumu panelle ortak: 'Temizle' sapma alarmını da sıfırlar
+        self.mission_tracker = MissionTracker(
+            waypoints, off_route_m=alerts.off_route_m, clear_route_m=alerts.off_route_clear_m,
+            alarm_states=self.alarm_panel.alarm_states if self.alarm_panel else None)
+        if self.map_widget:
+            self.map_widget.set_route([(wp['latitude'], wp['longitude']) for wp in waypoints])
+        logger.info("Görev takibi başladı: %d waypoint, %.1f km",
+                    len(waypoints), self.mission_tracker.total_distance / 1000)
+
+    def _stop_mission_tracking(self):
+        """Görev takibini bitir; süren sapma alarmını kapat"""
+        tracker, self.mission_tracker = self.mission_tracker, None
+        if tracker is None:
+            return
+        state = tracker.alarm_states.get(ROUTE_ALERT_TYPE)
+        tracker.reset()
+        if state and state.is_active and self.alarm_panel:
+            self.alarm_panel.process_transition(ROUTE_ALERT_TYPE, CLEARED, state)
+        if self.waypoint_panel:
+            self.waypoint_panel.clear_progress()
+        if self.map_widget:
+            self.map_widget.set_route_progress(None)
+
+    def _update_mission_progress(self, packets):
+        """Her paketi rotaya göre değerlendir; panel ve harita son durumla güncellenir"""
+        tracker = self.mission_tracker
+        progress = None
+        for p in packets:
+            progress = tracker.update_packet(p)
+            if progress and self.alarm_panel and (progress['transition'] or progress['off_route']):
+                self.alarm_panel.process_transition(
+                    ROUTE_ALERT_TYPE, progress['transition'],
+                    tracker.alarm_states.get(ROUTE_ALERT_TYPE))
+        if progress is None:
+            return
 
-            print("✅ Tüm sinyaller bağlandı!")
+        if self.waypoint_panel:
+            self.waypoint_panel.update_progress(progress)
+        if self.map_widget:
+            self.map_widget.set_route_progress(
+                None if progress['completed'] else progress['leg'], progress['off_route'])
 
     def clear_graphs(self):
         """Tüm grafikleri temizle"""
-        print("🔄 Grafikler temizleniyor...")
-        self.charts_widget.clear_data()
-        print("✅ Grafikler temizlendi!")
+        self._chart_backlog.clear()
+        if self.charts_widget:
+            self.charts_widget.clear_data()
+        logger.info("Grafikler temizlendi")
 
     def clear_map_path(self):
         """Harita yolunu temizle"""
-        print("🔄 Harita yolu temizleniyor...")
-        self.map_widget.reset_path()
-        print("✅ Harita yolu temizlendi!")
+        if self.map_widget:
+            self.map_widget.reset_path()
+        else:
+            self.flight_track.clear()
+        logger.info("Harita yolu temizlendi")
 
     def emergency_stop(self):
         """Acil durdur - Worker'ı durdur"""
-        print("🚨 ACİL DURDUR başlatıldı!")
+        logger.critical("ACİL DURDUR başlatıldı")
 
         if hasattr(self, 'worker') and self.worker.isRunning():
+            self.worker.running = False  # run() döngüsü quit() ile durmaz
             self.worker.quit()
             self.worker.wait()
-            print("🚨 ACİL DURDUR: Veri akışı durduruldu!")
+            logger.critical("ACİL DURDUR: veri akışı durduruldu")
 
             # Tekrar başlatma butonu
             from PySide6.QtWidgets import QMessageBox
@@ -398,32 +700,44 @@ class MainWindow(QMainWindow):
     def restart_worker(self):
         """Worker'ı yeniden başlat"""
         try:
-            print("🔄 Worker yeniden başlatılıyor...")
-            self.worker = TelemetryWorker(database_manager=self.db_manager)
-            self.worker.new_data.connect(self.update_telemetry)
+            self.worker = self._create_worker()
             self.worker.start()
-            print("✅ Veri akışı yeniden başlatıldı!")
+            logger.info("Veri akışı yeniden başlatıldı")
         except Exception as e:
-            print(f"❌ Worker başlatılamadı: {e}")
+            logger.error("Worker başlatılamadı: %s", e)
 
     def closeEvent(self, event):
         """Uygulama kapanırken temizlik"""
         if hasattr(self, 'worker'):
+            self.worker.running = False  # run() döngüsü quit() ile durmaz
             self.worker.quit()
             self.worker.wait()
 
+        if self._db_loader:
+            self._db_loader.wait(2000)
+
         # Veritabanı bağlantısını kapat
         if hasattr(self, 'db_manager') and self.db_manager:
             self.db_manager.close_connection()
 
+        if self.metrics_server:
+            self.metrics_server.stop()
+
+        # Karo sunucusunu durdur
+        if getattr(self, 'tile_server', None):
+            self.tile_server.stop()
+            self.tile_server.provider.cache.close()
+
         event.accept()
 
     # Bu kısım dosyanın en sonunda olmalı ve düzeltilmeli:
 
 
 def main():
+    config = get_config()
+    config.setup_logging()
     app = QApplication(sys.argv)
-    win = MainWindow()
+    win = MainWindow(config)
     win.show()
     sys.exit(app.exec())
 
@@ -1,52 +1,215 @@
-# src/ui/map_widget.py - reset_path() metodu eklendi
+# src/ui/map_widget.py - Sayfa bir kez yüklenir, güncellemeler JavaScript ile gönderilir
 import folium
 import io
+import json
+from branca.element import MacroElement
+from jinja2 import Template
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QUrl, QTimer
+
+from src.utils.flight_track import FlightTrack
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _UavMapBridge(MacroElement):
+    """Folium haritasına artımlı güncelleme için JavaScript köprüsü ekler"""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            window.uavMap = (function () {
+                var map = {{ this._parent.get_name() }};
+                var marker = {{ this.marker.get_name() }};
+                var style = {color: "blue", weight: 3, opacity: 0.7};
+                // Kesinleşmiş (sadeleştirilmiş) iz ve henüz sadeleştirilmemiş kuyruk
+                var path = L.polyline([], style).bindTooltip("İHA Rotası").addTo(map);
+                var tail = L.polyline([], style).addTo(map);
+                var fences = L.layerGroup().addTo(map);
+                // Planlanan görev rotası ve uçulan (aktif) bacak
+                var route = L.polyline([], {color: "purple", weight: 2, dashArray: "4 6"})
+                    .bindTooltip("Görev Rotası").addTo(map);
+                var waypoints = L.layerGroup().addTo(map);
+                var waypointRenderer = L.canvas();  // Binlerce nokta için SVG yerine canvas
+                var leg = L.polyline([], {color: "orange", weight: 5, opacity: 0.8}).addTo(map);
+
+                var pending = [];
+                var scheduled = false;
+
+                function setTail(points) {
+                    var committed = path.getLatLngs();
+                    tail.setLatLngs(committed.length ?
+                        [committed[committed.length - 1]].concat(points) : points);
+                }
+
+                function applyOne(u) {
+                    if (u.reset) { path.setLatLngs(u.reset); }
+                    for (var i = 0; i < u.append.length; i++) {
+                        path.addLatLng(u.append[i]);
+                    }
+
+                    if (u.tailReplace) {
+                        setTail(u.tail);
+                    } else {
+                        for (var j = 0; j < u.tail.length; j++) {
+                            tail.addLatLng(u.tail[j]);
+                        }
+                    }
+
+                    if (u.position) {
+                        var ll = L.latLng(u.position[0], u.position[1]);
+                        marker.setLatLng(ll);
+                        marker.setTooltipContent(
+                            "İHA Konumu<br>Lat: " + ll.lat.toFixed(5) +
+                            "<br>Lon: " + ll.lng.toFixed(5));
+                        // Zoom/pan'ı bozmadan yalnızca görüş dışına çıkınca takip et
+                        if (!map.getBounds().contains(ll)) { map.panTo(ll); }
+                    }
+                }
+
+                function apply() {
+                    scheduled = false;
+                    var updates = pending;
+                    pending = [];
+                    for (var i = 0; i < updates.length; i++) { applyOne(updates[i]); }
+                }
+
+                return {
+                    // Aynı animasyon karesindeki güncellemeleri tek seferde uygula
+                    update: function (u) {
+                        pending.push(u);
+                        if (!scheduled) {
+                            scheduled = true;
+                            window.requestAnimationFrame(apply);
+                        }
+                        return map.getZoom();
+                    },
+                    // Coğrafi sınırlar: yasak bölgeler kırmızı, izin verilenler yeşil
+                    setFences: function (list) {
+                        fences.clearLayers();
+                        for (var i = 0; i < list.length; i++) {
+                            var f = list[i];
+                            var color = f.kind === "exclusion" ? "red" : "green";
+                            var opts = {color: color, weight: 2, fillOpacity: 0.1,
+                                        dashArray: f.kind === "exclusion" ? null : "6 4"};
+                            var layer = f.shape === "cylinder" ?
+                                L.circle(f.center, L.extend({radius: f.radius}, opts)) :
+                                L.polygon(f.points, opts);
+                            var band = (f.floor === null ? "-" : f.floor + " m") + " / " +
+                                       (f.ceiling === null ? "-" : f.ceiling + " m");
+                            layer.bindTooltip(f.name + "<br>Taban/Tavan: " + band);
+                            fences.addLayer(layer);
+                        }
+                    },
+                    setRoute: function (points) {
+                        route.setLatLngs(points);
+                        leg.setLatLngs([]);
+                        waypoints.clearLayers();
+                        for (var i = 0; i < points.length; i++) {
+                            waypoints.addLayer(L.circleMarker(points[i], {
+                                radius: 4, color: "purple", weight: 1, fillOpacity: 0.6,
+                                renderer: waypointRenderer
+                            }).bindTooltip("WP" + i));
+                        }
+                    },
+                    // Aktif bacağı vurgula; rotadan sapmada kırmızı
+                    setProgress: function (p) {
+                        var points = route.getLatLngs();
+                        if (!p || p.leg + 1 >= points.length) { leg.setLatLngs([]); return; }
+                        leg.setLatLngs([points[p.leg], points[p.leg + 1]]);
+                        leg.setStyle({color: p.offRoute ? "red" : "orange"});
+                    },
+                    zoom: function () { return map.getZoom(); },
+                    center: function () { map.panTo(marker.getLatLng()); }
+                };
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, marker):
+        super().__init__()
+        self._name = 'UavMapBridge'
+        self.marker = marker
 
 
 class MapWidget(QWebEngineView):
-    def __init__(self, start_lat=39.9, start_lon=32.8, zoom=13):
+    # Güncellemeler bu aralıkta (≈1 kare) tek bir runJavaScript çağrısında birleştirilir
+    FLUSH_INTERVAL_MS = 16
+    # Kullanıcı zoom'unu değiştirdiğinde doğru ayrıntı seviyesine geçmek için
+    ZOOM_POLL_INTERVAL_MS = 500
+
+    def __init__(self, start_lat=39.9, start_lon=32.8, zoom=13, tile_url=None,
+                 min_spacing_m=2.0, track=None, flush_interval_ms=None,
+                 zoom_poll_interval_ms=None):
         super().__init__()
+        self.tile_url = tile_url  # Yerel karo sunucusu (None: OpenStreetMap)
         self.start_lat = start_lat
         self.start_lon = start_lon
         self.zoom = zoom
         self.current_lat = start_lat
         self.current_lon = start_lon
-        self.path_points = []  # İHA'nın izlediği yolu saklamak için
+        # Tüm uçuş izi (kısaltılmaz, zoom'a göre sadeleştirilerek çizilir).
+        # Dışarıdan verilirse widget oluşmadan önce toplanan iz de çizilir.
+        self.track = track if track is not None else FlightTrack(min_spacing_m=min_spacing_m)
+
+        # Sayfadaki çizimin iz ile senkronizasyon durumu
+        self._page_ready = False
+        self._view_zoom = zoom
+        self._pending_reset = True
+        self._position_dirty = False
+        self._sent_level = None
+        self._sent_generation = None  # İz başka yerden temizlenirse yeniden gönderilir
+        self._sent_committed = 0
+        self._sent_tail_start = 0
+        self._sent_tail_end = 0
+        self._geofences = []  # Çizilecek sınırlar (sayfa yenilenirse tekrar gönderilir)
+        self._route = []  # Görev noktaları [lat, lon] (sayfa yenilenirse tekrar gönderilir)
+        self._route_progress = None  # Gönderilen aktif bacak durumu
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(
+            self.FLUSH_INTERVAL_MS if flush_interval_ms is None else flush_interval_ms)
+        self._flush_timer.timeout.connect(self._flush_updates)
+
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setInterval(
+            self.ZOOM_POLL_INTERVAL_MS if zoom_poll_interval_ms is None else zoom_poll_interval_ms)
+        self._zoom_timer.timeout.connect(self._poll_zoom)
+
+        self.loadFinished.connect(self._on_load_finished)
         self._generate_map(start_lat, start_lon)
 
-    def _generate_map(self, lat, lon, show_path=True):
-        """Harita oluştur"""
+    def _generate_map(self, lat, lon):
+        """Harita sayfasını oluştur ve yükle (yalnızca başlangıçta)"""
+        self._page_ready = False
+
         # Harita merkezi
-        m = folium.Map(location=[lat, lon], zoom_start=self.zoom)
+        if self.tile_url:
+            m = folium.Map(location=[lat, lon], zoom_start=self.zoom, tiles=self.tile_url,
+                           attr="&copy; OpenStreetMap contributors (çevrimdışı önbellek)")
+        else:
+            m = folium.Map(location=[lat, lon], zoom_start=self.zoom)
 
-        # Mevcut konum marker'ı (kırmızı)
+        # Başlangıç noktası marker'ı (yeşil)
         folium.Marker(
+            [self.start_lat, self.start_lon],
+            tooltip="Başlangıç Noktası",
+            popup="İHA Başlangıç Noktası",
+            icon=folium.Icon(color='green', icon='home')
+        ).add_to(m)
+
+        # Mevcut konum marker'ı (kırmızı)
+        marker = folium.Marker(
             [lat, lon],
             tooltip=f"İHA Konumu\nLat: {lat:.5f}\nLon: {lon:.5f}",
             popup=f"Güncel Konum<br>Lat: {lat:.5f}<br>Lon: {lon:.5f}",
             icon=folium.Icon(color='red', icon='plane')
-        ).add_to(m)
+        )
+        marker.add_to(m)
 
-        # Başlangıç noktası marker'ı (yeşil)
-        if lat != self.start_lat or lon != self.start_lon:
-            folium.Marker(
-                [self.start_lat, self.start_lon],
-                tooltip="Başlangıç Noktası",
-                popup="İHA Başlangıç Noktası",
-                icon=folium.Icon(color='green', icon='home')
-            ).add_to(m)
-
-        # Yol çizgisi
-        if show_path and len(self.path_points) > 1:
-            folium.PolyLine(
-                self.path_points,
-                color="blue",
-                weight=3,
-                opacity=0.7,
-                tooltip="İHA Rotası"
-            ).add_to(m)
+        # Yol çizgisi ve güncelleme köprüsü
+        _UavMapBridge(marker).add_to(m)
 
         # HTML'i oluştur ve widget'a yükle
         data = io.BytesIO()
@@ -54,48 +217,146 @@ class MapWidget(QWebEngineView):
         html_content = data.getvalue().decode()
         self.setHtml(html_content)
 
+        # Yeni sayfadaki iz boş: yüklenince tamamı gönderilecek
+        self._pending_reset = True
+
+    def _on_load_finished(self, ok):
+        """Sayfa yüklendiğinde bekleyen güncellemeleri gönder"""
+        self._page_ready = ok
+        if ok:
+            self._zoom_timer.start()
+            self._send_geofences()
+            self._send_route()
+            self._flush_updates()
+
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_updates(self):
+        """Biriken güncellemeleri tek bir JavaScript çağrısıyla gönder"""
+        if not self._page_ready:
+            return  # loadFinished sonrası tekrar denenecek
+
+        track = self.track
+        level = track.level_zoom(self._view_zoom)
+        tail_start = track.tail_start(level)
+        total = len(track)
+
+        update = {'position': None, 'reset': None, 'append': [],
+                  'tail': [], 'tailReplace': False}
+
+        if (self._pending_reset or level != self._sent_level
+                or track.generation != self._sent_generation):
+            # Tüm izi (bu zoom seviyesinin sadeleştirilmiş hali) yeniden gönder
+            update['reset'] = track.committed_points(level)
+            update['tail'] = track.points(tail_start)
+            update['tailReplace'] = True
+        else:
+            # Yalnızca farkı gönder: yeni kesinleşen noktalar + kuyruk
+            update['append'] = track.committed_points(level, self._sent_committed)
+            if tail_start != self._sent_tail_start:
+                update['tail'] = track.points(tail_start)
+                update['tailReplace'] = True
+            else:
+                update['tail'] = track.points(self._sent_tail_end)
+
+        if self._position_dirty:
+            update['position'] = [self.current_lat, self.current_lon]
+
+        if not (update['position'] or update['reset'] is not None or update['append']
+                or update['tail'] or update['tailReplace']):
+            return
+
+        script = "window.uavMap ? window.uavMap.update({}) : null;".format(json.dumps(update))
+        self.page().runJavaScript(script, 0, self._on_view_zoom)
+
+        self._pending_reset = False
+        self._position_dirty = False
+        self._sent_level = level
+        self._sent_generation = track.generation
+        self._sent_committed = track.committed_count(level)
+        self._sent_tail_start = tail_start
+        self._sent_tail_end = total
+
+    def _poll_zoom(self):
+        if self._page_ready:
+            self.page().runJavaScript(
+                "window.uavMap ? window.uavMap.zoom() : null;", 0, self._on_view_zoom)
+
+    def _on_view_zoom(self, zoom):
+        """Sayfadaki zoom değişince uygun ayrıntı seviyesine geç"""
+        if zoom is None:
+            return
+        self._view_zoom = zoom
+        if self.track.level_zoom(zoom) != self._sent_level:
+            self._schedule_flush()
+
     def update_position(self, lat, lon):
         """
-        Harita merkezini ve marker'ı yeni konuma taşır.
-        Ayrıca yol izini tutar.
+        Marker'ı yeni konuma taşır ve yol izini tutar.
+        Sayfa yeniden yüklenmez; değişiklikler bir sonraki karede gönderilir.
         """
-        # Yeni nokta yoldan çok farklıysa path'e ekle
-        if not self.path_points or self._distance_significant(lat, lon):
-            self.path_points.append([lat, lon])
-            # Path çok uzarsa eski noktaları temizle (performans için)
-            if len(self.path_points) > 100:
-                self.path_points = self.path_points[-50:]
+        # Son noktadan min_spacing_m'den uzaksa ize ekle (tüm uçuş saklanır)
+        self.track.add(lat, lon)
 
         self.current_lat = lat
         self.current_lon = lon
-        self._generate_map(lat, lon)
-
-    def _distance_significant(self, lat, lon, threshold=0.0001):
-        """
-        İki nokta arasındaki mesafe anlamlı mı kontrol eder
-        (Çok sık güncelleme yapmamak için)
-        """
-        if not self.path_points:
-            return True
-
-        last_point = self.path_points[-1]
-        distance = abs(lat - last_point[0]) + abs(lon - last_point[1])
-        return distance > threshold
+        self._position_dirty = True
+        self._schedule_flush()
 
     def reset_path(self):
         """Yol izini temizle - STATUS PANEL BUTONU İÇİN"""
-        self.path_points = []
-        self._generate_map(self.current_lat, self.current_lon)
-        print("🗺️ Harita yolu temizlendi!")
+        self.track.clear()  # generation değişir: sonraki karede iz sıfırlanır
+        self._schedule_flush()
+        logger.debug("Harita yolu temizlendi")
 
     def center_map(self):
         """Haritayı mevcut konuma ortala"""
-        self._generate_map(self.current_lat, self.current_lon)
+        if self._page_ready:
+            self.page().runJavaScript("window.uavMap && window.uavMap.center();")
+
+    def set_geofences(self, fences):
+        """Coğrafi sınırları (Geofence listesi) haritada çiz"""
+        self._geofences = [fence.to_map_shape() for fence in fences]
+        self._send_geofences()
+
+    def _send_geofences(self):
+        if self._page_ready:
+            script = "window.uavMap && window.uavMap.setFences({});".format(
+                json.dumps(self._geofences))
+            self.page().runJavaScript(script)
 
     def add_waypoint(self, lat, lon, alt):
         """Haritaya waypoint ekle"""
-        print(f"📍 Waypoint eklendi: {lat:.5f}, {lon:.5f}, {alt}m")
+        self._route.append([lat, lon])
+        self._send_route()
+        logger.debug("Waypoint eklendi: %.5f, %.5f, %sm", lat, lon, alt)
 
     def clear_waypoints(self):
         """Waypoint'leri temizle"""
-        print("🗑️ Waypoint'ler temizlendi")
\ No newline at end of file
+        self.set_route([])
+        logger.debug("Waypoint'ler temizlendi")
+
+    def set_route(self, points):
+        """Görev rotasını [(lat, lon), ...] ile değiştir (tek çağrı)"""
+        self._route = [[lat, lon] for lat, lon in points]
+        self._route_progress = None
+        self._send_route()
+
+    def set_route_progress(self, leg, off_route=False):
+        """Aktif bacağı vurgula (leg None: vurgu yok); değişmediyse gönderilmez"""
+        progress = None if leg is None else {'leg': leg, 'offRoute': bool(off_route)}
+        if progress == self._route_progress:
+            return
+        self._route_progress = progress
+        if self._page_ready:
+            self.page().runJavaScript(
+                "window.uavMap && window.uavMap.setProgress({});".format(json.dumps(progress)))
+
+    def _send_route(self):
+        if self._page_ready:
+            script = ("window.uavMap && (window.uavMap.setRoute({}), "
+                      "window.uavMap.setProgress({}));").format(
+                json.dumps(self._route), json.dumps(self._route_progress))
+            self.page().runJavaScript(script)
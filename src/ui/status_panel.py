@@ -6,6 +6,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 
+from src.utils.rolling_stats import TelemetryStats
+
 
 class StatusPanel(QWidget):
     # ---- Yeni Sinyaller ----
@@ -15,6 +17,8 @@ class StatusPanel(QWidget):
 
     def __init__(self):
         super().__init__()
+        # Tüm uçuş boyunca kümülatif güç istatistikleri
+        self.flight_stats = TelemetryStats(fields=('battery_voltage',))
         self.setup_ui()
         self._connect_signals()
 
@@ -103,7 +107,13 @@ class StatusPanel(QWidget):
 
         # Batarya seviyesi
         self.battery_bar.setValue(int(packet.battery_percent))
-        self.battery_voltage_label.setText(f"Voltaj: {packet.battery_voltage:.1f} V")
+        self.flight_stats.update(packet)
+        min_voltage = self.flight_stats['battery_voltage'].min
+        if min_voltage is not None:
+            self.battery_voltage_label.setText(
+                f"Voltaj: {packet.battery_voltage:.1f} V (Min: {min_voltage:.1f} V)")
+        else:
+            self.battery_voltage_label.setText(f"Voltaj: {packet.battery_voltage:.1f} V")
 
         # Batarya rengi
         if packet.battery_percent > 50:
@@ -2,11 +2,31 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                QListWidget, QPushButton, QLineEdit, QSpinBox,
                                QComboBox, QDoubleSpinBox, QGroupBox, QFormLayout,
-                               QListWidgetItem, QMessageBox)
+                               QFileDialog, QInputDialog, QMessageBox)
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QColor
 from datetime import datetime
 
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Liste renk kodları (eylem -> arka plan)
+ACTION_COLORS = {
+    'TAKEOFF': (200, 255, 200),  # Açık yeşil
+    'LAND': (255, 200, 200),  # Açık kırmızı
+    'HOVER': (255, 255, 200),  # Açık sarı
+}
+
+
+def _format_eta(seconds) -> str:
+    """Saniyeyi dd:ss / s:dd:ss biçimine çevir (None: hız yok)"""
+    if seconds is None:
+        return "--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
 
 class WaypointPanel(QWidget):
     """Waypoint/Görev Noktası Yönetim Paneli"""
@@ -15,11 +35,14 @@ class WaypointPanel(QWidget):
     waypointAdded = Signal(float, float, float)  # lat, lon, alt
     missionStarted = Signal(list)  # waypoint listesi
     missionCleared = Signal()
+    missionLoaded = Signal(list)  # yüklenen waypoint listesi
 
-    def __init__(self):
+    def __init__(self, database_manager=None):
         super().__init__()
+        self.db_manager = database_manager
         self.waypoints = []
         self.mission_name = ""
+        self._active_row = None  # Listede vurgulanan hedef waypoint
         self.init_ui()
 
     def init_ui(self):
@@ -41,6 +64,9 @@ class WaypointPanel(QWidget):
         # Waypoint listesi
         self._create_waypoint_list_group(layout)
 
+        # Tarama ızgarası
+        self._create_survey_group(layout)
+
         # Kontrol butonları
         self._create_control_buttons(layout)
 
@@ -48,6 +74,10 @@ class WaypointPanel(QWidget):
         self.stats_label = QLabel("📊 Görev: 0 waypoint, 0.0 km, ~0 dk")
         layout.addWidget(self.stats_label)
 
+        # Canlı görev ilerlemesi (görev başlayınca güncellenir)
+        self.progress_label = QLabel("🧭 İlerleme: görev başlatılmadı")
+        layout.addWidget(self.progress_label)
+
         layout.addStretch()
         self.setLayout(layout)
 
@@ -138,6 +168,47 @@ class WaypointPanel(QWidget):
         self.move_down_btn.clicked.connect(self.move_waypoint_down)
         self.remove_btn.clicked.connect(self.remove_waypoint)
 
+    def _create_survey_group(self, parent_layout):
+        """Tarama ızgarası formu (listedeki noktalar çokgen köşeleri olur)"""
+        group = QGroupBox("🔲 Tarama Izgarası")
+        layout = QFormLayout()
+
+        self.footprint_width_spin = QDoubleSpinBox()
+        self.footprint_width_spin.setRange(1, 2000)
+        self.footprint_width_spin.setValue(150)
+        self.footprint_width_spin.setSuffix(" m")
+        layout.addRow("Kare genişliği:", self.footprint_width_spin)
+
+        self.footprint_height_spin = QDoubleSpinBox()
+        self.footprint_height_spin.setRange(1, 2000)
+        self.footprint_height_spin.setValue(100)
+        self.footprint_height_spin.setSuffix(" m")
+        layout.addRow("Kare yüksekliği:", self.footprint_height_spin)
+
+        self.front_overlap_spin = QSpinBox()
+        self.front_overlap_spin.setRange(0, 95)
+        self.front_overlap_spin.setValue(75)
+        self.front_overlap_spin.setSuffix(" %")
+        layout.addRow("Ön bindirme:", self.front_overlap_spin)
+
+        self.side_overlap_spin = QSpinBox()
+        self.side_overlap_spin.setRange(0, 95)
+        self.side_overlap_spin.setValue(65)
+        self.side_overlap_spin.setSuffix(" %")
+        layout.addRow("Yan bindirme:", self.side_overlap_spin)
+
+        self.grid_angle_spin = QDoubleSpinBox()
+        self.grid_angle_spin.setRange(0, 180)
+        self.grid_angle_spin.setSuffix(" °")
+        layout.addRow("Hat yönü:", self.grid_angle_spin)
+
+        self.generate_grid_btn = QPushButton("🔲 Izgara Oluştur")
+        self.generate_grid_btn.clicked.connect(self.generate_survey)
+        layout.addRow(self.generate_grid_btn)
+
+        group.setLayout(layout)
+        parent_layout.addWidget(group)
+
     def _create_control_buttons(self, parent_layout):
         """Ana kontrol butonları"""
         button_layout = QHBoxLayout()
@@ -145,17 +216,30 @@ class WaypointPanel(QWidget):
         self.start_mission_btn = QPushButton("🚀 Görevi Başlat")
         self.clear_mission_btn = QPushButton("🗑️ Görevi Temizle")
         self.save_mission_btn = QPushButton("💾 Görevi Kaydet")
+        self.load_mission_btn = QPushButton("📂 Görevi Yükle")
+        self.load_mission_btn.setEnabled(self.db_manager is not None)
 
         button_layout.addWidget(self.start_mission_btn)
         button_layout.addWidget(self.clear_mission_btn)
         button_layout.addWidget(self.save_mission_btn)
+        button_layout.addWidget(self.load_mission_btn)
+
+        file_layout = QHBoxLayout()
+        self.import_mission_btn = QPushButton("📥 İçe Aktar")
+        self.export_mission_btn = QPushButton("📤 Dışa Aktar")
+        file_layout.addWidget(self.import_mission_btn)
+        file_layout.addWidget(self.export_mission_btn)
 
         parent_layout.addLayout(button_layout)
+        parent_layout.addLayout(file_layout)
 
         # Buton sinyalleri
         self.start_mission_btn.clicked.connect(self.start_mission)
         self.clear_mission_btn.clicked.connect(self.clear_mission)
         self.save_mission_btn.clicked.connect(self.save_mission)
+        self.load_mission_btn.clicked.connect(self.choose_mission)
+        self.import_mission_btn.clicked.connect(self.choose_import_file)
+        self.export_mission_btn.clicked.connect(self.choose_export_file)
 
     def add_waypoint(self):
         """Yeni waypoint ekle"""
@@ -182,7 +266,7 @@ class WaypointPanel(QWidget):
         # Sinyal gönder
         self.waypointAdded.emit(lat, lon, alt)
 
-        print(f"✅ Waypoint eklendi: {lat:.5f}, {lon:.5f}, {alt}m")
+        logger.debug("Waypoint eklendi: %.5f, %.5f, %sm", lat, lon, alt)
 
     def remove_waypoint(self):
         """Seçili waypoint'i kaldır"""
@@ -192,7 +276,7 @@ class WaypointPanel(QWidget):
             self._reorder_waypoints()
             self._update_waypoint_list()
             self._update_stats()
-            print(f"❌ Waypoint kaldırıldı: {removed['latitude']:.5f}, {removed['longitude']:.5f}")
+            logger.debug("Waypoint kaldırıldı: %.5f, %.5f", removed['latitude'], removed['longitude'])
 
     def move_waypoint_up(self):
         """Waypoint'i yukarı taşı"""
@@ -231,7 +315,7 @@ class WaypointPanel(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.missionStarted.emit(self.waypoints.copy())
-            print(f"🚀 Görev başlatıldı: {mission_name}")
+            logger.info("Görev başlatıldı: %s", mission_name)
 
     def clear_mission(self):
         """Tüm waypoint'leri temizle"""
@@ -246,15 +330,25 @@ class WaypointPanel(QWidget):
             self._update_waypoint_list()
             self._update_stats()
             self.missionCleared.emit()
-            print("🗑️ Görev temizlendi")
+            logger.debug("Görev temizlendi")
 
     def save_mission(self):
-        """Görevi kaydet (basit text formatı)"""
+        """Görevi kaydet (veritabanı yoksa basit text formatı)"""
         if not self.waypoints:
             QMessageBox.warning(self, "Uyarı", "Kaydedilecek waypoint yok!")
             return
 
         mission_name = self.mission_name_edit.text() or f"mission_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        if self.db_manager:
+            try:
+                self.db_manager.save_mission(mission_name, self._mission_rows())
+                self.mission_name_edit.setText(mission_name)
+                QMessageBox.information(self, "Başarılı", f"Görev kaydedildi: {mission_name}")
+            except Exception as e:
+                QMessageBox.critical(self, "Hata", f"Kayıt hatası: {e}")
+            return
+
         filename = f"{mission_name}.txt"
 
         try:
@@ -268,33 +362,192 @@ class WaypointPanel(QWidget):
                             f"{wp['altitude']}m, {wp['action']}, {wp['hold_time']}s\n")
 
             QMessageBox.information(self, "Başarılı", f"Görev kaydedildi: {filename}")
-            print(f"💾 Görev kaydedildi: {filename}")
+            logger.info("Görev kaydedildi: %s", filename)
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Kayıt hatası: {e}")
 
-    def _update_waypoint_list(self):
-        """Waypoint listesini güncelle"""
-        self.waypoint_list.clear()
+    def choose_mission(self):
+        """Kayıtlı görevlerden birini seçip yükle"""
+        if not self.db_manager:
+            return
+        names = [mission['mission_name'] for mission in self.db_manager.get_missions()]
+        if not names:
+            QMessageBox.information(self, "Bilgi", "Kayıtlı görev yok")
+            return
+        name, ok = QInputDialog.getItem(self, "Görev Yükle", "Görev:", names, 0, False)
+        if ok and name:
+            self.load_mission(name)
+
+    def load_mission(self, mission_name: str) -> bool:
+        """Kayıtlı görevi veritabanından yükle"""
+        if not self.db_manager:
+            return False
+        stored = self.db_manager.load_mission(mission_name)
+        if not stored:
+            logger.warning("Görev bulunamadı: %s", mission_name)
+            return False
+        self._set_mission(mission_name, stored)
+        return True
+
+    def generate_survey(self):
+        """Listedeki noktaları köşe kabul eden çokgen için tarama ızgarası oluştur"""
+        if len(self.waypoints) < 3:
+            QMessageBox.warning(self, "Uyarı", "Çokgen için en az 3 köşe noktası ekleyin!")
+            return
 
+        from src.utils.survey_grid import grid_waypoints, survey_grid
+
+        try:
+            lats, lons = survey_grid(
+                [(wp['latitude'], wp['longitude']) for wp in self.waypoints],
+                (self.footprint_width_spin.value(), self.footprint_height_spin.value()),
+                self.front_overlap_spin.value() / 100, self.side_overlap_spin.value() / 100,
+                self.grid_angle_spin.value())
+        except ValueError as e:
+            QMessageBox.warning(self, "Uyarı", f"Izgara oluşturulamadı: {e}")
+            return
+        name = self.mission_name_edit.text() or f"survey_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self._set_mission(name, grid_waypoints(lats, lons, self.alt_spin.value()))
+
+    def choose_import_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Görev İçe Aktar", "", "Görev dosyaları (*.plan *.waypoints *.txt);;Tümü (*)")
+        if path:
+            self.import_mission_file(path)
+
+    def choose_export_file(self):
+        if not self.waypoints:
+            QMessageBox.warning(self, "Uyarı", "Dışa aktarılacak waypoint yok!")
+            return
+        name = self.mission_name_edit.text() or "mission"
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Görev Dışa Aktar", f"{name}.plan",
+            "QGroundControl plan (*.plan);;MAVLink WPL (*.waypoints)")
+        if path:
+            self.export_mission_file(path)
+
+    def import_mission_file(self, path: str) -> bool:
+        """.plan / WPL dosyasını yükle; veritabanı varsa dosya adıyla kaydet"""
+        from pathlib import Path
+        from src.services.mission_files import read_mission
+
+        try:
+            waypoints = list(read_mission(path))
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.critical(self, "Hata", f"Görev dosyası okunamadı: {e}")
+            return False
+        if not waypoints:
+            QMessageBox.warning(self, "Uyarı", "Dosyada görev noktası yok!")
+            return False
+
+        name = Path(path).stem
+        if self.db_manager:
+            try:
+                self.db_manager.save_mission(name, waypoints)
+            except Exception as e:
+                logger.error("İçe aktarılan görev kaydedilemedi: %s", e)
+        self._set_mission(name, waypoints)
+        return True
+
+    def export_mission_file(self, path: str) -> int:
+        """Görevi .plan / WPL dosyasına yaz; yazılan öğe sayısı"""
+        from src.services.mission_files import write_mission
+
+        try:
+            count = write_mission(path, self._mission_rows())
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", f"Dışa aktarma hatası: {e}")
+            return 0
+        logger.info("Görev dışa aktarıldı: %s (%d öğe)", path, count)
+        return count
+
+    def _mission_rows(self):
+        """Panel listesi -> görev deposu / dosya biçimi"""
+        return [{'latitude': wp['latitude'], 'longitude': wp['longitude'],
+                 'altitude': wp['altitude'], 'action_type': wp['action'],
+                 'hold_time': wp['hold_time']} for wp in self.waypoints]
+
+    def _set_mission(self, mission_name: str, rows):
+        """Listeyi görev deposu biçimindeki satırlarla değiştir; tek geçişte yeniden kur"""
+        now = datetime.now()
+        self.waypoints = [{
+            'order': i,
+            'latitude': wp['latitude'],
+            'longitude': wp['longitude'],
+            'altitude': wp['altitude'],
+            'action': wp.get('action_type', 'FLY_TO'),
+            'hold_time': wp.get('hold_time', 0),
+            'timestamp': now
+        } for i, wp in enumerate(rows)]
+        self.mission_name_edit.setText(mission_name)
+        self._update_waypoint_list()
+        self._update_stats()
+        self.missionLoaded.emit(self.waypoints.copy())
+        logger.info("Görev yüklendi: %s (%d waypoint)", mission_name, len(self.waypoints))
+
+    def update_progress(self, progress: dict):
+        """MissionTracker durumunu göster; hedef waypoint listede kalın yazılır"""
+        if not progress:
+            return
+        target = progress['target_index']
+        if progress['completed']:
+            text = "🏁 Görev tamamlandı"
+        else:
+            text = (f"🧭 Bacak {progress['leg'] + 1} → WP{target} | "
+                    f"Yanal: {progress['cross_track_m']:+.1f} m | "
+                    f"Kalan: {progress['remaining_m'] / 1000:.2f} km "
+                    f"(%{progress['progress'] * 100:.0f}) | "
+                    f"WP ETA: {_format_eta(progress['eta_target_s'])} | "
+                    f"Bitiş: {_format_eta(progress['eta_end_s'])}")
+            if progress['off_route']:
+                text = "⚠️ ROTA DIŞI | " + text
+        self.progress_label.setText(text)
+        self.progress_label.setStyleSheet("color: red;" if progress['off_route'] else "")
+        self._set_active_row(None if progress['completed'] else target)
+
+    def clear_progress(self):
+        """İlerleme göstergesini sıfırla"""
+        self.progress_label.setText("🧭 İlerleme: görev başlatılmadı")
+        self.progress_label.setStyleSheet("")
+        self._set_active_row(None)
+
+    def _set_active_row(self, row):
+        """Yalnızca önceki ve yeni satırın yazı tipi değişir"""
+        if row == self._active_row:
+            return
+        for index, bold in ((self._active_row, False), (row, True)):
+            item = self.waypoint_list.item(index) if index is not None else None
+            if item:
+                font = item.font()
+                font.setBold(bold)
+                item.setFont(font)
+        self._active_row = row
+
+    def _update_waypoint_list(self):
+        """Waypoint listesini güncelle (tek addItems, güncellemeler kapalıyken)"""
+        texts = []
         for i, wp in enumerate(self.waypoints):
             text = (f"WP{i}: {wp['latitude']:.5f}, {wp['longitude']:.5f}, "
                     f"{wp['altitude']}m - {wp['action']}")
 
             if wp['hold_time'] > 0:
                 text += f" ({wp['hold_time']}s)"
+            texts.append(text)
 
-            item = QListWidgetItem(text)
+        self.waypoint_list.setUpdatesEnabled(False)
+        try:
+            self._active_row = None
+            self.waypoint_list.clear()
+            self.waypoint_list.addItems(texts)
 
             # Renk kodlama
-            if wp['action'] == 'TAKEOFF':
-                item.setBackground(QColor(200, 255, 200))  # Açık yeşil
-            elif wp['action'] == 'LAND':
-                item.setBackground(QColor(255, 200, 200))  # Açık kırmızı
-            elif wp['action'] == 'HOVER':
-                item.setBackground(QColor(255, 255, 200))  # Açık sarı
-
-            self.waypoint_list.addItem(item)
+            for i, wp in enumerate(self.waypoints):
+                color = ACTION_COLORS.get(wp['action'])
+                if color:
+                    self.waypoint_list.item(i).setBackground(QColor(*color))
+        finally:
+            self.waypoint_list.setUpdatesEnabled(True)
 
     def _reorder_waypoints(self):
         """Waypoint sıralarını güncelle"""
@@ -308,14 +561,9 @@ class WaypointPanel(QWidget):
         # Toplam mesafe hesapla
         total_distance = 0
         if count > 1:
-            for i in range(1, count):
-                prev_wp = self.waypoints[i - 1]
-                curr_wp = self.waypoints[i]
-                distance = self._calculate_distance(
-                    prev_wp['latitude'], prev_wp['longitude'],
-                    curr_wp['latitude'], curr_wp['longitude']
-                )
-                total_distance += distance
+            from src.core.utils import track_length
+            total_distance = track_length([wp['latitude'] for wp in self.waypoints],
+                                          [wp['longitude'] for wp in self.waypoints])
 
         # Tahmini süre (15 m/s ortalama hızla)
         flight_time = (total_distance / 15 / 60) if total_distance > 0 else 0  # dakika
@@ -325,19 +573,3 @@ class WaypointPanel(QWidget):
         self.stats_label.setText(
             f"📊 Görev: {count} waypoint, {total_distance / 1000:.1f} km, ~{total_time:.0f} dk"
         )
-
-    def _calculate_distance(self, lat1, lon1, lat2, lon2):
-        """İki nokta arası mesafe (Haversine formülü - metre)"""
-        import math
-
-        R = 6371000  # Dünya yarıçapı (metre)
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        a = (math.sin(delta_phi / 2) ** 2 +
-             math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
\ No newline at end of file
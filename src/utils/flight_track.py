@@ -0,0 +1,175 @@
+# src/utils/flight_track.py
+"""
+Tüm uçuş izini kompakt dizilerde tutan ve zoom seviyesine göre
+Douglas-Peucker ile artımlı sadeleştiren yapı
+
+İz sabit boyutlu parçalar (chunk) halinde sadeleştirilir: her zoom
+seviyesi için kesinleşmiş (committed) nokta indeksleri ve henüz
+sadeleştirilmemiş kısa bir kuyruk tutulur. Böylece yeni nokta başına
+maliyet, izin toplam uzunluğundan bağımsızdır.
+"""
+
+import math
+from array import array
+from typing import List, Optional
+
+from ..core.geodesy import local_xy
+
+# Web Mercator'da ekvatorda zoom 0 için piksel başına metre
+METERS_PER_PIXEL_Z0 = 156543.03392
+
+
+def douglas_peucker(lats, lons, start: int, end: int, tolerance_m: float) -> List[int]:
+    """[start, end] aralığını sadeleştir, korunan indeksleri sıralı döndür"""
+    if end - start < 2:
+        return list(range(start, end + 1))
+
+    lat0, lon0 = lats[start], lons[start]
+    cos_lat0 = math.cos(math.radians(lat0))
+    xs = []
+    ys = []
+    for i in range(start, end + 1):
+        x, y = local_xy(lats[i], lons[i], lat0, lon0, cos_lat0)
+        xs.append(x)
+        ys.append(y)
+
+    keep = [False] * (end - start + 1)
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance_m * tolerance_m
+    stack = [(0, end - start)]
+
+    while stack:
+        first, last = stack.pop()
+        ax, ay = xs[first], ys[first]
+        dx, dy = xs[last] - ax, ys[last] - ay
+        length_sq = dx * dx + dy * dy
+
+        max_dist_sq = -1.0
+        max_index = first
+        for i in range(first + 1, last):
+            px, py = xs[i] - ax, ys[i] - ay
+            if length_sq > 0:
+                t = (px * dx + py * dy) / length_sq
+                t = 0.0 if t < 0 else (1.0 if t > 1 else t)
+                ex, ey = px - t * dx, py - t * dy
+            else:
+                ex, ey = px, py
+            dist_sq = ex * ex + ey * ey
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                max_index = i
+
+        if max_dist_sq > tolerance_sq:
+            keep[max_index] = True
+            stack.append((first, max_index))
+            stack.append((max_index, last))
+
+    return [start + i for i, kept in enumerate(keep) if kept]
+
+
+def zoom_tolerance_m(zoom: int, latitude: float = 0.0, pixels: float = 1.0) -> float:
+    """Verilen zoom seviyesinde `pixels` piksele karşılık gelen metre"""
+    return pixels * METERS_PER_PIXEL_Z0 * math.cos(math.radians(latitude)) / (2 ** zoom)
+
+
+class _LevelOfDetail:
+    """Tek bir zoom seviyesi için artımlı sadeleştirme durumu"""
+
+    __slots__ = ('zoom', 'tolerance_m', 'committed', 'tail_start')
+
+    def __init__(self, zoom: int, tolerance_m: float):
+        self.zoom = zoom
+        self.tolerance_m = tolerance_m
+        self.committed = array('l')  # Kesinleşmiş nokta indeksleri
+        self.tail_start = 0  # Henüz sadeleştirilmemiş kuyruğun başlangıcı
+
+
+class FlightTrack:
+    """Tüm uçuş izi (kompakt) + zoom bağımlı sadeleştirilmiş görünümler"""
+
+    def __init__(self, min_spacing_m: float = 2.0, chunk_size: int = 256,
+                 min_zoom: int = 10, max_zoom: int = 18, tolerance_px: float = 1.0):
+        self.min_spacing_m = min_spacing_m
+        self.chunk_size = max(chunk_size, 3)
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.tolerance_px = tolerance_px
+
+        self.lats = array('d')
+        self.lons = array('d')
+        self._levels = {}
+        self.generation = 0  # clear() sonrası artar; MapWidget izin silindiğini buradan anlar
+
+    def __len__(self):
+        return len(self.lats)
+
+    def clear(self):
+        """İzi tamamen temizle"""
+        self.lats = array('d')
+        self.lons = array('d')
+        self._levels = {}
+        self.generation += 1
+
+    def is_significant(self, lat: float, lon: float) -> bool:
+        """Son noktaya uzaklık min_spacing_m'den büyük mü (metre)"""
+        if not self.lats:
+            return True
+        lat0, lon0 = self.lats[-1], self.lons[-1]
+        x, y = local_xy(lat, lon, lat0, lon0)
+        return x * x + y * y >= self.min_spacing_m * self.min_spacing_m
+
+    def add(self, lat: float, lon: float) -> bool:
+        """Nokta ekle; çok yakınsa atla. Eklendiyse True döner"""
+        if not self.is_significant(lat, lon):
+            return False
+
+        if not self.lats:
+            # Tolerans enlem bağımlı: ilk noktada hesapla
+            self._levels = {
+                zoom: _LevelOfDetail(zoom, zoom_tolerance_m(zoom, lat, self.tolerance_px))
+                for zoom in range(self.min_zoom, self.max_zoom + 1)
+            }
+
+        self.lats.append(lat)
+        self.lons.append(lon)
+
+        last = len(self.lats) - 1
+        for level in self._levels.values():
+            if last - level.tail_start + 1 >= self.chunk_size:
+                self._commit(level, last)
+        return True
+
+    def _commit(self, level: _LevelOfDetail, end: int):
+        """Kuyruğu sadeleştir ve son nokta hariç kesinleştir"""
+        kept = douglas_peucker(self.lats, self.lons, level.tail_start, end, level.tolerance_m)
+        level.committed.extend(kept[:-1])
+        level.tail_start = kept[-1]
+
+    def level_zoom(self, zoom: float) -> int:
+        """Harita zoom'unu desteklenen seviye aralığına sıkıştır"""
+        return int(min(max(round(zoom), self.min_zoom), self.max_zoom))
+
+    def committed_count(self, zoom: float) -> int:
+        level = self._levels.get(self.level_zoom(zoom))
+        return len(level.committed) if level else 0
+
+    def tail_start(self, zoom: float) -> int:
+        level = self._levels.get(self.level_zoom(zoom))
+        return level.tail_start if level else 0
+
+    def committed_points(self, zoom: float, start: int = 0) -> List[List[float]]:
+        """Kesinleşmiş sadeleştirilmiş noktalar ([start:] dilimi)"""
+        level = self._levels.get(self.level_zoom(zoom))
+        if not level:
+            return []
+        lats, lons = self.lats, self.lons
+        return [[lats[i], lons[i]] for i in level.committed[start:]]
+
+    def points(self, start: int = 0, end: Optional[int] = None) -> List[List[float]]:
+        """Ham noktalar ([start:end] dilimi)"""
+        end = len(self.lats) if end is None else end
+        return [[self.lats[i], self.lons[i]] for i in range(start, end)]
+
+    def simplified(self, zoom: float) -> List[List[float]]:
+        """Verilen zoom için tüm iz: kesinleşmiş kısım + ham kuyruk"""
+        return self.committed_points(zoom) + self.points(self.tail_start(zoom))
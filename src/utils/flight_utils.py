@@ -4,17 +4,30 @@
 """
 
 import json
-import pandas as pd
+import os
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from ..telemetry.data_models import TelemetryPacket
+from ..services.alerts import CompiledRuleSet
+from ..services.alert_writer import AlertWriter
+from ..services.geofence import GeofenceEngine, ALERT_PREFIX as GEOFENCE_ALERT_PREFIX
+from ..services.mission_tracker import ROUTE_ALERT_TYPE
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rapor içeriği değiştiğinde artırılır; eski önbellek dosyaları kullanılmaz
+REPORT_SCHEMA_VERSION = 2
 
 
 class FlightDataLogger:
     """Uçuş veri kayıt ve analiz sınıfı"""
 
-    def __init__(self, database_manager):
+    def __init__(self, database_manager, cache_dir=None):
         self.db_manager = database_manager
+        self.cache_dir = cache_dir  # None: veritabanının yanındaki <ad>_reports/
 
     def save_telemetry(self, packet: TelemetryPacket) -> bool:
         """Telemetri verisini kaydet"""
@@ -29,157 +42,204 @@ class FlightDataLogger:
         else:
             return self.db_manager.get_latest_telemetry()
 
-    def generate_flight_report(self, session_id: int) -> Dict:
-        """Uçuş raporu oluştur"""
+    def generate_flight_report(self, session_id: int, use_cache: bool = True) -> Dict:
+        """Uçuş raporu oluştur
+
+        İstatistikler SQL'de hesaplanır; tamamlanmış (COMPLETED) oturumların
+        raporları diskte önbelleklenir ve yeniden açılışta doğrudan okunur.
+        """
         if not self.db_manager:
             return {}
 
-        # Oturum bilgilerini al
-        sessions = self.db_manager.get_flight_sessions()
-        session_info = next((s for s in sessions if s['id'] == session_id), None)
-
+        session_info = self.db_manager.get_flight_session(session_id)
         if not session_info:
             return {"error": "Oturum bulunamadı"}
 
-        # Telemetri verilerini al
-        telemetry_data = self.db_manager.get_session_telemetry(session_id)
+        cache_path = self._report_cache_path(session_id) \
+            if use_cache and session_info['status'] == 'COMPLETED' else None
+        if cache_path:
+            cached = self._read_cached_report(cache_path)
+            if cached is not None:
+                return cached
 
-        if not telemetry_data:
+        stats = self.db_manager.get_session_report_stats(session_id)
+        if not stats['total_records']:
             return {"error": "Telemetri verisi bulunamadı"}
 
-        # İstatistikleri hesapla
-        altitudes = [d['altitude'] for d in telemetry_data if d['altitude']]
-        velocities = [d['velocity'] for d in telemetry_data if d['velocity']]
-        batteries = [d['battery_percent'] for d in telemetry_data if d['battery_percent']]
+        from ..core.utils import track_length
+
+        lats, lons = self.db_manager.get_session_track(session_id)
+        altitude = stats['fields']['altitude']
+        velocity = stats['fields']['velocity']
+        battery_start = stats['battery_start'] or 0
+        battery_end = stats['battery_end'] or 0
 
         report = {
+            'schema_version': REPORT_SCHEMA_VERSION,
             'session_info': session_info,
             'statistics': {
-                'total_records': len(telemetry_data),
-                'max_altitude': max(altitudes) if altitudes else 0,
-                'min_altitude': min(altitudes) if altitudes else 0,
-                'avg_altitude': sum(altitudes) / len(altitudes) if altitudes else 0,
-                'max_velocity': max(velocities) if velocities else 0,
-                'avg_velocity': sum(velocities) / len(velocities) if velocities else 0,
-                'battery_start': batteries[0] if batteries else 0,
-                'battery_end': batteries[-1] if batteries else 0,
-                'battery_consumed': batteries[0] - batteries[-1] if len(batteries) > 1 else 0
+                'total_records': stats['total_records'],
+                'max_altitude': altitude['max'] or 0,
+                'min_altitude': altitude['min'] or 0,
+                'avg_altitude': altitude['avg'] or 0,
+                'max_velocity': velocity['max'] or 0,
+                'avg_velocity': velocity['avg'] or 0,
+                'battery_start': battery_start,
+                'battery_end': battery_end,
+                'battery_consumed': battery_start - battery_end,
+                'total_distance': track_length(lats, lons),
+                'percentiles': {field: values['percentiles']
+                                for field, values in stats['fields'].items()},
+                'histograms': {field: values['histogram']
+                               for field, values in stats['fields'].items()}
             },
-            'flight_path': [(d['latitude'], d['longitude']) for d in telemetry_data]
+            'flight_path': list(zip(lats, lons))
         }
 
+        if cache_path:
+            self._write_cached_report(cache_path, report)
         return report
 
+    def _report_cache_path(self, session_id: int) -> Optional[Path]:
+        """Önbellek dosyası: <veritabanı>_reports/session_<id>_v<şema>.json"""
+        if self.cache_dir is None:
+            db_path = getattr(self.db_manager, 'db_path', None)
+            if db_path is None:
+                return None
+            self.cache_dir = Path(db_path).parent / f"{Path(db_path).stem}_reports"
+        return Path(self.cache_dir) / f"session_{session_id}_v{REPORT_SCHEMA_VERSION}.json"
+
+    @staticmethod
+    def _read_cached_report(path: Path) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Rapor önbelleği okunamadı (%s): %s", path, e)
+            return None
+
+        info = report['session_info']
+        for key in ('start_time', 'end_time'):
+            if info.get(key):
+                info[key] = datetime.fromisoformat(info[key])
+        report['flight_path'] = [tuple(point) for point in report['flight_path']]
+        return report
+
+    @staticmethod
+    def _write_cached_report(path: Path, report: Dict):
+        """Raporu atomik olarak yaz (yarım dosya okunmasın)"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False,
+                          default=lambda value: value.isoformat())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Rapor önbelleğe yazılamadı (%s): %s", path, e)
+
 
 class AlertManager:
     """Alarm ve uyarı yönetimi sınıfı"""
 
-    def __init__(self, database_manager):
+    def __init__(self, database_manager, rules=None, writer=None, geofences=None, tracker=None):
         self.db_manager = database_manager
         self.active_alerts = {}
 
-        # Alarm eşikleri
-        self.thresholds = {
-            'battery_critical': 15.0,
-            'battery_warning': 30.0,
-            'altitude_max': 400.0,
-            'altitude_min': 5.0,
-            'velocity_max': 30.0,
-            'gps_satellites_min': 6
-        }
+        # Alarm kuralları (AlarmPanel ile ortak, bir kez derlenir)
+        self.rule_set = rules if isinstance(rules, CompiledRuleSet) else CompiledRuleSet(rules)
 
-    def check_battery_levels(self, packet: TelemetryPacket) -> List[Dict]:
-        """Batarya seviyelerini kontrol et"""
-        alerts = []
-        battery = packet.battery_percent
-
-        if battery <= self.thresholds['battery_critical']:
-            alert = {
-                'type': 'BATTERY_CRITICAL',
-                'severity': 'CRITICAL',
-                'message': f'KRİTİK BATARYA! {battery:.1f}% - Acil iniş gerekli!',
-                'value': battery
-            }
-            alerts.append(alert)
-            self._log_alert(alert)
+        # Coğrafi sınırlar (GeofenceEngine veya Geofence listesi)
+        if geofences is not None and not isinstance(geofences, GeofenceEngine):
+            geofences = GeofenceEngine(geofences)
+        self.geofences = geofences
 
-        elif battery <= self.thresholds['battery_warning']:
-            alert = {
-                'type': 'BATTERY_LOW',
-                'severity': 'WARNING',
-                'message': f'Düşük batarya: {battery:.1f}% - İnişe hazır olun',
-                'value': battery
-            }
-            alerts.append(alert)
-            self._log_alert(alert)
+        # Görev rotası takibi (MissionTracker; görev başlayınca atanır)
+        self.tracker = tracker
 
-        return alerts
+        # Kayıtlar arka planda, tekrarlar birleştirilerek yazılır
+        if writer is None and database_manager:
+            writer = AlertWriter(database_manager)
+        self.writer = writer
 
-    def check_gps_quality(self, packet: TelemetryPacket) -> List[Dict]:
-        """GPS kalitesini kontrol et"""
-        alerts = []
-        gps = packet.gps
-
-        if gps.satellites < self.thresholds['gps_satellites_min']:
-            alert = {
-                'type': 'GPS_POOR',
-                'severity': 'WARNING',
-                'message': f'Zayıf GPS sinyali: {gps.satellites} uydu (Min: {self.thresholds["gps_satellites_min"]})',
-                'value': gps.satellites
-            }
-            alerts.append(alert)
-            self._log_alert(alert)
+    @property
+    def thresholds(self) -> Dict[str, float]:
+        """Kural tipi -> eşik (kurallardan türetilir, salt okunur kopya)
 
-        if gps.fix_quality < 3:
-            alert = {
-                'type': 'GPS_FIX_LOST',
-                'severity': 'CRITICAL',
-                'message': f'GPS kilidi kayboldu! Fix kalitesi: {gps.fix_quality}',
-                'value': gps.fix_quality
-            }
-            alerts.append(alert)
-            self._log_alert(alert)
+        Eşikler AlertConfig.thresholds veya kural dosyasıyla değiştirilir;
+        bu sözlüğü değiştirmek değerlendirmeyi etkilemez.
+        """
+        return {rule.type: rule.threshold for rule in self.rule_set.rules}
+
+    def _check(self, packet: TelemetryPacket, categories) -> List[Dict]:
+        """Kuralları değerlendir; tetiklenenleri kaydet, temizlenenleri çöz"""
+        alerts = []
+        for rule, (raised, cleared, value) in zip(self.rule_set.rules,
+                                                  self.rule_set.evaluate_raw(packet)):
+            if categories and rule.category not in categories:
+                continue
+
+            if raised:
+                alert = rule.make_alert(value, packet.timestamp)
+                alerts.append(alert)
+                self.active_alerts[rule.type] = alert
+                self._log_alert(alert)
+            elif cleared and self.active_alerts.pop(rule.type, None):
+                self._resolve_alert(rule.type, packet.timestamp)
 
         return alerts
 
-    def check_flight_envelope(self, packet: TelemetryPacket) -> List[Dict]:
-        """Uçuş zarfını kontrol et (rakım, hız vb.)"""
-        alerts = []
+    def check_all(self, packet: TelemetryPacket) -> List[Dict]:
+        """Tüm kuralları, coğrafi sınırları ve görev rotasını kontrol et"""
+        return self._check(packet, None) + self.check_geofences(packet) + self.check_route(packet)
 
-        # Rakım kontrolleri
-        if packet.gps.altitude > self.thresholds['altitude_max']:
-            alert = {
-                'type': 'ALTITUDE_HIGH',
-                'severity': 'WARNING',
-                'message': f'Yüksek rakım: {packet.gps.altitude:.1f}m (Max: {self.thresholds["altitude_max"]}m)',
-                'value': packet.gps.altitude
-            }
-            alerts.append(alert)
-            self._log_alert(alert)
+    def check_geofences(self, packet: TelemetryPacket) -> List[Dict]:
+        """Coğrafi sınır ihlallerini kontrol et"""
+        if not self.geofences:
+            return []
 
-        elif packet.gps.altitude < self.thresholds['altitude_min']:
-            alert = {
-                'type': 'ALTITUDE_LOW',
-                'severity': 'WARNING',
-                'message': f'Düşük rakım: {packet.gps.altitude:.1f}m - Çarpma riski!',
-                'value': packet.gps.altitude
-            }
-            alerts.append(alert)
+        alerts = self.geofences.check_packet(packet)
+        current = set()
+        for alert in alerts:
+            current.add(alert['type'])
+            self.active_alerts[alert['type']] = alert
             self._log_alert(alert)
 
-        # Hız kontrolü
-        if packet.velocity > self.thresholds['velocity_max']:
-            alert = {
-                'type': 'VELOCITY_HIGH',
-                'severity': 'WARNING',
-                'message': f'Yüksek hız: {packet.velocity:.1f} m/s (Max: {self.thresholds["velocity_max"]} m/s)',
-                'value': packet.velocity
-            }
-            alerts.append(alert)
-            self._log_alert(alert)
+        # Artık ihlal edilmeyen sınırların kayıtlarını kapat
+        for alert_type in [t for t in self.active_alerts
+                           if t.startswith(GEOFENCE_ALERT_PREFIX) and t not in current]:
+            del self.active_alerts[alert_type]
+            self._resolve_alert(alert_type, packet.timestamp)
 
         return alerts
 
+    def check_route(self, packet: TelemetryPacket) -> List[Dict]:
+        """Görev rotasından sapmayı kontrol et"""
+        if not self.tracker:
+            return []
+
+        alerts = self.tracker.check_packet(packet)
+        if alerts:
+            self.active_alerts[ROUTE_ALERT_TYPE] = alerts[0]
+            self._log_alert(alerts[0])
+        elif self.active_alerts.pop(ROUTE_ALERT_TYPE, None):
+            self._resolve_alert(ROUTE_ALERT_TYPE, packet.timestamp)
+        return alerts
+
+    def check_battery_levels(self, packet: TelemetryPacket) -> List[Dict]:
+        """Batarya seviyelerini kontrol et"""
+        return self._check(packet, ('battery',))
+
+    def check_gps_quality(self, packet: TelemetryPacket) -> List[Dict]:
+        """GPS kalitesini kontrol et"""
+        return self._check(packet, ('gps',))
+
+    def check_flight_envelope(self, packet: TelemetryPacket) -> List[Dict]:
+        """Uçuş zarfını kontrol et (rakım, hız vb.)"""
+        return self._check(packet, ('envelope',))
+
     def trigger_emergency_alerts(self, alert_type: str, message: str):
         """Acil durum alarmı tetikle"""
         alert = {
@@ -190,29 +250,29 @@ class AlertManager:
         }
 
         self._log_alert(alert)
-        print(f"🚨 {alert['message']}")
+        logger.critical("%s", alert['message'], extra={'alert_type': alert['type']})
 
         return alert
 
     def _log_alert(self, alert: Dict):
-        """Alarmı veritabanına kaydet"""
-        if not self.db_manager or not self.db_manager.current_session_id:
+        """Alarmı kayıt kuyruğuna at (çağıranı bloklamaz)"""
+        if not self.writer or not self.db_manager.current_session_id:
             return
+        self.writer.submit(alert)
 
-        try:
-            from ..database.models import AlertLog
+    def _resolve_alert(self, alert_type: str, timestamp: datetime = None):
+        """Temizlenen alarmın kaydını kapat"""
+        if self.writer and self.db_manager.current_session_id:
+            self.writer.resolve(alert_type, timestamp=timestamp)
 
-            with self.db_manager.get_session() as session:
-                alert_log = AlertLog(
-                    session_id=self.db_manager.current_session_id,
-                    alert_type=alert['type'],
-                    severity=alert['severity'],
-                    message=alert['message']
-                )
-                session.add(alert_log)
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Bekleyen alarm kayıtlarını yaz"""
+        return self.writer.flush(timeout) if self.writer else True
 
-        except Exception as e:
-            print(f"Alarm kayıt hatası: {e}")
+    def close(self):
+        """Kalan kayıtları yaz ve yazıcıyı durdur"""
+        if self.writer:
+            self.writer.stop()
 
 
 class WaypointManager:
@@ -241,53 +301,164 @@ class WaypointManager:
 
         self.waypoints.append(waypoint)
 
-        # Veritabanına kaydet
+        # Veritabanına kaydet (aynı sıradaki eski kayıt varsa güncellenir)
         if self.db_manager:
             try:
-                from ..database.models import Waypoint
+                self.db_manager.save_mission(self.current_mission, [waypoint], replace=False)
+                logger.debug("Waypoint kaydedildi: %.5f, %.5f", lat, lon)
+            except Exception as e:
+                logger.error("Waypoint kayıt hatası: %s", e)
+                return False
+
+        return True
 
-                with self.db_manager.get_session() as session:
-                    wp = Waypoint(**waypoint)
-                    session.add(wp)
-                    print(f"✅ Waypoint eklendi: {lat:.5f}, {lon:.5f}")
-                    return True
+    def add_waypoints(self, waypoints: List[Dict]) -> bool:
+        """Birden fazla waypoint'i sona ekle ve tek işlemde kaydet
 
+        Her öğe latitude, longitude, altitude ve isteğe bağlı action_type,
+        hold_time anahtarlarını taşır.
+        """
+        if not self.current_mission:
+            self.current_mission = f"Mission_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        added = [{
+            'mission_name': self.current_mission,
+            'order_index': len(self.waypoints) + i,
+            'latitude': wp['latitude'],
+            'longitude': wp['longitude'],
+            'altitude': wp['altitude'],
+            'action_type': wp.get('action_type', 'FLY_TO'),
+            'hold_time': wp.get('hold_time', 0)
+        } for i, wp in enumerate(waypoints)]
+        self.waypoints.extend(added)
+
+        if self.db_manager and added:
+            try:
+                self.db_manager.save_mission(self.current_mission, added, replace=False)
             except Exception as e:
-                print(f"Waypoint kayıt hatası: {e}")
+                logger.error("Waypoint kayıt hatası: %s", e)
                 return False
+        return True
+
+    def save_mission(self, mission_name: str = None) -> bool:
+        """Görevi veritabanına bütünüyle yaz (verilirse yeni adla)
+
+        Kayıtlı görev listeyle birebir aynı olur; fazla eski noktalar silinir.
+        """
+        if mission_name:
+            self.current_mission = mission_name
+        if not self.current_mission:
+            return False
+        for index, waypoint in enumerate(self.waypoints):
+            waypoint['mission_name'] = self.current_mission
+            waypoint['order_index'] = index
 
+        if not self.db_manager:
+            return True
+        try:
+            self.db_manager.save_mission(self.current_mission, self.waypoints)
+            logger.info("Görev kaydedildi: %s (%d waypoint)", self.current_mission, len(self.waypoints))
+            return True
+        except Exception as e:
+            logger.error("Görev kayıt hatası: %s", e)
+            return False
+
+    def load_mission(self, mission_name: str) -> bool:
+        """Kayıtlı görevi yükle (mevcut liste değiştirilir)"""
+        if not self.db_manager:
+            return False
+        try:
+            waypoints = self.db_manager.load_mission(mission_name)
+        except Exception as e:
+            logger.error("Görev yükleme hatası: %s", e)
+            return False
+        if not waypoints:
+            logger.warning("Görev bulunamadı: %s", mission_name)
+            return False
+
+        self.current_mission = mission_name
+        self.waypoints = [{
+            'mission_name': mission_name,
+            'order_index': index,
+            'latitude': wp['latitude'],
+            'longitude': wp['longitude'],
+            'altitude': wp['altitude'],
+            'action_type': wp['action_type'],
+            'hold_time': wp['hold_time']
+        } for index, wp in enumerate(waypoints)]
+        logger.info("Görev yüklendi: %s (%d waypoint)", mission_name, len(self.waypoints))
         return True
 
+    def delete_mission(self, mission_name: str = None) -> bool:
+        """Görevi veritabanından sil (varsayılan: mevcut görev, liste de temizlenir)"""
+        mission_name = mission_name or self.current_mission
+        if not mission_name:
+            return False
+        if mission_name == self.current_mission:
+            self.clear_mission()
+        if not self.db_manager:
+            return True
+        try:
+            self.db_manager.delete_mission(mission_name)
+            return True
+        except Exception as e:
+            logger.error("Görev silme hatası: %s", e)
+            return False
+
+    def add_survey_grid(self, polygon: List[Tuple[float, float]], altitude: float,
+                        footprint: Tuple[float, float] = None, front_overlap: float = 0.75,
+                        side_overlap: float = 0.65, angle_deg: float = 0.0) -> int:
+        """Çokgeni tarayan ızgara noktalarını (PHOTO) sona ekle; eklenen nokta sayısı
+
+        footprint verilmezse varsayılan kameranın bu yükseklikteki izdüşümü kullanılır.
+        """
+        from .survey_grid import camera_footprint, grid_waypoints, survey_grid
+
+        lats, lons = survey_grid(polygon, footprint or camera_footprint(altitude),
+                                 front_overlap, side_overlap, angle_deg)
+        if not self.add_waypoints(grid_waypoints(lats, lons, altitude)):
+            return 0
+        logger.info("Tarama ızgarası eklendi: %d nokta", len(lats))
+        return len(lats)
+
+    def import_mission(self, path: str, mission_name: str = None) -> bool:
+        """QGroundControl .plan veya MAVLink WPL dosyasını görev olarak yükle ve kaydet"""
+        from ..services.mission_files import read_mission
+
+        try:
+            waypoints = list(read_mission(path))
+        except (OSError, ValueError, KeyError) as e:
+            logger.error("Görev dosyası okunamadı: %s", e)
+            return False
+
+        self.current_mission = mission_name or Path(path).stem
+        self.waypoints = [dict(wp, mission_name=self.current_mission, order_index=index)
+                          for index, wp in enumerate(waypoints)]
+        return self.save_mission()
+
+    def export_mission(self, path: str) -> int:
+        """Görevi uzantıya göre .plan veya WPL dosyasına yaz; yazılan öğe sayısı"""
+        from ..services.mission_files import write_mission
+
+        return write_mission(path, self.waypoints)
+
     def calculate_route(self) -> Dict:
         """Rota hesapla"""
         if len(self.waypoints) < 2:
             return {"error": "En az 2 waypoint gerekli"}
 
-        total_distance = 0.0
-        route_segments = []
-
-        for i in range(1, len(self.waypoints)):
-            prev_wp = self.waypoints[i - 1]
-            curr_wp = self.waypoints[i]
+        from ..core.utils import haversine, initial_bearing
 
-            # Mesafe hesapla (Haversine formülü kullanabilir)
-            distance = self._calculate_distance(
-                prev_wp['latitude'], prev_wp['longitude'],
-                curr_wp['latitude'], curr_wp['longitude']
-            )
+        lats = [wp['latitude'] for wp in self.waypoints]
+        lons = [wp['longitude'] for wp in self.waypoints]
+        distances = haversine(lats[:-1], lons[:-1], lats[1:], lons[1:]).tolist()
+        bearings = initial_bearing(lats[:-1], lons[:-1], lats[1:], lons[1:]).tolist()
+        total_distance = sum(distances)
 
-            total_distance += distance
-
-            segment = {
-                'from': f"WP{i - 1}",
-                'to': f"WP{i}",
-                'distance': distance,
-                'bearing': self._calculate_bearing(
-                    prev_wp['latitude'], prev_wp['longitude'],
-                    curr_wp['latitude'], curr_wp['longitude']
-                )
-            }
-            route_segments.append(segment)
+        route_segments = [
+            {'from': f"WP{i}", 'to': f"WP{i + 1}", 'distance': distance, 'bearing': bearing}
+            for i, (distance, bearing) in enumerate(zip(distances, bearings))
+        ]
 
         return {
             'total_distance': total_distance,
@@ -296,6 +467,73 @@ class WaypointManager:
             'mission_name': self.current_mission
         }
 
+    def optimize_route(self, time_budget_s: float = 1.0, average_speed: float = 15.0,
+                       apply: bool = True) -> Dict:
+        """Ara noktaların sırasını en kısa rotaya göre yeniden düzenle
+
+        TAKEOFF noktaları başta, LAND noktaları sonda (kendi sıralarıyla)
+        sabit kalır; TAKEOFF yoksa ilk nokta başlangıç kabul edilir. Diğer
+        noktalar en yakın komşu + 2-opt/Or-opt ile süre bütçesi içinde
+        sıralanır. apply=True ise yeni sıra görev listesine ve veritabanına
+        yazılır.
+        """
+        if len(self.waypoints) < 3:
+            return {"error": "En az 3 waypoint gerekli"}
+
+        from .route_optimizer import distance_matrix, optimize_order
+
+        started = time.perf_counter()
+        takeoff = [i for i, wp in enumerate(self.waypoints) if wp['action_type'] == 'TAKEOFF']
+        land = [i for i, wp in enumerate(self.waypoints)
+                if wp['action_type'] == 'LAND' and i not in takeoff]
+        head = takeoff or [0]
+        anchored = set(head) | set(land)
+        free = [i for i in range(len(self.waypoints)) if i not in anchored]
+
+        # Alt problem: son kalkış noktası + serbest noktalar (+ ilk iniş noktası)
+        nodes = [head[-1]] + free + land[:1]
+        matrix = distance_matrix([self.waypoints[i]['latitude'] for i in nodes],
+                                 [self.waypoints[i]['longitude'] for i in nodes])
+        budget = max(0.0, time_budget_s - (time.perf_counter() - started))
+        result = optimize_order(matrix, start=0, end=len(nodes) - 1 if land else None,
+                                time_budget_s=budget)
+
+        order = head[:-1] + [nodes[k] for k in result['order']] + land[1:]
+        original_distance = self._route_distance(range(len(self.waypoints)))
+        optimized_distance = self._route_distance(order)
+        if optimized_distance >= original_distance:
+            order, optimized_distance = list(range(len(self.waypoints))), original_distance
+
+        saved = original_distance - optimized_distance
+        report = {
+            'mission_name': self.current_mission,
+            'total_waypoints': len(self.waypoints),
+            'order': order,
+            'original_distance': original_distance,
+            'optimized_distance': optimized_distance,
+            'distance_saved': saved,
+            'time_saved_min': saved / average_speed / 60,
+            'passes': result['passes'],
+            'converged': result['converged'],
+            'elapsed_s': time.perf_counter() - started,
+            'applied': False
+        }
+        if apply and saved > 0:
+            report['applied'] = self._apply_order(order)
+        return report
+
+    def _route_distance(self, order) -> float:
+        from ..core.utils import haversine
+
+        lats = [self.waypoints[i]['latitude'] for i in order]
+        lons = [self.waypoints[i]['longitude'] for i in order]
+        return float(haversine(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum())
+
+    def _apply_order(self, order: List[int]) -> bool:
+        """Yeni sırayı listeye ve veritabanına yaz"""
+        self.waypoints = [self.waypoints[i] for i in order]
+        return self.save_mission()
+
     def estimate_flight_time(self, average_speed: float = 15.0) -> float:
         """Tahmini uçuş süresi hesapla (dakika)"""
         route = self.calculate_route()
@@ -320,40 +558,4 @@ class WaypointManager:
         """Mevcut görev planını temizle"""
         self.waypoints.clear()
         self.current_mission = None
-        print("✅ Görev planı temizlendi")
-
-    def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """İki nokta arası mesafe hesapla (Haversine formülü - metre)"""
-        import math
-
-        R = 6371000  # Dünya yarıçapı (metre)
-
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        a = (math.sin(delta_phi / 2) ** 2 +
-             math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        distance = R * c
-        return distance
-
-    def _calculate_bearing(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """İki nokta arası yön açısı hesapla (derece)"""
-        import math
-
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-        delta_lon = lon2 - lon1
-
-        y = math.sin(delta_lon) * math.cos(lat2)
-        x = (math.cos(lat1) * math.sin(lat2) -
-             math.sin(lat1) * math.cos(lat2) * math.cos(delta_lon))
-
-        bearing = math.atan2(y, x)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360  # 0-360 derece arası
-
-        return bearing
\ No newline at end of file
+        logger.debug("Görev planı temizlendi")
@@ -0,0 +1,186 @@
+# src/utils/rolling_stats.py
+"""
+Telemetri serileri için O(1) kayan istatistikler
+
+Min/max monoton kuyruklarla, ortalama ve varyans Welford yöntemiyle
+(ekleme ve çıkarma) tutulur. Pencere verilmezse tüm uçuş boyunca
+kümülatif istatistik hesaplanır.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+
+class RollingStats:
+    """Tek bir seri için kayan (veya kümülatif) istatistik"""
+
+    def __init__(self, window: Optional[int] = None):
+        if window is not None and window < 1:
+            raise ValueError("Pencere boyutu en az 1 olmalı")
+
+        self.window = window
+        self.clear()
+
+    def clear(self):
+        """Tüm istatistikleri sıfırla"""
+        self.count = 0
+        self.last = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._index = 0  # Şimdiye kadar eklenen örnek sayısı
+
+        if self.window is None:
+            # Kümülatif mod: min/max için tek değer yeterli
+            self._min = None
+            self._max = None
+        else:
+            # Pencereli mod: değerler ve (index, değer) monoton kuyrukları
+            self._values = deque()
+            self._min_queue = deque()  # Artan sıralı
+            self._max_queue = deque()  # Azalan sıralı
+
+    def add(self, value: Optional[float]):
+        """Yeni örnek ekle (None değerler yok sayılır)"""
+        if value is None:
+            return
+
+        value = float(value)
+        self.last = value
+
+        if self.window is None:
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+        else:
+            index = self._index
+
+            # Monoton kuyrukları güncelle
+            min_queue = self._min_queue
+            while min_queue and min_queue[-1][1] >= value:
+                min_queue.pop()
+            min_queue.append((index, value))
+
+            max_queue = self._max_queue
+            while max_queue and max_queue[-1][1] <= value:
+                max_queue.pop()
+            max_queue.append((index, value))
+
+            self._values.append(value)
+
+            # Pencere dolduysa en eski değeri çıkar
+            if len(self._values) > self.window:
+                self._remove(self._values.popleft())
+
+            # Pencere dışına düşen uçları temizle
+            oldest = index - self.window
+            if min_queue[0][0] <= oldest:
+                min_queue.popleft()
+            if max_queue[0][0] <= oldest:
+                max_queue.popleft()
+
+        self._index += 1
+
+        # Welford ekleme
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    def extend(self, values: Iterable[Optional[float]]):
+        """Birden fazla örnek ekle"""
+        for value in values:
+            self.add(value)
+
+    def _remove(self, value: float):
+        """Welford çıkarma (pencereden düşen örnek için)"""
+        if self.count <= 1:
+            self.count = 0
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+
+        self.count -= 1
+        delta = value - self._mean
+        self._mean -= delta / self.count
+        self._m2 -= delta * (value - self._mean)
+        if self._m2 < 0:
+            self._m2 = 0.0  # Kayan nokta birikim hatasına karşı
+
+    @property
+    def min(self) -> Optional[float]:
+        if self.window is None:
+            return self._min
+        return self._min_queue[0][1] if self._min_queue else None
+
+    @property
+    def max(self) -> Optional[float]:
+        if self.window is None:
+            return self._max
+        return self._max_queue[0][1] if self._max_queue else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self.count else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Örneklem varyansı (n-1)"""
+        if self.count < 2:
+            return 0.0 if self.count else None
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def to_dict(self) -> Dict:
+        """İstatistikleri dict olarak döndür"""
+        return {
+            'count': self.count,
+            'last': self.last,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean,
+            'std': self.std
+        }
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return (f"<RollingStats(window={self.window}, count={self.count}, "
+                f"min={self.min}, max={self.max}, mean={self.mean})>")
+
+
+class TelemetryStats:
+    """Telemetri paketlerinden alan bazlı kayan istatistikler"""
+
+    FIELDS = {
+        'altitude': lambda p: p.gps.altitude,
+        'velocity': lambda p: p.velocity,
+        'battery_percent': lambda p: p.battery_percent,
+        'battery_voltage': lambda p: p.battery_voltage,
+    }
+
+    def __init__(self, window: Optional[int] = None, fields: Iterable[str] = None):
+        self.window = window
+        names = list(fields) if fields is not None else list(self.FIELDS)
+        self.stats = {name: RollingStats(window) for name in names}
+
+    def update(self, packet):
+        """Paketteki tüm alanları istatistiklere ekle"""
+        for name, stats in self.stats.items():
+            stats.add(self.FIELDS[name](packet))
+
+    def clear(self):
+        for stats in self.stats.values():
+            stats.clear()
+
+    def __getitem__(self, name: str) -> RollingStats:
+        return self.stats[name]
+
+    def to_dict(self) -> Dict[str, Dict]:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
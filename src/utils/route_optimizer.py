@@ -0,0 +1,217 @@
+# src/utils/route_optimizer.py
+"""
+Büyük görevler için rota sıralama (açık yol gezgin satıcı problemi)
+
+1. Haversine mesafe matrisi tek NumPy yayınlamasıyla kurulur.
+2. En yakın komşu ile başlangıç sırası çıkarılır.
+3. Süre bütçesi dolana veya iyileşme kalmayana kadar 2-opt (kenar çifti
+   ters çevirme) ve Or-opt (1-3 noktalık parçayı taşıma) turları yapılır.
+   2-opt'ta her noktanın tüm kenarlara karşı kazancı, Or-opt'ta tüm
+   parçaların en yakın komşu kenarlarına karşı kazancı vektörel hesaplanır.
+
+Başlangıç noktası sabittir; bitiş noktası isteğe bağlı sabitlenir. Bitiş
+serbestse her noktaya uzaklığı 0 olan sanal bir düğüm sona eklenir ve
+problem iki ucu sabit yola indirgenir.
+"""
+
+import time
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from ..core.utils import EARTH_RADIUS_M
+
+OR_OPT_MAX_LENGTH = 3  # Taşınan en uzun parça (nokta)
+OR_OPT_NEIGHBOURS = 10  # Or-opt'ta parça uçları başına aday komşu
+_EPS = 1e-9
+
+
+def distance_matrix(lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """Tüm nokta çiftleri arası büyük daire mesafe matrisi (n x n, metre)
+
+    Haversine ile aynı sonucu verir; birim küre vektörleri arası kiriş
+    uzunluğundan hesaplanır ve n² trigonometrik çağrı yerine yalnızca
+    n²'lik bir arcsin gerektirir.
+    """
+    phi, lam = np.radians(np.asarray(lats, dtype=float)), np.radians(np.asarray(lons, dtype=float))
+    xyz = (np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi))
+    chord = np.zeros((len(phi), len(phi)))
+    for axis in xyz:
+        diff = axis[:, None] - axis[None, :]
+        diff *= diff
+        chord += diff
+    np.sqrt(chord, out=chord)
+    chord *= 0.5
+    np.minimum(chord, 1.0, out=chord)
+    np.arcsin(chord, out=chord)
+    chord *= 2.0 * EARTH_RADIUS_M
+    return chord
+
+
+def path_length(matrix: np.ndarray, order: Sequence[int]) -> float:
+    order = np.asarray(order)
+    return float(matrix[order[:-1], order[1:]].sum()) if len(order) > 1 else 0.0
+
+
+def nearest_neighbour(matrix: np.ndarray, start: int, end: Optional[int] = None) -> np.ndarray:
+    """start'tan en yakın ziyaret edilmemiş noktaya giderek sıra oluştur; end en sona"""
+    n = len(matrix)
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    if end is not None:
+        visited[end] = True
+    order = [start]
+    current = start
+    for _ in range(n - visited.sum()):
+        distances = np.where(visited, np.inf, matrix[current])
+        current = int(distances.argmin())
+        visited[current] = True
+        order.append(current)
+    if end is not None and end != start:
+        order.append(end)
+    return np.array(order, dtype=np.int64)
+
+
+def _two_opt_pass(matrix, route, edges, deadline) -> int:
+    """Her i için en iyi j: route[i+1..j] ters çevrilir (uçlar sabit)"""
+    n = len(route)
+    improvements = 0
+    for i in range(n - 3):
+        if time.perf_counter() > deadline:
+            break
+        a, b = route[i], route[i + 1]
+        js = np.arange(i + 2, n - 1)
+        delta = matrix[a, route[js]] + matrix[b, route[js + 1]] - edges[i] - edges[js]
+        k = int(delta.argmin())
+        if delta[k] < -_EPS:
+            j = int(js[k])
+            route[i + 1:j + 1] = route[i + 1:j + 1][::-1].copy()
+            edges[i + 1:j] = edges[i + 1:j][::-1].copy()
+            edges[i] = matrix[route[i], route[i + 1]]
+            edges[j] = matrix[route[j], route[j + 1]]
+            improvements += 1
+    return improvements
+
+
+def _nearest_candidates(matrix: np.ndarray, k: int) -> np.ndarray:
+    """Her noktanın en yakın k komşusu (kendisi hariç)"""
+    k = min(k, len(matrix) - 1)
+    masked = matrix + np.diag(np.full(len(matrix), np.inf))
+    return np.argpartition(masked, k - 1, axis=1)[:, :k]
+
+
+def _or_opt_pass(matrix, route, edges, neighbours, deadline) -> int:
+    """1..OR_OPT_MAX_LENGTH noktalık parçayı (gerekirse ters) komşusunun yanına taşı
+
+    Tüm parçaların kazancı aday komşu kenarlara karşı tek seferde
+    hesaplanır; birbirine dokunmayan iyileştirmeler sırayla uygulanır.
+    """
+    n = len(route)
+    improvements = 0
+    for length in range(1, OR_OPT_MAX_LENGTH + 1):
+        if time.perf_counter() > deadline or n - length < 2:
+            break
+        position = np.empty(n, dtype=np.int64)
+        position[route] = np.arange(n)
+
+        starts = np.arange(1, n - length)  # Son nokta sabit; ilk nokta taşınmaz
+        first, last = route[starts], route[starts + length - 1]
+        prev, nxt = route[starts - 1], route[starts + length]
+        gain = edges[starts - 1] + edges[starts + length - 1] - matrix[prev, nxt]
+
+        # Aday kenarlar: uç noktaların komşularının önündeki ve arkasındaki kenar
+        near = np.concatenate((neighbours[first], neighbours[last]), axis=1)
+        candidates = np.concatenate((position[near] - 1, position[near]), axis=1)
+        valid = ((candidates >= 0) & (candidates <= n - 2) &
+                 ((candidates < starts[:, None] - 1) | (candidates > starts[:, None] + length - 1)))
+        candidates = np.where(valid, candidates, 0)
+        u, v = route[candidates], route[candidates + 1]
+        forward = matrix[u, first[:, None]] + matrix[last[:, None], v]
+        backward = matrix[u, last[:, None]] + matrix[first[:, None], v]
+        cost = np.where(valid, np.minimum(forward, backward) - edges[candidates], np.inf)
+        best = cost.argmin(axis=1)
+        rows = np.arange(len(starts))
+        improvement = gain - cost[rows, best]
+
+        touched = np.zeros(n, dtype=bool)
+        for row in np.flatnonzero(improvement > _EPS)[np.argsort(-improvement[improvement > _EPS])]:
+            if time.perf_counter() > deadline:
+                break
+            u_node, v_node = int(u[row, best[row]]), int(v[row, best[row]])
+            nodes = [int(prev[row]), int(nxt[row]), u_node, v_node]
+            segment_nodes = route[position[first[row]]:position[first[row]] + length]
+            if touched[nodes].any() or touched[segment_nodes].any():
+                continue  # Önceki taşıma bu kenarları değiştirdi; gelecek turda bakılır
+            touched[nodes] = True
+            touched[segment_nodes] = True
+
+            i = int(position[first[row]])
+            segment = route[i:i + length].copy()
+            if backward[row, best[row]] < forward[row, best[row]]:
+                segment = segment[::-1]
+            rest = np.concatenate((route[:i], route[i + length:]))
+            insert_at = int(np.flatnonzero(rest == u_node)[0]) + 1
+            route[:] = np.concatenate((rest[:insert_at], segment, rest[insert_at:]))
+            position[route] = np.arange(n)
+            improvements += 1
+        edges[:] = matrix[route[:-1], route[1:]]
+    return improvements
+
+
+def optimize_order(matrix: np.ndarray, start: int = 0, end: Optional[int] = None,
+                   time_budget_s: float = 1.0) -> Dict:
+    """Açık yol sırasını iyileştir
+
+    start: ilk nokta (sabit), end: son nokta (None: serbest). Dönüş:
+    order (matris indeksleri), distance, initial_distance (en yakın komşu
+    öncesi, verilen sıra), passes, improvements, elapsed_s, converged.
+    """
+    started = time.perf_counter()
+    deadline = started + time_budget_s
+    n = len(matrix)
+    identity = list(range(n))
+    if end is not None and end != start:
+        identity = [start] + [k for k in identity if k not in (start, end)] + [end]
+    else:
+        identity = [start] + [k for k in identity if k != start]
+    initial_distance = path_length(matrix, identity)
+
+    if n <= 2:
+        order = np.array(identity, dtype=np.int64)
+        return {'order': order.tolist(), 'distance': path_length(matrix, order),
+                'initial_distance': initial_distance, 'passes': 0, 'improvements': 0,
+                'elapsed_s': time.perf_counter() - started, 'converged': True}
+
+    # Serbest bitiş: sanal düğüm (her noktaya 0 m) sabit son nokta olur
+    free_end = end is None
+    work = matrix
+    if free_end:
+        work = np.zeros((n + 1, n + 1))
+        work[:n, :n] = matrix
+        end = n
+
+    route = nearest_neighbour(work, start, end)
+    edges = work[route[:-1], route[1:]]
+    neighbours = _nearest_candidates(work, OR_OPT_NEIGHBOURS)
+
+    passes = improvements = 0
+    converged = False
+    while time.perf_counter() < deadline:
+        passes += 1
+        changed = _two_opt_pass(work, route, edges, deadline)
+        changed += _or_opt_pass(work, route, edges, neighbours, deadline)
+        improvements += changed
+        if not changed:
+            converged = time.perf_counter() < deadline
+            break
+
+    order = route[:-1] if free_end else route
+    return {
+        'order': order.tolist(),
+        'distance': path_length(matrix, order),
+        'initial_distance': initial_distance,
+        'passes': passes,
+        'improvements': improvements,
+        'elapsed_s': time.perf_counter() - started,
+        'converged': converged,
+    }
@@ -0,0 +1,119 @@
+# src/utils/survey_grid.py
+"""
+Çokgen alan için tarama (lawnmower) ızgarası üretimi
+
+Çokgenin köşeleri ağırlık merkezi çevresinde yerel Doğu-Kuzey düzlemine
+çevrilir ve tarama yönüne göre döndürülür. Tarama hatları yan bindirmeden,
+hat üzerindeki çekim noktaları ön bindirmeden bulunan aralıklarla dizilir:
+
+1. Her hattın tüm çokgen kenarlarıyla kesişimleri tek matris işlemiyle
+   (hat x kenar) hesaplanır; sıralanmış kesişim çiftleri içeride kalan
+   aralıklardır (içbükey çokgende hat başına birden fazla aralık olabilir).
+2. Aralıklardaki noktalar np.repeat/cumsum ile tek seferde üretilir;
+   tek numaralı hatlar ters yönde uçulur (yılan düzeni).
+3. Noktalar geri döndürülüp enlem/boylama çevrilir.
+
+Python döngüsü yoktur; on binlerce noktalık ızgaralar milisaniyeler sürer.
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..core.utils import enu_to_geodetic, geodetic_to_enu
+
+
+def camera_footprint(altitude: float, sensor_width_mm: float = 13.2,
+                     sensor_height_mm: float = 8.8, focal_length_mm: float = 8.8) -> Tuple[float, float]:
+    """Nadir çekimde bir karenin yerdeki genişlik ve yüksekliği (metre)
+
+    Varsayılanlar 1" sensörlü yaygın haritalama kamerasıdır. Genişlik
+    tarama hatlarına dik, yükseklik uçuş yönündedir.
+    """
+    scale = altitude / focal_length_mm
+    return sensor_width_mm * scale, sensor_height_mm * scale
+
+
+def survey_grid(polygon: Sequence[Tuple[float, float]], footprint: Tuple[float, float],
+                front_overlap: float = 0.75, side_overlap: float = 0.65,
+                angle_deg: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Çokgeni (lat, lon köşeleri) kaplayan çekim noktaları, uçuş sırasıyla
+
+    footprint: (genişlik, yükseklik) metre; bkz. camera_footprint.
+    angle_deg: tarama hatlarının yönü (0: doğu-batı, 90: kuzey-güney).
+    Dönüş: (enlemler, boylamlar) NumPy dizileri.
+    """
+    if len(polygon) < 3:
+        raise ValueError("Çokgen en az 3 köşe içermeli")
+    if not (0 <= front_overlap < 1 and 0 <= side_overlap < 1):
+        raise ValueError("Bindirme oranı 0 ile 1 arasında olmalı")
+    line_spacing = footprint[0] * (1 - side_overlap)
+    photo_spacing = footprint[1] * (1 - front_overlap)
+    if line_spacing <= 0 or photo_spacing <= 0:
+        raise ValueError("Kamera izdüşümü pozitif olmalı")
+
+    corners = np.asarray(polygon, dtype=float)
+    lat0, lon0 = corners[:, 0].mean(), corners[:, 1].mean()
+    east, north, _ = geodetic_to_enu(corners[:, 0], corners[:, 1], np.zeros(len(corners)), lat0, lon0)
+
+    # Hatlar döndürülmüş düzlemde x eksenine paralel
+    angle = math.radians(angle_deg)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    x = east * cos_a + north * sin_a
+    y = -east * sin_a + north * cos_a
+
+    # Kenarlar (x1, y1) -> (x2, y2); hatlar çokgenin alt ucundan yarım aralık içeride
+    x1, y1, x2, y2 = x, y, np.roll(x, -1), np.roll(y, -1)
+    lanes = np.arange(y.min() + line_spacing / 2, y.max(), line_spacing)
+    if not len(lanes):
+        lanes = np.array([(y.min() + y.max()) / 2])
+
+    # Hat x kenar kesişimleri (yarı açık aralık: köşeler iki kez sayılmaz)
+    crosses = (y1 > lanes[:, None]) != (y2 > lanes[:, None])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = (lanes[:, None] - y1) / (y2 - y1)
+    xs = np.where(crosses, x1 + t * (x2 - x1), np.nan)
+    xs.sort(axis=1)  # NaN'lar sona
+
+    # İçeride kalan aralıklar: sıralı kesişimlerin (0,1), (2,3), ... çiftleri
+    pairs = crosses.sum(axis=1) // 2
+    max_pairs = int(pairs.max()) if len(pairs) else 0
+    if max_pairs == 0:
+        return np.empty(0), np.empty(0)
+    starts, ends = xs[:, 0:2 * max_pairs:2], xs[:, 1:2 * max_pairs:2]
+    valid = np.arange(max_pairs)[None, :] < pairs[:, None]
+
+    # Yılan düzeni: tek numaralı hatlarda aralıklar ve noktalar sağdan sola
+    lane_index = np.broadcast_to(np.arange(len(lanes))[:, None], valid.shape)
+    reverse = lane_index % 2 == 1
+    order = np.where(reverse, -np.arange(max_pairs)[None, :], np.arange(max_pairs)[None, :])
+    rows, cols = np.nonzero(valid)
+    sequence = np.lexsort((order[rows, cols], rows))
+    rows, cols = rows[sequence], cols[sequence]
+
+    first = np.where(reverse[rows, cols], ends[rows, cols], starts[rows, cols])
+    length = ends[rows, cols] - starts[rows, cols]
+    direction = np.where(reverse[rows, cols], -1.0, 1.0)
+
+    # Aralık başına nokta sayısı (iki uç dahil); eşit dağıtılır, aralık
+    # photo_spacing'i aşmaz (ön bindirme en az istenen kadar)
+    counts = np.where(length > 0, np.ceil(length / photo_spacing).astype(np.int64) + 1, 1)
+    interval = np.repeat(np.arange(len(counts)), counts)
+    step = np.arange(len(interval)) - np.repeat(np.cumsum(counts) - counts, counts)
+    spacing = np.where(counts > 1, length / np.maximum(counts - 1, 1), 0.0)
+
+    px = first[interval] + direction[interval] * step * spacing[interval]
+    py = lanes[rows][interval]
+
+    # Geri döndür ve jeodezik koordinata çevir
+    east = px * cos_a - py * sin_a
+    north = px * sin_a + py * cos_a
+    lats, lons, _ = enu_to_geodetic(east, north, np.zeros(len(east)), lat0, lon0)
+    return np.atleast_1d(lats), np.atleast_1d(lons)
+
+
+def grid_waypoints(lats, lons, altitude: float, action_type: str = 'PHOTO') -> List[Dict]:
+    """Izgara noktalarını WaypointManager.add_waypoints biçimine çevir"""
+    return [{'latitude': lat, 'longitude': lon, 'altitude': altitude, 'action_type': action_type}
+            for lat, lon in zip(np.asarray(lats).tolist(), np.asarray(lons).tolist())]
@@ -0,0 +1,485 @@
+# tests/test_services.py
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+import json
+from datetime import datetime
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.tile_cache import (TileCache, TileProvider, TileServer, is_public_osm,
+                                     lat_lon_to_tile, tiles_for_bbox, tiles_along_path)
+from src.services import tile_cache
+from src.services.alerts import (AlertEngine, CompiledRuleSet, load_rules,
+                                 packets_to_arrays)
+from src.services.alarm_state import ACTIVE, RAISED, CLEARED
+from src.services.geofence import Geofence, GeofenceEngine, OUTSIDE_ALERT_TYPE
+from src.services.fleet_reports import generate_fleet_reports
+from src.services.mission_files import read_mission, write_mission
+from src.services.mission_tracker import MissionTracker, ROUTE_ALERT_TYPE
+from src.database.database_manager import DatabaseManager
+from src.telemetry.data_models import TelemetryPacket, GPSData
+
+
+class TestTileMath(unittest.TestCase):
+    """Karo koordinat hesaplamalarının testleri"""
+
+    def test_lat_lon_to_tile(self):
+        """Bilinen bir noktanın karo koordinatı"""
+        self.assertEqual(lat_lon_to_tile(0.0, 0.0, 1), (1, 1))
+        self.assertEqual(lat_lon_to_tile(39.9334, 32.8597, 10), (605, 387))
+
+    def test_bbox_tiles(self):
+        """Sınır kutusu karoları her zoom seviyesini kapsamalı"""
+        tiles = tiles_for_bbox(39.90, 32.80, 39.96, 32.90, range(12, 14))
+        zooms = {z for z, _, _ in tiles}
+        self.assertEqual(zooms, {12, 13})
+        self.assertIn((12,) + lat_lon_to_tile(39.93, 32.85, 12), tiles)
+
+    def test_path_tiles_are_contiguous(self):
+        """Uzun bacaklarda aradaki karolar atlanmamalı"""
+        tiles = tiles_along_path([(39.90, 32.80), (39.90, 33.20)], [14], buffer_tiles=0)
+        xs = sorted(x for _, x, _ in tiles)
+        self.assertEqual(xs, list(range(xs[0], xs[-1] + 1)))
+
+
+class TestTileCache(unittest.TestCase):
+    """MBTiles önbelleği testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = TileCache(os.path.join(self.temp_dir, "tiles.mbtiles"), max_tiles=3)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_put_get(self):
+        """Kaydedilen karo geri okunabilmeli"""
+        self.cache.put(10, 605, 387, b"png-data")
+        self.assertEqual(self.cache.get(10, 605, 387), b"png-data")
+        self.assertIsNone(self.cache.get(10, 1, 1))
+
+    def test_lru_eviction(self):
+        """Kapasite aşılınca en eski erişilen karo silinmeli"""
+        for x in range(3):
+            self.cache.put(5, x, 0, b"tile")
+        self.cache.get(5, 0, 0)  # 0 yeniden kullanıldı, 1 en eski
+        self.cache._flush_access()
+        self.cache.put(5, 3, 0, b"tile")
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertTrue(self.cache.contains(5, 0, 0))
+        self.assertFalse(self.cache.contains(5, 1, 0))
+
+    def test_provider_metrics(self):
+        """İsabet oranı ve upstream çağrıları doğru sayılmalı"""
+        calls = []
+
+        def fake_fetcher(zoom, x, y):
+            calls.append((zoom, x, y))
+            return b"tile"
+
+        provider = TileProvider(self.cache, fetcher=fake_fetcher)
+        provider.get_tile(8, 1, 1)
+        provider.get_tile(8, 1, 1)
+
+        metrics = provider.metrics()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(metrics['hits'], 1)
+        self.assertEqual(metrics['misses'], 1)
+        self.assertAlmostEqual(metrics['hit_rate'], 0.5)
+
+    def test_offline_miss(self):
+        """Çevrimdışı modda eksik karo için upstream çağrılmamalı"""
+        provider = TileProvider(self.cache, fetcher=lambda z, x, y: self.fail("upstream"),
+                                offline=True)
+        self.assertIsNone(provider.get_tile(8, 2, 2))
+
+    def test_prefetch_rate_limited(self):
+        """Ön yükleme upstream isteklerini verilen hızla sınırlamalı"""
+        from unittest.mock import patch
+
+        clock = {'now': 100.0, 'slept': []}
+
+        class FakeTime:
+            @staticmethod
+            def monotonic():
+                return clock['now']
+
+            @staticmethod
+            def sleep(seconds):
+                clock['slept'].append(seconds)
+                clock['now'] += seconds
+
+            perf_counter = time = monotonic
+
+        self.cache.put(5, 0, 0, b"tile")  # Önbellekte: beklemeden atlanır
+        provider = TileProvider(self.cache, fetcher=lambda z, x, y: b"tile")
+        with patch.object(tile_cache, 'time', FakeTime):
+            summary = provider.prefetch([(5, 0, 0), (5, 1, 0), (5, 2, 0)], rate_hz=2.0)
+
+        self.assertEqual(summary['fetched'], 2)
+        self.assertEqual(summary['skipped'], 1)
+        self.assertEqual(clock['slept'], [0.5])
+
+    def test_prefetch_refuses_public_osm(self):
+        """Herkese açık OSM sunucusundan toplu indirme --force olmadan reddedilmeli"""
+        from unittest.mock import patch
+        from src.core.config import AppConfig
+
+        self.assertTrue(is_public_osm("https://a.tile.openstreetmap.org/{z}/{x}/{y}.png"))
+        self.assertFalse(is_public_osm("http://tiles.example.local/{z}/{x}/{y}.png"))
+
+        cache_path = os.path.join(self.temp_dir, "prefetch.mbtiles")
+        config = AppConfig()
+        with patch.object(tile_cache, 'get_config', return_value=config), \
+                patch.object(AppConfig, 'setup_logging'):
+            code = tile_cache.main(['prefetch', '--bbox', '39.90', '32.80', '39.91', '32.81',
+                                    '--zoom', '10', '10', '--cache', cache_path])
+        self.assertEqual(code, 1)
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_prefetch_refuses_more_tiles_than_capacity(self):
+        """Kapasiteden fazla karo gerektiren ön yükleme başlamadan reddedilmeli"""
+        from unittest.mock import patch
+        from src.core.config import AppConfig
+
+        cache_path = os.path.join(self.temp_dir, "prefetch.mbtiles")
+        args = ['prefetch', '--bbox', '39.90', '32.80', '39.96', '32.90', '--zoom', '14', '14',
+                '--cache', cache_path, '--upstream', 'http://tiles.example.local/{z}/{x}/{y}.png']
+        self.assertGreater(len(tiles_for_bbox(39.90, 32.80, 39.96, 32.90, [14])), 2)
+
+        with patch.object(tile_cache, 'get_config', return_value=AppConfig()), \
+                patch.object(AppConfig, 'setup_logging'), \
+                patch.object(TileProvider, 'prefetch') as prefetch:
+            code = tile_cache.main(args + ['--max-tiles', '2'])
+        self.assertEqual(code, 1)
+        prefetch.assert_not_called()
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_missing_tile_not_cached_by_browser(self):
+        """Eksik karo 404'ü no-store ile, bulunan karo max-age ile sunulmalı"""
+        import urllib.error
+        import urllib.request
+
+        self.cache.put(8, 1, 1, b"tile")
+        server = TileServer(TileProvider(self.cache, offline=True))
+        server.start()
+        try:
+            base = server.url_template.split('/tiles/')[0]
+            with urllib.request.urlopen(f"{base}/tiles/8/1/1.png", timeout=5) as response:
+                self.assertEqual(response.headers['Cache-Control'], 'max-age=86400')
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                urllib.request.urlopen(f"{base}/tiles/8/2/2.png", timeout=5)
+            self.assertEqual(ctx.exception.code, 404)
+            self.assertEqual(ctx.exception.headers['Cache-Control'], 'no-store')
+            ctx.exception.close()
+        finally:
+            server.stop()
+
+
+def _packet(battery=80.0, altitude=100.0, satellites=12, fix_quality=4, velocity=15.0):
+    gps = GPSData(latitude=39.9, longitude=32.8, altitude=altitude,
+                  fix_quality=fix_quality, satellites=satellites)
+    return TelemetryPacket(timestamp=datetime.now(), gps=gps, velocity=velocity,
+                           battery_percent=battery, battery_voltage=22.0, status="FLYING")
+
+
+class TestAlertRules(unittest.TestCase):
+    """Derlenmiş alarm kural motoru testleri"""
+
+    def setUp(self):
+        self.rule_set = CompiledRuleSet()
+
+    def test_single_packet_evaluation(self):
+        """Kritik batarya düşük batarya uyarısını bastırmalı"""
+        types = {a['type'] for a in self.rule_set.evaluate(_packet(battery=10.0, satellites=4))}
+        self.assertIn('BATTERY_CRITICAL', types)
+        self.assertIn('GPS_POOR', types)
+        self.assertNotIn('BATTERY_LOW', types)
+
+        alerts = self.rule_set.evaluate(_packet(battery=25.0), categories=['battery'])
+        self.assertEqual([a['type'] for a in alerts], ['BATTERY_LOW'])
+        self.assertIn('25.0%', alerts[0]['message'])
+
+    def test_batch_matches_single(self):
+        """Vektörel sonuçlar tek paket sonuçlarıyla aynı olmalı"""
+        packets = [_packet(battery=b, altitude=a, satellites=s, velocity=v)
+                   for b, a, s, v in [(10, 3, 4, 31), (25, 100, 6, 29), (31, 395, 7, 20),
+                                      (16, 401, 12, 35), (80, 6, 5, 28)]]
+        masks = self.rule_set.evaluate_batch(packets_to_arrays(packets))
+
+        for i, packet in enumerate(packets):
+            for rule, (raised, cleared, _) in zip(self.rule_set.rules,
+                                                  self.rule_set.evaluate_raw(packet)):
+                self.assertEqual(bool(masks[rule.type]['raised'][i]), raised, rule.type)
+                self.assertEqual(bool(masks[rule.type]['cleared'][i]), cleared, rule.type)
+
+    def test_rules_from_config(self):
+        """Yapılandırmadan yüklenen kural derlenip değerlendirilmeli"""
+        rules = load_rules([{'type': 'SLOW', 'field': 'velocity', 'op': '<',
+                             'threshold': 2.0, 'message': 'Yavaş: {value}'}])
+        alerts = CompiledRuleSet(rules).evaluate(_packet(velocity=1.0))
+        self.assertEqual(alerts[0]['message'], 'Yavaş: 1.0')
+
+        with self.assertRaises(ValueError):
+            load_rules([{'type': 'X', 'field': 'velocity', 'op': '==', 'threshold': 1}])
+
+    def test_rule_source_injection_rejected(self):
+        """Alan adı ve operatör derlenen kaynağa kod sokamamalı"""
+        injected = 'velocity if __import__("sys").stdout.write("INJECTED") else 0'
+        with self.assertRaises(ValueError):
+            load_rules([{'type': 'X', 'field': injected, 'op': '>', 'threshold': 1}])
+
+        rule = load_rules([{'type': 'X', 'field': 'velocity', 'op': '>', 'threshold': 1}])[0]
+        with self.assertRaises(ValueError):
+            CompiledRuleSet([rule.model_copy(update={'field': injected})])
+        with self.assertRaises(ValueError):
+            CompiledRuleSet([rule.model_copy(update={'op': '> 0 or __import__("os") or'})])
+
+    def test_engine_debounce_and_clear(self):
+        """Uyarı iki örnekte tetiklenmeli, histerezis dışında temizlenmeli"""
+        engine = AlertEngine()
+        transitions = lambda p: {r.type: t for r, t, _ in engine.process(p)}
+
+        self.assertIsNone(transitions(_packet(velocity=31.0)).get('VELOCITY_HIGH'))
+        self.assertEqual(transitions(_packet(velocity=31.0)).get('VELOCITY_HIGH'), RAISED)
+        self.assertNotEqual(transitions(_packet(velocity=29.0)).get('VELOCITY_HIGH'), CLEARED)
+        self.assertEqual(transitions(_packet(velocity=27.0)).get('VELOCITY_HIGH'), CLEARED)
+
+
+class TestGeofence(unittest.TestCase):
+    """Coğrafi sınır motoru testleri"""
+
+    def setUp(self):
+        self.area = Geofence(name="Alan", kind="inclusion", ceiling_m=120,
+                             points=[(39.80, 32.70), (39.80, 32.90), (40.00, 32.90), (40.00, 32.70)])
+        self.airport = Geofence(name="Havalimanı", shape="cylinder",
+                                center=(39.90, 32.80), radius_m=1000)
+        self.zone = Geofence(name="Üçgen", floor_m=50,
+                             points=[(39.85, 32.72), (39.85, 32.76), (39.88, 32.74)])
+        self.engine = GeofenceEngine([self.area, self.airport, self.zone])
+
+    def test_point_checks(self):
+        """Yasak bölge, taban irtifası ve izin alanı dışı ayrı ayrı algılanmalı"""
+        self.assertEqual(self.engine.check(39.95, 32.85, 100), [])
+        self.assertEqual(self.engine.check(39.905, 32.80, 100), [self.airport])
+        self.assertEqual(self.engine.check(39.86, 32.74, 60), [self.zone])
+        self.assertEqual(self.engine.check(39.86, 32.74, 40), [])  # Taban altında
+        self.assertEqual(self.engine.check(39.95, 32.85, 150), [None])  # Tavan üstü
+        self.assertEqual(self.engine.check(41.0, 32.85, 100), [None])
+
+    def test_batch_matches_single(self):
+        """Vektörel değerlendirme tek nokta sonuçlarıyla aynı olmalı"""
+        import random
+        random.seed(3)
+        points = [(random.uniform(39.78, 40.02), random.uniform(32.68, 32.92),
+                   random.uniform(0, 150)) for _ in range(2000)]
+        result = self.engine.check_batch(*zip(*points))
+
+        for i, (lat, lon, alt) in enumerate(points):
+            breached = self.engine.check(lat, lon, alt)
+            self.assertEqual(bool(result['outside'][i]), None in breached)
+            self.assertEqual(bool(result['exclusion']['Havalimanı'][i]), self.airport in breached)
+            self.assertEqual(bool(result['exclusion']['Üçgen'][i]), self.zone in breached)
+
+    def test_packet_alerts(self):
+        """Paket ihlali alarm dict'i olarak dönmeli"""
+        packet = _packet(altitude=150.0)
+        alerts = self.engine.check_packet(packet)
+        self.assertEqual({a['type'] for a in alerts},
+                         {OUTSIDE_ALERT_TYPE, self.airport.alert_type})
+
+        with self.assertRaises(ValueError):
+            Geofence(name="Eksik", points=[(39.0, 32.0), (39.1, 32.0)])
+
+
+class TestMissionTracker(unittest.TestCase):
+    """Görev ilerleme takibi testleri"""
+
+    def setUp(self):
+        # Doğuya ~855 m, sonra kuzeye ~1113 m; WP1'de 30 s bekleme
+        self.waypoints = [{'latitude': 39.90, 'longitude': 32.80},
+                          {'latitude': 39.90, 'longitude': 32.81, 'hold_time': 30},
+                          {'latitude': 39.91, 'longitude': 32.81}]
+        self.tracker = MissionTracker(self.waypoints, off_route_m=25.0, clear_route_m=15.0,
+                                      raise_debounce=2, clear_debounce=2)
+
+    def test_cross_track_and_remaining(self):
+        """Yanal sapma işaretli, kalan mesafe ve ETA beklemeyi içermeli"""
+        import numpy as np
+        from src.core.utils import local_xy
+
+        # Bacak uzunlukları izleyicinin kullandığı yerel düzlemde (local_xy)
+        leg1, _ = local_xy(39.90, 32.81, 39.90, 32.80)
+        _, leg2 = local_xy(39.91, 32.81, 39.90, 32.81)
+        state = self.tracker.update(39.9002, 32.805, speed=10.0)  # ~22 m kuzeyde (solda)
+        self.assertEqual((state['leg'], state['target_index']), (0, 1))
+        self.assertAlmostEqual(state['cross_track_m'], -22.3, delta=0.5)
+        self.assertAlmostEqual(state['remaining_m'], leg1 / 2 + leg2, delta=1.0)
+        self.assertAlmostEqual(state['eta_end_s'], (leg1 / 2 + leg2) / 10 + 30, delta=0.2)
+        self.assertAlmostEqual(state['progress'], leg1 / 2 / (leg1 + leg2), places=2)
+
+        state = self.tracker.update(39.905, 32.8101, speed=10.0)  # 2. bacakta, doğuda (sağda)
+        self.assertEqual(state['leg'], 1)
+        self.assertGreater(state['cross_track_m'], 0)
+        etas = self.tracker.etas(10.0)
+        self.assertTrue(np.isnan(etas[:2]).all())
+        self.assertAlmostEqual(etas[2], state['eta_end_s'], places=6)
+
+    def test_leg_advance_and_completion(self):
+        """Kabul yarıçapına girilince bacak ilerlemeli, son noktada görev bitmeli"""
+        self.assertEqual(self.tracker.update(39.90003, 32.80998)['leg'], 1)
+        self.assertFalse(self.tracker.completed)
+        state = self.tracker.update(39.90995, 32.81)
+        self.assertTrue(state['completed'])
+        self.assertEqual((state['remaining_m'], state['progress']), (0.0, 1.0))
+        self.assertIsNone(self.tracker.update(39.91, 32.81, speed=10.0)['eta_end_s'])
+
+    def test_off_route_alarm_hysteresis(self):
+        """Sapma alarmı debounce ile tetiklenmeli, histerezis bandında sürmeli"""
+        transitions = [self.tracker.update(lat, 32.805)['transition']
+                       for lat in (39.9004, 39.9004, 39.9004, 39.9002, 39.9001, 39.9001)]
+        self.assertEqual(transitions, [None, RAISED, ACTIVE, None, None, CLEARED])
+
+        packet = _packet()
+        packet.gps.latitude, packet.gps.longitude = 39.9004, 32.805
+        self.tracker.check_packet(packet)
+        alerts = self.tracker.check_packet(packet)
+        self.assertEqual([a['type'] for a in alerts], [ROUTE_ALERT_TYPE])
+        self.assertIn('Rotadan sapma', alerts[0]['message'])
+
+    def test_single_waypoint(self):
+        """Tek noktalı görevde hedefe mesafe ve ETA verilmeli"""
+        tracker = MissionTracker(self.waypoints[:1])
+        state = tracker.update(39.901, 32.80, speed=10.0)
+        self.assertEqual(state['target_index'], 0)
+        self.assertAlmostEqual(state['remaining_m'], 111.3, delta=0.5)
+        self.assertFalse(state['off_route'])
+        self.assertEqual(len(tracker.etas(10.0)), 1)
+
+        with self.assertRaises(ValueError):
+            MissionTracker([])
+
+
+class TestFleetReports(unittest.TestCase):
+    """Filo geneli toplu rapor testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "fleet.db")
+        database = DatabaseManager(self.db_path)
+        self.session_ids = []
+        for battery in (90.0, 70.0):
+            self.session_ids.append(database.start_flight_session())
+            database.save_telemetry_batch([_packet(battery=battery), _packet(battery=battery - 10)])
+            database.end_flight_session()
+        self.session_ids.append(database.start_flight_session())  # Telemetrisiz oturum
+        database.close_connection()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_sequential_and_parallel_match(self):
+        """Süreç havuzu sıralı yolla aynı satırları üretmeli"""
+        csv_path = os.path.join(self.temp_dir, "fleet.csv")
+        progress = []
+        sequential = generate_fleet_reports(self.db_path, self.session_ids, workers=1,
+                                            output=csv_path, use_cache=False,
+                                            progress=lambda done, total: progress.append(done))
+        parallel = generate_fleet_reports(self.db_path, self.session_ids, workers=2,
+                                          output=os.path.join(self.temp_dir, "fleet.json"))
+
+        self.assertEqual(progress, [1, 2, 3])
+        self.assertEqual(sorted(sequential['rows'], key=lambda r: r['session_id']),
+                         sorted(parallel['rows'], key=lambda r: r['session_id']))
+        fleet = sequential['fleet']
+        self.assertEqual((fleet['sessions'], fleet['failed']), (3, 1))
+        self.assertAlmostEqual(fleet['battery_consumed'], 20.0)
+
+        with open(csv_path, encoding='utf-8') as f:
+            self.assertEqual(len(f.read().strip().splitlines()), 4)
+        with open(os.path.join(self.temp_dir, "fleet.json"), encoding='utf-8') as f:
+            summary = json.load(f)
+        self.assertEqual(len(summary['sessions']), 3)
+        self.assertEqual(summary['fleet']['sessions'], 3)
+
+    def test_read_only_connection(self):
+        """Salt okunur yönetici yazmayı reddetmeli"""
+        database = DatabaseManager(self.db_path, read_only=True)
+        self.assertEqual(database.get_session_ids(status='COMPLETED'), self.session_ids[:2])
+        with self.assertRaises(Exception):
+            database.start_flight_session("Yazma")
+        database.close_connection()
+
+
+class TestMissionFiles(unittest.TestCase):
+    """QGroundControl .plan / MAVLink WPL içe-dışa aktarma testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.waypoints = [
+            {'latitude': 39.9, 'longitude': 32.8, 'altitude': 0.0, 'action_type': 'TAKEOFF', 'hold_time': 0.0},
+            {'latitude': 39.91, 'longitude': 32.81, 'altitude': 80.0, 'action_type': 'PHOTO', 'hold_time': 0.0},
+            {'latitude': 39.92, 'longitude': 32.82, 'altitude': 80.0, 'action_type': 'HOVER', 'hold_time': 15.0},
+            {'latitude': 39.93, 'longitude': 32.83, 'altitude': 90.0, 'action_type': 'FLY_TO', 'hold_time': 2.0},
+            {'latitude': 39.9, 'longitude': 32.8, 'altitude': 0.0, 'action_type': 'LAND', 'hold_time': 0.0},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Her iki biçimde yazılan görev aynen geri okunmalı"""
+        for name in ("mission.plan", "mission.waypoints"):
+            path = os.path.join(self.temp_dir, name)
+            # PHOTO ek bir DO_DIGICAM_CONTROL öğesi yazar
+            self.assertEqual(write_mission(path, iter(self.waypoints)), 6)
+            self.assertEqual(list(read_mission(path)), self.waypoints)
+
+        with open(os.path.join(self.temp_dir, "mission.plan"), encoding='utf-8') as f:
+            plan = json.load(f)
+        self.assertEqual(plan['mission']['plannedHomePosition'], [39.9, 32.8, 0.0])
+        self.assertEqual([item['command'] for item in plan['mission']['items']], [22, 16, 203, 19, 16, 21])
+
+    def test_wpl_skips_home_and_unknown_commands(self):
+        """Ev konumu ve konumsuz komutlar görev noktası sayılmamalı"""
+        path = os.path.join(self.temp_dir, "qgc.waypoints")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("QGC WPL 110\n"
+                    "0\t1\t0\t16\t0\t0\t0\t0\t39.9\t32.8\t950\t1\n"
+                    "1\t0\t3\t22\t0\t0\t0\t0\t39.9\t32.8\t30\t1\n"
+                    "2\t0\t3\t178\t1\t12\t-1\t0\t0\t0\t0\t1\n"
+                    "3\t0\t3\t16\t0\t0\t0\t0\t39.91\t32.81\t30\t1\n")
+        self.assertEqual([wp['action_type'] for wp in read_mission(path)], ['TAKEOFF', 'FLY_TO'])
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("not a mission\n")
+        with self.assertRaises(ValueError):
+            list(read_mission(path))
+
+    def test_import_into_mission_store(self):
+        """İçe aktarılan dosya görev deposuna tek seferde kaydedilmeli"""
+        from src.utils.flight_utils import WaypointManager
+
+        path = os.path.join(self.temp_dir, "Imported.plan")
+        write_mission(path, self.waypoints)
+        database = DatabaseManager(os.path.join(self.temp_dir, "missions.db"))
+        try:
+            manager = WaypointManager(database)
+            self.assertTrue(manager.import_mission(path))
+            self.assertEqual(manager.current_mission, "Imported")
+            stored = database.load_mission("Imported")
+            self.assertEqual([wp['action_type'] for wp in stored],
+                             [wp['action_type'] for wp in self.waypoints])
+            self.assertEqual(manager.export_mission(os.path.join(self.temp_dir, "out.waypoints")), 6)
+        finally:
+            database.close_connection()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -103,6 +103,10 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsInstance(session_id, int)
         self.assertEqual(self.db_manager.current_session_id, session_id)
 
+    def test_unknown_flight_session(self):
+        """Olmayan oturum için None dönmeli"""
+        self.assertIsNone(self.db_manager.get_flight_session(12345))
+
     def test_telemetry_save(self):
         """Telemetri kaydetme testi"""
         # Önce oturum başlat
@@ -123,6 +127,237 @@ class TestDatabaseManager(unittest.TestCase):
         result = self.db_manager.save_telemetry(packet)
         self.assertTrue(result)
 
+    def test_telemetry_batch_save(self):
+        """Toplu telemetri kaydetme testi"""
+        session_id = self.db_manager.start_flight_session("Batch Session")
+
+        packets = [
+            TelemetryPacket(
+                timestamp=datetime.now(),
+                gps=GPSData(latitude=40.0 + i * 0.001, longitude=33.0, altitude=200.0),
+                velocity=15.0,
+                battery_voltage=23.5,
+                battery_percent=75.0 - i,
+                status="CRUISING"
+            )
+            for i in range(3)
+        ]
+
+        self.assertTrue(self.db_manager.save_telemetry_batch(packets))
+        records = self.db_manager.get_session_telemetry(session_id)
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[2]['battery_percent'], 73.0)
+
+    def test_flight_report_sql_and_cache(self):
+        """Rapor SQL'den hesaplanmalı, tamamlanan oturum diskten okunmalı"""
+        import tempfile
+        from datetime import timedelta
+        from src.utils.flight_utils import FlightDataLogger
+
+        session_id = self.db_manager.start_flight_session("Report Session")
+        start = datetime.now()
+        self.db_manager.save_telemetry_batch([
+            TelemetryPacket(
+                timestamp=start + timedelta(seconds=i),
+                gps=GPSData(latitude=40.0 + i * 0.001, longitude=33.0, altitude=float(i + 1)),
+                velocity=float(i), battery_voltage=23.5, battery_percent=100.0 - i,
+                status="CRUISING")
+            for i in range(100)
+        ])
+
+        cache_dir = tempfile.mkdtemp()
+        report_logger = FlightDataLogger(self.db_manager, cache_dir=cache_dir)
+        report = report_logger.generate_flight_report(session_id)
+        stats = report['statistics']
+        self.assertEqual(stats['total_records'], 100)
+        self.assertEqual((stats['min_altitude'], stats['max_altitude']), (1.0, 100.0))
+        self.assertEqual(stats['battery_consumed'], 99.0)
+        self.assertEqual(stats['percentiles']['altitude'], {'p50': 50.0, 'p90': 90.0,
+                                                            'p95': 95.0, 'p99': 99.0})
+        self.assertEqual(stats['histograms']['velocity']['counts'], [10] * 10)
+        self.assertAlmostEqual(stats['total_distance'], 99 * 111.19, delta=5)
+        self.assertEqual(os.listdir(cache_dir), [])  # Aktif oturum önbelleğe alınmaz
+
+        self.db_manager.end_flight_session()
+        first = report_logger.generate_flight_report(session_id)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        cached = report_logger.generate_flight_report(session_id)
+        self.assertEqual(cached, first)
+
+    def test_session_summary_maintained(self):
+        """Oturum kapanınca özet yazılmalı; eksik özetler toplu doldurulmalı"""
+        from datetime import timedelta
+
+        start = datetime.now()
+        session_ids = []
+        for offset in (0.0, 50.0):
+            session_ids.append(self.db_manager.start_flight_session())
+            self.db_manager.save_telemetry_batch([
+                TelemetryPacket(
+                    timestamp=start + timedelta(seconds=i),
+                    gps=GPSData(latitude=40.0 + i * 0.001, longitude=33.0,
+                                altitude=offset + i + 1),
+                    velocity=10.0, battery_voltage=23.5, battery_percent=100.0 - i,
+                    status="CRUISING")
+                for i in range(100)
+            ])
+            self.db_manager.end_flight_session()
+
+        summary = self.db_manager.get_session_summaries()[0]
+        self.assertEqual(summary['record_count'], 100)
+        self.assertEqual((summary['altitude_p50'], summary['altitude_p95']), (50.0, 95.0))
+        self.assertAlmostEqual(summary['battery_drain_per_min'], 60.0)
+        self.assertAlmostEqual(summary['time_above_50m_s'], 50.0, places=2)
+        self.assertAlmostEqual(summary['distance_m'], 99 * 111.19, delta=5)
+        self.assertEqual((summary['min_latitude'], summary['max_longitude']), (40.0, 33.0))
+        session = self.db_manager.get_flight_session(session_ids[0])
+        self.assertEqual(session['total_distance'], summary['distance_m'])
+
+        over_120 = self.db_manager.get_session_summaries(min_max_altitude=120)
+        self.assertEqual([s['session_id'] for s in over_120], [session_ids[1]])
+        fleet = self.db_manager.get_fleet_statistics()
+        self.assertEqual((fleet['flights'], fleet['total_records']), (2, 200))
+
+        # Özeti silinen oturum toplu doldurmayla geri gelmeli
+        with self.db_manager.engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM session_summaries")
+        self.assertEqual(self.db_manager.backfill_session_summaries(), 2)
+        self.assertEqual(self.db_manager.get_session_summaries()[0]['time_above_50m_s'],
+                         summary['time_above_50m_s'])
+
+    def test_spatial_track_index(self):
+        """Alan/yarıçap sorguları geçen oturumları ve zaman aralıklarını bulmalı"""
+        from datetime import timedelta
+
+        start = datetime(2026, 1, 1, 12, 0, 0)
+        session_ids = []
+        for lon in (33.0, 33.5):  # Kuzeye uçan iki paralel iz (~42 km aralık; noktalar ~111 m arayla)
+            session_ids.append(self.db_manager.start_flight_session())
+            self.db_manager.save_telemetry_batch([
+                TelemetryPacket(
+                    timestamp=start + timedelta(seconds=i),
+                    gps=GPSData(latitude=40.0 + i * 0.001, longitude=lon, altitude=100.0),
+                    velocity=15.0, battery_voltage=23.5, battery_percent=90.0,
+                    status="CRUISING")
+                for i in range(200)
+            ])
+            self.db_manager.end_flight_session()
+
+        # İkinci 60'lık parçanın içindeki 40.1-40.11 bandı: 100-110. konumlar
+        matches = self.db_manager.find_sessions_in_bbox(40.0995, 32.99, 40.1105, 33.01)
+        self.assertEqual([m['session_id'] for m in matches], [session_ids[0]])
+        self.assertEqual(matches[0]['windows'], [(start + timedelta(seconds=100),
+                                                  start + timedelta(seconds=110))])
+        coarse = self.db_manager.find_sessions_in_bbox(40.0995, 32.99, 40.1105, 33.01, exact=False)
+        self.assertEqual(coarse[0]['windows'], [(start + timedelta(seconds=60),
+                                                 start + timedelta(seconds=119))])
+
+        # Parçalar arası geçiş (59. ve 60. konum arası) kutularda kalmalı
+        self.assertEqual(len(self.db_manager.find_sessions_in_bbox(
+            40.0593, 33.49, 40.0597, 33.51, exact=False)), 1)
+
+        near = self.db_manager.find_sessions_near(40.05, 33.5, 250)
+        self.assertEqual([m['session_id'] for m in near], [session_ids[1]])
+        self.assertEqual(near[0]['windows'], [(start + timedelta(seconds=48),
+                                               start + timedelta(seconds=52))])
+        self.assertEqual(self.db_manager.find_session_ids_in_bbox(39.0, 32.0, 41.0, 34.0),
+                         session_ids)
+        self.assertEqual(self.db_manager.find_sessions_near(41.0, 33.0, 1000), [])
+
+        # R*Tree olmadan aynı sonuç (parça tablosu üzerinde tarama)
+        self.db_manager.spatial_index = False
+        self.assertEqual(self.db_manager.find_sessions_near(40.05, 33.5, 250), near)
+
+    def test_mission_save_load_replace(self):
+        """Görev toplu kaydedilmeli, yüklenmeli, yerinde değiştirilip silinmeli"""
+        from src.utils.flight_utils import WaypointManager
+
+        manager = WaypointManager(self.db_manager)
+        manager.add_waypoint(40.0, 33.0, 0, action_type='TAKEOFF')
+        manager.add_waypoints([{'latitude': 40.0 + i * 0.001, 'longitude': 33.0, 'altitude': 100.0}
+                               for i in range(1, 500)])
+        self.assertTrue(manager.save_mission("Survey"))
+
+        loaded = WaypointManager(self.db_manager)
+        self.assertTrue(loaded.load_mission("Survey"))
+        self.assertEqual(loaded.waypoints, manager.waypoints)
+        self.assertEqual(loaded.waypoints[0]['action_type'], 'TAKEOFF')
+
+        # Kısaltılmış ve ters çevrilmiş liste eski fazlalıkları silmeli (tekil sıra indeksi)
+        loaded.waypoints = loaded.waypoints[:100][::-1]
+        self.assertTrue(loaded.save_mission())
+        stored = self.db_manager.load_mission("Survey")
+        self.assertEqual([wp['order_index'] for wp in stored], list(range(100)))
+        self.assertEqual(stored[-1]['action_type'], 'TAKEOFF')
+        self.assertEqual(self.db_manager.get_missions()[0]['waypoint_count'], 100)
+
+        self.assertTrue(loaded.delete_mission())
+        self.assertEqual(loaded.waypoints, [])
+        self.assertEqual(self.db_manager.load_mission("Survey"), [])
+        self.assertFalse(loaded.load_mission("Survey"))
+
+    def test_alert_storm_coalesced(self):
+        """Tekrarlar birden çok yazımda da tek satırda birleşmeli, temizlenince çözülmeli"""
+        from collections import Counter
+        from datetime import timedelta
+        from src.services.alert_writer import AlertWriter
+        from src.utils.flight_utils import AlertManager
+
+        session_id = self.db_manager.start_flight_session("Alert Session")
+        writer = AlertWriter(self.db_manager, autostart=False)
+        manager = AlertManager(self.db_manager, writer=writer)
+        start = datetime.now()
+
+        def packet(i, battery):
+            return TelemetryPacket(
+                timestamp=start + timedelta(seconds=i),
+                gps=GPSData(latitude=40.0, longitude=33.0, altitude=200.0,
+                            fix_quality=1, satellites=12),
+                velocity=15.0, battery_voltage=23.5,
+                battery_percent=battery, status="CRUISING")
+
+        for i in range(100):
+            manager.check_all(packet(i, 10.0))
+            if i % 10 == 9:
+                manager.flush()  # Her 10 pakette bir ayrı yazım
+        manager.check_all(packet(100, 50.0))
+        manager.flush()
+
+        metrics = writer.get_metrics()
+        self.assertEqual(metrics['flushes'], 11)
+        self.assertEqual(metrics['rows_inserted'], 2)
+
+        rows = self.db_manager.get_session_alerts(session_id)
+        self.assertEqual(Counter((a['session_id'], a['alert_type']) for a in rows),
+                         {(session_id, 'BATTERY_CRITICAL'): 1, (session_id, 'GPS_LOST'): 1})
+        alerts = {a['alert_type']: a for a in rows}
+        self.assertEqual(alerts['BATTERY_CRITICAL']['occurrences'], 100)
+        self.assertEqual(alerts['BATTERY_CRITICAL']['resolved'], 'YES')
+        self.assertIsNotNone(alerts['BATTERY_CRITICAL']['resolved_time'])
+        self.assertEqual(alerts['GPS_LOST']['occurrences'], 101)
+        self.assertEqual(alerts['GPS_LOST']['resolved'], 'NO')
+
+    def test_alert_write_retried_after_failure(self):
+        """Başarısız yazımdaki alarm ve çözümü kaybolmamalı"""
+        from unittest.mock import patch
+        from src.services.alert_writer import AlertWriter
+
+        session_id = self.db_manager.start_flight_session("Retry Session")
+        writer = AlertWriter(self.db_manager, autostart=False)
+        now = datetime.now()
+        writer.submit({'type': 'GPS_LOST', 'severity': 'CRITICAL', 'message': 'GPS yok',
+                       'timestamp': now})
+        writer.resolve('GPS_LOST', timestamp=now)
+        with patch.object(self.db_manager, 'get_session', side_effect=RuntimeError("kilitli")):
+            writer.flush()
+        self.assertEqual(writer.get_metrics()['pending_groups'], 1)
+        self.assertEqual(self.db_manager.get_session_alerts(session_id), [])
+
+        writer.flush()
+        rows = self.db_manager.get_session_alerts(session_id)
+        self.assertEqual([(a['alert_type'], a['resolved']) for a in rows], [('GPS_LOST', 'YES')])
+        self.assertEqual(writer.get_metrics()['pending_groups'], 0)
+
     def test_get_database_info(self):
         """Veritabanı bilgi alma testi"""
         info = self.db_manager.get_database_info()
@@ -133,6 +368,179 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsInstance(info['total_sessions'], int)
 
 
+class TestHeadlessRecorder(unittest.TestCase):
+    """GUI'siz kaydedici testleri"""
+
+    def setUp(self):
+        self.db_manager = DatabaseManager("test_headless.db")
+
+    def tearDown(self):
+        self.db_manager.close_connection()
+        if os.path.exists("test_headless.db"):
+            os.remove("test_headless.db")
+
+    def test_records_without_qt(self):
+        """Kaydedici paketleri kaydetmeli ve Qt modüllerini import etmemeli"""
+        import subprocess
+        from src.telemetry.recorder import HeadlessRecorder
+
+        recorder = HeadlessRecorder(self.db_manager, sample_rate=200.0, flush_rate=20.0,
+                                    metrics_interval_s=0)
+        recorder.run_forever(duration=0.5)
+        metrics = recorder.get_metrics()
+
+        self.assertGreater(metrics['packets_saved'], 20)
+        self.assertEqual(metrics['packets_saved'], metrics['packets_received'])
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertIsNone(self.db_manager.current_session_id)  # Oturum kapatıldı
+
+        code = ("import sys, src.telemetry.recorder, src.utils.flight_utils; "
+                "sys.exit(int(any(m in sys.modules for m in ('PySide6', 'folium', 'pyqtgraph'))))")
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(subprocess.call([sys.executable, "-c", code], cwd=project_root), 0)
+
+
+    def test_metrics_port_in_use(self):
+        """Metrik portu doluysa kaydedici uyarıp çalışmaya devam etmeli"""
+        import shutil
+        import socket
+        import subprocess
+        import tempfile
+
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        temp_dir = tempfile.mkdtemp()
+        with socket.socket() as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            result = subprocess.run(
+                [sys.executable, "-m", "src.telemetry.recorder",
+                 "--db", os.path.join(temp_dir, "recorder.db"), "--duration", "0.2",
+                 "--metrics-interval", "0", "--metrics-port", str(busy.getsockname()[1])],
+                cwd=project_root, capture_output=True, text=True, timeout=60)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Metrik uç noktası başlatılamadı", result.stdout + result.stderr)
+
+
+class TestPipelineMetrics(unittest.TestCase):
+    """Hat aşaması gecikme ve hız ölçümü testleri"""
+
+    def _packet(self):
+        gps = GPSData(latitude=39.9, longitude=32.8, altitude=100.0)
+        return TelemetryPacket(timestamp=datetime.now(), gps=gps)
+
+    def test_histogram_percentiles(self):
+        """Yüzdelikler HDR çözünürlüğü (~%3) içinde doğru olmalı"""
+        from src.core.logger import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        for value in range(1, 100001):
+            histogram.record(value * 1000)  # 1 µs - 100 ms
+
+        self.assertEqual(histogram.total, 100000)
+        for q in (0.5, 0.9, 0.99):
+            expected = q * 100000 * 1000
+            self.assertAlmostEqual(histogram.percentile(q) / expected, 1.0, delta=0.035)
+        self.assertEqual(histogram.max_ns, 100000 * 1000)
+
+    def test_stage_chain(self):
+        """Her aşama bir öncekinden gecikmeyi, ekran aşaması uçtan ucu ölçmeli"""
+        from src.core.logger import (PipelineMetrics, RECEIVE, DECODE, DB_COMMIT,
+                                     RENDER, END_TO_END)
+
+        metrics = PipelineMetrics()
+        packets = [self._packet() for _ in range(10)]
+        for packet in packets:
+            metrics.mark(packet, RECEIVE, t_ns=1000000)
+            metrics.mark(packet, DECODE, t_ns=1000000 + 50000)  # 50 µs
+        metrics.mark_batch(packets, DB_COMMIT)
+        metrics.mark_batch(packets, RENDER)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot[RECEIVE]['samples'], 0)  # İlk aşamanın gecikmesi yok
+        self.assertAlmostEqual(snapshot[DECODE]['p50_us'], 50.0, delta=2.0)
+        self.assertEqual(snapshot[DB_COMMIT]['count'], 10)
+        self.assertEqual(snapshot[END_TO_END]['samples'], 10)
+        self.assertGreaterEqual(snapshot[END_TO_END]['p50_us'], snapshot[RENDER]['p50_us'])
+        self.assertNotIn('_trace', packets[0].model_dump())
+
+        metrics.register_gauge('queue_depth', lambda: 3)
+        text = metrics.render_text()
+        self.assertIn('uav_stage_latency_us{stage="decode",quantile="0.5"}', text)
+        self.assertIn('uav_stage_packets_total{stage="render"} 10', text)
+        self.assertIn('uav_queue_depth 3', text)
+
+    def test_metrics_endpoint(self):
+        """/metrics uç noktası Prometheus metnini sunmalı"""
+        import urllib.request
+        from src.core.logger import PipelineMetrics, DECODE
+        from src.services.metrics_server import MetricsServer
+
+        metrics = PipelineMetrics()
+        metrics.mark(self._packet(), DECODE)
+        server = MetricsServer(metrics, port=0)
+        server.start()
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                body = response.read().decode('utf-8')
+        finally:
+            server.stop()
+        self.assertIn('uav_stage_packets_total{stage="decode"} 1', body)
+
+
+class TestKinematicsEstimator(unittest.TestCase):
+    """GPS akışından hız/rota kestirimi testleri"""
+
+    def test_finite_difference_and_reported(self):
+        """Bildirim yoksa konum farkı, varsa bildirilen değerler kullanılmalı"""
+        import math
+        from src.telemetry.kinematics import KinematicsEstimator
+
+        estimator = KinematicsEstimator(time_constant_s=1.0)
+        meters_per_deg_lon = 111320.0 * math.cos(math.radians(39.9))
+        for t in range(20):  # Doğuya 10 m/s, 2 m/s tırmanış
+            estimator.update(float(t), 39.9, 32.8 + t * 10 / meters_per_deg_lon, 100 + 2 * t)
+        self.assertAlmostEqual(estimator.ground_speed, 10.0, delta=0.05)
+        self.assertAlmostEqual(estimator.course, 90.0, delta=0.5)
+        self.assertAlmostEqual(estimator.climb_rate, 2.0, delta=0.05)
+
+        # GPS sıçraması hızı bozmamalı
+        estimator.update(20.0, 40.9, 32.8, 140)
+        self.assertEqual(estimator.rejected, 1)
+        self.assertAlmostEqual(estimator.ground_speed, 10.0, delta=0.05)
+
+        # Alıcının bildirdiği hız ve rota önceliklidir
+        estimator.update(21.0, 40.9, 32.8, 140, ground_speed=12.5, course=370.0)
+        self.assertEqual(estimator.ground_speed, 12.5)
+        self.assertAlmostEqual(estimator.course, 10.0)
+
+    def test_no_numpy_import(self):
+        """Modül (ve sabitleri aldığı geodesy) NumPy yüklememeli"""
+        import subprocess
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys, src.telemetry.kinematics; "
+                "print('numpy' in sys.modules, 'PySide6' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.strip(), 'False False')
+
+    def test_simulator_velocity_is_derived(self):
+        """Simülatör hızı konum değişiminden türetilmeli"""
+        from src.telemetry.data_receiver import TelemetrySimulator
+
+        simulator = TelemetrySimulator(sample_rate=10.0)
+        packets = []
+        for _ in range(50):
+            packets.append(simulator.generate_packet())
+            simulator.step()
+        self.assertEqual(packets[0].velocity, 0.0)
+        self.assertTrue(all(0.0 <= p.velocity < 40.0 for p in packets))
+        self.assertIsNotNone(packets[-1].course)
+        self.assertIsNotNone(packets[-1].climb_rate)
+
+
 class TestMAVLinkManager(unittest.TestCase):
     """MAVLink yöneticisi testleri"""
 
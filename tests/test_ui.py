@@ -17,6 +17,7 @@ from src.ui.alarm_panel import AlarmPanel
 from src.ui.waypoint_panel import WaypointPanel
 from src.ui.status_panel import StatusPanel
 from src.telemetry.data_models import TelemetryPacket, GPSData, AttitudeData
+from src.telemetry.data_generator import TelemetryWorker
 
 
 class TestAlarmPanel(unittest.TestCase):
@@ -38,16 +39,17 @@ class TestAlarmPanel(unittest.TestCase):
         """Alarm paneli oluşturma testi"""
         self.assertIsNotNone(self.alarm_panel)
         self.assertFalse(self.alarm_panel.alarms_muted)
-        self.assertEqual(self.alarm_panel.alarm_list.count(), 0)
+        self.assertEqual(self.alarm_panel.alarm_model.rowCount(), 0)
 
     def test_add_warning_alarm(self):
         """Uyarı alarmı ekleme testi"""
-        initial_count = self.alarm_panel.alarm_list.count()
+        initial_count = self.alarm_panel.alarm_model.rowCount()
 
         self.alarm_panel.add_alarm("TEST_WARNING", "WARNING", "Test uyarı mesajı")
 
-        self.assertEqual(self.alarm_panel.alarm_list.count(), initial_count + 1)
-        item_text = self.alarm_panel.alarm_list.item(0).text()
+        self.assertEqual(self.alarm_panel.alarm_model.rowCount(), initial_count + 1)
+        model = self.alarm_panel.alarm_model
+        item_text = model.data(model.index(0))
         self.assertIn("Test uyarı mesajı", item_text)
         self.assertIn("🟡", item_text)
 
@@ -55,19 +57,20 @@ class TestAlarmPanel(unittest.TestCase):
         """Kritik alarm ekleme testi"""
         self.alarm_panel.add_alarm("TEST_CRITICAL", "CRITICAL", "Test kritik mesajı")
 
-        item = self.alarm_panel.alarm_list.item(0)
-        self.assertIn("Test kritik mesajı", item.text())
-        self.assertIn("🔴", item.text())
+        model = self.alarm_panel.alarm_model
+        item_text = model.data(model.index(0))
+        self.assertIn("Test kritik mesajı", item_text)
+        self.assertIn("🔴", item_text)
 
     def test_clear_alarms(self):
         """Alarm temizleme testi"""
         # Önce alarm ekle
         self.alarm_panel.add_alarm("TEST", "WARNING", "Test mesajı")
-        self.assertEqual(self.alarm_panel.alarm_list.count(), 1)
+        self.assertEqual(self.alarm_panel.alarm_model.rowCount(), 1)
 
         # Temizle
         self.alarm_panel.clear_alarms()
-        self.assertEqual(self.alarm_panel.alarm_list.count(), 0)
+        self.assertEqual(self.alarm_panel.alarm_model.rowCount(), 0)
 
     def test_mute_toggle(self):
         """Sessiz modu toggle testi"""
@@ -95,11 +98,56 @@ class TestAlarmPanel(unittest.TestCase):
             status="LOW_BATTERY"
         )
 
-        initial_count = self.alarm_panel.alarm_list.count()
+        initial_count = self.alarm_panel.alarm_model.rowCount()
         self.alarm_panel.check_telemetry_alarms(packet)
 
         # Alarm eklenmiş olmalı
-        self.assertGreater(self.alarm_panel.alarm_list.count(), initial_count)
+        self.assertGreater(self.alarm_panel.alarm_model.rowCount(), initial_count)
+
+    def _battery_packet(self, battery_percent):
+        gps = GPSData(latitude=40.0, longitude=33.0, altitude=100.0, satellites=10, fix_quality=4)
+        return TelemetryPacket(
+            timestamp=datetime.now(),
+            gps=gps,
+            velocity=15.0,
+            battery_percent=battery_percent,
+            battery_voltage=22.0,
+            status="FLYING"
+        )
+
+    def test_persistent_alarm_added_once(self):
+        """Süren koşul her pakette yeni satır eklememeli"""
+        for _ in range(50):
+            self.alarm_panel.check_telemetry_alarms(self._battery_packet(25.0))
+
+        model = self.alarm_panel.alarm_model
+        self.assertEqual(model.rowCount(), 1)
+        self.assertIn("x49", model.data(model.index(0)))  # Debounce: 2. örnekte tetiklenir
+
+    def test_alarm_hysteresis(self):
+        """Eşik etrafındaki salınım alarmı temizlememeli, bant dışı temizlemeli"""
+        for battery in (25.0, 25.0, 31.0, 29.5, 31.5):
+            self.alarm_panel.check_telemetry_alarms(self._battery_packet(battery))
+
+        state = self.alarm_panel.alarm_states.get('BATTERY_LOW')
+        self.assertTrue(state.is_active)
+
+        self.alarm_panel.check_telemetry_alarms(self._battery_packet(40.0))
+        self.assertFalse(state.is_active)
+
+        model = self.alarm_panel.alarm_model
+        self.assertEqual(model.rowCount(), 1)
+        self.assertIn("temizlendi", model.data(model.index(0)))
+
+    def test_alarm_list_capped(self):
+        """Liste kapasiteyi aşmamalı"""
+        panel = AlarmPanel(max_alarms=10)
+        for i in range(25):
+            panel.add_alarm("TEST", "WARNING", f"Mesaj {i}")
+
+        model = panel.alarm_model
+        self.assertEqual(model.rowCount(), 10)
+        self.assertIn("Mesaj 24", model.data(model.index(0)))
 
 
 class TestWaypointPanel(unittest.TestCase):
@@ -196,6 +244,90 @@ class TestWaypointPanel(unittest.TestCase):
 
             self.assertEqual(len(self.waypoint_panel.waypoints), 0)
 
+    def test_load_mission_from_database(self):
+        """Kayıtlı görev listeye tek seferde yüklenmeli"""
+        import tempfile
+        from src.database.database_manager import DatabaseManager
+
+        database = DatabaseManager(os.path.join(tempfile.mkdtemp(), "missions.db"))
+        self.addCleanup(database.close_connection)
+        panel = WaypointPanel(database)
+        panel.add_waypoint()
+        panel.action_combo.setCurrentText("LAND")
+        panel.add_waypoint()
+        panel.mission_name_edit.setText("Panel Mission")
+        with patch('PySide6.QtWidgets.QMessageBox.information'):
+            panel.save_mission()
+
+        loaded = []
+        other = WaypointPanel(database)
+        other.missionLoaded.connect(loaded.append)
+        self.assertTrue(other.load_mission("Panel Mission"))
+        self.assertEqual(other.waypoint_list.count(), 2)
+        self.assertEqual([wp['action'] for wp in other.waypoints], ['FLY_TO', 'LAND'])
+        self.assertEqual(len(loaded[0]), 2)
+        self.assertEqual(other.mission_name_edit.text(), "Panel Mission")
+        self.assertFalse(other.load_mission("Missing"))
+
+    def test_mission_progress_and_off_route_alarm(self):
+        """Görev takibi panelde ilerleme göstermeli, sapma alarmı alarm paneline düşmeli"""
+        from src.services.mission_tracker import MissionTracker, ROUTE_ALERT_TYPE
+
+        panel = self.waypoint_panel
+        for lat, lon in [(40.0, 33.0), (40.0, 33.01), (40.01, 33.01)]:
+            panel.lat_spin.setValue(lat)
+            panel.lon_spin.setValue(lon)
+            panel.add_waypoint()
+
+        alarm_panel = AlarmPanel()
+        tracker = MissionTracker(panel.waypoints, alarm_states=alarm_panel.alarm_states,
+                                 raise_debounce=1)
+        progress = tracker.update(40.0005, 33.005, speed=10.0)  # ~56 m solda
+        alarm_panel.process_transition(ROUTE_ALERT_TYPE, progress['transition'],
+                                       tracker.alarm_states.get(ROUTE_ALERT_TYPE))
+        panel.update_progress(progress)
+
+        self.assertIn("ROTA DIŞI", panel.progress_label.text())
+        self.assertIn("WP1", panel.progress_label.text())
+        self.assertTrue(panel.waypoint_list.item(1).font().bold())
+        self.assertEqual(alarm_panel.alarm_model.rowCount(), 1)
+        self.assertIn("UYARI", alarm_panel.status_label.text())
+
+        panel.update_progress(tracker.update(40.01, 33.01))
+        self.assertIn("tamamlandı", panel.progress_label.text())
+        self.assertFalse(panel.waypoint_list.item(1).font().bold())
+
+    def test_geofence_alarms_in_main_window(self):
+        """Sınır ihlali alarm paneline düşmeli, ihlal bitince temizlenmeli"""
+        from src.core.config import get_config
+        from src.services.geofence import Geofence, GeofenceEngine
+        from src.ui.main_window import MainWindow
+
+        zone = Geofence(name="Havalimanı", shape="cylinder", center=(40.0, 33.0), radius_m=500)
+        window = MainWindow.__new__(MainWindow)  # Worker/harita/veritabanı olmadan
+        window.config = get_config()
+        window.alarm_panel = AlarmPanel()
+        window.geofence_engine = GeofenceEngine([zone])
+        window._geofence_alarm_types = set()
+
+        def packet(lat):
+            return TelemetryPacket(
+                timestamp=datetime.now(), velocity=15.0, battery_percent=80.0,
+                battery_voltage=22.0, status="FLYING",
+                gps=GPSData(latitude=lat, longitude=33.0, altitude=100.0,
+                            fix_quality=4, satellites=12))
+
+        window._check_geofences([packet(40.001), packet(40.001)])
+        model = window.alarm_panel.alarm_model
+        self.assertEqual(model.rowCount(), 1)
+        self.assertIn("KRİTİK", window.alarm_panel.status_label.text())
+        self.assertEqual(window._geofence_alarm_types, {zone.alert_type})
+
+        window._check_geofences([packet(40.02)])
+        self.assertEqual(window._geofence_alarm_types, set())
+        self.assertEqual(len(window.alarm_panel.alarm_states.active()), 0)
+        self.assertIn("Normal", window.alarm_panel.status_label.text())
+
     def test_mission_statistics(self):
         """Görev istatistikleri testi"""
         # İki waypoint ekle (mesafe hesaplanabilir)
@@ -284,6 +416,138 @@ class TestStatusPanel(unittest.TestCase):
         self.assertTrue(self.status_panel.emergencyStopRequested)
 
 
+class TestTelemetryWorkerBatching(unittest.TestCase):
+    """Worker'ın toplu (batch) sinyal gönderimi testleri"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Test sınıfı başlatma"""
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_queue_bounded_at_high_rate(self):
+        """200 Hz girişte paketler ekran hızında toplanmalı (sahte saatle)"""
+        worker = TelemetryWorker(sample_rate=200.0, display_rate=30.0)
+        clock = _FakeClock(worker, duration=1.0)
+        batches = []
+
+        def consume(packets):
+            batches.append(len(packets))
+            worker.batch_consumed()
+
+        worker.new_batch.connect(consume)
+        # Döngü bu thread'de, sahte saatle çalışır: zamanlamadan bağımsız
+        with patch('src.telemetry.data_generator.time', clock):
+            worker.run()
+
+        metrics = worker.get_queue_metrics()
+        self.assertEqual(sum(batches), 200)  # 1 s x 200 Hz
+        self.assertEqual(metrics['packets_emitted'], 200)
+        self.assertEqual(metrics['buffered_packets'], 0)
+        self.assertTrue(29 <= len(batches) <= 31)  # Paket başına değil, ekran hızında
+        self.assertTrue(all(6 <= size <= 7 for size in batches[:-1]))
+        self.assertLessEqual(metrics['max_batch_size'], 7)
+        self.assertEqual(metrics['max_pending_batches'], 1)
+
+    def test_pending_batches_tracked(self):
+        """GUI'nin işlemediği batch'ler kuyruk derinliğinde sayılmalı"""
+        worker = TelemetryWorker(sample_rate=200.0, display_rate=30.0)
+        packet = worker.simulator.generate_packet()
+
+        for _ in range(3):
+            worker._enqueue(packet)
+            worker._emit_batch()
+        worker._emit_batch()  # Boş tampon batch üretmez
+        self.assertEqual(worker.get_queue_metrics()['pending_batches'], 3)
+
+        worker.batch_consumed()
+        worker._enqueue(packet)
+        worker._emit_batch()
+        metrics = worker.get_queue_metrics()
+        self.assertEqual(metrics['pending_batches'], 3)
+        self.assertEqual(metrics['max_pending_batches'], 3)
+
+
+class _FakeClock:
+    """time modülü yerine geçen sahte saat: sleep zamanı ilerletir,
+    süre dolunca worker'ı durdurur"""
+
+    TICK = 1e-6  # Gerçek saat gibi her okumada biraz ilerler
+
+    def __init__(self, worker, duration):
+        self.worker = worker
+        self.duration = duration
+        self.now = 0.0
+
+    def perf_counter(self):
+        # Kayan nokta artığı yüzünden döngü beklemeden dönse de zaman durmaz
+        self._advance(self.TICK)
+        return self.now
+
+    def sleep(self, seconds):
+        self._advance(seconds)
+
+    def _advance(self, seconds):
+        self.now += seconds
+        if self.now >= self.duration:
+            self.worker.running = False
+
+
+class TestMainWindowLazyTabs(unittest.TestCase):
+    """Ağır sekmelerin ilk açılışta oluşturulması testleri"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Test sınıfı başlatma"""
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        import tempfile
+        from src.database.database_manager import DatabaseManager
+        from src.ui.main_window import MainWindow
+
+        self.temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(self.temp_dir, "lazy.db")
+        with patch('src.ui.main_window.DatabaseManager', lambda _: DatabaseManager(db_path)):
+            self.window = MainWindow()
+
+    def tearDown(self):
+        import shutil
+        self.window.worker.stop_session()  # Geçici veritabanı silinmeden önce
+        self.window.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_heavy_tabs_deferred(self):
+        """Grafikler sekmesi açılana kadar oluşturulmamalı, birikmiş veri aktarılmalı"""
+        self.assertIsNone(self.window.charts_widget)
+        self.assertIsNone(self.window.db_stats_label)
+
+        packets = []
+        for i in range(5):
+            gps = GPSData(latitude=39.9 + i * 0.001, longitude=32.8, altitude=100.0 + i)
+            packets.append(TelemetryPacket(timestamp=datetime.now(), gps=gps, velocity=15.0,
+                                           battery_percent=80.0, battery_voltage=24.0,
+                                           status="FLYING"))
+        self.window.update_telemetry_batch(packets)
+        self.assertEqual(len(self.window.flight_track), 5)
+
+        self.window.tabs.setCurrentIndex(1)  # Grafikler
+        self.assertIsNotNone(self.window.charts_widget)
+        self.assertEqual(list(self.window.charts_widget.altitude_data)[-1], 104.0)
+
+        tabs = self.window.tabs
+        tabs.setCurrentIndex(next(i for i in range(tabs.count()) if "Veritabanı" in tabs.tabText(i)))
+        self.assertIsNotNone(self.window.db_stats_label)
+        self.window._db_loader.wait(5000)
+        self.app.processEvents()
+        self.assertIn("Toplam oturum", self.window.db_stats_label.text())
+
+
 if __name__ == '__main__':
     # Test suite oluştur
     loader = unittest.TestLoader()
@@ -293,6 +557,8 @@ if __name__ == '__main__':
     suite.addTests(loader.loadTestsFromTestCase(TestAlarmPanel))
     suite.addTests(loader.loadTestsFromTestCase(TestWaypointPanel))
     suite.addTests(loader.loadTestsFromTestCase(TestStatusPanel))
+    suite.addTests(loader.loadTestsFromTestCase(TestTelemetryWorkerBatching))
+    suite.addTests(loader.loadTestsFromTestCase(TestMainWindowLazyTabs))
 
     # Testleri çalıştır
     runner = unittest.TextTestRunner(verbosity=2)
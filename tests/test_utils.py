@@ -0,0 +1,335 @@
+# tests/test_utils.py
+import unittest
+import random
+import statistics
+import sys
+import os
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.rolling_stats import RollingStats
+from src.utils.flight_track import FlightTrack, douglas_peucker
+
+
+class TestRollingStats(unittest.TestCase):
+    """Kayan istatistik yapısının testleri"""
+
+    def test_windowed_matches_naive(self):
+        """Pencereli istatistikler doğrudan hesaplamayla aynı olmalı"""
+        random.seed(42)
+        window = 25
+        stats = RollingStats(window=window)
+        values = []
+
+        for _ in range(500):
+            value = random.uniform(-100, 100)
+            values.append(value)
+            stats.add(value)
+
+            tail = values[-window:]
+            self.assertEqual(stats.min, min(tail))
+            self.assertEqual(stats.max, max(tail))
+            self.assertAlmostEqual(stats.mean, sum(tail) / len(tail), places=6)
+            if len(tail) > 1:
+                self.assertAlmostEqual(stats.std, statistics.stdev(tail), places=6)
+
+    def test_cumulative_mode(self):
+        """Pencere verilmezse tüm uçuş istatistiği tutulmalı"""
+        stats = RollingStats()
+        stats.extend([5.0, 1.0, 9.0, None, 3.0])
+
+        self.assertEqual(stats.count, 4)
+        self.assertEqual(stats.min, 1.0)
+        self.assertEqual(stats.max, 9.0)
+        self.assertEqual(stats.last, 3.0)
+        self.assertAlmostEqual(stats.mean, 4.5)
+
+    def test_clear(self):
+        """Temizleme sonrası istatistikler boş olmalı"""
+        stats = RollingStats(window=3)
+        stats.extend([1.0, 2.0, 3.0, 4.0])
+        stats.clear()
+
+        self.assertEqual(stats.count, 0)
+        self.assertIsNone(stats.min)
+        self.assertIsNone(stats.max)
+        self.assertIsNone(stats.mean)
+
+
+class TestFlightTrack(unittest.TestCase):
+    """Uçuş izi ve sadeleştirme testleri"""
+
+    def test_metric_spacing_filter(self):
+        """Minimum aralıktan yakın noktalar ize eklenmemeli"""
+        track = FlightTrack(min_spacing_m=5.0)
+        self.assertTrue(track.add(39.9, 32.8))
+        self.assertFalse(track.add(39.90001, 32.8))  # ~1.1 m
+        self.assertTrue(track.add(39.9001, 32.8))  # ~11 m
+        self.assertEqual(len(track), 2)
+
+    def test_douglas_peucker_straight_line(self):
+        """Doğru üzerindeki ara noktalar atılmalı"""
+        lats = [39.9 + i * 0.001 for i in range(10)]
+        lons = [32.8] * 10
+        self.assertEqual(douglas_peucker(lats, lons, 0, 9, 1.0), [0, 9])
+
+    def test_full_track_retained(self):
+        """İz kısaltılmamalı, sadeleştirilmiş görünüm uçları korumalı"""
+        random.seed(7)
+        track = FlightTrack(min_spacing_m=1.0, chunk_size=64)
+        lat, lon = 39.9, 32.8
+        for _ in range(5000):
+            lat += random.uniform(-1, 1) * 0.0002
+            lon += random.uniform(-1, 1) * 0.0002
+            track.add(lat, lon)
+
+        coarse = track.simplified(10)
+        fine = track.simplified(18)
+
+        self.assertGreater(len(track), 4000)
+        self.assertEqual(coarse[0], [track.lats[0], track.lons[0]])
+        self.assertEqual(coarse[-1], [track.lats[-1], track.lons[-1]])
+        self.assertLess(len(coarse), len(fine))
+
+    def test_clear(self):
+        """Temizleme izi boşaltmalı ve haritanın fark edeceği nesli artırmalı"""
+        track = FlightTrack()
+        track.add(39.9, 32.8)
+        generation = track.generation
+        track.clear()
+        self.assertEqual(len(track), 0)
+        self.assertEqual(track.simplified(13), [])
+        self.assertEqual(track.generation, generation + 1)
+
+
+class TestLogging(unittest.TestCase):
+    """Kuyruk tabanlı günlük testleri"""
+
+    def tearDown(self):
+        from src.core.logger import shutdown_logging
+        shutdown_logging()
+
+    def test_levels_and_json_file(self):
+        """Modül seviyeleri uygulanmalı, dosyaya JSON-lines yazılmalı"""
+        import io
+        import json
+        import tempfile
+        from src.core.logger import get_logger, setup_logging, shutdown_logging
+
+        log_file = os.path.join(tempfile.mkdtemp(), "uav.jsonl")
+        console = io.StringIO()
+        setup_logging(level="INFO", module_levels={'ui': 'WARNING'},
+                      log_file=log_file, stream=console)
+
+        data = {'battery': 50}
+        get_logger('src.telemetry.worker').info("Paket %d: %s", 7, data)
+        data['battery'] = 10  # Kuyruktayken değişse de kayıt etkilenmemeli
+        get_logger('src.telemetry.worker').debug("gizli")
+        get_logger('src.ui.alarm_panel').info("gizli")
+        get_logger('src.ui.alarm_panel').warning("Alarm", extra={'alert_type': 'LOW_BATTERY'})
+        shutdown_logging()
+
+        with open(log_file, encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual([e['msg'] for e in entries], ["Paket 7: {'battery': 50}", "Alarm"])
+        self.assertEqual(entries[0]['logger'], 'uav.telemetry.worker')
+        self.assertEqual(entries[1]['alert_type'], 'LOW_BATTERY')
+        self.assertNotIn("gizli", console.getvalue())
+        self.assertIn("Alarm", console.getvalue())
+
+
+
+class TestGeodesy(unittest.TestCase):
+    """Vektörel jeodezi fonksiyonlarının testleri"""
+
+    def test_distances_and_bearing(self):
+        """Bilinen değerler ve skaler/dizi tutarlılığı"""
+        import numpy as np
+        from src.core.utils import haversine, vincenty, initial_bearing, track_length
+
+        # Flinders Peak - Buninyong (Vincenty 1975): 54972.271 m
+        self.assertAlmostEqual(vincenty(-37.9510334, 144.4248679, -37.652821, 143.926497),
+                               54972.27, delta=0.5)
+        self.assertAlmostEqual(haversine(0, 0, 0, 1), 111194.93, places=1)
+        self.assertAlmostEqual(initial_bearing(39.9, 32.8, 40.0, 32.8), 0.0)
+        self.assertAlmostEqual(initial_bearing(39.9, 32.8, 39.9, 32.7), 270.0, places=1)
+
+        lats, lons = np.array([39.9, 39.91, 39.92]), np.array([32.8, 32.81, 32.8])
+        segments = haversine(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        self.assertAlmostEqual(segments[0], haversine(39.9, 32.8, 39.91, 32.81))
+        self.assertAlmostEqual(track_length(lats, lons), segments.sum())
+        # Eksik konuma değen segmentler atlanır
+        self.assertAlmostEqual(track_length([39.9, np.nan, 39.91, 39.92], [32.8] * 4),
+                               haversine(39.91, 32.8, 39.92, 32.8))
+
+    def test_enu_and_segment(self):
+        """ENU gidiş-dönüş ve nokta-doğru parçası uzaklığı"""
+        from src.core.utils import (geodetic_to_enu, enu_to_geodetic, point_to_segment,
+                                    cross_track)
+
+        east, north, up = geodetic_to_enu([39.91, 39.93], [32.84, 32.86], [1000, 1200],
+                                          39.92, 32.85, 900)
+        lats, lons, alts = enu_to_geodetic(east, north, up, 39.92, 32.85, 900)
+        self.assertTrue(abs(lats[1] - 39.93) < 1e-9 and abs(lons[0] - 32.84) < 1e-9)
+        self.assertAlmostEqual(alts[1], 1200, places=3)
+
+        # Doğuya giden bacağın ortasının ~556 m kuzeyi: uzaklık 556 m, t = 0.5
+        distance, t = point_to_segment(39.905, 32.805, 39.9, 32.8, 39.9, 32.81)
+        self.assertAlmostEqual(distance, 556.6, delta=1.0)
+        self.assertAlmostEqual(t, 0.5)
+        xtd, atd = cross_track(39.905, 32.805, 39.9, 32.8, 39.9, 32.81)
+        self.assertLess(xtd, 0)  # Rotanın solu
+        self.assertAlmostEqual(abs(xtd), 556.0, delta=2.0)
+
+
+class TestConfig(unittest.TestCase):
+    """Merkezi yapılandırma testleri"""
+
+    def test_profile_file_env_precedence(self):
+        """Profil < dosya < ortam değişkeni sırasıyla birleştirilmeli"""
+        import json
+        import tempfile
+        from src.core.config import load_config
+
+        path = os.path.join(tempfile.mkdtemp(), "uav.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'charts': {'max_points': 80}, 'map': {'min_spacing_m': 3.0},
+                       'alerts': {'thresholds': {'BATTERY_LOW': 25}}}, f)
+
+        config = load_config(path, environ={'UAV_PROFILE': 'laptop',
+                                            'UAV__MAP__MIN_SPACING_M': '7.5',
+                                            'UAV__METRICS__ENABLED': 'false'})
+        self.assertEqual(config.profile, 'laptop')
+        self.assertEqual(config.telemetry.display_rate_hz, 15.0)  # profil
+        self.assertEqual(config.charts.max_points, 80)  # dosya
+        self.assertEqual(config.map.min_spacing_m, 7.5)  # ortam
+        self.assertFalse(config.metrics.enabled)
+
+        thresholds = {rule.type: rule.threshold for rule in config.alerts.build_rules()}
+        self.assertEqual(thresholds['BATTERY_LOW'], 25.0)
+
+        # Varsayılan profil mevcut sabitlerle aynı; yazım hataları reddedilir
+        self.assertEqual(load_config(environ={}).charts.max_points, 100)
+        with self.assertRaises(ValueError):
+            load_config(environ={'UAV__CHARTS__MAX_POINT': '10'})
+        with self.assertRaises(ValueError):
+            load_config(environ={'UAV_PROFILE': 'yok'})
+
+
+class TestRouteOptimizer(unittest.TestCase):
+    """Görev rotası sıralama testleri"""
+
+    def test_grid_order_and_anchors(self):
+        """Karıştırılmış ızgara kısalmalı; TAKEOFF/LAND yerinde kalmalı"""
+        import tempfile
+        from src.database.database_manager import DatabaseManager
+        from src.database.models import Waypoint
+        from src.utils.flight_utils import WaypointManager
+
+        random.seed(4)
+        grid = [(39.9 + r * 0.001, 32.8 + c * 0.001) for r in range(10) for c in range(10)]
+        random.shuffle(grid)
+        database = DatabaseManager(os.path.join(tempfile.mkdtemp(), "route.db"))
+        self.addCleanup(database.close_connection)
+        manager = WaypointManager(database)
+        manager.add_waypoint(39.899, 32.8, 0, action_type='TAKEOFF')
+        for lat, lon in grid:
+            manager.add_waypoint(lat, lon, 100)
+        manager.add_waypoint(39.899, 32.801, 0, action_type='LAND')
+        before = manager.calculate_route()['total_distance']
+
+        report = manager.optimize_route(time_budget_s=2.0)
+        self.assertTrue(report['applied'])
+        self.assertEqual(sorted(report['order']), list(range(102)))
+        self.assertEqual((report['order'][0], report['order'][-1]), (0, 101))
+        self.assertEqual(manager.waypoints[0]['action_type'], 'TAKEOFF')
+        self.assertEqual(manager.waypoints[-1]['action_type'], 'LAND')
+        self.assertEqual([wp['order_index'] for wp in manager.waypoints], list(range(102)))
+        with database.get_session() as session:
+            stored = [(row.latitude, row.longitude) for row in session.query(Waypoint)
+                      .filter_by(mission_name=manager.current_mission).order_by(Waypoint.order_index)]
+        self.assertEqual(stored, [(wp['latitude'], wp['longitude']) for wp in manager.waypoints])
+
+        # 100 noktalık 111 m ızgara: en iyi yol ~99 x 111 m (+ kalkış/iniş bacakları)
+        after = manager.calculate_route()['total_distance']
+        self.assertAlmostEqual(report['original_distance'], before)
+        self.assertAlmostEqual(report['optimized_distance'], after)
+        self.assertLess(after, 99 * 111.2 * 1.15 + 2 * 1100)
+        self.assertAlmostEqual(report['time_saved_min'], (before - after) / 15.0 / 60)
+
+    def test_free_end_matches_brute_force(self):
+        """Küçük problemde serbest bitişli en iyi yol bulunmalı"""
+        import itertools
+        from src.utils.route_optimizer import distance_matrix, optimize_order, path_length
+
+        random.seed(9)
+        points = [(39.9 + random.random() * 0.01, 32.8 + random.random() * 0.01) for _ in range(8)]
+        matrix = distance_matrix(*zip(*points))
+        best = min(path_length(matrix, (0,) + rest)
+                   for rest in itertools.permutations(range(1, 8)))
+        result = optimize_order(matrix, start=0)
+        self.assertEqual(result['order'][0], 0)
+        self.assertLessEqual(result['distance'], best * 1.05)
+        self.assertLessEqual(result['distance'], result['initial_distance'])
+
+
+class TestSurveyGrid(unittest.TestCase):
+    """Tarama ızgarası üretimi testleri"""
+
+    def test_rectangle_spacing_and_serpentine(self):
+        """Hat/çekim aralıkları bindirmeye uymalı, hatlar sırayla ters yönde uçulmalı"""
+        import numpy as np
+        from src.core.utils import haversine, local_xy
+        from src.utils.survey_grid import survey_grid
+
+        # ~1 km x ~1 km kare; 100x60 m kare, %50 bindirme -> 50 m hat, <=30 m çekim aralığı
+        square = [(39.9, 32.8), (39.9, 32.8117), (39.909, 32.8117), (39.909, 32.8)]
+        lats, lons = survey_grid(square, (100, 60), front_overlap=0.5, side_overlap=0.5)
+        x, y = local_xy(lats, lons, 39.9, 32.8)
+
+        same_lane = np.abs(np.diff(y)) < 1
+        lanes = y[np.concatenate(([0], np.flatnonzero(~same_lane) + 1))]
+        self.assertEqual(len(lanes), 20)
+        self.assertTrue(np.allclose(np.diff(lanes), 50, atol=0.5))
+        steps = haversine(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        self.assertLessEqual(steps[same_lane].max(), 30.01)
+        width, _ = local_xy(39.9, 32.8117, 39.9, 32.8)
+        self.assertTrue((x >= -0.5).all() and (x <= width + 0.5).all())
+
+        # Yılan düzeni: ilk hat doğuya, ikinci hat batıya
+        first_lane = np.abs(y - y[0]) < 1
+        self.assertGreater(x[first_lane][-1], x[first_lane][0])
+        second_lane = np.abs(y - lanes[1]) < 1
+        self.assertLess(x[second_lane][-1], x[second_lane][0])
+
+    def test_concave_polygon_and_manager(self):
+        """L biçimli alanda noktalar boşluğa düşmemeli; ızgara göreve eklenebilmeli"""
+        import numpy as np
+        from src.services.geofence import point_in_polygon
+        from src.utils.flight_utils import WaypointManager
+        from src.utils.survey_grid import survey_grid
+
+        shape = [(39.9, 32.8), (39.9, 32.82), (39.905, 32.82), (39.905, 32.81),
+                 (39.92, 32.81), (39.92, 32.8)]
+        lats, lons = survey_grid(shape, (60, 40), angle_deg=30)
+        self.assertGreater(len(lats), 500)
+        # Köşe (39.91, 32.815) boşlukta; hiçbir nokta oraya yakın olmamalı
+        self.assertFalse(((lats > 39.906) & (lons > 32.811)).any())
+        inside = [point_in_polygon(lat, lon, [p[0] for p in shape], [p[1] for p in shape])
+                  for lat, lon in zip(lats[::25], lons[::25])]
+        self.assertGreaterEqual(np.mean(inside), 0.95)  # Sınır üstündekiler hariç
+
+        manager = WaypointManager(None)
+        manager.add_waypoint(39.9, 32.8, 0, action_type='TAKEOFF')
+        added = manager.add_survey_grid(shape, 80, footprint=(60, 40), angle_deg=30)
+        self.assertEqual(added, len(lats))
+        self.assertEqual(manager.waypoints[1]['action_type'], 'PHOTO')
+        self.assertEqual(manager.waypoints[-1]['order_index'], added)
+
+        with self.assertRaises(ValueError):
+            survey_grid(shape[:2], (60, 40))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)